@@ -110,6 +110,32 @@ class BaseAdapter:
 
         return wrapper
 
+    @staticmethod
+    def _handoff(result):
+        """
+        Hand a result over to downstream modules.
+
+        Under pandas Copy-on-Write (mode.copy_on_write = True),
+            DataFrames and Series, also those nested in dicts,
+            are returned as shallow copies sharing memory with the stored result,
+            and a copy is only taken when either side is modified.
+        Otherwise the result is deep copied.
+
+        Args:
+            result: The result stored by the adapter.
+
+        Returns:
+            A copy of the result that is safe to modify.
+        """
+        if pd.get_option("mode.copy_on_write") is not True:
+            return deepcopy(result)
+
+        if isinstance(result, (pd.DataFrame, pd.Series)):
+            return result.copy(deep=False)
+        if isinstance(result, dict):
+            return {key: BaseAdapter._handoff(value) for key, value in result.items()}
+        return deepcopy(result)
+
     @log_and_raise_not_implemented
     def _run(self, input: dict):
         """
@@ -292,7 +318,7 @@ class SplitterAdapter(BaseAdapter):
         Retrieve the splitting result.
             Due to Config force num_samples = 1, return 1st dataset is fine.
         """
-        result: dict = deepcopy(self.data[1])
+        result: dict = self._handoff(self.data[1])
         return result
 
     def get_metadata(self) -> SchemaMetadata:
@@ -403,7 +429,7 @@ class PreprocessorAdapter(BaseAdapter):
         """
         Retrieve the pre-processing result.
         """
-        result: pd.DataFrame = deepcopy(self.data_preproc)
+        result: pd.DataFrame = self._handoff(self.data_preproc)
         return result
 
     def get_metadata(self) -> SchemaMetadata:
@@ -499,7 +525,7 @@ class SynthesizerAdapter(BaseAdapter):
         """
         Retrieve the synthesizing result.
         """
-        return deepcopy(self.data_syn)
+        return self._handoff(self.data_syn)
 
 
 class PostprocessorAdapter(BaseAdapter):
@@ -562,7 +588,7 @@ class PostprocessorAdapter(BaseAdapter):
         """
         Retrieve the pre-processing result.
         """
-        result: pd.DataFrame = deepcopy(self.data_postproc)
+        result: pd.DataFrame = self._handoff(self.data_postproc)
         return result
 
 
@@ -587,7 +613,9 @@ class ConstrainerAdapter(BaseAdapter):
         config = self._transform_field_combinations(config)
         super().__init__(config)
 
-        # Store sampling configuration if provided
+        # Store sampling configuration if provided,
+        #   popping from a copy keeps the experiment config intact for other branches
+        config = dict(config)
         self.sample_dict = {}
         self.sample_dict.update(
             {
@@ -597,6 +625,7 @@ class ConstrainerAdapter(BaseAdapter):
                     "sampling_ratio",
                     "max_trials",
                     "verbose_step",
+                    "n_jobs",
                 ]
                 if key in config
             }
@@ -677,7 +706,7 @@ class ConstrainerAdapter(BaseAdapter):
         Returns:
             pd.DataFrame: The constrained data.
         """
-        return deepcopy(self.constrained_data)
+        return self._handoff(self.constrained_data)
 
     def _transform_field_combinations(self, config: dict) -> dict:
         """Transform field combinations from YAML list format to tuple format
@@ -765,7 +794,7 @@ class EvaluatorAdapter(BaseAdapter):
         Returns:
             (dict[str, pd.DataFrame]): The evaluation results.
         """
-        return deepcopy(self.evaluations)
+        return self._handoff(self.evaluations)
 
 
 class DescriberAdapter(BaseAdapter):
@@ -841,7 +870,7 @@ class DescriberAdapter(BaseAdapter):
         """
         Retrieve the pre-processing result.
         """
-        return deepcopy(self.description)
+        return self._handoff(self.description)
 
 
 class ReporterAdapter(BaseAdapter):
@@ -957,12 +986,12 @@ class ReporterAdapter(BaseAdapter):
                     index_tuple = tuple(
                         item for pair in temp_dict.items() for item in pair
                     )
-                    data[index_tuple] = deepcopy(result[key])
+                    data[index_tuple] = self._handoff(result[key])
             else:
                 index_tuple = tuple(
                     item for pair in index_dict.items() for item in pair
                 )
-                data[index_tuple] = deepcopy(result)
+                data[index_tuple] = self._handoff(result)
         self.input["data"] = data
         self.input["data"]["exist_report"] = status.get_report()
 
@@ -982,4 +1011,4 @@ class ReporterAdapter(BaseAdapter):
             (dict) key as module name,
             value as raw/processed data (others) or report data (Reporter)
         """
-        return deepcopy(self.report)
+        return self._handoff(self.report)
@@ -1,5 +1,12 @@
+import math
+import os
+import random
+import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 
+import numpy as np
 import pandas as pd
 
 from petsard.constrainer.constrainer_base import BaseConstrainer
@@ -11,6 +18,290 @@ from petsard.constrainer.field_proportions_constrainer import (
     FieldProportionsConstrainer,
 )
 from petsard.constrainer.nan_group_constrainer import NaNGroupConstrainer
+from petsard.exceptions import UnableToSynthesizeError, UnsupportedMethodError
+
+
+def _generate_batch(
+    synthesizer,
+    postprocessor,
+    num_rows: int,
+    conditions: list[dict] | None = None,
+    keep_fields: list[str] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """
+    Sample num_rows rows from the synthesizer and apply the postprocessor.
+
+    The row count is also forwarded to the fitted implementation of the synthesizer,
+        and restored after sampling.
+        With conditions, the rows are sampled by conditional sampling instead.
+
+    Args:
+        synthesizer: Synthesizer instance for generating synthetic data
+        postprocessor: Optional postprocessor for data transformation
+        num_rows: Number of rows to sample, ignored with conditions
+        conditions: Optional conditions of synthesizer.sample_from_conditions
+        keep_fields: Optional fields to keep as sampled, before postprocessing
+
+    Returns:
+        Sampled DataFrame, and the keep_fields of it before postprocessing
+            (None without keep_fields or if the synthesizer lacks these fields)
+    """
+    if conditions is not None:
+        new_samples = synthesizer.sample_from_conditions(conditions)
+    else:
+        synthesizer.config.update(
+            {
+                "sample_from": "Constrainter",
+                "sample_num_rows": num_rows,
+            }
+        )
+
+        impl = getattr(synthesizer, "_impl", None)
+        impl_config = getattr(impl, "config", None)
+        if not isinstance(impl_config, dict) or "sample_num_rows" not in impl_config:
+            impl_config = None
+
+        if impl_config is None:
+            new_samples = synthesizer.sample()
+        else:
+            impl_num_rows = impl_config["sample_num_rows"]
+            impl.update_config({"sample_num_rows": num_rows})
+            try:
+                new_samples = synthesizer.sample()
+            finally:
+                impl.update_config({"sample_num_rows": impl_num_rows})
+
+    raw_fields = None
+    if keep_fields is not None and all(f in new_samples.columns for f in keep_fields):
+        raw_fields = new_samples[keep_fields].reset_index(drop=True)
+
+    # Apply postprocessor if provided
+    if postprocessor is not None:
+        new_samples = postprocessor.inverse_transform(new_samples)
+
+    return new_samples, raw_fields
+
+
+# Worker state of the parallel resampling: (synthesizer, postprocessor)
+_resample_worker_state: tuple | None = None
+
+
+def _init_resample_worker(synthesizer, postprocessor):
+    """
+    Initializer of the worker processes used by resample_until_satisfy(n_jobs > 1).
+
+    Args:
+        synthesizer: Fitted synthesizer instance of the parent
+        postprocessor: Optional postprocessor of the parent
+    """
+    global _resample_worker_state
+
+    _resample_worker_state = (synthesizer, postprocessor)
+
+
+def _generate_batch_in_worker(
+    num_rows: int,
+    seed: int,
+    conditions: list[dict] | None = None,
+    keep_fields: list[str] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """
+    Sample a batch in a worker process.
+
+    Forked workers start with the random state of the parent,
+        so every batch reseeds the random generators to get different rows.
+
+    Args:
+        num_rows: Number of rows to sample
+        seed: Seed of the random generators for this batch
+        conditions: same as _generate_batch
+        keep_fields: same as _generate_batch
+
+    Returns:
+        same as _generate_batch
+    """
+    synthesizer, postprocessor = _resample_worker_state
+
+    random.seed(seed)
+    np.random.seed(seed)
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.manual_seed(seed)
+
+    return _generate_batch(
+        synthesizer, postprocessor, num_rows, conditions, keep_fields
+    )
+
+
+@contextmanager
+def _resample_pool(synthesizer, postprocessor, n_jobs: int):
+    """
+    Process pool of resample_until_satisfy, sharing the fitted synthesizer
+
+    Yields:
+        tuple[ProcessPoolExecutor | None, int]:
+            The pool and its number of workers, the pool is None when n_jobs is 1
+    """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs <= 1:
+        yield None, 1
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_init_resample_worker,
+        initargs=(synthesizer, postprocessor),
+    ) as pool:
+        yield pool, n_jobs
+
+
+class _AcceptedRows:
+    """
+    Accepted rows of resample_until_satisfy, deduplicated across trials.
+
+    Rows are compared by their hashes, and the chunks of every trial
+        are concatenated once by to_frame() instead of in each trial.
+    """
+
+    def __init__(self):
+        self.chunks: list[pd.DataFrame] = []
+        self.hashes: np.ndarray = np.empty(0, dtype=np.uint64)
+        self.n_rows: int = 0
+
+    def add(self, rows: pd.DataFrame) -> int:
+        """
+        Add the rows not seen before.
+
+        Args:
+            rows: Rows satisfying the constraints
+
+        Returns:
+            Number of rows added
+        """
+        if rows.empty:
+            if not self.chunks:
+                self.chunks.append(rows)
+            return 0
+
+        hashes = pd.util.hash_pandas_object(rows, index=False).to_numpy()
+        is_new = ~pd.Series(hashes).duplicated().to_numpy()
+        is_new &= ~np.isin(hashes, self.hashes)
+
+        self.chunks.append(rows[is_new])
+        self.hashes = np.concatenate([self.hashes, hashes[is_new]])
+        n_added = int(is_new.sum())
+        self.n_rows += n_added
+        return n_added
+
+    def to_frame(self) -> pd.DataFrame | None:
+        """
+        Concatenate the accepted rows.
+
+        Returns:
+            DataFrame of the accepted rows, None if nothing was added
+        """
+        if not self.chunks:
+            return None
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore",
+                category=FutureWarning,
+                message=".*behavior of DataFrame concatenation with empty or all-NA entries.*",
+            )
+            return pd.concat(self.chunks, axis=0, ignore_index=True)
+
+
+class _PushdownPlan:
+    """
+    Conditions of resample_until_satisfy pushed down into the synthesizer.
+
+    Value combinations of the pushdown fields are counted, as sampled by
+        the synthesizer before postprocessing, on the rows of unconditioned
+        batches passing the pushed down constraints only. Once min_rows rows
+        are counted, batches are sampled on these combinations in proportion to
+        their counts, which is the distribution of the synthesizer restricted
+        to these constraints. Constraints are still applied to reject the
+        remaining violations, the same as rejection sampling would.
+
+    A share of every batch is still sampled without conditions,
+        so the counts keep growing and combinations unseen so far can appear.
+    """
+
+    def __init__(self, fields: list[str], min_rows: int, max_conditions: int):
+        self.fields: list[str] = fields
+        self.min_rows: int = min_rows
+        self.max_conditions: int = max_conditions
+        self.n_rows: int = 0
+        self.counts: pd.Series | None = None
+        self.disabled: bool = False
+
+    @property
+    def active(self) -> bool:
+        """Whether batches are sampled conditionally"""
+        return not self.disabled and self.n_rows >= self.min_rows
+
+    def observe(self, raw_fields: pd.DataFrame, kept: np.ndarray) -> None:
+        """
+        Count the value combinations of the rows kept by the pushed down constraints.
+
+        Args:
+            raw_fields: Pushdown fields of an unconditioned batch before postprocessing
+            kept: Positions of the rows kept by the pushed down constraints
+        """
+        if len(kept) == 0:
+            return
+
+        counts = raw_fields.iloc[kept].value_counts(dropna=False)
+        if self.counts is not None:
+            counts = (
+                pd.concat([self.counts, counts])
+                .groupby(level=list(range(counts.index.nlevels)), dropna=False)
+                .sum()
+            )
+        self.counts = counts[counts > 0]
+        self.n_rows += len(kept)
+        if len(self.counts) > self.max_conditions:
+            self.disabled = True
+
+    def allocate(
+        self, num_rows: int, rng: np.random.Generator, n_parts: int
+    ) -> list[list[dict]]:
+        """
+        Draw the rows of each combination, split into n_parts lists of conditions.
+
+        Args:
+            num_rows: Number of rows to sample
+            rng: Random generator
+            n_parts: Number of parts, one per worker
+
+        Returns:
+            Conditions of synthesizer.sample_from_conditions of each part
+        """
+        weights = self.counts.to_numpy(dtype=float)
+        rows = rng.multinomial(num_rows, weights / weights.sum())
+
+        parts: list[list[dict]] = [[] for _ in range(n_parts)]
+        offset = 0
+        for values, n_rows in zip(self.counts.index, rows, strict=True):
+            if not isinstance(values, tuple):
+                # Index of a single field
+                values = (values,)
+            quotient, remainder = divmod(int(n_rows), n_parts)
+            for part in range(n_parts):
+                part_rows = quotient + ((part - offset) % n_parts < remainder)
+                if part_rows > 0:
+                    parts[part].append(
+                        {
+                            "num_rows": part_rows,
+                            "column_values": dict(
+                                zip(self.fields, values, strict=True)
+                            ),
+                        }
+                    )
+            offset = (offset + remainder) % n_parts
+        return [conditions for conditions in parts if conditions]
 
 
 class Constrainer:
@@ -23,6 +314,19 @@ class Constrainer:
         "field_proportions": FieldProportionsConstrainer,
     }
 
+    # Margin on the rows estimated by the acceptance rate in resample_until_satisfy
+    RESAMPLE_SAFETY_FACTOR: float = 1.2
+    # Largest growth of the batch between two trials of resample_until_satisfy
+    RESAMPLE_MAX_GROWTH: int = 10
+    # Consecutive trials without new rows before resample_until_satisfy gives up
+    RESAMPLE_MAX_STALLED_TRIALS: int = 5
+    # Rows passing the pushed down constraints counted before pushing them down
+    PUSHDOWN_MIN_ROWS: int = 100
+    # Share of the pushed down batches still sampled without conditions
+    PUSHDOWN_EXPLORE_SHARE: float = 0.1
+    # Most value combinations of the pushdown fields sampled as conditions
+    PUSHDOWN_MAX_CONDITIONS: int = 1000
+
     def __init__(self, config: dict):
         """
         Initialize with full constraint configuration
@@ -39,6 +343,12 @@ class Constrainer:
             resample_trails (int):
                 Number of trials to reach the target number of rows,
                 set after calling resample_until_satisfy
+            resample_acceptance_rate (float):
+                Share of the sampled rows satisfying all constraints,
+                set after calling resample_until_satisfy
+            resample_pushdown_fields (list[str]):
+                Fields pushed down into conditional sampling,
+                set after calling resample_until_satisfy
         """
         if not isinstance(config, dict):
             raise ValueError("Config must be a dictionary")
@@ -47,6 +357,8 @@ class Constrainer:
         self._setup_constrainers()
 
         self.resample_trails = None
+        self.resample_acceptance_rate = None
+        self.resample_pushdown_fields = None
 
     def _setup_constrainers(self):
         """Initialize all constraint instances"""
@@ -66,6 +378,13 @@ class Constrainer:
         """
         Apply all constraints in sequence
 
+        Filtering constraints are evaluated as keep-masks on the shared input
+            and combined, the filtered DataFrame is materialized once,
+            then the transforming actions (NaN erase / copy) run on it in place.
+            It is materialized earlier only when a constraint reads fields
+            written by a preceding transform, or has no keep-mask
+            (e.g. field proportions, which select rows by their counts).
+
         Args:
             df: Input DataFrame
             target_rows: Target number of rows (used internally by resample_until_satisfy)
@@ -73,14 +392,97 @@ class Constrainer:
         Returns:
             DataFrame after applying all constraints
         """
-        result = df.copy()
+        result: pd.DataFrame = df
+        mask: np.ndarray | None = None
+        pending: list = []  # transforming constrainers not yet run on result
+        written: set[str] = set()
         for _constraint_type, constrainer in self._constrainers.items():
             # Set target rows for field proportions constrainer if needed
             if _constraint_type == "field_proportions" and target_rows is not None:
                 constrainer._set_target_rows(target_rows)
-            result = constrainer.apply(result)
+
+            keep_mask = getattr(constrainer, "keep_mask", None)
+            if keep_mask is not None and written:
+                fields = getattr(constrainer, "mask_fields", lambda: None)()
+                if fields is None or written.intersection(fields):
+                    # The mask has to see the transformed values
+                    result = self._materialize(result, mask, pending)
+                    mask, pending, written = None, [], set()
+
+            constraint_mask = None if keep_mask is None else keep_mask(result)
+            if constraint_mask is None:
+                result = self._materialize(result, mask, pending)
+                mask, pending, written = None, [], set()
+                result = constrainer.apply(result)
+                continue
+
+            mask = constraint_mask if mask is None else mask & constraint_mask
+            transform_fields = getattr(constrainer, "transform_fields", list)()
+            if transform_fields:
+                pending.append(constrainer)
+                written.update(transform_fields)
+
+        result = self._materialize(result, mask, pending)
+        return df.copy() if result is df else result
+
+    @staticmethod
+    def _materialize(
+        result: pd.DataFrame, mask: np.ndarray | None, pending: list
+    ) -> pd.DataFrame:
+        """
+        Filter result by the combined keep-mask with a single copy,
+            then run the pending transforms on the copy in place.
+
+        Args:
+            result: Data the mask and transforms refer to, never modified
+            mask: Combined keep-mask, None if no keep-mask was evaluated
+            pending: Constrainers whose transform has not run yet,
+                always empty when mask is None
+
+        Returns:
+            Filtered DataFrame with a RangeIndex, or result if mask is None
+        """
+        if mask is None:
+            return result
+
+        result = result.take(np.flatnonzero(mask))
+        result.index = pd.RangeIndex(len(result))
+        for constrainer in pending:
+            constrainer.transform(result)
         return result
 
+    def _pushdown_fields(self) -> list[str]:
+        """
+        Fields of the constraints which can be pushed down into conditional sampling
+
+        Returns:
+            list of field names
+        """
+        fields: list[str] = []
+        for constrainer in self._constrainers.values():
+            for field in getattr(constrainer, "pushdown_fields", list)():
+                if field not in fields:
+                    fields.append(field)
+        return fields
+
+    def _pushdown_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Rows kept by the constraints which can be pushed down into conditional sampling
+
+        Args:
+            df: Input DataFrame
+
+        Returns:
+            Boolean array of length len(df)
+        """
+        mask: np.ndarray = np.ones(len(df), dtype=bool)
+        for constrainer in self._constrainers.values():
+            pushdown_mask = getattr(constrainer, "pushdown_mask", None)
+            constraint_mask = None if pushdown_mask is None else pushdown_mask(df)
+            if constraint_mask is not None:
+                mask &= constraint_mask
+        return mask
+
     @classmethod
     def register(cls, name: str, constraint_class: type):
         """
@@ -103,38 +505,69 @@ class Constrainer:
         max_trials: int = 300,
         sampling_ratio: float = 10.0,
         verbose_step: int = 10,
+        n_jobs: int = 1,
+        pushdown: bool = False,
     ) -> pd.DataFrame:
         """
         Resample data until meeting the constraints with target number of rows.
 
+        The acceptance rate of the constraints is estimated online,
+            so each trial generates about the rows needed to reach the target.
+            Accepted rows are collected and concatenated once at the end.
+
+        With pushdown, equality and membership constraints (see pushdown_fields
+            of each constrainer) are pushed down into the conditional sampling
+            of the synthesizer once PUSHDOWN_MIN_ROWS generated rows satisfy them.
+            Value combinations of these fields are sampled in proportion to how
+            often the synthesizer generates them among the rows satisfying these
+            constraints, so the result follows the same distribution as rejection
+            sampling. PUSHDOWN_EXPLORE_SHARE of each batch is still sampled without
+            conditions to keep counting the combinations. Other constraints are
+            still enforced by rejection, as are all constraints if the synthesizer
+            has no conditional sampling.
+
         Args:
             data: Input DataFrame to be constrained
             target_rows: Number of rows to achieve
             synthesizer: Synthesizer instance for generating synthetic data
             postprocessor: Optional postprocessor for data transformation
             max_trials: Maximum number of trials before giving up
-            sampling_ratio: Multiple of target_rows to generate in each trial.
-                    Default is 10.0, meaning it will generate 10x the target rows
-                    to compensate for data loss during constraint filtering.
+            sampling_ratio: Multiple of target_rows to generate in the first trial,
+                    before any acceptance rate is known. Default is 10.0.
+                    Later trials are sized by the estimated acceptance rate,
+                    growing at most RESAMPLE_MAX_GROWTH times per trial,
+                    up to RESAMPLE_MAX_GROWTH times the first batch
+                    (or target_rows if larger).
             verbose_step: Print progress every verbose_step trials. Default is 10.
+            n_jobs: Number of worker processes generating the batch of each trial
+                    concurrently, -1 means all CPUs. Default is 1 (serial).
+            pushdown: Push equality and membership constraints down into
+                    conditional sampling of the synthesizer. Default is False.
 
         Attr:
             resample_trails (int): Number of trials to reach the target number of rows
+            resample_acceptance_rate (float):
+                Share of the sampled rows satisfying all constraints
+            resample_pushdown_fields (list[str]):
+                Fields pushed down into conditional sampling, empty if none
 
         Returns:
             DataFrame that satisfies all constraints with target number of rows
 
         Raises:
-            ValueError: If data is empty or synthesizer is None
+            ValueError: If data is empty, synthesizer is None or n_jobs is invalid
         """
         # Input validation
         if len(data) == 0:
             raise ValueError("Empty DataFrame is not allowed")
         if synthesizer is None:
             raise ValueError("Synthesizer cannot be None")
+        if not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+            raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs}")
 
         self.resample_trails = 0
-        result_df = None
+        self.resample_acceptance_rate = None
+        accepted = _AcceptedRows()
         remain_rows = target_rows - data.shape[0]
 
         if remain_rows <= 0:
@@ -149,73 +582,191 @@ class Constrainer:
                 return result
             elif constrained_data.shape[0] > 0:
                 # If we have some rows but not enough, continue with resampling
-                result_df = constrained_data
-                remain_rows = target_rows - constrained_data.shape[0]
+                accepted.add(constrained_data)
+                remain_rows = target_rows - accepted.n_rows
             else:
                 # If no rows remain after constraints, start fresh with resampling
-                result_df = None
                 remain_rows = target_rows
 
-        while remain_rows > 0:
-            self.resample_trails += 1
-            if self.resample_trails >= max_trials:
-                warnings.warn(
-                    f"Maximum trials ({max_trials}) reached but only got {result_df.shape[0] if result_df is not None else 0} rows",
-                    stacklevel=2,
+        plan = None
+        if pushdown and callable(getattr(synthesizer, "sample_from_conditions", None)):
+            pushdown_fields = self._pushdown_fields()
+            if pushdown_fields:
+                plan = _PushdownPlan(
+                    pushdown_fields,
+                    self.PUSHDOWN_MIN_ROWS,
+                    self.PUSHDOWN_MAX_CONDITIONS,
                 )
-                break
-
-            # Generate new samples
-            synthesizer.config.update(
-                {
-                    "sample_from": "Constrainter",
-                    "sample_num_rows": int(target_rows * sampling_ratio),
-                }
-            )
-
-            new_samples = synthesizer.sample()
+        self.resample_pushdown_fields = []
+
+        n_generated = 0
+        n_sampled_accepted = 0
+        n_total_generated = 0
+        n_total_satisfied = 0
+        batch_rows = max(int(target_rows * sampling_ratio), 1)
+        max_batch_rows = max(batch_rows, target_rows) * self.RESAMPLE_MAX_GROWTH
+        n_stalled_trials = 0
+        seeds = np.random.default_rng(42)
+        with _resample_pool(synthesizer, postprocessor, n_jobs) as (pool, n_workers):
+
+            def generate(num_rows, conditions=None, keep_fields=None):
+                if pool is None:
+                    return _generate_batch(
+                        synthesizer,
+                        postprocessor,
+                        num_rows,
+                        None if conditions is None else conditions[0],
+                        keep_fields,
+                    )
 
-            # Apply postprocessor if provided
-            if postprocessor is not None:
-                new_samples = postprocessor.inverse_transform(new_samples)
+                if conditions is None:
+                    quotient, remainder = divmod(num_rows, n_workers)
+                    sizes = [
+                        quotient + (worker < remainder)
+                        for worker in range(min(n_workers, num_rows))
+                    ]
+                    conditions = [None] * len(sizes)
+                else:
+                    sizes = [
+                        sum(condition["num_rows"] for condition in part)
+                        for part in conditions
+                    ]
+                batches = list(
+                    pool.map(
+                        _generate_batch_in_worker,
+                        sizes,
+                        seeds.integers(2**32, size=len(sizes)).tolist(),
+                        conditions,
+                        [keep_fields] * len(sizes),
+                    )
+                )
+                raw_fields = [raw for _, raw in batches]
+                return (
+                    pd.concat(
+                        [samples for samples, _ in batches],
+                        axis=0,
+                        ignore_index=True,
+                    ),
+                    None
+                    if any(raw is None for raw in raw_fields)
+                    else pd.concat(raw_fields, axis=0, ignore_index=True),
+                )
 
-            # Apply constraints
-            filtered_samples = self.apply(new_samples, target_rows)
+            while remain_rows > 0:
+                self.resample_trails += 1
+                if self.resample_trails >= max_trials:
+                    warnings.warn(
+                        f"Maximum trials ({max_trials}) reached but only got {accepted.n_rows} rows",
+                        stacklevel=2,
+                    )
+                    break
+
+                if n_generated > 0:
+                    # Size the batch to reach the target by the estimated acceptance rate
+                    acceptance_rate = (n_sampled_accepted + 1) / (n_generated + 1)
+                    batch_rows = min(
+                        math.ceil(
+                            remain_rows / acceptance_rate * self.RESAMPLE_SAFETY_FACTOR
+                        ),
+                        batch_rows * self.RESAMPLE_MAX_GROWTH,
+                        max_batch_rows,
+                    )
 
-            # Combine with existing results
-            if result_df is None:
-                result_df = filtered_samples
-            else:
-                with warnings.catch_warnings():
-                    warnings.filterwarnings(
-                        "ignore",
-                        category=FutureWarning,
-                        message=".*behavior of DataFrame concatenation with empty or all-NA entries.*",
+                # Generate new samples
+                conditional_samples = None
+                unconditioned_rows = batch_rows
+                was_active = plan is not None and plan.active
+                if was_active:
+                    unconditioned_rows = max(
+                        math.ceil(batch_rows * self.PUSHDOWN_EXPLORE_SHARE), 1
+                    )
+                    conditions = plan.allocate(
+                        batch_rows - unconditioned_rows,
+                        seeds,
+                        1 if pool is None else n_workers,
                     )
+                    try:
+                        if conditions:
+                            conditional_samples, _ = generate(0, conditions)
+                    except (UnsupportedMethodError, UnableToSynthesizeError) as e:
+                        warnings.warn(
+                            f"Conditional sampling failed, falling back to rejection sampling: {e}",
+                            stacklevel=2,
+                        )
+                        plan.disabled = True
+                        unconditioned_rows = batch_rows
 
-                    result_df = (
-                        pd.concat(
-                            [result_df, filtered_samples],
-                            axis=0,
-                            ignore_index=True,
+                keep_fields = (
+                    plan.fields if plan is not None and not plan.disabled else None
+                )
+                new_samples, raw_fields = generate(
+                    unconditioned_rows, keep_fields=keep_fields
+                )
+                if keep_fields is not None:
+                    if raw_fields is None or len(raw_fields) != len(new_samples):
+                        # The synthesizer does not generate the fields as constrained,
+                        #   or the postprocessor changed the rows
+                        plan.disabled = True
+                    else:
+                        plan.observe(
+                            raw_fields, np.flatnonzero(self._pushdown_mask(new_samples))
                         )
-                        .drop_duplicates()
-                        .reset_index(drop=True)
+                if conditional_samples is not None:
+                    new_samples = pd.concat(
+                        [conditional_samples, new_samples], axis=0, ignore_index=True
                     )
 
-            # Check if we have enough rows
-            if result_df.shape[0] >= target_rows:
-                # Randomly select target number of rows
-                result_df = result_df.sample(
-                    n=target_rows, random_state=42
-                ).reset_index(drop=True)
-                remain_rows = 0
-            else:
-                remain_rows = target_rows - result_df.shape[0]
+                # Apply constraints
+                filtered_samples = self.apply(new_samples, target_rows)
 
-            if verbose_step > 0 and self.resample_trails % verbose_step == 0:
-                print(
-                    f"Trial {self.resample_trails}: Got {result_df.shape[0] if result_df is not None else 0} rows, need {remain_rows} more"
+                n_generated += len(new_samples)
+                n_added = accepted.add(filtered_samples)
+                n_sampled_accepted += n_added
+                n_total_generated += len(new_samples)
+                n_total_satisfied += len(filtered_samples)
+                self.resample_acceptance_rate = n_total_satisfied / max(
+                    n_total_generated, 1
                 )
+                remain_rows = max(target_rows - accepted.n_rows, 0)
+
+                if plan is not None and plan.active != was_active:
+                    # Acceptance rates of the other sampling mode no longer apply
+                    n_generated = 0
+                    n_sampled_accepted = 0
+                    if plan.active:
+                        self.resample_pushdown_fields = list(plan.fields)
+                        batch_rows = min(
+                            max(
+                                math.ceil(remain_rows * self.RESAMPLE_SAFETY_FACTOR), 1
+                            ),
+                            max_batch_rows,
+                        )
+
+                if verbose_step > 0 and self.resample_trails % verbose_step == 0:
+                    print(
+                        f"Trial {self.resample_trails}: Got {accepted.n_rows} rows, need {remain_rows} more, "
+                        f"acceptance rate {self.resample_acceptance_rate:.2%}"
+                    )
+
+                n_stalled_trials = 0 if n_added > 0 else n_stalled_trials + 1
+                if (
+                    remain_rows > 0
+                    and n_stalled_trials >= self.RESAMPLE_MAX_STALLED_TRIALS
+                ):
+                    # e.g. the synthesizer generates fewer distinct feasible rows
+                    #   than the target, larger batches would not help
+                    warnings.warn(
+                        f"No new rows in {n_stalled_trials} consecutive trials, "
+                        f"stopping with only {accepted.n_rows} rows",
+                        stacklevel=2,
+                    )
+                    break
+
+        result_df = accepted.to_frame()
+        if result_df is not None and result_df.shape[0] >= target_rows:
+            # Randomly select target number of rows
+            result_df = result_df.sample(n=target_rows, random_state=42).reset_index(
+                drop=True
+            )
 
         return result_df
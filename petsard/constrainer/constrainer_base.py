@@ -1,6 +1,7 @@
 import warnings
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
 
 
@@ -21,6 +22,71 @@ class BaseConstrainer(ABC):
         """Apply the constraint to the data"""
         pass
 
+    def keep_mask(self, df: pd.DataFrame) -> np.ndarray | None:
+        """
+        Boolean mask of the rows kept by the constraint, without copying df.
+            Constraints which cannot be evaluated row by row return None,
+            then Constrainer materializes the data and calls apply() instead.
+
+        Args:
+            df: Input DataFrame
+
+        Returns:
+            Boolean array of length len(df), or None
+        """
+        return None
+
+    def mask_fields(self) -> list[str] | None:
+        """
+        Fields read by keep_mask()
+
+        Returns:
+            list of field names, None if unknown
+        """
+        return None
+
+    def transform(self, df: pd.DataFrame) -> None:
+        """
+        Modify the rows kept by keep_mask() in place, e.g. erase or copy values
+
+        Args:
+            df: DataFrame already filtered by keep_mask(), owned by the caller
+        """
+        return None
+
+    def transform_fields(self) -> list[str]:
+        """
+        Fields written by transform()
+
+        Returns:
+            list of field names
+        """
+        return []
+
+    def pushdown_fields(self) -> list[str]:
+        """
+        Fields whose constraint depends only on a few discrete values,
+            so it can be pushed down into conditional sampling.
+            Constraints without such fields are only enforced by rejection.
+
+        Returns:
+            list of field names
+        """
+        return []
+
+    def pushdown_mask(self, df: pd.DataFrame) -> np.ndarray | None:
+        """
+        Boolean mask of the rows kept by the constraints on the pushdown fields only,
+            i.e. the part of keep_mask() enforced by conditional sampling.
+
+        Args:
+            df: Input DataFrame
+
+        Returns:
+            Boolean array of length len(df), or None without pushdown fields
+        """
+        return None
+
     def _check_columns_exist(self, df: pd.DataFrame, columns: list[str]) -> bool:
         """
         Check if all columns exist in DataFrame
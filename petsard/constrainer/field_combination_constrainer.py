@@ -1,5 +1,6 @@
 from typing import List
 
+import numpy as np
 import pandas as pd
 
 from petsard.exceptions import ConfigError
@@ -42,6 +43,7 @@ class FieldCombinationConstrainer:
         """
         self._validate_constraint_format(constraints)
         self.constraints = constraints
+        self._rule_tables: list[dict] = self._compile_rule_tables()
 
     def _validate_constraint_format(self, constraints):
         """
@@ -158,9 +160,197 @@ class FieldCombinationConstrainer:
                     f"Columns {missing_fields} do not exist in the DataFrame"
                 )
 
+    def _compile_rule_tables(self) -> list[dict]:
+        """
+        Compile each constraint group into lookup frames once
+
+        Returns:
+            List of rule tables, one per constraint group, with keys:
+                - source_fields: Tuple of source field names
+                - target_field: Target field name
+                - sources: DataFrame of constrained source value tuples
+                - rules: DataFrame of allowed (source values..., target value) tuples
+        """
+        rule_tables: list[dict] = []
+        for field_map, conditions in self.constraints:
+            source_fields = list(field_map.keys())[0]
+            target_field = list(field_map.values())[0]
+
+            # Ensure source_fields is a tuple
+            if isinstance(source_fields, str):
+                source_fields = (source_fields,)
+            n_fields: int = len(source_fields)
+
+            sources: list[tuple] = []
+            rules: list[tuple] = []
+            for source_values, allowed_values in conditions.items():
+                if not isinstance(source_values, tuple):
+                    source_values = (source_values,)
+                source_values = source_values[:n_fields]
+
+                # 規範化允許值為列表
+                if not isinstance(allowed_values, (list, tuple)):
+                    allowed_values = [allowed_values]
+
+                sources.append(source_values)
+                rules.extend((*source_values, value) for value in allowed_values)
+
+            # Positional column names, as source and target fields may repeat
+            source_columns: list[int] = list(range(n_fields))
+            rule_tables.append(
+                {
+                    "source_fields": source_fields,
+                    "target_field": target_field,
+                    "sources": pd.DataFrame(
+                        sources, columns=source_columns, dtype=object
+                    ),
+                    "rules": pd.DataFrame(
+                        rules, columns=[*source_columns, n_fields], dtype=object
+                    ),
+                }
+            )
+
+        return rule_tables
+
+    def _encode(
+        self, column: pd.Series, values: pd.Series, is_source: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Factorize a column and map rule values onto the same codes
+
+        Args:
+            column: Column of the DataFrame
+            values: Rule values to be matched against the column
+            is_source: Whether the column is a source field.
+                Source fields match "pd.NA" to NA and compare category as string,
+                target fields match NA values as isin() does.
+
+        Returns:
+            Tuple of (column codes, value codes).
+                NA in the column has its own code, unmatched values are -1.
+        """
+        codes, uniques = pd.factorize(column)
+        uniques = pd.Index(uniques)
+
+        # 對於 category 類型，先轉換為字符串再比較
+        as_str: bool = is_source and isinstance(column.dtype, pd.CategoricalDtype)
+        if as_str:
+            str_codes, uniques = pd.factorize(uniques.astype(str))
+            codes = np.where(codes < 0, -1, str_codes[codes])
+
+        na_code: int = len(uniques)
+        column_codes: np.ndarray = np.where(codes < 0, na_code, codes)
+
+        if is_source:
+            is_na = values.map(self._is_na_value).to_numpy(dtype=bool)
+        else:
+            is_na = values.map(
+                lambda value: pd.api.types.is_scalar(value) and pd.isna(value)
+            ).to_numpy(dtype=bool)
+        lookup = values[~is_na]
+        if as_str:
+            lookup = lookup.map(str)
+
+        value_codes: np.ndarray = np.full(len(values), -1, dtype=np.int64)
+        value_codes[is_na] = na_code
+        if len(lookup):
+            value_codes[~is_na] = uniques.get_indexer(pd.Index(lookup, dtype=object))
+
+        return column_codes, value_codes
+
+    @staticmethod
+    def _combine_codes(key: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """
+        Combine two code arrays into dense keys of their pairs.
+            -1 (unmatched) codes never collide with codes of the DataFrame.
+
+        Args:
+            key: Current key codes
+            codes: Codes to be combined, -1 for unmatched
+
+        Returns:
+            Dense int64 keys of (key, codes) pairs
+        """
+        radix: int = int(codes.max(initial=0)) + 2
+        combined: np.ndarray = key.astype(np.int64) * radix + (codes + 1)
+        return pd.factorize(combined)[0]
+
+    def _apply_rule_table(self, df: pd.DataFrame, rule_table: dict) -> np.ndarray:
+        """
+        Validate rows against a rule table by membership of factorized keys
+
+        Args:
+            df: Input DataFrame
+            rule_table: Compiled rule table of a constraint group
+
+        Returns:
+            Boolean mask of rows to keep:
+                - rows whose source values are not constrained
+                - rows whose (source values, target value) tuple is allowed
+        """
+        n_rows: int = len(df)
+        sources: pd.DataFrame = rule_table["sources"]
+        rules: pd.DataFrame = rule_table["rules"]
+        n_sources: int = len(sources)
+
+        # Source keys of rows, constrained sources and allowed rules in one array
+        key: np.ndarray = np.zeros(n_rows + n_sources + len(rules), dtype=np.int64)
+        for i, field in enumerate(rule_table["source_fields"]):
+            column_codes, value_codes = self._encode(
+                df[field],
+                pd.concat([sources[i], rules[i]], ignore_index=True),
+                is_source=True,
+            )
+            key = self._combine_codes(key, np.concatenate([column_codes, value_codes]))
+
+        row_keys: np.ndarray = key[:n_rows]
+        source_keys: np.ndarray = key[n_rows : n_rows + n_sources]
+        rule_keys: np.ndarray = key[n_rows + n_sources :]
+
+        # 找到匹配源值的行
+        constrained: np.ndarray = np.zeros(key.max(initial=-1) + 1, dtype=bool)
+        constrained[source_keys] = True
+        source_mask: np.ndarray = constrained[row_keys]
+
+        # 檢查 (源值, 目標值) 是否為允許的組合
+        column_codes, value_codes = self._encode(
+            df[rule_table["target_field"]],
+            rules[len(rule_table["source_fields"])],
+            is_source=False,
+        )
+        pair_key: np.ndarray = self._combine_codes(
+            np.concatenate([row_keys, rule_keys]),
+            np.concatenate([column_codes, value_codes]),
+        )
+        allowed: np.ndarray = np.zeros(pair_key.max(initial=-1) + 1, dtype=bool)
+        allowed[pair_key[n_rows:]] = True
+        value_mask: np.ndarray = allowed[pair_key[:n_rows]]
+
+        # - 源不匹配的行保留
+        # - 源匹配且目標合法的行保留
+        # - 源匹配但目標不合法的行移除
+        return ~source_mask | value_mask
+
+    def pushdown_fields(self) -> list[str]:
+        """
+        Source and target fields of all constraint groups,
+            as their allowed combinations are enumerated by the rules
+
+        Returns:
+            list of field names
+        """
+        fields: list[str] = []
+        for rule_table in self._rule_tables:
+            for field in (*rule_table["source_fields"], rule_table["target_field"]):
+                if field not in fields:
+                    fields.append(field)
+        return fields
+
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Apply field combination constraints to DataFrame
+        Apply field combination constraints to DataFrame.
+            Each rule table is validated by one membership test of factorized
+            keys, and the DataFrame is filtered once for all constraint groups.
 
         Args:
             df: Input DataFrame to be filtered
@@ -171,62 +361,56 @@ class FieldCombinationConstrainer:
         Raises:
             ConfigError: If configuration is incompatible with the DataFrame
         """
-        # Perform complete validation before applying constraints
-        self.validate_config(df)
-
-        result = df.copy()
+        return df.loc[self.keep_mask(df)].reset_index(drop=True)
 
-        for constraint_group in self.constraints:
-            # Parse source and target fields from the constraint
-            field_map, conditions = constraint_group
+    def keep_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Combine the membership tests of all rule tables into one mask.
 
-            # Extract source and target fields
-            source_fields = list(field_map.keys())[0]
-            target_field = list(field_map.values())[0]
+        Args:
+            df: Input DataFrame
 
-            # Ensure source_fields is a tuple
-            if isinstance(source_fields, str):
-                source_fields = (source_fields,)
+        Returns:
+            Boolean array of the rows meeting all constraints
 
-            # 初始化掩碼 - 默認保留所有行
-            mask = pd.Series(True, index=result.index)
+        Raises:
+            ConfigError: If configuration is incompatible with the DataFrame
+        """
+        # Perform complete validation before applying constraints
+        self.validate_config(df)
 
-            # 對每個源值-目標值對應關係
-            for source_values, allowed_values in conditions.items():
-                if isinstance(source_values, str):
-                    source_values = (source_values,)
+        mask: np.ndarray = np.ones(len(df), dtype=bool)
+        for rule_table in self._rule_tables:
+            mask &= self._apply_rule_table(df, rule_table)
 
-                # 找到匹配源值的行
-                source_mask = pd.Series(True, index=result.index)
-                for field, value in zip(source_fields, source_values):
-                    if self._is_na_value(value):
-                        field_match = result[field].isna()
-                    else:
-                        # 對於 category 類型，先轉換為字符串再比較
-                        if isinstance(result[field].dtype, pd.CategoricalDtype):
-                            field_match = result[field].astype(str) == str(value)
-                        else:
-                            field_match = result[field] == value
+        return mask
 
-                    source_mask &= field_match
+    def pushdown_mask(self, df: pd.DataFrame) -> np.ndarray | None:
+        """
+        Every rule table is on the pushdown fields, so this is keep_mask()
 
-                # 規範化允許值為列表
-                if not isinstance(allowed_values, (list, tuple)):
-                    allowed_values = [allowed_values]
+        Args:
+            df: Input DataFrame
 
-                # 檢查目標值
-                value_mask = result[target_field].isin(allowed_values)
+        Returns:
+            Boolean array of the rows meeting all constraints,
+                None if there are no constraint groups
+        """
+        return self.keep_mask(df) if self._rule_tables else None
 
-                # 更清晰的邏輯：
-                # - 源不匹配的行保留
-                # - 源匹配且目標合法的行保留
-                # - 源匹配但目標不合法的行移除
-                row_mask = (~source_mask) | (source_mask & value_mask)
+    def mask_fields(self) -> list[str]:
+        """
+        Fields read by keep_mask(), the same as the pushdown fields
 
-                # 更新總掩碼
-                mask &= row_mask
+        Returns:
+            list of field names
+        """
+        return self.pushdown_fields()
 
-            # 應用掩碼
-            result = result[mask].reset_index(drop=True)
+    def transform(self, df: pd.DataFrame) -> None:
+        """Field combinations only filter rows"""
+        pass
 
-        return result
+    def transform_fields(self) -> list[str]:
+        """Field combinations only filter rows"""
+        return []
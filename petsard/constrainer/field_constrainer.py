@@ -1,6 +1,10 @@
+import operator
 import re
 import warnings
+from collections.abc import Callable, Iterable
+from functools import reduce
 
+import numpy as np
 import pandas as pd
 
 from petsard.constrainer.constrainer_base import BaseConstrainer
@@ -17,11 +21,53 @@ class FieldConstrainer(BaseConstrainer):
     # Regex pattern for operators
     OPERATOR_PATTERN = r"(?:<=|>=|==|!=|<|>|&|\||IS(?:\s+NOT)?)"
 
+    COMPARISON_FUNCS = {
+        ">": operator.gt,
+        ">=": operator.ge,
+        "<": operator.lt,
+        "<=": operator.le,
+        "==": operator.eq,
+        "!=": operator.ne,
+    }
+
     def __init__(self, config):
         super().__init__(config)
         self._validate_config_structure()  # Perform basic structure validation during initialization
         self._validate_syntax()  # Perform syntax validation during initialization
 
+        # Compile each constraint once into a predicate: DataFrame -> boolean mask
+        self._predicates: list[Callable[[pd.DataFrame], pd.Series]] = (
+            self._compile_predicates()
+        )
+
+    def __getstate__(self) -> dict:
+        """
+        Drop the compiled predicates when pickling, as closures cannot be pickled.
+            They are recompiled from config by __setstate__.
+        """
+        state = self.__dict__.copy()
+        state.pop("_predicates", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore the state and recompile the predicates.
+        """
+        self.__dict__.update(state)
+        self._predicates = self._compile_predicates()
+
+    def _compile_predicates(self) -> list[Callable[[pd.DataFrame], pd.Series]]:
+        """
+        Compile each constraint of config into a predicate.
+
+        Returns:
+            Predicates mapping a DataFrame to its boolean mask, one per constraint
+        """
+        return [
+            self._compile_expression(self._tokenize(constraint))
+            for constraint in self.config
+        ]
+
     def _validate_config_structure(self) -> None:
         """
         Validate the basic structure of configuration during initialization.
@@ -179,10 +225,76 @@ class FieldConstrainer(BaseConstrainer):
 
         return list(set(fields))
 
+    def pushdown_fields(self) -> list[str]:
+        """
+        Fields of the constraints made only of equality tests against literals,
+            e.g. "job == 'Engineer'" or "(education == 'PhD') | (education IS pd.NA)".
+
+        Returns:
+            list of field names
+        """
+        fields: list[str] = []
+        for constraint in self.config:
+            for field in self._equality_fields(self._tokenize(constraint)) or []:
+                if field not in fields:
+                    fields.append(field)
+        return fields
+
+    def _equality_fields(self, tokens: list) -> list[str] | None:
+        """
+        Fields of a constraint if all its comparisons are "field == literal"
+            or "field IS pd.NA", combined by "&", "|" and parentheses.
+
+        Args:
+            tokens: List of tokens of the constraint
+
+        Returns:
+            list of field names, None if the constraint has other comparisons
+        """
+        operands: list[str] = [
+            token for token in tokens if token not in ("(", ")", "&", "|")
+        ]
+        if len(operands) % 3 != 0:
+            return None
+
+        fields: list[str] = []
+        for i in range(0, len(operands), 3):
+            left, op, right = operands[i : i + 3]
+            if self._is_literal(left):
+                return None
+            if not (
+                (op == "==" and self._is_literal(right))
+                or (op == "IS" and right == "pd.NA")
+            ):
+                return None
+            fields.append(left)
+        return fields
+
+    @staticmethod
+    def _is_literal(expr: str) -> bool:
+        """
+        Check whether an expression is a string, number or date literal
+
+        Args:
+            expr: Expression to check
+
+        Returns:
+            True if the expression is a literal
+        """
+        if re.match(r"^['\"](.+)['\"]$", expr) or expr.startswith("DATE("):
+            return True
+        try:
+            float(expr)
+        except ValueError:
+            return False
+        return True
+
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply field constraints to DataFrame.
         Performs validation before applying constraints.
+            The compiled predicates of all constraints are combined
+            into one mask, and the DataFrame is filtered once.
 
         Args:
             df: Input DataFrame to be filtered
@@ -190,30 +302,108 @@ class FieldConstrainer(BaseConstrainer):
         Returns:
             DataFrame: Filtered DataFrame based on constraints
 
+        Raises:
+            ConfigError: If any required columns are missing
+        """
+        return df.loc[self.keep_mask(df)].reset_index(drop=True)
+
+    def keep_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Combine the compiled predicates of all constraints into one mask.
+            Rows where a predicate is missing (pd.NA) are not kept.
+
+        Args:
+            df: Input DataFrame
+
+        Returns:
+            Boolean array of the rows satisfying all constraints
+
         Raises:
             ConfigError: If any required columns are missing
         """
         # Perform complete validation before applying constraints
         _ = self.validate_config(df)
 
-        result = df.copy()
-        for constraint in self.config:
-            tokens = self._tokenize(constraint)
-            involved_columns: list[str] = []
+        return self._combine_predicates(df, range(len(self.config)))
 
-            mask, involved_columns = self._parse_expression(
-                tokens.copy(), result, involved_columns
-            )
-            if mask is None:
+    def pushdown_mask(self, df: pd.DataFrame) -> np.ndarray | None:
+        """
+        Combine the predicates of the constraints on the pushdown fields only,
+            i.e. those made only of equality tests against literals.
+
+        Args:
+            df: Input DataFrame
+
+        Returns:
+            Boolean array of the rows satisfying these constraints,
+                None if there are no such constraints
+
+        Raises:
+            ConfigError: If any required columns are missing
+        """
+        indices: list[int] = [
+            i
+            for i, constraint in enumerate(self.config)
+            if self._equality_fields(self._tokenize(constraint)) is not None
+        ]
+        if not indices:
+            return None
+
+        _ = self.validate_config(df)
+
+        return self._combine_predicates(df, indices)
+
+    def _combine_predicates(
+        self, df: pd.DataFrame, indices: Iterable[int]
+    ) -> np.ndarray:
+        """
+        AND the compiled predicates of the constraints at the given indices.
+            Rows where a predicate is missing (pd.NA) are not kept.
+
+        Args:
+            df: Input DataFrame
+            indices: Positions of the constraints in the config
+
+        Returns:
+            Boolean array of the rows satisfying these constraints
+        """
+        mask: np.ndarray = np.ones(len(df), dtype=bool)
+        for i in indices:
+            constraint, predicate = self.config[i], self._predicates[i]
+            constraint_mask = predicate(df)
+            if constraint_mask is None:
                 warnings.warn(
                     f"Warning: Constraint '{constraint}' parsing failed", stacklevel=2
                 )
                 continue
 
-            # Apply the constraint
-            result = result.loc[mask].reset_index(drop=True)
+            mask &= constraint_mask.to_numpy(dtype=bool, na_value=False)
 
-        return result.reset_index(drop=True)
+        return mask
+
+    def mask_fields(self) -> list[str]:
+        """
+        Operands of the constraints which may refer to fields,
+            i.e. all tokens but operators, parentheses and string or date literals.
+            Numbers are included as field names take precedence over literals.
+
+        Returns:
+            list of field names
+        """
+        fields: list[str] = []
+        for constraint in self.config:
+            for token in map(str.strip, self._tokenize(constraint)):
+                if (
+                    token in self.ALL_OPERATORS
+                    or token in ("(", ")", "NOT", "pd.NA")
+                    or token.startswith("DATE(")
+                    or re.match(r"^['\"](.+)['\"]$", token)
+                ):
+                    continue
+                for field in map(str.strip, token.split("+")):
+                    if field not in fields:
+                        fields.append(field)
+        return fields
 
     def _tokenize(self, condition: str) -> list:
         """
@@ -310,22 +500,20 @@ class FieldConstrainer(BaseConstrainer):
 
         return [token for token in tokens if token.strip()]
 
-    def _get_value(
-        self, expr: str, df: pd.DataFrame, involved_columns: list[str]
-    ) -> tuple[pd.Series | float | str | None, list[str]]:
+    def _compile_value(self, expr: str) -> Callable[[pd.DataFrame], object]:
         """
-        Get value from expression. Handles fields, literals, and date functions.
+        Compile an expression into a function returning its value.
+            Handles fields, literals, and date functions.
 
         Args:
-            expr: Expression to evaluate (field name, literal value, or DATE function)
-            df: DataFrame containing the data
-            involved_columns: List of columns involved in the expression
+            expr: Expression to compile (field name, literal value, or DATE function)
 
         Returns:
-            Tuple of (evaluated value, updated involved columns)
+            Function of DataFrame returning the evaluated value
+                (pd.Series, float, str, pd.Timestamp or None)
         """
         if expr is None:
-            return None, involved_columns
+            return lambda df: None
 
         expr = expr.strip()
 
@@ -333,81 +521,85 @@ class FieldConstrainer(BaseConstrainer):
         date_match = re.match(r"DATE\((\d{4}-\d{2}-\d{2})\)", expr)
         if date_match:
             try:
-                date_str = date_match.group(1)
-                return pd.Timestamp(date_str), involved_columns
+                date_value = pd.Timestamp(date_match.group(1))
             except Exception as e:
                 print(f"Date parsing error: {e}")
-                return None, involved_columns
+                date_value = None
+            return lambda df: date_value
 
         # Handle string literals (text within quotes)
         string_match = re.match(r"^['\"](.+)['\"]$", expr)
         if string_match:
             # Return the string literal without quotes
-            return string_match.group(1), involved_columns
+            literal = string_match.group(1)
+            return lambda df: literal
 
         if "+" in expr:
             col1, col2 = map(str.strip, expr.split("+"))
+            return lambda df: self._add_columns(df, col1, col2)
 
-            if col1 not in df.columns or col2 not in df.columns:
+        try:
+            number: float | None = float(expr)
+        except ValueError:
+            number = None
+
+        def get_value(df: pd.DataFrame) -> object:
+            # Field names take precedence over literals
+            if expr in df.columns:
+                return df[expr]
+            if number is None and expr != "pd.NA":
                 warnings.warn(
-                    f"Warning: Column '{col1}' or '{col2}' does not exist",
-                    UserWarning,
-                    stacklevel=2,
+                    f"Warning: Cannot parse value '{expr}'", UserWarning, stacklevel=2
                 )
-                return None, involved_columns
-            involved_columns = list(set(involved_columns + [col1, col2]))
+            return number
 
-            try:
-                col1_data = df[col1].copy()
-                col2_data = df[col2].copy()
-
-                if isinstance(col1_data, pd.DatetimeIndex):
-                    col1_data = pd.Series(col1_data, index=df.index)
-                if isinstance(col2_data, pd.DatetimeIndex):
-                    col2_data = pd.Series(col2_data, index=df.index)
-
-                if pd.api.types.is_datetime64_any_dtype(
-                    col1_data.dtype
-                ) and pd.api.types.is_numeric_dtype(col2_data.dtype):
-                    result = col1_data + pd.to_timedelta(col2_data, unit="D")
-                elif pd.api.types.is_numeric_dtype(
-                    col1_data.dtype
-                ) and pd.api.types.is_datetime64_any_dtype(col2_data.dtype):
-                    result = col2_data + pd.to_timedelta(col1_data, unit="D")
-                else:
-                    result = col1_data + col2_data
-
-                return pd.Series(result, index=df.index), involved_columns
-
-            except Exception as e:
-                warnings.warn(
-                    f"Warning: Operation failed '{str(e)}'", UserWarning, stacklevel=2
-                )
-                return None, involved_columns
+        return get_value
 
-        if expr in df.columns:
-            col_data = df[expr].copy()
-            involved_columns = list(set(involved_columns + [expr]))
+    def _add_columns(self, df: pd.DataFrame, col1: str, col2: str) -> pd.Series | None:
+        """
+        Add two columns. Numbers added to a datetime column are taken as days.
 
-            if isinstance(col_data, pd.DatetimeIndex):
-                col_data = pd.Series(col_data, index=df.index)
+        Args:
+            df: DataFrame containing the data
+            col1: Left column name
+            col2: Right column name
 
-            return col_data, involved_columns
+        Returns:
+            Series of the sum, None if a column is missing or the addition failed
+        """
+        if col1 not in df.columns or col2 not in df.columns:
+            warnings.warn(
+                f"Warning: Column '{col1}' or '{col2}' does not exist",
+                UserWarning,
+                stacklevel=2,
+            )
+            return None
 
         try:
-            return float(expr), involved_columns
-        except Exception:
-            if expr != "pd.NA":
-                warnings.warn(
-                    f"Warning: Cannot parse value '{expr}'", UserWarning, stacklevel=2
-                )
-            return None, involved_columns
+            col1_data = df[col1]
+            col2_data = df[col2]
+
+            if pd.api.types.is_datetime64_any_dtype(
+                col1_data.dtype
+            ) and pd.api.types.is_numeric_dtype(col2_data.dtype):
+                return col1_data + pd.to_timedelta(col2_data, unit="D")
+            if pd.api.types.is_numeric_dtype(
+                col1_data.dtype
+            ) and pd.api.types.is_datetime64_any_dtype(col2_data.dtype):
+                return col2_data + pd.to_timedelta(col1_data, unit="D")
+            return col1_data + col2_data
+
+        except Exception as e:
+            warnings.warn(
+                f"Warning: Operation failed '{str(e)}'", UserWarning, stacklevel=2
+            )
+            return None
 
     def _process_comparison(
         self,
-        left: list[pd.Series | float],
+        left: pd.Series | float | None,
         op: str,
-        right: list[pd.Series | float],
+        right: pd.Series | float | None,
         df: pd.DataFrame,
     ) -> pd.Series:
         """
@@ -426,31 +618,15 @@ class FieldConstrainer(BaseConstrainer):
             if left is None or right is None:
                 return pd.Series(False, index=df.index)
 
-            if not isinstance(left, pd.Series):
-                left = pd.Series(left, index=df.index)
-            if not isinstance(right, pd.Series):
-                right = pd.Series(right, index=df.index)
-
-            left = left.reindex(df.index)
-            right = right.reindex(df.index)
-
-            if op == ">":
-                result = left > right
-            elif op == ">=":
-                result = left >= right
-            elif op == "<":
-                result = left < right
-            elif op == "<=":
-                result = left <= right
-            elif op == "==":
-                result = left == right
-            elif op == "!=":
-                result = left != right
-            else:
+            if op not in self.COMPARISON_FUNCS:
                 warnings.warn(f"Warning: Unsupported operator '{op}'", stacklevel=2)
                 return pd.Series(False, index=df.index)
 
-            return result
+            # Scalars are broadcast by pandas, only two scalars need a Series
+            if not isinstance(left, pd.Series) and not isinstance(right, pd.Series):
+                left = pd.Series(left, index=df.index)
+
+            return self.COMPARISON_FUNCS[op](left, right)
         except Exception as e:
             print(f"Comparison failed: {e}")
             warnings.warn(
@@ -458,19 +634,15 @@ class FieldConstrainer(BaseConstrainer):
             )
             return pd.Series(False, index=df.index)
 
-    def _parse_expression(
-        self, tokens: list, df: pd.DataFrame, involved_columns: list[str]
-    ) -> tuple[pd.Series, list[str]]:
+    def _compile_expression(self, tokens: list) -> Callable[[pd.DataFrame], pd.Series]:
         """
-        Parse and evaluate expression
+        Parse tokens once and compile them into a predicate
 
         Args:
             tokens: List of tokens to parse
-            df: DataFrame containing the data
-            involved_columns: List of columns involved in the expression
 
         Returns:
-            Tuple of (boolean mask, updated involved columns)
+            Function of DataFrame returning the boolean mask
         """
 
         class Parser:
@@ -495,20 +667,18 @@ class FieldConstrainer(BaseConstrainer):
 
         parser = Parser(tokens)
 
-        def parse_primary(involved_columns: list[str]) -> tuple[pd.Series, list[str]]:
+        def parse_primary() -> Callable[[pd.DataFrame], pd.Series]:
             token = parser.peek()
 
             if token == "(":
                 parser.consume()  # Skip '('
-                result, involved_columns = parse_or(involved_columns)
+                result = parse_or()
                 if parser.peek() == ")":
                     parser.consume()  # Skip ')'
-                    return result, involved_columns
+                    return result
                 raise ConfigError("Expected closing parenthesis")
 
-            left, involved_columns = self._get_value(
-                parser.consume(), df, involved_columns
-            )
+            left = self._compile_value(parser.consume())
 
             if parser.peek() == "IS":
                 parser.consume()
@@ -520,35 +690,38 @@ class FieldConstrainer(BaseConstrainer):
                 if parser.peek() == "pd.NA":
                     parser.consume()
                     if is_not:
-                        return ~pd.isna(left), involved_columns
-                    return pd.isna(left), involved_columns
+                        return lambda df: ~pd.isna(left(df))
+                    return lambda df: pd.isna(left(df))
 
-            if parser.peek() in [">", ">=", "==", "!=", "<", "<="]:
+            if parser.peek() in self.COMPARISON_FUNCS:
                 op = parser.consume()
-                right, involved_columns = self._get_value(
-                    parser.consume(), df, involved_columns
-                )
-                return self._process_comparison(left, op, right, df), involved_columns
+                right = self._compile_value(parser.consume())
+                return lambda df: self._process_comparison(left(df), op, right(df), df)
 
-            if not isinstance(left, pd.Series):
-                return pd.Series(False, index=df.index), involved_columns
+            def is_truthy(df: pd.DataFrame) -> pd.Series:
+                value = left(df)
+                if not isinstance(value, pd.Series):
+                    return pd.Series(False, index=df.index)
+                return value.notna() & (value != 0)
 
-            return left.notna() & (left != 0), involved_columns
+            return is_truthy
 
-        def parse_and(involved_columns: list[str]) -> tuple[pd.Series, list[str]]:
-            result, involved_columns = parse_primary(involved_columns)
+        def parse_and() -> Callable[[pd.DataFrame], pd.Series]:
+            operands = [parse_primary()]
             while parser.peek() == "&":
                 parser.consume()
-                right, involved_columns = parse_primary(involved_columns)
-                result = result & right
-            return result, involved_columns
+                operands.append(parse_primary())
+            if len(operands) == 1:
+                return operands[0]
+            return lambda df: reduce(operator.and_, (func(df) for func in operands))
 
-        def parse_or(involved_columns: list[str]) -> tuple[pd.Series, list[str]]:
-            result, involved_columns = parse_and(involved_columns)
+        def parse_or() -> Callable[[pd.DataFrame], pd.Series]:
+            operands = [parse_and()]
             while parser.peek() == "|":
                 parser.consume()
-                right, involved_columns = parse_and(involved_columns)
-                result = result | right
-            return result, involved_columns
+                operands.append(parse_and())
+            if len(operands) == 1:
+                return operands[0]
+            return lambda df: reduce(operator.or_, (func(df) for func in operands))
 
-        return parse_or(involved_columns)
+        return parse_or()
@@ -2,6 +2,7 @@ import itertools
 import warnings
 from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
 
 from petsard.constrainer.constrainer_base import BaseConstrainer
@@ -256,13 +257,12 @@ class FieldProportionsConfig:
 
                 # 處理 'all' 模式
                 elif mode == "all" and key not in self.original_proportions:
-                    # 為欄位組合創建一個連接值
-                    combined = data[fields].apply(lambda row: tuple(row), axis=1)
-
                     # 計算每個組合值的比例
-                    value_counts = combined.value_counts(
-                        dropna=False, normalize=True
-                    ).to_dict()
+                    value_counts = (
+                        data[fields]
+                        .value_counts(dropna=False, normalize=True)
+                        .to_dict()
+                    )
                     self.original_proportions[key] = value_counts
 
                     # 計算每個組合值的最小和最大樣本數
@@ -497,10 +497,9 @@ class FieldProportionsConfig:
                     count_bounds = self.min_max_counts[key]
 
                     # 計算過濾後資料的實際計數
-                    combined = filtered_data[fields].apply(
-                        lambda row: tuple(row), axis=1
+                    value_counts = (
+                        filtered_data[fields].value_counts(dropna=False).to_dict()
                     )
-                    value_counts = combined.value_counts(dropna=False).to_dict()
 
                     # 檢查每個組合值的實際計數是否在允許範圍內
                     for value in set(original_counts.keys()):
@@ -539,6 +538,9 @@ class FieldProportionsConfig:
 class FieldProportionsConstrainer(BaseConstrainer):
     """Field proportions constrainer for maintaining data distribution proportions"""
 
+    # 選取列的最大遍歷次數，每次遍歷為線性時間
+    MAX_SELECTION_PASSES: int = 25
+
     def __init__(self, config: dict):
         """
         Initialize field proportions constrainer
@@ -621,6 +623,172 @@ class FieldProportionsConstrainer(BaseConstrainer):
 
         return result_df
 
+    @staticmethod
+    def _normalize_key(value) -> tuple:
+        """
+        將值轉為元組，並將缺失值統一為 None，以便比對含 NaN 的值
+
+        Args:
+            value: 單一值或欄位組合的值元組
+
+        Returns:
+            tuple: 正規化後的元組
+        """
+        values = value if isinstance(value, tuple) else (value,)
+        return tuple(
+            None if pd.api.types.is_scalar(v) and pd.isna(v) else v for v in values
+        )
+
+    def _get_quota_groups(
+        self, data: pd.DataFrame, config: FieldProportionsConfig
+    ) -> list[dict]:
+        """
+        將 min_max_counts 轉換為每個規則的列類別代碼與計數上限
+
+        Args:
+            data (pd.DataFrame)：要過濾的資料
+            config (FieldProportionsConfig)：包含欄位比例保留的設定類別
+
+        Returns:
+            list[dict]：每個規則一項，包含：
+                - codes (np.ndarray)：每一列所屬類別的代碼
+                - caps (np.ndarray)：每個類別的最大計數，不受限的類別為 inf
+                - descs (list[str])：每個類別的描述
+        """
+        quota_groups: list[dict] = []
+
+        for rule in config.field_proportions:
+            fields = rule["fields"]
+            mode = rule["mode"]
+            fields_list: list[str] = [fields] if isinstance(fields, str) else fields
+            key = (fields if isinstance(fields, str) else tuple(fields), mode)
+            if key not in config.min_max_counts or not all(
+                f in data.columns for f in fields_list
+            ):
+                continue
+            count_bounds: dict = config.min_max_counts[key]
+
+            if mode == "missing":
+                # 以缺失模式的位元組合作為類別代碼
+                isna = data[fields_list].isna().to_numpy()
+                codes = np.zeros(len(data), dtype=np.int64)
+                for i in range(len(fields_list)):
+                    codes = codes * 2 + isna[:, i]
+
+                patterns = list(
+                    itertools.product([False, True], repeat=len(fields_list))
+                )
+                caps = np.full(len(patterns), np.inf)
+                descs: list[str] = []
+                for code, pattern in enumerate(patterns):
+                    if isinstance(fields, str):
+                        bounds = count_bounds["缺失值"] if pattern[0] else None
+                        desc = f"欄位 {fields} 的缺失值"
+                    else:
+                        bounds = count_bounds.get(pattern)
+                        desc = f"欄位組合 {key[0]} 的 " + (
+                            bounds["desc"] if bounds else str(pattern)
+                        )
+                    if bounds is not None:
+                        caps[code] = bounds["max"]
+                    descs.append(desc)
+
+            else:
+                # 將各欄位因子化後合併為組合代碼
+                codes = np.zeros(len(data), dtype=np.int64)
+                for f in fields_list:
+                    field_codes, _ = pd.factorize(data[f], use_na_sentinel=True)
+                    codes = codes * (field_codes.max(initial=0) + 2) + (field_codes + 1)
+                    codes = pd.factorize(codes)[0]
+
+                normalized_bounds: dict = {
+                    self._normalize_key(value): bounds
+                    for value, bounds in count_bounds.items()
+                }
+                _, first_rows = np.unique(codes, return_index=True)
+                caps = np.full(len(first_rows), np.inf)
+                descs = []
+                for code, row in enumerate(
+                    data[fields_list].iloc[first_rows].itertuples(index=False)
+                ):
+                    value = row[0] if isinstance(fields, str) else tuple(row)
+                    bounds = normalized_bounds.get(self._normalize_key(value))
+                    if bounds is not None:
+                        caps[code] = bounds["max"]
+                    descs.append(
+                        f"欄位 {fields} 的值 {value}"
+                        if isinstance(fields, str)
+                        else f"欄位組合 {key[0]} 的值 {value}"
+                    )
+
+            quota_groups.append(
+                {"codes": codes, "caps": np.maximum(caps, 0), "descs": descs}
+            )
+
+        return quota_groups
+
+    def _select_within_quotas(
+        self, quota_groups: list[dict], n_rows: int, random_state: int = 42
+    ) -> np.ndarray:
+        """
+        依隨機順序選取列，使每個規則每個類別的計數不超過上限
+
+        等同於依隨機順序逐列檢查：若該列在所有規則的類別都仍有配額則保留。
+            以向量化的不動點迭代求解：每次遍歷依目前選取的列，
+            計算每一列之前同類別已選取的列數，並保留所有類別都未達上限的列。
+            奇數次遍歷的結果必定符合所有上限，並逐步逼近逐列選取的結果。
+
+        Args:
+            quota_groups (list[dict])：_get_quota_groups 的結果
+            n_rows (int)：資料行數
+            random_state (int)：隨機順序的種子
+
+        Returns:
+            np.ndarray：是否保留每一列的布林陣列（原始順序）
+        """
+        order = np.random.default_rng(random_state).permutation(n_rows)
+
+        # 只有計數可能超過上限的類別需要檢查；預先依類別穩定排序，
+        # 每次遍歷只需線性時間的累加
+        sorted_groups: list[tuple] = []
+        for group in quota_groups:
+            codes = group["codes"][order]
+            binding = group["caps"] < np.bincount(codes, minlength=len(group["caps"]))
+            rows = np.flatnonzero(binding[codes])
+            if rows.size == 0:
+                continue
+            sort_idx = rows[np.argsort(codes[rows], kind="stable")].astype(np.int32)
+            sorted_codes = codes[sort_idx]
+            is_start = np.ones(sort_idx.size, dtype=bool)
+            is_start[1:] = sorted_codes[1:] != sorted_codes[:-1]
+            segment_start = np.maximum.accumulate(
+                np.where(is_start, np.arange(sort_idx.size, dtype=np.int32), 0)
+            )
+            caps = np.ceil(group["caps"][sorted_codes]).astype(np.int32)
+            sorted_groups.append((sort_idx, segment_start, caps))
+
+        selected = np.ones(n_rows, dtype=bool)
+        feasible = selected
+        for n_pass in range(1, self.MAX_SELECTION_PASSES + 1):
+            next_selected = np.ones(n_rows, dtype=bool)
+            for sort_idx, segment_start, caps in sorted_groups:
+                chosen = selected[sort_idx].view(np.int8)
+                # 同類別中排在此列之前已選取的列數
+                preceding = np.cumsum(chosen, dtype=np.int32) - chosen
+                preceding -= preceding[segment_start]
+                next_selected[sort_idx[preceding >= caps]] = False
+
+            if np.array_equal(next_selected, selected):
+                feasible = next_selected
+                break
+            selected = next_selected
+            if n_pass % 2 == 1:
+                feasible = selected
+
+        result = np.zeros(n_rows, dtype=bool)
+        result[order[feasible]] = True
+        return result
+
     def _constraint_filter_field_proportions(
         self,
         data: pd.DataFrame,
@@ -629,6 +797,9 @@ class FieldProportionsConstrainer(BaseConstrainer):
         """
         根據給定的欄位比例保留條件過濾 DataFrame，確保欄位的值分布計數維持在可接受範圍內。
 
+        先由 min_max_counts 計算所有規則每個類別的配額，
+            再依隨機順序一次選取所有規則配額內的列，執行時間與資料行數成線性。
+
         Args:
             data (pd.DataFrame)：要過濾的資料
             config (FieldProportionsConfig)：包含欄位比例保留的設定類別
@@ -638,6 +809,16 @@ class FieldProportionsConstrainer(BaseConstrainer):
                 - 過濾後的資料，索引已重置
                 - 操作記錄資料框，包含過濾動作、條件、影響行數等資訊
         """
+        ops_columns: list[str] = [
+            "迭代次數",
+            "移除條件",
+            "移除原因",
+            "當前計數",
+            "最大計數",
+            "需移除計數",
+            "實際移除筆數",
+            "剩餘行數",
+        ]
         if (
             config is None
             or not hasattr(config, "original_proportions")
@@ -647,159 +828,29 @@ class FieldProportionsConstrainer(BaseConstrainer):
         ):
             return data, pd.DataFrame()
 
-        # 複製資料以避免修改原始資料
-        data_result = data.copy()
-        initial_rows = len(data_result)
+        quota_groups = self._get_quota_groups(data, config)
+        selected = self._select_within_quotas(quota_groups, len(data))
+        data_result = data.loc[selected]
 
-        # 創建操作記錄的列表
+        # 記錄每個計數過多的條件
         ops_records = []
-
-        # 設定最大迭代次數，避免無限循環
-        max_iterations = 50
-        iteration = 0
-
-        while iteration < max_iterations:
-            iteration += 1
-
-            # 檢查是否符合所有條件
-            proportions_satisfied, violations = config.check_proportions(data_result)
-
-            # 如果沒有違反比例要求，直接返回
-            if proportions_satisfied:
-                break
-
-            # 將違規條件按類型分類
-            overflow_violations = []  # 計數過多的違規
-            underflow_violations = []  # 計數過少的違規
-
-            for violation in violations:
-                actual_count = violation["實際計數"]
-                min_count = violation["最小計數"]
-                max_count = violation["最大計數"]
-
-                if actual_count > max_count:
-                    overflow_violations.append(violation)
-                elif actual_count < min_count:
-                    underflow_violations.append(violation)
-
-            # 如果沒有計數過多的違規，而只有計數過少的違規，那麼我們可能無法進一步調整
-            if not overflow_violations:
-                break
-
-            # 1. 先標記所有需要保護的資料（計數過少的條件）
-            protect_mask = pd.Series(False, index=data_result.index)
-
-            # 2. 找出第一個計數過多的違規條件，進行處理
-            found_overflow = False
-
-            for violation in overflow_violations:
-                field_name = violation["欄位"]
-                value = violation["值"]
-                actual_count = violation["實際計數"]
-                max_count = violation["最大計數"]
-                mode = violation["模式"]
-
-                # 計算需要移除的數量
-                remove_needed = actual_count - max_count
-
-                # 建立過濾條件遮罩
-                if isinstance(field_name, str):
-                    # 單一欄位
-                    if mode == "all":
-                        # 找出特定值的資料
-                        if pd.isna(value):
-                            value_mask = data_result[field_name].isna()
-                        else:
-                            value_mask = data_result[field_name] == value
-                        condition_desc = f"欄位 {field_name} 的值 {value}"
-                    else:  # mode == 'missing'
-                        # 找出缺失值的資料
-                        value_mask = data_result[field_name].isna()
-                        condition_desc = f"欄位 {field_name} 的缺失值"
-                else:
-                    # 欄位組合
-                    fields = (
-                        field_name if isinstance(field_name, tuple) else [field_name]
-                    )
-                    if mode == "all":
-                        # 處理欄位組合的特定值
-                        if (
-                            isinstance(value, str)
-                            and value.startswith("(")
-                            and value.endswith(")")
-                        ):
-                            # 解析字符串形式的元組
-                            import ast
-
-                            try:
-                                parsed_value = ast.literal_eval(value)
-                                if isinstance(parsed_value, tuple):
-                                    value_mask = pd.Series(
-                                        True, index=data_result.index
-                                    )
-                                    for i, field in enumerate(fields):
-                                        if i < len(parsed_value):
-                                            if pd.isna(parsed_value[i]):
-                                                value_mask &= data_result[field].isna()
-                                            else:
-                                                value_mask &= (
-                                                    data_result[field]
-                                                    == parsed_value[i]
-                                                )
-                                else:
-                                    value_mask = data_result[list(fields)].apply(
-                                        lambda row: str(tuple(row)) == value, axis=1
-                                    )
-                            except:
-                                value_mask = data_result[list(fields)].apply(
-                                    lambda row: str(tuple(row)) == value, axis=1
-                                )
-                        else:
-                            value_mask = data_result[list(fields)].apply(
-                                lambda row: str(tuple(row)) == str(value), axis=1
-                            )
-                        condition_desc = f"欄位組合 {field_name} 的值 {value}"
-                    else:  # mode == 'missing'
-                        # 處理欄位組合的缺失模式 - 簡化處理
-                        value_mask = pd.Series(False, index=data_result.index)
-                        condition_desc = f"欄位組合 {field_name} 的 {value}"
-
-                # 如果有可用的資料可以移除
-                available_count = value_mask.sum()
-                if available_count > 0:
-                    # 決定要移除多少筆資料
-                    remove_count = min(remove_needed, available_count)
-
-                    # 隨機選擇要移除的索引
-                    indices_to_remove = (
-                        data_result[value_mask]
-                        .sample(n=remove_count, random_state=42)
-                        .index
-                    )
-
-                    # 記錄操作
-                    detailed_record = {
-                        "迭代次數": iteration,
-                        "移除條件": condition_desc,
+        for group in quota_groups:
+            n_categories = len(group["caps"])
+            current = np.bincount(group["codes"], minlength=n_categories)
+            kept = np.bincount(group["codes"][selected], minlength=n_categories)
+            for code in np.flatnonzero(current > group["caps"]):
+                ops_records.append(
+                    {
+                        "迭代次數": 1,
+                        "移除條件": group["descs"][code],
                         "移除原因": "計數過多",
-                        "當前計數": actual_count,
-                        "最大計數": max_count,
-                        "需移除計數": remove_needed,
-                        "實際移除筆數": remove_count,
-                        "剩餘行數": len(data_result) - remove_count,
+                        "當前計數": int(current[code]),
+                        "最大計數": int(group["caps"][code]),
+                        "需移除計數": int(current[code] - group["caps"][code]),
+                        "實際移除筆數": int(current[code] - kept[code]),
+                        "剩餘行數": len(data_result),
                     }
-
-                    ops_records.append(detailed_record)
-
-                    # 過濾資料
-                    data_result = data_result.drop(indices_to_remove)
-
-                    found_overflow = True
-                    break  # 找到一個條件處理後就跳出，重新評估所有條件
-
-            # 如果所有計數過多的條件都無法處理，則退出循環
-            if not found_overflow:
-                break
+                )
 
         # 最終檢查
         final_proportions_satisfied, final_violations = config.check_proportions(
@@ -815,18 +866,7 @@ class FieldProportionsConstrainer(BaseConstrainer):
         ops_df = (
             pd.DataFrame(ops_records)
             if ops_records
-            else pd.DataFrame(
-                columns=[
-                    "迭代次數",
-                    "移除條件",
-                    "移除原因",
-                    "當前計數",
-                    "最大計數",
-                    "需移除計數",
-                    "實際移除筆數",
-                    "剩餘行數",
-                ]
-            )
+            else pd.DataFrame(columns=ops_columns)
         )
 
         return data_result.reset_index(drop=True), ops_df
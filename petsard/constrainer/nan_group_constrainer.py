@@ -147,15 +147,75 @@ class NaNGroupConstrainer(BaseConstrainer):
 
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply NaN group constraints to DataFrame"""
+        result = df.loc[self.keep_mask(df)].reset_index(drop=True)
+        self.transform(result)
+        return result
+
+    def keep_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Mask of the rows kept by the delete actions
+
+        Args:
+            df: Input DataFrame
+
+        Returns:
+            Boolean array of the rows whose delete fields are not NaN
+
+        Raises:
+            ConfigError: If any required columns are missing
+        """
         _ = self.validate_config(df)
-        result = df.copy()
 
-        # First apply all delete actions
+        mask: np.ndarray = np.ones(len(df), dtype=bool)
+        for main_field in self.mask_fields():
+            mask &= df[main_field].notna().to_numpy()
+        return mask
+
+    def mask_fields(self) -> list[str]:
+        """
+        Main fields of the delete actions
+
+        Returns:
+            list of field names
+        """
+        return [
+            main_field
+            for main_field, actions in self.constraints.items()
+            if actions == "delete" or ("delete" in actions)
+        ]
+
+    def transform_fields(self) -> list[str]:
+        """
+        Fields written by the erase, copy and nan_if_condition actions
+
+        Returns:
+            list of field names
+        """
+        fields: list[str] = []
         for main_field, actions in self.constraints.items():
-            if actions == "delete" or ("delete" in actions):
-                result = result[~result[main_field].isna()]
+            if actions == "delete":
+                continue
 
-        # Then apply erase and copy actions
+            for action, related in actions.items():
+                if action == "delete":
+                    continue
+                if action == "nan_if_condition":
+                    written = [main_field]
+                else:
+                    written = [related] if isinstance(related, str) else related
+                for field in written:
+                    if field not in fields:
+                        fields.append(field)
+        return fields
+
+    def transform(self, df: pd.DataFrame) -> None:
+        """
+        Apply the erase, copy and nan_if_condition actions in place
+
+        Args:
+            df: DataFrame already filtered by keep_mask()
+        """
+        # Apply erase and copy actions
         for main_field, actions in self.constraints.items():
             if actions == "delete":  # Skip if it's a direct delete action
                 continue
@@ -172,8 +232,8 @@ class NaNGroupConstrainer(BaseConstrainer):
                             else expected_value
                         )
 
-                        mask = result[target_col].isin(expected_value)
-                        result.loc[mask, main_field] = pd.NA
+                        mask = df[target_col].isin(expected_value)
+                        df.loc[mask, main_field] = pd.NA
                     continue
 
                 related_cols = [related] if isinstance(related, str) else related
@@ -186,15 +246,13 @@ class NaNGroupConstrainer(BaseConstrainer):
                         continue
 
                     if action == "erase":
-                        result.loc[result[main_field].isna(), col] = np.nan
+                        df.loc[df[main_field].isna(), col] = np.nan
                     elif action == "copy":
-                        if result[col].dtype != result[main_field].dtype:
+                        if df[col].dtype != df[main_field].dtype:
                             warnings.warn(
-                                f"Warning: Cannot copy values from '{main_field}' ({result[main_field].dtype}) to '{col}' ({result[col].dtype})",
+                                f"Warning: Cannot copy values from '{main_field}' ({df[main_field].dtype}) to '{col}' ({df[col].dtype})",
                                 stacklevel=2,
                             )
                             continue
-                        mask = result[main_field].notna() & result[col].isna()
-                        result.loc[mask, col] = result.loc[mask, main_field]
-
-        return result.reset_index(drop=True)
+                        mask = df[main_field].notna() & df[col].isna()
+                        df.loc[mask, col] = df.loc[mask, main_field]
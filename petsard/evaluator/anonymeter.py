@@ -11,6 +11,7 @@ from anonymeter.evaluators import (
     LinkabilityEvaluator,
     SinglingOutEvaluator,
 )
+from joblib import Parallel, delayed
 
 from petsard.config_base import BaseConfig
 from petsard.evaluator.evaluator_base import BaseEvaluator
@@ -70,12 +71,18 @@ class AnonymeterConfig(BaseConfig):
             The Anonymeter documentation states it supports 'tuple of int',
             but this is not reflected in their type annotations,
             so we will omit it here and only mention this for reference.
+            A list of such pairs runs Linkability in batch, one attack per pair.
         secret (str | list[str], optional):
             The secret attribute(s) of the target records, unknown to the attacker.
             This is what the attacker will try to guess.
+            A list runs Inference in batch, one attack per secret,
+            each using the aux_cols except its own secret.
         n_jobs (int, optional):
             Specifies the number of jobs Anonymeter will use. Not supported for SinglingOut.
             -1 means all threads except one. -2 means every thread.
+            In batch, the number of attacks run concurrently, each by one job.
+        batch (list[dict[str, Any]]):
+            The secret or aux_cols of each attack in batch. Empty if not in batch.
         ori (pd.DataFrame): The original data.
         syn (pd.DataFrame): The synthetic data.
         control (pd.DataFrame): The control data.
@@ -97,6 +104,7 @@ class AnonymeterConfig(BaseConfig):
     aux_cols: tuple[list[str], list[str]] = None
     secret: str | list[str] = None
     n_jobs: int = -2
+    batch: list[dict[str, Any]] = field(default_factory=list, init=False)
     ori: pd.DataFrame = None
     syn: pd.DataFrame = None
     control: pd.DataFrame = None
@@ -168,33 +176,30 @@ class AnonymeterConfig(BaseConfig):
                     )
                     self._logger.error(error_msg)
                     raise ConfigError(error_msg)
-                elif (
-                    len(self.aux_cols) != 2
-                    or not (
-                        isinstance(self.aux_cols[0], list)
-                        and isinstance(self.aux_cols[1], list)
-                    )
-                    or not all(
-                        isinstance(item, str)
-                        for item in self.aux_cols[0] + self.aux_cols[1]
-                    )
-                ):
-                    error_msg = (
-                        "The auxiliary columns must be a tuple of two lists of strings."
-                    )
-                    self._logger.error(error_msg)
-                    raise ConfigError(error_msg)
-                elif set(self.aux_cols[0]).intersection(set(self.aux_cols[1])):
-                    overlapping_columns: set[str] = set(self.aux_cols[0]).intersection(
-                        set(self.aux_cols[1])
-                    )
-                    error_msg = (
-                        f"The two lists in auxiliary columns must not have overlapping elements. "
-                        f"Found overlapping elements: {overlapping_columns}"
-                    )
-                    self._logger.error(error_msg)
-                    raise ConfigError(error_msg)
+                elif self._is_aux_cols_batch(self.aux_cols):
+                    for aux_cols in self.aux_cols:
+                        self._validate_linkability_aux_cols(aux_cols)
+                    self.batch = [
+                        {"aux_cols": tuple(aux_cols)} for aux_cols in self.aux_cols
+                    ]
+                else:
+                    self._validate_linkability_aux_cols(self.aux_cols)
             else:  # Inference
+                if isinstance(self.secret, list):
+                    if not self.secret or not all(
+                        isinstance(item, str) for item in self.secret
+                    ):
+                        error_msg = (
+                            "The secret attributes must be a non-empty list of strings."
+                        )
+                        self._logger.error(error_msg)
+                        raise ConfigError(error_msg)
+                    elif len(set(self.secret)) != len(self.secret):
+                        error_msg = "The secret attributes must not be duplicated."
+                        self._logger.error(error_msg)
+                        raise ConfigError(error_msg)
+                    self.batch = [{"secret": secret} for secret in self.secret]
+
                 if self.aux_cols is not None:
                     if not isinstance(self.aux_cols, list) or not all(
                         isinstance(item, str) for item in self.aux_cols
@@ -209,12 +214,65 @@ class AnonymeterConfig(BaseConfig):
                         )
                         self._logger.error(error_msg)
                         raise ConfigError(error_msg)
-                    else:
+                    elif not self.batch:
                         if self.secret in self.aux_cols:
                             error_msg = "The secret attribute(s) must not be included in the auxiliary columns."
                             self._logger.error(error_msg)
                             raise ConfigError(error_msg)
 
+    @staticmethod
+    def _is_aux_cols_batch(aux_cols: Any) -> bool:
+        """
+        Check if the aux_cols of Linkability is a list of aux_cols pairs.
+
+        Args:
+            aux_cols (Any): The aux_cols of config.
+
+        Return:
+            (bool): True if every item is a pair of lists.
+        """
+        return (
+            isinstance(aux_cols, list)
+            and len(aux_cols) > 0
+            and all(
+                isinstance(pair, list | tuple)
+                and len(pair) == 2
+                and all(isinstance(cols, list) for cols in pair)
+                for pair in aux_cols
+            )
+        )
+
+    def _validate_linkability_aux_cols(self, aux_cols: Any) -> None:
+        """
+        Validate one aux_cols pair of Linkability.
+
+        Args:
+            aux_cols (Any): The aux_cols pair.
+
+        Raises:
+            ConfigError: If the aux_cols is not two non-overlapping lists of strings.
+        """
+        error_msg: str = None
+
+        if (
+            len(aux_cols) != 2
+            or not (isinstance(aux_cols[0], list) and isinstance(aux_cols[1], list))
+            or not all(isinstance(item, str) for item in aux_cols[0] + aux_cols[1])
+        ):
+            error_msg = "The auxiliary columns must be a tuple of two lists of strings."
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        elif set(aux_cols[0]).intersection(set(aux_cols[1])):
+            overlapping_columns: set[str] = set(aux_cols[0]).intersection(
+                set(aux_cols[1])
+            )
+            error_msg = (
+                f"The two lists in auxiliary columns must not have overlapping elements. "
+                f"Found overlapping elements: {overlapping_columns}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
     def update_data(self, data: dict) -> None:
         error_msg: str = None
 
@@ -242,6 +300,10 @@ class AnonymeterConfig(BaseConfig):
                     "due to 'max_n_attacks'"
                 )
 
+            if self.batch:
+                self._update_batch()
+                return
+
             if self.eval_method_code == AnonymeterMap.INFERENCE:
                 if self.aux_cols is None:
                     self.aux_cols = [
@@ -267,6 +329,42 @@ class AnonymeterConfig(BaseConfig):
                     self._logger.error(error_msg)
                     raise ConfigError(error_msg)
 
+    def _update_batch(self) -> None:
+        """
+        Resolve the aux_cols of each Inference attack in batch,
+            and validate the columns of every attack exist in the original data.
+
+        Raises:
+            ConfigError: If a secret or auxiliary column does not exist.
+        """
+        error_msg: str = None
+
+        for run in self.batch:
+            if self.eval_method_code == AnonymeterMap.INFERENCE:
+                if run["secret"] not in self.ori.columns:
+                    error_msg = f"The secret attribute(s) '{run['secret']}' must exist in the original data."
+                    self._logger.error(error_msg)
+                    raise ConfigError(error_msg)
+
+                run["aux_cols"] = [
+                    col
+                    for col in (
+                        self.ori.columns if self.aux_cols is None else self.aux_cols
+                    )
+                    if col != run["secret"]
+                ]
+                all_aux_cols: list[str] = run["aux_cols"]
+            else:  # Linkability
+                all_aux_cols = run["aux_cols"][0] + run["aux_cols"][1]
+
+            invalid_columns: list[str] = [
+                col for col in all_aux_cols if col not in self.ori.columns
+            ]
+            if invalid_columns:
+                error_msg = f"The following auxiliary columns do not exist in the original data: {invalid_columns}"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+
 
 class Anonymeter(BaseEvaluator):
     """
@@ -338,21 +436,25 @@ class Anonymeter(BaseEvaluator):
 
         self._impl: Any = None
 
-    def _extract_scores(self) -> dict[str, Any]:
+    def _extract_scores(self, impl: Any = None) -> dict[str, Any]:
         """
         _extract_scores of Anonymeter.
             Uses .risk()/.results() method in Anonymeter
             to extract result from self._impl into the designated dictionary.
 
+        Args:
+            impl (Any, optional): The evaluated evaluator object. Default is self._impl.
+
         Return
             (dict[str, Any]). Result as specific format describe in eval().
         """
+        impl = self._impl if impl is None else impl
 
         result: dict[str, Any] = {}
 
         # Handle the risk
         try:
-            risk = self._impl.risk()
+            risk = impl.risk()
             result["risk"] = safe_round(risk.value)
             result["risk_CI_btm"] = safe_round(risk.ci[0])
             result["risk_CI_top"] = safe_round(risk.ci[1])
@@ -363,7 +465,7 @@ class Anonymeter(BaseEvaluator):
 
         # Handle the attack_rate, baseline_rate, control_rate
         try:
-            results = self._impl.results()
+            results = impl.results()
             for rate_type in ["attack_rate", "baseline_rate", "control_rate"]:
                 rate_result = getattr(results, rate_type, None)
                 if rate_result:
@@ -433,6 +535,111 @@ class Anonymeter(BaseEvaluator):
 
         return details
 
+    def _evaluate_impl(self, impl: Any, evaluate_params: dict[str, Any]) -> None:
+        """
+        Run .evaluate() of the evaluator object,
+            retrying up to MAX_ATTEMPTS_OF_RUNTIME_ERROR times on RuntimeError.
+
+        Args:
+            impl (Any): The evaluator object.
+            evaluate_params (dict[str, Any]): The parameters of .evaluate().
+        """
+        attempts_for_impl_evaluate: int = 0
+        while attempts_for_impl_evaluate < self.MAX_ATTEMPTS_OF_RUNTIME_ERROR:
+            attempts_for_impl_evaluate += 1
+            try:
+                impl.evaluate(**evaluate_params)
+                break  # successful
+            except RuntimeError:
+                error_msg: str = (
+                    f"Evaluating trial {attempts_for_impl_evaluate} / {self.MAX_ATTEMPTS_OF_RUNTIME_ERROR}"
+                    " failed due to RunTimeError."
+                )
+                self._logger.warning(error_msg)
+
+                if attempts_for_impl_evaluate == self.MAX_ATTEMPTS_OF_RUNTIME_ERROR:
+                    error_msg = f"Exceeded the maximum number of attempts ({self.MAX_ATTEMPTS_OF_RUNTIME_ERROR}). "
+                    self._logger.warning(error_msg)
+
+    def _run_batch_attack(
+        self, evaluator_class: Any, params: dict[str, Any], run: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Run one attack of the batch, by one job.
+
+        Args:
+            evaluator_class (Any): The Anonymeter evaluator class.
+            params (dict[str, Any]): The shared parameters of the evaluator class.
+            run (dict[str, Any]): The secret and/or aux_cols of this attack.
+
+        Return:
+            (dict[str, Any]): The attack of the run followed by its scores.
+        """
+        impl: Any = evaluator_class(**{**params, **run})
+        self._evaluate_impl(impl, {"n_jobs": 1})
+
+        return {
+            "secret" if "secret" in run else "aux_cols": run.get(
+                "secret", run["aux_cols"]
+            ),
+            **self._extract_scores(impl),
+        }
+
+    def _eval_batch(self) -> dict[str, pd.DataFrame]:
+        """
+        Evaluating every attack of the batch.
+            The validated data is shared by all attacks,
+            which are run concurrently by n_jobs threads.
+            Neighbour searches of Anonymeter are compiled by numba without the GIL.
+
+        Return:
+            (dict[str, pd.DataFrame]) Result as following key-value pairs:
+            - global: The scores of the attack with the highest risk.
+            - details: The scores of every attack, one row each,
+                leading with its 'secret' (Inference) or 'aux_cols' (Linkability).
+        """
+        evaluator_class: Any = self.ANONYMETER_CLASS_MAP[
+            self.anonymeter_config.eval_method_code
+        ]
+        params: dict[str, Any] = self.anonymeter_config.get_params(
+            param_configs=[
+                {attr: {"action": "INCLUDE"}}
+                for attr in self.REQUIRED_ANONYMETER_KEYS_MAP[
+                    self.anonymeter_config.eval_method_code
+                ]
+                if attr not in ["secret", "aux_cols"]
+            ]
+        )
+        self._logger.info(
+            f"Evaluating {len(self.anonymeter_config.batch)} attacks in batch"
+        )
+
+        # warnings are caught once here, catch_warnings() is not thread-safe
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+
+            batch_scores: list[dict[str, Any]] = Parallel(
+                n_jobs=self.anonymeter_config.n_jobs, prefer="threads"
+            )(
+                delayed(self._run_batch_attack)(evaluator_class, params, run)
+                for run in self.anonymeter_config.batch
+            )
+
+            for warning in w:
+                self._logger.debug(f"Warning during _eval: {warning.message}")
+
+        details: pd.DataFrame = pd.DataFrame(batch_scores)
+        risk: pd.Series = pd.to_numeric(details["risk"], errors="coerce")
+        highest_risk: int = risk.idxmax() if risk.notna().any() else 0
+        self._logger.info("Successfully extracting scores")
+
+        return {
+            "global": details.loc[[highest_risk]].rename(
+                index={highest_risk: "result"}
+            ),
+            "details": details,
+        }
+
     def _eval(self, data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
         """
         Evaluating the evaluator.
@@ -472,9 +679,12 @@ class Anonymeter(BaseEvaluator):
                 A value of 0 indicates none of success attack,
                     and 1 indicates totally success attack.
                 Includes control_Rate_err for its error rate.
+            See _eval_batch() for the result of a batch.
         """
 
         self.anonymeter_config.update_data(data)
+        if self.anonymeter_config.batch:
+            return self._eval_batch()
 
         self._logger.debug(
             f"Initializing evaluator with method: {self.config['eval_method']}"
@@ -503,31 +713,17 @@ class Anonymeter(BaseEvaluator):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
 
-            attempts_for_impl_evaluate: int = 0
-            while attempts_for_impl_evaluate < self.MAX_ATTEMPTS_OF_RUNTIME_ERROR:
-                attempts_for_impl_evaluate += 1
-                try:
-                    self._impl.evaluate(
-                        **self.anonymeter_config.get_params(
-                            param_configs=[
-                                {attr: {"action": "INCLUDE"}}
-                                for attr in self.REQUIRED_ANONYMETER_KEYS_EVALUATE_MAP[
-                                    self.anonymeter_config.eval_method_code
-                                ]
-                            ]
-                        )
-                    )
-                    break  # successful
-                except RuntimeError:
-                    error_msg: str = (
-                        f"Evaluating trial {attempts_for_impl_evaluate} / {self.MAX_ATTEMPTS_OF_RUNTIME_ERROR}"
-                        " failed due to RunTimeError."
-                    )
-                    self._logger.warning(error_msg)
-
-                    if attempts_for_impl_evaluate == self.MAX_ATTEMPTS_OF_RUNTIME_ERROR:
-                        error_msg = f"Exceeded the maximum number of attempts ({self.MAX_ATTEMPTS_OF_RUNTIME_ERROR}). "
-                        self._logger.warning(error_msg)
+            self._evaluate_impl(
+                self._impl,
+                self.anonymeter_config.get_params(
+                    param_configs=[
+                        {attr: {"action": "INCLUDE"}}
+                        for attr in self.REQUIRED_ANONYMETER_KEYS_EVALUATE_MAP[
+                            self.anonymeter_config.eval_method_code
+                        ]
+                    ]
+                ),
+            )
 
             for warning in w:
                 self._logger.debug(f"Warning during _eval: {warning.message}")
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Optional
@@ -26,6 +27,7 @@ from petsard.evaluator.data_describer_base import (
     DataDescriberStd,
     DataDescriberVar,
 )
+from petsard.evaluator.data_describer_sketch import DataDescriberSketch
 from petsard.evaluator.evaluator_base import BaseEvaluator
 from petsard.exceptions import ConfigError, UnsupportedMethodError
 from petsard.metadater import safe_round
@@ -80,6 +82,17 @@ class DataDescriberConfig(BaseConfig):
         eval_method (str): The evaluation method.
         eval_method_code (int): The evaluation method code.
         describe_method (list[str]): The list of describing methods.
+        percentile (int | float): The percentile of 'percentile' method.
+        streaming (bool): Describe the data chunk by chunk in one pass by mergeable sketches,
+            so only the sketch state is bounded for a DataFrame; pass an iterable of chunks
+            (e.g. Loader.load_chunks()) to bound the input as well.
+            Quantiles and nunique become approximate. Default is False.
+        chunk_size (int): Number of rows per chunk in streaming mode. Default is 100000.
+        sketch_k (int): Accuracy parameter k of the KLL quantile sketch.
+            Rank error is about 1.7% for k=200. Default is 200.
+        hll_precision (int): Number of index bits of the HyperLogLog distinct count sketch,
+            between 4 and 18. Relative standard error is 1.04 / sqrt(2^hll_precision),
+            about 0.81% for 14. Default is 14.
     """
 
     eval_method: str
@@ -129,6 +142,10 @@ class DataDescriberConfig(BaseConfig):
         ]
     )
     percentile: int | float = None
+    streaming: bool = False
+    chunk_size: int = 100000
+    sketch_k: int = 200
+    hll_precision: int = 14
 
     def __post_init__(self):
         super().__post_init__()
@@ -150,6 +167,30 @@ class DataDescriberConfig(BaseConfig):
             self._logger.error(error_msg)
             raise UnsupportedMethodError(error_msg)
 
+        if not isinstance(self.streaming, bool):
+            error_msg = f"streaming should be a boolean, got {self.streaming}"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        for param, minimum in [("chunk_size", 1), ("sketch_k", 8)]:
+            value = getattr(self, param)
+            if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+                error_msg = f"{param} should be an integer >= {minimum}, got {value}"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+
+        if (
+            not isinstance(self.hll_precision, int)
+            or isinstance(self.hll_precision, bool)
+            or not 4 <= self.hll_precision <= 18
+        ):
+            error_msg = (
+                f"hll_precision should be an integer between 4 and 18, "
+                f"got {self.hll_precision}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
         if "percentile" not in self.describe_method:
             self.percentile = None
             self._logger.debug(
@@ -283,6 +324,86 @@ class DataDescriber(BaseEvaluator):
 
         return columnwise_desc_df
 
+    def eval(self, data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+        """
+        Describe the data.
+            Overridden BaseEvaluator's eval().
+
+        In streaming mode, data["data"] may also be an iterable of DataFrame chunks,
+            e.g. Loader.load_chunks(), so the table is never held in memory at once.
+
+        Args:
+            data (dict): same as _eval() method.
+
+        Returns:
+            (dict[str, pd.DataFrame]): same as _eval() method.
+        """
+        chunks = data.get("data")
+        if (
+            self.desc_config.streaming
+            and chunks is not None
+            and not isinstance(chunks, pd.DataFrame)
+        ):
+            self._logger.info(f"Evaluating {self.__class__.__name__} from chunks")
+            return self._eval(data)
+
+        return super().eval(data)
+
+    def _describe_streaming(
+        self, data: pd.DataFrame | Iterable[pd.DataFrame]
+    ) -> DataDescriberSketch:
+        """
+        Consume the data chunk by chunk into a DataDescriberSketch.
+
+        A DataFrame is already in memory and is sliced into chunks of chunk_size,
+            so only the sketch state is bounded. Chunks from an iterable
+            (e.g. Loader.load_chunks()) are read one at a time.
+
+        Args:
+            data (pd.DataFrame | Iterable[pd.DataFrame]): The data to be described.
+
+        Return:
+            (DataDescriberSketch): The sketch of all chunks.
+        """
+        error_msg: str | None = None
+
+        chunk_size: int = self.desc_config.chunk_size
+        chunks: Iterable[pd.DataFrame] = data
+        if isinstance(data, pd.DataFrame):
+            self._logger.info(
+                f"Describing {data.shape[0]} rows in streaming mode "
+                f"with chunk size {chunk_size}"
+            )
+            chunks = (
+                data.iloc[start : start + chunk_size]
+                for start in range(0, max(data.shape[0], 1), chunk_size)
+            )
+        else:
+            self._logger.info("Describing data chunks in streaming mode")
+
+        sketch = DataDescriberSketch(
+            describe_method=self.desc_config.describe_method,
+            percentile=self.desc_config.percentile,
+            sketch_k=self.desc_config.sketch_k,
+            hll_precision=self.desc_config.hll_precision,
+        )
+        n_chunks: int = 0
+        for chunk in chunks:
+            if not isinstance(chunk, pd.DataFrame):
+                error_msg = f"Data chunks should be DataFrame, got {type(chunk)}"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            sketch.update(chunk)
+            n_chunks += 1
+
+        if n_chunks == 0:
+            error_msg = "No data chunk to describe"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        self._logger.debug(f"Described {n_chunks} chunks")
+        return sketch
+
     def _eval(self, data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
         """
         Evaluating the describer.
@@ -300,6 +421,10 @@ class DataDescriber(BaseEvaluator):
         )
         self.desc_config.update_data(data)
 
+        sketch: DataDescriberSketch | None = None
+        if self.desc_config.streaming:
+            sketch = self._describe_streaming(data["data"])
+
         # Assign to list first, convert to DataFrame later
         temp_desc_result: dict[str, list[Any]] = {}
         granularity: str = None
@@ -315,7 +440,12 @@ class DataDescriber(BaseEvaluator):
             if granularity not in temp_desc_result:
                 temp_desc_result[granularity] = []
 
-            temp_desc_result[granularity].append(self._impl[method].eval(data["data"]))
+            if self.desc_config.streaming:
+                temp_desc_result[granularity].append(sketch.describe(method))
+            else:
+                temp_desc_result[granularity].append(
+                    self._impl[method].eval(data["data"])
+                )
 
         desc_result: dict[str, pd.DataFrame] = {}
         if "global" in temp_desc_result:
@@ -318,8 +318,7 @@ class DataDescriberCov(BaseDataDescriber):
 
     def _eval(self, data: pd.DataFrame) -> dict[str, int | float]:
         temp = data.cov(numeric_only=True)
-        upper_indices = np.triu_indices_from(temp, k=1)
-        temp.values[upper_indices] = np.nan
+        temp = temp.mask(np.triu(np.ones(temp.shape, dtype=bool), k=1))
 
         # 確保索引名稱不會與現有列名衝突
         index_name = "col1"
@@ -351,8 +350,7 @@ class DataDescriberCorr(BaseDataDescriber):
 
     def _eval(self, data: pd.DataFrame) -> dict[str, int | float]:
         temp = data.corr(method="pearson", numeric_only=True)
-        upper_indices = np.triu_indices_from(temp, k=1)
-        temp.values[upper_indices] = np.nan
+        temp = temp.mask(np.triu(np.ones(temp.shape, dtype=bool), k=1))
 
         # 確保索引名稱不會與現有列名衝突
         index_name = "col1"
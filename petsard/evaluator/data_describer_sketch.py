@@ -0,0 +1,595 @@
+import logging
+import warnings
+from copy import deepcopy
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_object_dtype, is_string_dtype
+
+
+class MomentSketch:
+    """
+    Mergeable count, mean, central moments (M2, M3, M4), min and max
+        of each numerical column. Chunks are combined by the pairwise
+        update formulas of Chan et al. and Pébay, so the results are exact
+        up to floating point error.
+    """
+
+    def __init__(self, n_cols: int):
+        """
+        Args:
+            n_cols (int): Number of numerical columns.
+        """
+        self.n: np.ndarray = np.zeros(n_cols)
+        self.mean: np.ndarray = np.zeros(n_cols)
+        self.m2: np.ndarray = np.zeros(n_cols)
+        self.m3: np.ndarray = np.zeros(n_cols)
+        self.m4: np.ndarray = np.zeros(n_cols)
+        self.min: np.ndarray = np.full(n_cols, np.nan)
+        self.max: np.ndarray = np.full(n_cols, np.nan)
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Add a chunk of values.
+
+        Args:
+            values (np.ndarray): 2D float array (rows, columns), NaN as missing.
+        """
+        other = MomentSketch(values.shape[1])
+        mask: np.ndarray = ~np.isnan(values)
+        other.n = mask.sum(axis=0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            other.mean = np.where(other.n > 0, np.nansum(values, axis=0) / other.n, 0.0)
+        delta: np.ndarray = np.where(mask, values - other.mean, 0.0)
+        delta2: np.ndarray = delta**2
+        other.m2 = delta2.sum(axis=0)
+        other.m3 = (delta2 * delta).sum(axis=0)
+        other.m4 = (delta2**2).sum(axis=0)
+        if values.shape[0] > 0:
+            # all-NA columns give NaN with "All-NaN slice" warning
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                other.min = np.nanmin(values, axis=0)
+                other.max = np.nanmax(values, axis=0)
+        self.merge(other)
+
+    def merge(self, other: "MomentSketch") -> None:
+        """
+        Merge another MomentSketch of the same columns into this one.
+
+        Args:
+            other (MomentSketch): The sketch to be merged.
+        """
+        na, nb = self.n, other.n
+        n: np.ndarray = na + nb
+        delta: np.ndarray = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            n_safe: np.ndarray = np.where(n > 0, n, 1.0)
+            mean = self.mean + delta * nb / n_safe
+            m2 = self.m2 + other.m2 + delta**2 * na * nb / n_safe
+            m3 = (
+                self.m3
+                + other.m3
+                + delta**3 * na * nb * (na - nb) / n_safe**2
+                + 3.0 * delta * (na * other.m2 - nb * self.m2) / n_safe
+            )
+            m4 = (
+                self.m4
+                + other.m4
+                + delta**4 * na * nb * (na**2 - na * nb + nb**2) / n_safe**3
+                + 6.0 * delta**2 * (na**2 * other.m2 + nb**2 * self.m2) / n_safe**2
+                + 4.0 * delta * (na * other.m3 - nb * self.m3) / n_safe
+            )
+
+        self.n, self.mean, self.m2, self.m3, self.m4 = n, mean, m2, m3, m4
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+
+    def get(self, method: str) -> np.ndarray:
+        """
+        Get the statistic from the moments, as pandas does (ddof=1,
+            bias-corrected skewness and excess kurtosis).
+
+        Args:
+            method (str): One of mean, std, var, min, max, skew, kurtosis.
+
+        Return:
+            (np.ndarray) The statistic of each column, NaN if undefined.
+        """
+        n, m2 = self.n, self.m2
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if method == "mean":
+                return np.where(n > 0, self.mean, np.nan)
+            if method in ("var", "std"):
+                var = np.where(n > 1, m2 / (n - 1), np.nan)
+                return np.sqrt(var) if method == "std" else var
+            if method == "min":
+                return self.min
+            if method == "max":
+                return self.max
+            if method == "skew":
+                skew = np.sqrt(n * (n - 1)) / (n - 2) * np.sqrt(n) * self.m3 / m2**1.5
+                return np.where(n < 3, np.nan, np.where(m2 == 0, 0.0, skew))
+            if method == "kurtosis":
+                kurt = (n + 1) * n * (n - 1) * self.m4 / ((n - 2) * (n - 3) * m2**2)
+                kurt -= 3.0 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+                return np.where(n < 4, np.nan, np.where(m2 == 0, 0.0, kurt))
+        raise ValueError(f"Unsupported moment statistic: {method}")
+
+
+class CoMomentSketch:
+    """
+    Mergeable sums of pairwise complete observations of numerical columns,
+        giving covariance and Pearson correlation as pandas does
+        (pairwise NA exclusion, ddof=1). Values are shifted by
+        the first chunk's means to avoid catastrophic cancellation.
+    """
+
+    def __init__(self, n_cols: int):
+        """
+        Args:
+            n_cols (int): Number of numerical columns.
+        """
+        self.shift: np.ndarray | None = None
+        self.n: np.ndarray = np.zeros((n_cols, n_cols))
+        self.sx: np.ndarray = np.zeros((n_cols, n_cols))
+        self.sxx: np.ndarray = np.zeros((n_cols, n_cols))
+        self.sxy: np.ndarray = np.zeros((n_cols, n_cols))
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Add a chunk of values.
+
+        Args:
+            values (np.ndarray): 2D float array (rows, columns), NaN as missing.
+        """
+        if self.shift is None:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                self.shift = np.nan_to_num(np.nanmean(values, axis=0))
+        mask: np.ndarray = (~np.isnan(values)).astype(float)
+        centered: np.ndarray = np.where(mask > 0, values - self.shift, 0.0)
+
+        # [i, j]: sums of column i over the rows where column j is also present
+        self.n += mask.T @ mask
+        self.sx += centered.T @ mask
+        self.sxx += (centered**2).T @ mask
+        self.sxy += centered.T @ centered
+
+    def merge(self, other: "CoMomentSketch") -> None:
+        """
+        Merge another CoMomentSketch of the same columns into this one.
+
+        Args:
+            other (CoMomentSketch): The sketch to be merged.
+        """
+        if other.shift is None:
+            return
+        if self.shift is None:
+            self.shift = np.zeros_like(other.shift)
+        # move the sums of other onto the shift of this one
+        d: np.ndarray = other.shift - self.shift
+        sx: np.ndarray = other.sx + d[:, None] * other.n
+        self.sxx += other.sxx + 2 * d[:, None] * other.sx + d[:, None] ** 2 * other.n
+        self.sxy += (
+            other.sxy
+            + d[:, None] * other.sx.T
+            + d[None, :] * other.sx
+            + np.outer(d, d) * other.n
+        )
+        self.sx += sx
+        self.n += other.n
+
+    def get(self, method: str) -> np.ndarray:
+        """
+        Get the covariance or correlation matrix.
+
+        Args:
+            method (str): 'cov' or 'corr'.
+
+        Return:
+            (np.ndarray) The matrix, NaN if fewer than 2 pairwise observations.
+        """
+        n: np.ndarray = self.n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = (self.sxy - self.sx * self.sx.T / n) / (n - 1)
+            cov = np.where(n > 1, cov, np.nan)
+            if method == "cov":
+                return cov
+            var = np.where(n > 1, (self.sxx - self.sx**2 / n) / (n - 1), np.nan)
+            corr = np.clip(cov / np.sqrt(var * var.T), -1.0, 1.0)
+        np.fill_diagonal(corr, np.where(np.diag(var) > 0, 1.0, np.nan))
+        return corr
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang and Liberty, 2016) of one column.
+        Compactors of level h hold items of weight 2^h; a full compactor
+        sorts itself and promotes every other item to the next level.
+        The normalized rank error is about 1.7% for k=200 (99% confidence),
+        decreasing roughly as 1/k. While no compaction happened,
+        the quantiles are exact (linear interpolation as pandas).
+    """
+
+    C: float = 2.0 / 3.0
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        """
+        Args:
+            k (int): Capacity of the top compactor. Default is 200.
+            seed (int): Seed of the compaction offsets. Default is 0.
+        """
+        self.k: int = k
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+        self.compactors: list[np.ndarray] = [np.empty(0)]
+
+    def _capacity(self, level: int) -> int:
+        depth: int = len(self.compactors) - level - 1
+        return int(np.ceil(self.k * self.C**depth)) + 1
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Add non-missing values of a chunk.
+
+        Args:
+            values (np.ndarray): 1D float array, NaN are dropped.
+        """
+        values = values[~np.isnan(values)]
+        if values.size:
+            self.compactors[0] = np.concatenate([self.compactors[0], values])
+            self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """
+        Merge another KLLSketch into this one.
+
+        Args:
+            other (KLLSketch): The sketch to be merged.
+        """
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0))
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+        self._compress()
+
+    def _compress(self) -> None:
+        level: int = 0
+        while level < len(self.compactors):
+            items: np.ndarray = self.compactors[level]
+            if items.size >= self._capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0))
+                items = np.sort(items)
+                # keep the largest item back if the count is odd
+                keep: np.ndarray = items[items.size - items.size % 2 :]
+                offset: int = int(self._rng.integers(2))
+                promoted: np.ndarray = items[offset : items.size - items.size % 2 : 2]
+                self.compactors[level] = keep
+                self.compactors[level + 1] = np.concatenate(
+                    [self.compactors[level + 1], promoted]
+                )
+            level += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Get the approximate q-quantile.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Return:
+            (float) The quantile, NaN if no values were added.
+        """
+        if len(self.compactors) == 1:
+            items: np.ndarray = self.compactors[0]
+            return float(np.quantile(items, q)) if items.size else np.nan
+
+        items = np.concatenate(self.compactors)
+        weights: np.ndarray = np.concatenate(
+            [np.full(c.size, 2.0**level) for level, c in enumerate(self.compactors)]
+        )
+        order: np.ndarray = np.argsort(items, kind="stable")
+        cum_weights: np.ndarray = np.cumsum(weights[order])
+        idx: int = int(np.searchsorted(cum_weights, q * cum_weights[-1]))
+        return float(items[order][min(idx, items.size - 1)])
+
+
+class HyperLogLogSketch:
+    """
+    HyperLogLog distinct count sketch (Flajolet et al., 2007) of one column,
+        with linear counting for small cardinalities.
+        Values are hashed by pandas' 64 bits hash. The relative standard error
+        is 1.04 / sqrt(2^precision), about 0.81% for precision=14.
+    """
+
+    def __init__(self, precision: int = 14):
+        """
+        Args:
+            precision (int): Number of index bits, 2^precision registers. Default is 14.
+        """
+        self.precision: int = precision
+        self.registers: np.ndarray = np.zeros(2**precision, dtype=np.uint8)
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Add non-missing values of a chunk.
+
+        Args:
+            values (pd.Series): The column chunk, NA are dropped.
+        """
+        values = values.dropna()
+        if values.empty:
+            return
+        hashed: np.ndarray = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        p: int = self.precision
+        idx: np.ndarray = (hashed >> np.uint64(64 - p)).astype(np.intp)
+        rest: np.ndarray = hashed & np.uint64((1 << (64 - p)) - 1)
+
+        # rank: position of the leftmost 1-bit in the remaining 64 - p bits
+        bit_length: np.ndarray = np.zeros(rest.size, dtype=np.int64)
+        for shift in (32, 16, 8, 4, 2, 1):
+            high: np.ndarray = rest >= np.uint64(1 << shift)
+            bit_length[high] += shift
+            rest = np.where(high, rest >> np.uint64(shift), rest)
+        bit_length += (rest > 0).astype(np.int64)
+        rank: np.ndarray = (64 - p - bit_length + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: "HyperLogLogSketch") -> None:
+        """
+        Merge another HyperLogLogSketch of the same precision into this one.
+
+        Args:
+            other (HyperLogLogSketch): The sketch to be merged.
+        """
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        """
+        Get the estimated number of distinct values.
+
+        Return:
+            (int) The estimated distinct count.
+        """
+        m: int = self.registers.size
+        alpha: float = 0.7213 / (1 + 1.079 / m)
+        estimate: float = alpha * m**2 / np.sum(2.0 ** -self.registers.astype(float))
+        zeros: int = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class DataDescriberSketch:
+    """
+    One-pass, bounded-memory describer of a table consumed in chunks.
+        Holds mergeable sketches for the requested describing methods:
+
+        - row/column/NA counts, mean, std, var, min, max, skew, kurtosis,
+            cov and corr are exact (MomentSketch, CoMomentSketch).
+        - median, q1, q3 and percentile are approximate (KLLSketch).
+        - nunique is approximate (HyperLogLogSketch).
+
+    Numerical columns follow pandas' numeric_only=True (bool as 0/1),
+        nunique columns follow DataDescriberNUnique.
+    """
+
+    MOMENT_METHODS: list[str] = [
+        "mean",
+        "std",
+        "var",
+        "min",
+        "max",
+        "kurtosis",
+        "skew",
+    ]
+    QUANTILE_METHODS: dict[str, float] = {"median": 0.5, "q1": 0.25, "q3": 0.75}
+    PAIRWISE_METHODS: list[str] = ["cov", "corr"]
+
+    def __init__(
+        self,
+        describe_method: list[str],
+        percentile: float | None = None,
+        sketch_k: int = 200,
+        hll_precision: int = 14,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            describe_method (list[str]): The describing methods to sketch.
+            percentile (float, optional): The percentile of 'percentile' method.
+            sketch_k (int): k of KLLSketch. Default is 200.
+            hll_precision (int): precision of HyperLogLogSketch. Default is 14.
+            seed (int): Seed of KLLSketch. Default is 0.
+        """
+        self._logger: logging.Logger = logging.getLogger(
+            f"PETsARD.{self.__class__.__name__}"
+        )
+        self.describe_method: list[str] = describe_method
+        self.percentile: float | None = percentile
+        self.sketch_k: int = sketch_k
+        self.hll_precision: int = hll_precision
+        self.seed: int = seed
+
+        self.columns: list[str] | None = None
+        self.numeric_cols: list[str] = []
+        self.nunique_cols: list[str] = []
+        self.row_count: int = 0
+        self.global_na_count: int = 0
+        self.col_na_count: np.ndarray | None = None
+        self.moments: MomentSketch | None = None
+        self.comoments: CoMomentSketch | None = None
+        self.quantiles: dict[str, KLLSketch] = {}
+        self.distinct: dict[str, HyperLogLogSketch] = {}
+
+    def _init_columns(self, chunk: pd.DataFrame) -> None:
+        self.columns = list(chunk.columns)
+        self.numeric_cols = list(
+            chunk.select_dtypes(include=["number", "bool"]).columns
+        )
+        self.nunique_cols = [
+            col
+            for col, dtype in chunk.dtypes.items()
+            if is_bool_dtype(chunk[col])
+            or is_string_dtype(chunk[col])
+            or isinstance(dtype, pd.CategoricalDtype)
+            or is_object_dtype(chunk[col])
+        ]
+        self.col_na_count = np.zeros(len(self.columns), dtype=np.int64)
+
+        methods: set[str] = set(self.describe_method)
+        n_numeric: int = len(self.numeric_cols)
+        if methods.intersection(self.MOMENT_METHODS):
+            self.moments = MomentSketch(n_numeric)
+        if methods.intersection(self.PAIRWISE_METHODS):
+            self.comoments = CoMomentSketch(n_numeric)
+        if methods.intersection([*self.QUANTILE_METHODS, "percentile"]):
+            self.quantiles = {
+                col: KLLSketch(k=self.sketch_k, seed=self.seed + i)
+                for i, col in enumerate(self.numeric_cols)
+            }
+        if "nunique" in methods:
+            self.distinct = {
+                col: HyperLogLogSketch(precision=self.hll_precision)
+                for col in self.nunique_cols
+            }
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Add a chunk of rows. Every chunk should have the same columns and dtypes.
+
+        Args:
+            chunk (pd.DataFrame): The chunk to be described.
+        """
+        if self.columns is None:
+            self._init_columns(chunk)
+
+        na_mask: np.ndarray = chunk.isna().to_numpy()
+        self.row_count += chunk.shape[0]
+        self.global_na_count += int(na_mask.any(axis=1).sum())
+        self.col_na_count += na_mask.sum(axis=0)
+
+        if self.numeric_cols and (self.moments or self.comoments or self.quantiles):
+            values: np.ndarray = (
+                chunk[self.numeric_cols]
+                .astype(float)
+                .to_numpy(dtype=float, na_value=np.nan)
+            )
+            if self.moments:
+                self.moments.update(values)
+            if self.comoments:
+                self.comoments.update(values)
+            for i, sketch in enumerate(self.quantiles.values()):
+                sketch.update(values[:, i])
+
+        for col, sketch in self.distinct.items():
+            sketch.update(chunk[col])
+
+    def merge(self, other: "DataDescriberSketch") -> None:
+        """
+        Merge another DataDescriberSketch of the same columns into this one,
+            e.g. sketches of partitions described separately.
+
+        Args:
+            other (DataDescriberSketch): The sketch to be merged.
+        """
+        if other.columns is None:
+            return
+        if self.columns is None:
+            self.__dict__.update(
+                {
+                    key: deepcopy(value)
+                    for key, value in other.__dict__.items()
+                    if key != "_logger"
+                }
+            )
+            return
+
+        self.row_count += other.row_count
+        self.global_na_count += other.global_na_count
+        self.col_na_count += other.col_na_count
+        for name in ("moments", "comoments"):
+            if getattr(self, name) is not None:
+                getattr(self, name).merge(getattr(other, name))
+        for sketches, other_sketches in (
+            (self.quantiles, other.quantiles),
+            (self.distinct, other.distinct),
+        ):
+            for col, sketch in sketches.items():
+                sketch.merge(other_sketches[col])
+
+    def _pairwise(self, method: str) -> dict[str, dict[tuple[str, str], float]]:
+        matrix: pd.DataFrame = pd.DataFrame(
+            self.comoments.get(method),
+            index=self.numeric_cols,
+            columns=self.numeric_cols,
+        )
+        matrix = matrix.mask(np.triu(np.ones(matrix.shape, dtype=bool), k=1))
+        return {
+            method: {
+                (col1, col2): value
+                for col2 in matrix.columns
+                for col1, value in matrix[col2].items()
+                if not pd.isna(value)
+            }
+        }
+
+    def describe(self, method: str) -> dict[str, Any]:
+        """
+        Get the result of a describing method, in the same format
+            as the corresponding BaseDataDescriber.
+
+        Args:
+            method (str): The describing method.
+
+        Return:
+            (dict[str, Any]) The describe result.
+        """
+        if method == "row_count":
+            return {"row_count": int(self.row_count)}
+        if method == "col_count":
+            return {"col_count": len(self.columns)}
+        if method == "global_na_count":
+            return {"na_count": int(self.global_na_count)}
+        if method == "col_na_count":
+            return {
+                "na_count": {
+                    col: int(count)
+                    for col, count in zip(self.columns, self.col_na_count, strict=True)
+                }
+            }
+        if method in self.MOMENT_METHODS:
+            return {
+                method: dict(
+                    zip(
+                        self.numeric_cols,
+                        self.moments.get(method).tolist(),
+                        strict=True,
+                    )
+                )
+            }
+        if method in self.QUANTILE_METHODS or method == "percentile":
+            q: float = self.QUANTILE_METHODS.get(method, self.percentile)
+            key: str = (
+                f"{self.percentile * 100} th percentile"
+                if method == "percentile"
+                else method
+            )
+            return {
+                key: {col: sketch.quantile(q) for col, sketch in self.quantiles.items()}
+            }
+        if method == "nunique":
+            return {
+                "nunique": {
+                    col: sketch.count() for col, sketch in self.distinct.items()
+                }
+            }
+        if method in self.PAIRWISE_METHODS:
+            return self._pairwise(method)
+
+        error_msg: str = f"Unsupported streaming describe method: {method}"
+        self._logger.error(error_msg)
+        raise ValueError(error_msg)
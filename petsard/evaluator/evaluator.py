@@ -254,6 +254,9 @@ class Evaluator:
         columns_info: list[str, list[str]] = {}
         dtype_counts: list[str, list[str]] = {}
         for key, df in data.items():
+            if not isinstance(df, pd.DataFrame):
+                # e.g. data chunks of a streaming Describer
+                continue
             columns_info[key] = list(df.columns)
             dtype_counts[key] = dict(df.dtypes.value_counts())
 
@@ -1,22 +1,26 @@
 import logging
 import re
-from copy import deepcopy
+import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
+from joblib import Parallel, delayed
 from sklearn.cluster import KMeans
 from sklearn.ensemble import (
     GradientBoostingClassifier,
     GradientBoostingRegressor,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
     RandomForestClassifier,
     RandomForestRegressor,
 )
 from sklearn.linear_model import LinearRegression, LogisticRegression
-from sklearn.metrics import f1_score, silhouette_score
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.metrics import f1_score, r2_score, silhouette_score
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler
 from sklearn.svm import SVC
 
 from petsard.config_base import BaseConfig
@@ -61,6 +65,23 @@ class MLUtilityConfig(BaseConfig):
             Should be a numerical column for regression.
         n_clusters (list[int], optional):
             List of cluster numbers for clustering. Default is [4, 5, 6].
+        n_jobs (int, optional):
+            Number of joblib workers running the ori and syn model sets concurrently,
+            or the bootstrap repetitions when sample_size is set.
+            -1 means all CPUs, -2 all but one. Default is 1 (serially).
+        encoding (str, optional): Encoding of categorical columns.
+            - 'onehot': Dense one-hot encoding (default).
+            - 'sparse': Sparse CSR one-hot encoding, scaled without centering.
+            - 'native': Ordinal codes for the native categorical support of
+                HistGradientBoosting, the only model used. Not for clustering.
+        sample_size (int, optional):
+            Rows drawn with replacement from each of ori, syn and control
+            for every bootstrap repetition, stratified by target for classification.
+            Default is None, evaluating on the full data.
+        n_bootstrap (int, optional):
+            Number of bootstrap repetitions when sample_size is set. Default is 10.
+        confidence_level (float, optional):
+            Confidence level of the bootstrap percentile intervals. Default is 0.95.
         REQUIRED_INPUT_KEYS (list[str]): The required keys in the input data.
         n_rows (dict[str, int]): Number of rows in each data.
         category_cols (list[str]): List of categorical columns in the data.
@@ -73,6 +94,11 @@ class MLUtilityConfig(BaseConfig):
     eval_method_code: Optional[int] = None
     target: Optional[str] = None
     n_clusters: list[int] = field(default_factory=lambda: [4, 5, 6])
+    n_jobs: int = 1
+    encoding: str = "onehot"
+    sample_size: Optional[int] = None
+    n_bootstrap: int = 10
+    confidence_level: float = 0.95
     REQUIRED_INPUT_KEYS: list[str] = field(
         default_factory=lambda: ["ori", "syn", "control"]
     )
@@ -103,6 +129,44 @@ class MLUtilityConfig(BaseConfig):
             self._logger.error(error_msg)
             raise ConfigError(error_msg)
 
+        # Validate n_jobs
+        if not isinstance(self.n_jobs, int) or self.n_jobs == 0:
+            error_msg = "n_jobs must be a non-zero integer"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        # Validate encoding
+        if self.encoding not in ["onehot", "sparse", "native"]:
+            error_msg = (
+                f"Unsupported encoding: {self.encoding}. "
+                "Should be 'onehot', 'sparse' or 'native'"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        if self.encoding == "native" and self.eval_method_code == MLUtilityMap.CLUSTER:
+            error_msg = "Native categorical encoding is not supported for clustering"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        # Validate bootstrap
+        if self.sample_size is not None and (
+            not isinstance(self.sample_size, int) or self.sample_size < 1
+        ):
+            error_msg = "sample_size must be a positive integer"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        if not isinstance(self.n_bootstrap, int) or self.n_bootstrap < 1:
+            error_msg = "n_bootstrap must be a positive integer"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        if not 0 < self.confidence_level < 1:
+            error_msg = "confidence_level must be between 0 and 1"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
         # Validate target for specific methods
         if self.eval_method_code in [
             MLUtilityMap.REGRESSION,
@@ -187,6 +251,7 @@ class MLUtility(BaseEvaluator):
     }
     AVAILABLE_SCORES_GRANULARITY: list[str] = ["global", "details"]
     HIGH_CARDINALITY_THRESHOLD: float = 0.1  # 1/10 of rows
+    NATIVE_MAX_CATEGORIES: int = 255  # max_bins of HistGradientBoosting
     RANDOM_STATE_SEED: int = 42
 
     def __init__(self, config: dict):
@@ -200,6 +265,8 @@ class MLUtility(BaseEvaluator):
             AVAILABLE_SCORES_GRANULARITY (list[str]): The available scores granularity.
             HIGH_CARDINALITY_THRESHOLD (float):
                 The threshold for high cardinality. Represents as percentage of rows.
+            NATIVE_MAX_CATEGORIES (int): The maximum categories of a native categorical feature.
+                Columns with more categories are used as ordinal features.
             RANDOM_STATE_SEED (int): The random state seed for the models.
             _logger (logging.Logger): The logger object.
             config (dict): A dictionary containing the configuration settings.
@@ -207,6 +274,9 @@ class MLUtility(BaseEvaluator):
             _impl (Optional[dict[str, callable]]): The evaluator object.
                 - 'ori': The evaluator object for the original data.
                 - 'syn': The evaluator object for the synthetic data.
+            _model_timings (list[dict]): Fit/predict timings of the running model set.
+            _categorical_features (Optional[list[bool]]):
+                Native categorical mask of the features, only for 'native' encoding.
         """
         super().__init__(config=config)
         self._logger: logging.Logger = logging.getLogger(
@@ -224,6 +294,8 @@ class MLUtility(BaseEvaluator):
         self._logger.debug("MLUtilityConfig successfully initialized")
 
         self._impl: Optional[dict[str, callable]] = None
+        self._model_timings: list[dict] = []
+        self._categorical_features: Optional[list[bool]] = None
 
     def _preprocessing(
         self, data: dict[str, pd.DataFrame]
@@ -232,8 +304,9 @@ class MLUtility(BaseEvaluator):
         Preprocess the data for the evaluation.
             1. Remove missing values.
             2. Remove high cardinality columns.
-            3. One-hot encoding for categorical columns.
-            4. Standardize the data.
+            3. Encode categorical columns, by the encoding of config:
+                dense one-hot, sparse one-hot or native ordinal codes.
+            4. Standardize the data, except for native encoding.
             5. Check if the target column is constant.
 
         Args:
@@ -255,7 +328,11 @@ class MLUtility(BaseEvaluator):
                         The target column is constant
         """
         error_msg: Optional[str] = None
-        inprogress_data: dict[str, pd.DataFrame] = deepcopy(data)
+        # frames are replaced instead of modified, a shallow copy is enough
+        inprogress_data: dict[str, pd.DataFrame] = dict(data)
+        encoding: str = self.mlutility_config.encoding
+        encoded_categories: dict[str, Any] = {}
+        category_mask: list[bool] = []
         data_now: Optional[pd.DataFrame] = None
         preprocessed_data: dict[str, pd.DataFrame] = {}
 
@@ -318,6 +395,16 @@ class MLUtility(BaseEvaluator):
                         )
                         self._logger.debug(f"Column {col} removed for {key}")
 
+        if len(temp_category_cols) != 0 and encoding != "onehot":
+            # Categories are kept apart and joined to the numeric features later
+            encoded_categories, category_mask = self._encode_categories(
+                inprogress_data, temp_category_cols
+            )
+            for key in self.REQUIRED_INPUT_KEYS:
+                inprogress_data[key] = inprogress_data[key].drop(
+                    columns=temp_category_cols, inplace=False
+                )
+        elif len(temp_category_cols) != 0:
             # One-hot encoding
             ohe = OneHotEncoder(
                 drop="first",
@@ -367,18 +454,38 @@ class MLUtility(BaseEvaluator):
                         ]
                     )
                 )
-            ss_X = StandardScaler()
-            ss_X.fit(
-                pd.concat(
-                    [
-                        inprogress_data["ori"].drop(columns=[target], inplace=False),
-                        inprogress_data["syn"].drop(columns=[target], inplace=False),
-                        inprogress_data["control"].drop(
-                            columns=[target], inplace=False
-                        ),
-                    ]
+            if encoding == "onehot":
+                ss_X = StandardScaler()
+                ss_X.fit(
+                    pd.concat(
+                        [
+                            inprogress_data["ori"].drop(
+                                columns=[target], inplace=False
+                            ),
+                            inprogress_data["syn"].drop(
+                                columns=[target], inplace=False
+                            ),
+                            inprogress_data["control"].drop(
+                                columns=[target], inplace=False
+                            ),
+                        ]
+                    )
+                )
+                features: dict[str, Any] = {
+                    key: ss_X.transform(
+                        inprogress_data[key].drop(columns=[target], inplace=False)
+                    )
+                    for key in self.REQUIRED_INPUT_KEYS
+                }
+            else:
+                features = self._join_features(
+                    {
+                        key: inprogress_data[key].drop(columns=[target], inplace=False)
+                        for key in self.REQUIRED_INPUT_KEYS
+                    },
+                    encoded_categories,
+                    category_mask,
                 )
-            )
 
             for key in self.REQUIRED_INPUT_KEYS:
                 target_value: np.ndarray = inprogress_data[key][target].values
@@ -394,9 +501,19 @@ class MLUtility(BaseEvaluator):
                     if self.mlutility_config.eval_method_code == MLUtilityMap.REGRESSION
                     else target_value
                 )
-                preprocessed_data[key]["X"] = ss_X.transform(
-                    inprogress_data[key].drop(columns=[target], inplace=False)
-                )
+                preprocessed_data[key]["X"] = features[key]
+
+        elif (
+            self.mlutility_config.eval_method_code == MLUtilityMap.CLUSTER
+            and encoding == "sparse"
+        ):
+            features = self._join_features(
+                {key: inprogress_data[key] for key in self.REQUIRED_INPUT_KEYS},
+                encoded_categories,
+                category_mask,
+            )
+            for key in self.REQUIRED_INPUT_KEYS:
+                preprocessed_data[key] = {"X": features[key]}
 
         elif self.mlutility_config.eval_method_code == MLUtilityMap.CLUSTER:
             united_columns = list(
@@ -443,6 +560,103 @@ class MLUtility(BaseEvaluator):
 
         return preprocessed_data, "success"
 
+    def _encode_categories(
+        self, data: dict[str, pd.DataFrame], category_cols: list[str]
+    ) -> tuple[dict[str, Any], list[bool]]:
+        """
+        Encode the categorical columns apart from the numeric columns,
+            fitted on ori, syn and control together.
+            - 'sparse': One-hot encoding as scipy.sparse CSR matrix.
+            - 'native': Ordinal codes, unknown categories as NaN.
+
+        Args:
+            data (dict[str, pd.DataFrame]): The data to be evaluated.
+            category_cols (list[str]): The categorical columns to be encoded.
+
+        Returns:
+            (tuple[dict[str, Any], list[bool]]):
+                The encoded categories of each data,
+                and whether each column is a native categorical feature.
+                Columns over NATIVE_MAX_CATEGORIES are used as ordinal features.
+        """
+        if self.mlutility_config.encoding == "sparse":
+            encoder = OneHotEncoder(
+                drop="first",
+                sparse_output=True,
+                handle_unknown="infrequent_if_exist",
+            )
+        else:
+            encoder = OrdinalEncoder(
+                handle_unknown="use_encoded_value",
+                unknown_value=np.nan,
+                encoded_missing_value=np.nan,
+            )
+        encoder.fit(
+            pd.concat([data[key][category_cols] for key in self.REQUIRED_INPUT_KEYS])
+        )
+
+        category_mask: list[bool] = []
+        if self.mlutility_config.encoding == "native":
+            for col, categories in zip(category_cols, encoder.categories_, strict=True):
+                category_mask.append(len(categories) <= self.NATIVE_MAX_CATEGORIES)
+                if not category_mask[-1]:
+                    self._logger.warning(
+                        f"The column {col} has {len(categories)} categories, "
+                        f"over {self.NATIVE_MAX_CATEGORIES} of native categorical support. "
+                        "It is used as an ordinal feature."
+                    )
+        self._logger.debug(
+            f"{self.mlutility_config.encoding.capitalize()} encoding completed"
+        )
+
+        return {
+            key: encoder.transform(data[key][category_cols])
+            for key in self.REQUIRED_INPUT_KEYS
+        }, category_mask
+
+    def _join_features(
+        self,
+        numeric: dict[str, pd.DataFrame],
+        encoded_categories: dict[str, Any],
+        category_mask: list[bool],
+    ) -> dict[str, Any]:
+        """
+        Join the numeric columns with the encoded categories.
+            - 'sparse': CSR matrix standardized without centering,
+                so the one-hot columns stay sparse.
+            - 'native': Dense array without standardization,
+                and sets the native categorical mask of the features.
+
+        Args:
+            numeric (dict[str, pd.DataFrame]): The numeric columns of each data.
+            encoded_categories (dict[str, Any]): The output of _encode_categories().
+                Empty if there is no categorical column.
+            category_mask (list[bool]): The output of _encode_categories().
+
+        Returns:
+            (dict[str, Any]): The features of each data.
+        """
+        features: dict[str, Any] = {}
+        if self.mlutility_config.encoding == "sparse":
+            for key in self.REQUIRED_INPUT_KEYS:
+                blocks: list = [sp.csr_matrix(numeric[key].to_numpy(dtype=np.float64))]
+                if key in encoded_categories:
+                    blocks.append(encoded_categories[key])
+                features[key] = sp.hstack(blocks, format="csr")
+
+            ss = StandardScaler(with_mean=False)
+            ss.fit(sp.vstack(list(features.values()), format="csr"))
+            return {key: ss.transform(X) for key, X in features.items()}
+
+        for key in self.REQUIRED_INPUT_KEYS:
+            blocks = [numeric[key].to_numpy(dtype=np.float64)]
+            if key in encoded_categories:
+                blocks.append(encoded_categories[key])
+            features[key] = np.hstack(blocks)
+
+        self._categorical_features = [False] * numeric["ori"].shape[1] + category_mask
+        return features
+
     def _adjust_to_lower_bound(self, value: float) -> float:
         """
         Check if the score is beyond the lower bound.
@@ -474,6 +688,46 @@ class MLUtility(BaseEvaluator):
 
         return value
 
+    def _fit_predict(
+        self,
+        name: str,
+        model: Any,
+        X_train: np.ndarray,
+        X_test: np.ndarray,
+        y_train: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Fit the model once and predict the testing data,
+            recording the fit and predict time of the model.
+
+        Args:
+            name (str): The name of the model.
+            model (Any): The sklearn estimator.
+            X_train (np.ndarray): The data to be fitted.
+            X_test (np.ndarray): The data to be tested.
+            y_train (np.ndarray, optional): The target column of the training data.
+                None for clustering.
+
+        Returns:
+            (np.ndarray): The prediction of the testing data.
+        """
+        time_start: float = time.perf_counter()
+        if y_train is None:
+            model.fit(X_train)
+        else:
+            model.fit(X_train, y_train)
+        time_fitted: float = time.perf_counter()
+        y_pred: np.ndarray = model.predict(X_test)
+
+        self._model_timings.append(
+            {
+                "model": name,
+                "fit_seconds": time_fitted - time_start,
+                "predict_seconds": time.perf_counter() - time_fitted,
+            }
+        )
+        return y_pred
+
     def _classification(
         self,
         X_train: np.ndarray,
@@ -483,7 +737,8 @@ class MLUtility(BaseEvaluator):
     ) -> dict[str, float]:
         """
         Classification model fitting, evaluation, and testing.
-            The models used are logistic regression, SVC, random forest, and gradient boosting.
+            The models used are logistic regression, SVC, random forest, and gradient boosting,
+            or histogram-based gradient boosting with native categories for 'native' encoding.
 
         The metric used for evaluation is f1 score.
 
@@ -499,32 +754,39 @@ class MLUtility(BaseEvaluator):
                 - 'svc': The f1 score of the SVC model.
                 - 'random_forest': The f1 score of the random forest model.
                 - 'gradient_boosting': The f1 score of the gradient boosting model
+                - 'hist_gradient_boosting': The f1 score of the histogram-based
+                    gradient boosting model, the only model of 'native' encoding.
         """
         result: dict[str, float] = {}
         average_method: str = "micro"
 
-        models_to_evaluate_map: dict[str, callable] = {
-            "logistic_regression": LogisticRegression(
-                random_state=self.RANDOM_STATE_SEED
-            ),
-            "svc": SVC(random_state=self.RANDOM_STATE_SEED),
-            "random_forest": RandomForestClassifier(
-                random_state=self.RANDOM_STATE_SEED
-            ),
-            "gradient_boosting": GradientBoostingClassifier(
-                random_state=self.RANDOM_STATE_SEED
-            ),
-        }
-
-        # train
-        for model in models_to_evaluate_map.values():
-            model.fit(X_train, y_train)
+        models_to_evaluate_map: dict[str, callable] = (
+            {
+                "hist_gradient_boosting": HistGradientBoostingClassifier(
+                    categorical_features=self._categorical_features,
+                    random_state=self.RANDOM_STATE_SEED,
+                ),
+            }
+            if self.mlutility_config.encoding == "native"
+            else {
+                "logistic_regression": LogisticRegression(
+                    random_state=self.RANDOM_STATE_SEED
+                ),
+                "svc": SVC(random_state=self.RANDOM_STATE_SEED),
+                "random_forest": RandomForestClassifier(
+                    random_state=self.RANDOM_STATE_SEED
+                ),
+                "gradient_boosting": GradientBoostingClassifier(
+                    random_state=self.RANDOM_STATE_SEED
+                ),
+            }
+        )
 
-        # evaluate
+        # train once and evaluate
         result = {
             name: f1_score(
                 y_test,
-                model.fit(X_train, y_train).predict(X_test),
+                self._fit_predict(name, model, X_train, X_test, y_train),
                 average=average_method,
             )
             for name, model in models_to_evaluate_map.items()
@@ -558,12 +820,12 @@ class MLUtility(BaseEvaluator):
                 random_state=self.RANDOM_STATE_SEED, n_clusters=k, n_init="auto"
             )
 
-            k_model.fit(X_train)
+            y_pred: np.ndarray = self._fit_predict(
+                f"KMeans_cluster{k}", k_model, X_train, X_test
+            )
 
             try:
-                silhouette_score_value = silhouette_score(
-                    X_test, k_model.predict(X_test)
-                )
+                silhouette_score_value = silhouette_score(X_test, y_pred)
             except ValueError as e:
                 error_msg: str = (
                     "There is only one cluster in the prediction, "
@@ -590,7 +852,8 @@ class MLUtility(BaseEvaluator):
     ) -> dict[str, float]:
         """
         Regression model fitting, evaluation, and testing.
-            The models used are linear regression, random forest, and gradient boosting.
+            The models used are linear regression, random forest, and gradient boosting,
+            or histogram-based gradient boosting with native categories for 'native' encoding.
 
         The metric used for evaluation is R^2.
 
@@ -605,26 +868,62 @@ class MLUtility(BaseEvaluator):
                 - 'linear_regression': The R^2 score of the linear regression model.
                 - 'random_forest': The R^2 score of the random forest model.
                 - 'gradient_boosting': The R^2 score of the gradient boosting model
+                - 'hist_gradient_boosting': The R^2 score of the histogram-based
+                    gradient boosting model, the only model of 'native' encoding.
         """
         result: dict[str, float] = {}
 
-        models_to_evaluate_map: dict[str, callable] = {
-            "linear_regression": LinearRegression(),
-            "random_forest": RandomForestRegressor(random_state=self.RANDOM_STATE_SEED),
-            "gradient_boosting": GradientBoostingRegressor(
-                random_state=self.RANDOM_STATE_SEED
-            ),
-        }
+        models_to_evaluate_map: dict[str, callable] = (
+            {
+                "hist_gradient_boosting": HistGradientBoostingRegressor(
+                    categorical_features=self._categorical_features,
+                    random_state=self.RANDOM_STATE_SEED,
+                ),
+            }
+            if self.mlutility_config.encoding == "native"
+            else {
+                "linear_regression": LinearRegression(),
+                "random_forest": RandomForestRegressor(
+                    random_state=self.RANDOM_STATE_SEED
+                ),
+                "gradient_boosting": GradientBoostingRegressor(
+                    random_state=self.RANDOM_STATE_SEED
+                ),
+            }
+        )
 
         result = {
             name: self._adjust_to_lower_bound(
-                model.fit(X_train, y_train).score(X_test, y_test)
+                r2_score(
+                    y_test, self._fit_predict(name, model, X_train, X_test, y_train)
+                )
             )
             for name, model in models_to_evaluate_map.items()
         }
 
         return result
 
+    def _run_model_set(
+        self, model_params: dict[str, np.ndarray]
+    ) -> tuple[dict[str, float], list[dict]]:
+        """
+        Run the model set of the evaluation method on one training data.
+            Called by joblib, so the timings are returned with the scores.
+
+        Args:
+            model_params (dict[str, np.ndarray]): X_train, X_test, and
+                y_train, y_test for regression and classification.
+
+        Returns:
+            (tuple[dict[str, float], list[dict]]):
+                The scores of each model and the fit/predict timings of each model.
+        """
+        self._model_timings = []
+        result: dict[str, float] = self.MLUTILITY_CLASS_MAP[
+            self.mlutility_config.eval_method_code
+        ](**model_params)
+        return result, self._model_timings
+
     def _get_global(
         self, result: dict[str, Optional[dict[str, float]]]
     ) -> pd.DataFrame:
@@ -656,18 +955,64 @@ class MLUtility(BaseEvaluator):
 
         return compare_df
 
-    def _eval(self, data: dict[str, pd.DataFrame]) -> dict:
+    def _subsample(
+        self, data: dict[str, pd.DataFrame], rng: np.random.Generator
+    ) -> dict[str, pd.DataFrame]:
         """
-        Evaluate the data with the method given in the config.
+        Draw sample_size rows with replacement from each data,
+            stratified by the target for classification.
 
         Args:
             data (dict[str, pd.DataFrame]): The data to be evaluated.
+            rng (np.random.Generator): The random generator of the repetitions.
 
         Returns:
-            (dict) he evaluation result.
+            (dict[str, pd.DataFrame]): The subsample of each data.
+        """
+        sample_size: int = self.mlutility_config.sample_size
+        subsample: dict[str, pd.DataFrame] = {}
+
+        for key in self.REQUIRED_INPUT_KEYS:
+            n_rows: int = data[key].shape[0]
+            if self.mlutility_config.eval_method_code == MLUtilityMap.CLASSIFICATION:
+                # keep the class proportions, at least one row for each class
+                strata = (
+                    data[key].groupby(self.mlutility_config.target, sort=False).indices
+                )
+                positions: np.ndarray = np.concatenate(
+                    [
+                        rng.choice(
+                            indices,
+                            size=max(1, round(sample_size * len(indices) / n_rows)),
+                        )
+                        for indices in strata.values()
+                    ]
+                )
+            else:
+                positions = rng.choice(n_rows, size=sample_size)
+
+            subsample[key] = data[key].iloc[positions].reset_index(drop=True)
+
+        return subsample
+
+    def _evaluate(
+        self, data: dict[str, pd.DataFrame], n_jobs: int
+    ) -> tuple[dict[str, Optional[dict[str, float]]], list[dict]]:
+        """
+        Preprocess the data, then run the model sets of ori and syn.
+
+        Args:
+            data (dict[str, pd.DataFrame]): The data to be evaluated.
+            n_jobs (int): Number of joblib workers running the ori and syn model sets.
+
+        Returns:
+            (tuple[dict[str, Optional[dict[str, float]]], list[dict]]):
+                The scores of each model for 'ori' and 'syn',
+                and the fit/predict timings of each model.
         """
         preprocessed_data: dict[str, pd.DataFrame] = {}
         result_details: dict[str, Optional[dict[str, float]]] = {}
+        timings: list[dict] = []
 
         self.mlutility_config.update_data(data)
 
@@ -693,27 +1038,176 @@ class MLUtility(BaseEvaluator):
             )
             self._impl = {"ori": evaluator_class, "syn": evaluator_class}
 
-            result_details = {
-                data_type: evaluator_class(
-                    **(
-                        dict(
-                            X_train=preprocessed_data[data_type]["X"],
-                            y_train=preprocessed_data[data_type]["y"],
-                            X_test=preprocessed_data["control"]["X"],
-                            y_test=preprocessed_data["control"]["y"],
-                        )
-                        if self.mlutility_config.eval_method_code
-                        in [MLUtilityMap.CLASSIFICATION, MLUtilityMap.REGRESSION]
-                        else dict(
-                            X_train=preprocessed_data[data_type]["X"],
-                            X_test=preprocessed_data["control"]["X"],
-                        )
+            data_types: list[str] = ["ori", "syn"]
+            model_sets: list[tuple[dict[str, float], list[dict]]] = Parallel(
+                n_jobs=n_jobs
+            )(
+                delayed(self._run_model_set)(
+                    dict(
+                        X_train=preprocessed_data[data_type]["X"],
+                        y_train=preprocessed_data[data_type]["y"],
+                        X_test=preprocessed_data["control"]["X"],
+                        y_test=preprocessed_data["control"]["y"],
+                    )
+                    if self.mlutility_config.eval_method_code
+                    in [MLUtilityMap.CLASSIFICATION, MLUtilityMap.REGRESSION]
+                    else dict(
+                        X_train=preprocessed_data[data_type]["X"],
+                        X_test=preprocessed_data["control"]["X"],
                     )
                 )
-                for data_type in ["ori", "syn"]
+                for data_type in data_types
+            )
+
+            result_details = {
+                data_type: result
+                for data_type, (result, _) in zip(data_types, model_sets, strict=True)
             }
+            timings = [
+                {"data_type": data_type, **timing}
+                for data_type, (_, model_timings) in zip(
+                    data_types, model_sets, strict=True
+                )
+                for timing in model_timings
+            ]
+
+        return result_details, timings
+
+    def _eval_bootstrap(self, data: dict[str, pd.DataFrame]) -> dict:
+        """
+        Evaluate on n_bootstrap subsamples of sample_size rows,
+            the repetitions run by joblib workers.
+            Repetitions of which preprocessing fails are left out.
+
+        Args:
+            data (dict[str, pd.DataFrame]): The data to be evaluated.
+
+        Returns:
+            (dict) The evaluation result.
+                - global (pd.DataFrame): As _get_global() over the mean scores
+                    of the repetitions, with the percentile confidence interval
+                    of ori_mean, syn_mean and diff as '<name>_CI_btm' and '<name>_CI_top'.
+                - details (dict): Mean scores of each model for 'ori' and 'syn',
+                    'bootstrap' (pd.DataFrame), the scores of each repetition,
+                    and 'timing' (pd.DataFrame) with the repetition of each row.
+        """
+        n_bootstrap: int = self.mlutility_config.n_bootstrap
+        # validate the full data before sampling it
+        self.mlutility_config.update_data(data)
+
+        rng: np.random.Generator = np.random.default_rng(self.RANDOM_STATE_SEED)
+        self._logger.info(
+            f"Evaluating {n_bootstrap} bootstrap repetitions "
+            f"of {self.mlutility_config.sample_size} rows"
+        )
+        # the generator is consumed as dispatched, so only a few subsamples are held
+        repetitions: list[tuple[dict[str, Optional[dict[str, float]]], list[dict]]] = (
+            Parallel(n_jobs=self.mlutility_config.n_jobs)(
+                delayed(self._evaluate)(self._subsample(data, rng), n_jobs=1)
+                for _ in range(n_bootstrap)
+            )
+        )
+
+        scores: pd.DataFrame = pd.DataFrame(
+            [
+                {
+                    "repetition": repetition,
+                    "data_type": data_type,
+                    "model": model,
+                    "score": score,
+                }
+                for repetition, (result, _) in enumerate(repetitions)
+                if "error" not in result["ori"]
+                for data_type in ["ori", "syn"]
+                for model, score in result[data_type].items()
+            ],
+            columns=["repetition", "data_type", "model", "score"],
+        )
+        timings: list[dict] = [
+            {"repetition": repetition, **timing}
+            for repetition, (_, model_timings) in enumerate(repetitions)
+            for timing in model_timings
+        ]
+
+        n_valid: int = scores["repetition"].nunique()
+        if n_valid < n_bootstrap:
+            self._logger.warning(
+                f"{n_bootstrap - n_valid} of {n_bootstrap} bootstrap repetitions "
+                "failed in preprocessing and are left out"
+            )
+
+        result_details: dict[str, Optional[dict[str, float]]] = {
+            data_type: (
+                {"error": np.nan}
+                if n_valid == 0
+                else scores[scores["data_type"] == data_type]
+                .groupby("model", sort=False)["score"]
+                .mean()
+                .to_dict()
+            )
+            for data_type in ["ori", "syn"]
+        }
+        compare_df: pd.DataFrame = self._get_global(result_details)
+
+        # percentile interval of the repetition means over models
+        repetition_means: pd.DataFrame = scores.pivot_table(
+            index="repetition", columns="data_type", values="score", aggfunc="mean"
+        ).reindex(columns=["ori", "syn"])
+        repetition_means["diff"] = repetition_means["syn"] - repetition_means["ori"]
+        alpha: float = 1 - self.mlutility_config.confidence_level
+        for name, values in repetition_means.items():
+            if n_valid == 0:
+                btm, top = np.nan, np.nan
+            else:
+                btm, top = np.quantile(values, [alpha / 2, 1 - alpha / 2])
+            compare_df[f"{name}_CI_btm"] = safe_round(btm)
+            compare_df[f"{name}_CI_top"] = safe_round(top)
+
+        return {
+            "global": compare_df,
+            "details": {
+                **result_details,
+                "bootstrap": scores,
+                "timing": pd.DataFrame(
+                    timings,
+                    columns=[
+                        "repetition",
+                        "data_type",
+                        "model",
+                        "fit_seconds",
+                        "predict_seconds",
+                    ],
+                ),
+            },
+        }
+
+    def _eval(self, data: dict[str, pd.DataFrame]) -> dict:
+        """
+        Evaluate the data with the method given in the config.
+            Bootstrap subsamples are evaluated instead when sample_size is set.
+
+        Args:
+            data (dict[str, pd.DataFrame]): The data to be evaluated.
+
+        Returns:
+            (dict) he evaluation result.
+                - global (pd.DataFrame): Mean and std of the scores of ori and syn.
+                - details (dict): Scores of each model for 'ori' and 'syn',
+                    and 'timing' (pd.DataFrame), the fit/predict seconds of each model.
+                See _eval_bootstrap() for the result of bootstrap.
+        """
+        if self.mlutility_config.sample_size is not None:
+            return self._eval_bootstrap(data)
+
+        result_details, timings = self._evaluate(data, self.mlutility_config.n_jobs)
 
         return {
             "global": self._get_global(result_details),
-            "details": result_details,
+            "details": {
+                **result_details,
+                "timing": pd.DataFrame(
+                    timings,
+                    columns=["data_type", "model", "fit_seconds", "predict_seconds"],
+                ),
+            },
         }
@@ -1,11 +1,210 @@
-from collections import Counter
-from typing import Any, Optional
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
 
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
 from petsard.evaluator.evaluator_base import BaseEvaluator
+from petsard.exceptions import ConfigError
+
+
+class _CombinationKeys:
+    """
+    Integer keys of field combinations over synthetic rows followed by original rows
+
+    Every column is factorized once into codes shared by both datasets.
+    Combination keys are built from the longest cached prefix and cached
+    while under the byte budget, so the progressive search reuses them.
+    """
+
+    ORI_ABSENT = -1  # 原始資料中沒有此組合
+    ORI_COLLISION = -2  # 原始資料中此組合出現多次
+
+    def __init__(
+        self,
+        column_codes: dict[str, np.ndarray],
+        syn_cnt: int,
+        max_cache_bytes: int,
+    ):
+        """
+        Args:
+            column_codes: {column: codes of syn rows then ori rows}
+            syn_cnt: Number of syn rows
+            max_cache_bytes: Byte budget of cached combination keys
+        """
+        self.column_codes = column_codes
+        self.syn_cnt = syn_cnt
+        self.max_cache_bytes = max_cache_bytes
+
+        self._cache: dict[tuple[str, ...], np.ndarray] = {}
+        self._cache_bytes = 0
+
+    @classmethod
+    def from_data(
+        cls, syn_data: pd.DataFrame, ori_data: pd.DataFrame, max_cache_bytes: int
+    ) -> "_CombinationKeys":
+        """
+        Factorize every column of syn and ori
+
+        Args:
+            syn_data: Synthetic data
+            ori_data: Original data, with the same columns as syn_data
+            max_cache_bytes: Byte budget of cached combination keys
+        """
+        # Codes follow first appearance, missing values get their own code
+        column_codes: dict[str, np.ndarray] = {}
+        for col in syn_data.columns:
+            values = pd.concat(
+                [syn_data[col], ori_data[col]], ignore_index=True, copy=False
+            )
+            codes, _ = pd.factorize(values, use_na_sentinel=False)
+            column_codes[col] = codes.astype(np.int64, copy=False)
+
+        return cls(column_codes, len(syn_data), max_cache_bytes)
+
+    def share(self) -> SharedMemory:
+        """
+        Copy the column codes into a new shared memory block
+
+        The caller owns the block and must close() and unlink() it.
+
+        Returns:
+            SharedMemory: Codes as an int64 array of shape (columns, rows)
+        """
+        n_rows = len(next(iter(self.column_codes.values()), []))
+        shm = SharedMemory(
+            create=True, size=max(len(self.column_codes) * n_rows * 8, 1)
+        )
+        shared = np.ndarray(
+            (len(self.column_codes), n_rows), dtype=np.int64, buffer=shm.buf
+        )
+        for row, codes in enumerate(self.column_codes.values()):
+            shared[row] = codes
+        return shm
+
+    @classmethod
+    def attach(
+        cls,
+        shm: SharedMemory,
+        columns: list[str],
+        syn_cnt: int,
+        n_rows: int,
+        max_cache_bytes: int,
+    ) -> "_CombinationKeys":
+        """
+        View the column codes of a block created by share() without copying
+
+        Args:
+            shm: Shared memory block, must outlive the returned object
+            columns: Columns in the order of share()
+            syn_cnt: Number of syn rows
+            n_rows: Number of syn and ori rows
+            max_cache_bytes: Byte budget of cached combination keys
+        """
+        shared = np.ndarray((len(columns), n_rows), dtype=np.int64, buffer=shm.buf)
+        return cls(dict(zip(columns, shared, strict=True)), syn_cnt, max_cache_bytes)
+
+    def keys(self, combo: tuple[str, ...]) -> np.ndarray:
+        """
+        Key of each row's value combination
+
+        Keys are dense and assigned in order of first appearance, the same
+        order a Counter over row tuples would see. Columns are packed pairwise
+        (key * cardinality + code) and re-factorized, so keys never overflow.
+
+        Args:
+            combo: Field combination
+
+        Returns:
+            np.ndarray: Key of every syn row then ori row
+        """
+        size = len(combo)
+        while size > 1 and combo[:size] not in self._cache:
+            size -= 1
+        keys = self._cache.get(combo[:size], self.column_codes[combo[0]])
+
+        for end in range(size + 1, len(combo) + 1):
+            codes = self.column_codes[combo[end - 1]]
+            packed = keys * (int(codes.max()) + 1) + codes
+            keys, _ = pd.factorize(packed)
+            if self._cache_bytes + keys.nbytes <= self.max_cache_bytes:
+                self._cache[combo[:end]] = keys
+                self._cache_bytes += keys.nbytes
+
+        return keys
+
+    def ori_index(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Hash index from combination key to its unique original row
+
+        Args:
+            keys: Combination keys from keys()
+
+        Returns:
+            np.ndarray: Indexed by key, the ori row position if the combination
+                is unique in ori, else ORI_ABSENT or ORI_COLLISION
+        """
+        ori_keys = keys[self.syn_cnt :]
+        n_keys = int(keys.max()) + 1 if len(keys) else 0
+
+        ori_counts = np.bincount(ori_keys, minlength=n_keys)
+        index = np.full(n_keys, self.ORI_ABSENT, dtype=np.int64)
+        index[ori_keys] = np.arange(len(ori_keys))
+        index[ori_counts > 1] = self.ORI_COLLISION
+        return index
+
+
+# Worker state of the parallel progressive search: (evaluator, keys, shared memory)
+_search_worker_state: tuple | None = None
+
+
+def _init_search_worker(
+    config: dict,
+    shm_name: str,
+    columns: list[str],
+    syn_cnt: int,
+    n_rows: int,
+    max_cache_bytes: int,
+):
+    """
+    Initializer of the worker processes used by MPUCCs(n_jobs > 1).
+
+    Attaches to the factorized column codes shared by the parent,
+        every worker keeps its own combination key cache.
+
+    Args:
+        config (dict): Config of the parent MPUCCs.
+        shm_name (str): Name of the shared memory block of column codes.
+        columns (list[str]): Columns in the order of the block.
+        syn_cnt (int): Number of syn rows.
+        n_rows (int): Number of syn and ori rows.
+        max_cache_bytes (int): Byte budget of the worker key cache.
+    """
+    global _search_worker_state
+
+    shm = SharedMemory(name=shm_name)
+    combination_keys = _CombinationKeys.attach(
+        shm, columns, syn_cnt, n_rows, max_cache_bytes
+    )
+    _search_worker_state = (MPUCCs(dict(config)), combination_keys, shm)
+
+
+def _run_search_task(method: str, combo: tuple[str, ...]):
+    """
+    Run method(combo, combination_keys) of the worker MPUCCs.
+
+    Args:
+        method (str): Name of the MPUCCs method.
+        combo (tuple[str, ...]): Field combination.
+    """
+    evaluator, combination_keys, _ = _search_worker_state
+    return getattr(evaluator, method)(combo, combination_keys)
 
 
 class MPUCCs(BaseEvaluator):
@@ -44,6 +243,7 @@ class MPUCCs(BaseEvaluator):
     DEFAULT_MIN_ENTROPY_DELTA = 0.0  # 預設最小熵增益閾值
     DEFAULT_RENYI_ALPHA = 2.0  # Rényi 熵參數 α=2 (Collision Entropy)
     DEFAULT_FIELD_DECAY_FACTOR = 0.5  # 預設欄位衰減因子
+    KEY_CACHE_MAX_BYTES = 256 * 1024**2  # 組合鍵快取上限（位元組）
 
     def __init__(self, config: dict):
         """
@@ -58,6 +258,8 @@ class MPUCCs(BaseEvaluator):
                 - renyi_alpha (float): Alpha parameter for Rényi entropy calculation
                 - numeric_precision (int|None): Precision for numeric field comparison
                 - datetime_precision (str|None): Precision for datetime field comparison
+                - n_jobs (int): Worker processes of the progressive search,
+                    1 runs in this process (default), -1 uses all CPUs
         """
         super().__init__(config)
 
@@ -68,6 +270,16 @@ class MPUCCs(BaseEvaluator):
         self.config.setdefault("renyi_alpha", self.DEFAULT_RENYI_ALPHA)
         self.config.setdefault("numeric_precision", None)
         self.config.setdefault("datetime_precision", None)
+        self.config.setdefault("n_jobs", 1)
+
+        n_jobs = self.config["n_jobs"]
+        if not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+            error_msg: str = (
+                f"Invalid n_jobs configuration: {n_jobs}. "
+                "Should be a positive int or -1 for all CPUs."
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
 
     def _detect_numeric_precision(self, data: pd.DataFrame) -> int:
         """
@@ -336,23 +548,26 @@ class MPUCCs(BaseEvaluator):
         return deduplicated_data, deduplicated_cnt
 
     def _calculate_entropy_for_combo(
-        self, combo: tuple[str, ...], syn_data: pd.DataFrame, all_combinations: dict
+        self,
+        combo: tuple[str, ...],
+        combination_keys: _CombinationKeys,
+        all_combinations: dict | None = None,
     ) -> float:
         """Calculate normalized Rényi entropy (α=2, Collision Entropy) with caching"""
-        if combo in all_combinations:
+        if all_combinations is not None and combo in all_combinations:
             return all_combinations[combo]
 
-        combo_values = [tuple(row) for row in syn_data[list(combo)].values]
-        counter = Counter(combo_values)
-        total_cnt = len(syn_data)
-        n_unique_combinations = len(counter)
+        syn_cnt = combination_keys.syn_cnt
+        counts = np.bincount(combination_keys.keys(combo)[:syn_cnt])
+        counts = counts[counts > 0]
+        n_unique_combinations = len(counts)
 
         # If only one combination, entropy is 0
         if n_unique_combinations <= 1:
             normalized_entropy = 0.0
         else:
             # Calculate actual probability distribution
-            probs = np.array([count / total_cnt for count in counter.values()])
+            probs = counts / syn_cnt
 
             # Calculate collision entropy (Rényi α=2)
             # H₂(X) = -log₂(∑ pᵢ²)
@@ -369,28 +584,43 @@ class MPUCCs(BaseEvaluator):
             )
 
         # Cache result
-        all_combinations[combo] = normalized_entropy
+        if all_combinations is not None:
+            all_combinations[combo] = normalized_entropy
         return normalized_entropy
 
-    def _detect_unique_combinations_with_cnter(
-        self, data: pd.DataFrame, field_combo: tuple[str, ...]
-    ) -> dict[tuple, int]:
-        """Counter-optimized uniqueness detection"""
-        combo_values = [tuple(row) for row in data[list(field_combo)].values]
-        counter = Counter(combo_values)
+    def _detect_unique_combinations(
+        self, combo: tuple[str, ...], combination_keys: _CombinationKeys
+    ) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        Detect unique value combinations in syn and their unique match in ori
 
-        unique_combinations = {}
-        for i, combo_value in enumerate(combo_values):
-            if counter[combo_value] == self.UNIQUE_COUNT_THRESHOLD:
-                unique_combinations[combo_value] = i
+        Args:
+            combo: Field combination
+            combination_keys: Factorized keys of syn and ori
+
+        Returns:
+            tuple: (number of unique combinations in syn,
+                syn indices whose combination is also unique in ori,
+                the matching ori indices)
+        """
+        keys = combination_keys.keys(combo)
+        syn_keys = keys[: combination_keys.syn_cnt]
 
-        return unique_combinations
+        ori_index = combination_keys.ori_index(keys)
+        syn_counts = np.bincount(syn_keys, minlength=len(ori_index))
+        unique_mask = syn_counts[syn_keys] == self.UNIQUE_COUNT_THRESHOLD
+
+        # Vectorized join of syn keys against the ori hash index
+        ori_match = ori_index[syn_keys]
+        matched_indices = np.flatnonzero(unique_mask & (ori_match >= 0))
+
+        return int(unique_mask.sum()), matched_indices, ori_match[matched_indices]
 
     def _calculate_conditional_entropy_gain(
         self,
         new_combo: tuple[str, ...],
         base_combo: tuple[str, ...],
-        syn_data: pd.DataFrame,
+        combination_keys: _CombinationKeys,
         identified_indices: set[int],
         all_combinations: dict,
     ) -> float:
@@ -400,7 +630,7 @@ class MPUCCs(BaseEvaluator):
         Args:
             new_combo: New field combination (e.g., k1+k2)
             base_combo: Base combination (e.g., k1)
-            syn_data: Synthetic data
+            combination_keys: Factorized keys of syn and ori
             identified_indices: Already identified indices
             all_combinations: Dictionary of all combination entropy values
 
@@ -410,15 +640,15 @@ class MPUCCs(BaseEvaluator):
         if not base_combo:
             # If no base combination, return entropy of new combination
             return self._calculate_entropy_for_combo(
-                new_combo, syn_data, all_combinations
+                new_combo, combination_keys, all_combinations
             )
 
         # Use cache to calculate base and new combination entropy
         base_entropy = self._calculate_entropy_for_combo(
-            base_combo, syn_data, all_combinations
+            base_combo, combination_keys, all_combinations
         )
         new_entropy = self._calculate_entropy_for_combo(
-            new_combo, syn_data, all_combinations
+            new_combo, combination_keys, all_combinations
         )
 
         # Entropy gain = new entropy - base entropy
@@ -426,154 +656,128 @@ class MPUCCs(BaseEvaluator):
 
         return entropy_gain
 
-    def _find_unique_match(
-        self, data: pd.DataFrame, fields: tuple[str, ...], values: tuple[Any]
-    ) -> Optional[int]:
-        """Find unique match in dataset"""
-        if not isinstance(values, tuple):
-            values = (values,)
+    @contextmanager
+    def _search_pool(self, combination_keys: _CombinationKeys):
+        """
+        Process pool of the progressive search, sharing the column codes
 
-        if len(fields) != len(values):
-            return None
+        Yields:
+            ProcessPoolExecutor | None: None when n_jobs is 1
+        """
+        n_jobs = self.config.get("n_jobs", 1)
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs <= 1:
+            yield None
+            return
+
+        self._logger.info(f"Running progressive search with {n_jobs} processes")
+        shm = combination_keys.share()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_search_worker,
+                initargs=(
+                    self.config,
+                    shm.name,
+                    list(combination_keys.column_codes),
+                    combination_keys.syn_cnt,
+                    len(next(iter(combination_keys.column_codes.values()), [])),
+                    self.KEY_CACHE_MAX_BYTES // n_jobs,
+                ),
+            ) as pool:
+                yield pool
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _map_by_level(
+        self,
+        method: str,
+        combos: list[tuple[str, ...]],
+        combination_keys: _CombinationKeys,
+        pool: ProcessPoolExecutor | None,
+        level_times: dict[int, float],
+    ) -> dict[tuple[str, ...], object]:
+        """
+        Run method(combo, combination_keys) one combination size level at a time
 
-        mask = np.ones(len(data), dtype=bool)
+        Combinations of the same size are independent, so each level is one
+        batch of tasks for the process pool.
 
-        for field, value in zip(fields, values):
-            if pd.isna(value):
-                current_mask = data[field].isna().values
-            else:
-                current_mask = data[field].values == value
+        Args:
+            method: Name of the MPUCCs method
+            combos: Field combinations
+            combination_keys: Factorized keys of syn and ori
+            pool: Process pool from _search_pool(), None to run in this process
+            level_times: {combo_size: wall time in seconds}, accumulated in place
 
-            mask &= current_mask
+        Returns:
+            dict: {combo: result}
+        """
+        levels: dict[int, list[tuple[str, ...]]] = {}
+        for combo in combos:
+            levels.setdefault(len(combo), []).append(combo)
+
+        results = {}
+        for size in sorted(levels):
+            level_combos = levels[size]
+            start_time = time.perf_counter()
+
+            if pool is None:
+                level_results = (
+                    getattr(self, method)(combo, combination_keys)
+                    for combo in level_combos
+                )
+            else:
+                level_results = pool.map(_run_search_task, repeat(method), level_combos)
+
+            for combo, result in tqdm(
+                zip(level_combos, level_results, strict=True),
+                total=len(level_combos),
+                desc=f"Processing {size}-field combinations",
+                unit="combo",
+            ):
+                results[combo] = result
+
+            level_times[size] = (
+                level_times.get(size, 0.0) + time.perf_counter() - start_time
+            )
 
-            if not mask.any():
-                return None
+        return results
 
-        matching_indices = np.where(mask)[0]
-        return (
-            matching_indices[0]
-            if len(matching_indices) == self.UNIQUE_COUNT_THRESHOLD
-            else None
-        )
+    def _field_weighted(self, combo_size: int) -> float:
+        """Field weighting: combo_size = 1 is 1.0, then decay sequentially"""
+        if combo_size == 1:
+            return 1.0
+        return self.config.get(
+            "field_decay_factor", self.DEFAULT_FIELD_DECAY_FACTOR
+        ) ** (combo_size - 1)
 
-    def _progressive_field_search(
+    def _decide_step_combos(
         self,
-        sorted_columns: list[str],
-        syn_data: pd.DataFrame,
-        ori_data: pd.DataFrame,
-    ) -> tuple[list[dict], set[int], int, list[dict]]:
+        all_step_combos: list[tuple],
+        target_sizes: set[int],
+        min_target_size: int,
+        combination_keys: _CombinationKeys,
+        identified_indices: set[int],
+        all_combinations: dict,
+    ) -> tuple[list[dict], list[tuple[tuple[str, ...], dict]]]:
         """
-        Progressive field search - Core algorithm (mpUCCs version)
+        Decide pruning of every combination in search order
+
+        Pruning only depends on entropy and on the pruning of base combinations,
+        so it is decided before any uniqueness detection.
 
         Returns:
-            tuple: (detailed results, identified indices, iteration count, tree results)
+            tuple: (tree results, [(combo, tree record)] of combinations to detect)
         """
-        details_results = []
-        identified_indices = set()  # Already identified record indices
-        maximal_combinations = {}  # Record minimum identifying combination for each index {syn_idx: combo}
         tree_results = []  # Tree results
-
-        # Valid combination set - only contains target size combinations
-        valid_combinations = set()
-        # All combination set - contains all generated combinations and corresponding entropy values
-        all_combinations = {}  # {combo: entropy_value}
+        pending = []  # Combinations passing the pruning, in search order
         # Pruned combination set - pruned combinations will not be considered again
         pruned_combinations = set()
 
-        columns_num = len(sorted_columns)
-        n_cols = self.config.get("n_cols", None)
-
-        # Determine combination sizes to process
-        if n_cols is None:
-            target_sizes = set(range(self.MIN_COMBO_SIZE, columns_num + 1))
-        elif isinstance(n_cols, int):
-            target_sizes = {n_cols} if n_cols <= columns_num else set()
-        elif isinstance(n_cols, list):
-            target_sizes = {size for size in n_cols if size <= columns_num}
-        else:
-            raise ValueError(
-                f"Invalid n_cols configuration: {n_cols}. Should be None, int or list[int]."
-            )
-
-        # max_target_size should be the maximum value in target_sizes
-        max_target_size = max(target_sizes) if target_sizes else columns_num
-        # Find minimum target size to ensure algorithm can start
-        min_target_size = min(target_sizes) if target_sizes else self.MIN_COMBO_SIZE
-
-        # Pre-calculate all combinations to process for unified progress bar
-        all_step_combos = []
-
-        # Progressive field addition
-        for field_idx, current_field in enumerate(sorted_columns):
-            self._logger.info(f"Processing field {field_idx + 1}: {current_field}")
-
-            # Current step combinations to evaluate
-            current_step_combos = []
-
-            # 1. Single current field (always generated, but only processed if in target sizes)
-            single_combo = (current_field,)
-            if self.MIN_COMBO_SIZE in target_sizes:
-                # Single field has no base combination
-                current_step_combos.append(
-                    (single_combo, None)
-                )  # (combination, base combination)
-
-            # Always add single field to all_combinations as base and calculate its entropy
-            single_entropy = self._calculate_entropy_for_combo(
-                single_combo, syn_data, all_combinations
-            )
-            all_combinations[single_combo] = single_entropy
-
-            # 2. Current field combined with all previous combinations
-            for existing_combo in list(all_combinations.keys()):
-                # Check if current field is already in existing combination
-                if current_field in existing_combo:
-                    continue
-
-                new_combo = tuple(
-                    sorted(
-                        existing_combo + (current_field,),
-                        key=lambda x: sorted_columns.index(x),
-                    )
-                )
-
-                # Always add new combination to all_combinations (for future expansion)
-                if len(new_combo) <= max_target_size:
-                    new_entropy = self._calculate_entropy_for_combo(
-                        new_combo, syn_data, all_combinations
-                    )
-                    all_combinations[new_combo] = new_entropy
-
-                # Only add combinations that match target sizes to current step processing
-                if len(new_combo) in target_sizes and len(new_combo) <= max_target_size:
-                    # Use new logic to find valid base combination
-                    valid_base_combo = self._find_valid_base_combo(
-                        new_combo, target_sizes, sorted_columns
-                    )
-                    current_step_combos.append((new_combo, valid_base_combo))
-
-            # Add current step combinations to total list with field marking
-            for combo, base_combo in current_step_combos:
-                all_step_combos.append((combo, base_combo, current_field))
-
-        # Use unified progress bar to process all combinations
-        progress_bar = tqdm(
-            all_step_combos, desc="Processing field combinations", unit="combo"
-        )
-
-        # Build field index mapping table
-        field_to_index = {field: idx for idx, field in enumerate(sorted_columns)}
-
-        for combo, base_combo, current_field in progress_bar:
-            # Calculate current field progress
-            current_field_idx = field_to_index[current_field]
-            field_progress = f"Field {current_field_idx + 1}/{len(sorted_columns)}"
-
-            # Update progress bar description to show field progress and current processing field
-            progress_bar.set_description(
-                f"{field_progress} - Processing {current_field} combinations"
-            )
-
+        for combo, base_combo, _current_field in all_step_combos:
             # Check if base_combo is in target sizes and actually processed
             base_combo_valid = base_combo and len(base_combo) in target_sizes
 
@@ -582,17 +786,11 @@ class MPUCCs(BaseEvaluator):
                 base_combo in pruned_combinations if base_combo_valid else None
             )
 
+            combo_size = len(combo)
+            field_weighted = self._field_weighted(combo_size)
+
             # If base combination is pruned, directly prune this combination
             if base_is_pruned:
-                combo_size = len(combo)
-                # Correct field_weighted calculation: combo_size = 1 is 1.0, then decay sequentially
-                if combo_size == 1:
-                    field_weighted = 1.0
-                else:
-                    field_weighted = self.config.get(
-                        "field_decay_factor", self.DEFAULT_FIELD_DECAY_FACTOR
-                    ) ** (combo_size - 1)
-
                 tree_record = {
                     "check_order": len(tree_results) + 1,  # Which check number
                     "combo_size": combo_size,  # How many fields used
@@ -615,16 +813,6 @@ class MPUCCs(BaseEvaluator):
 
             # Normal case: calculate required entropy values
             combo_entropy = all_combinations.get(combo, 0.0)
-            combo_size = len(combo)
-
-            # Calculate weighting values
-            # Correct field_weighted calculation: combo_size = 1 is 1.0, then decay sequentially
-            if combo_size == 1:
-                field_weighted = 1.0
-            else:
-                field_weighted = self.config.get(
-                    "field_decay_factor", self.DEFAULT_FIELD_DECAY_FACTOR
-                ) ** (combo_size - 1)
 
             # total_weighted now only equals field_weighted
             total_weighted = field_weighted
@@ -651,6 +839,7 @@ class MPUCCs(BaseEvaluator):
                 "total_weighted": total_weighted,  # Total weighting = field_weighted
                 "weighted_mpuccs_collision_cnt": 0.0,  # Weighted mpUCCs collision (calculated later)
             }
+            tree_results.append(tree_record)
 
             # Conditional entropy check (only when there's valid and unpruned base combination)
             should_check_entropy = len(combo) in target_sizes and (
@@ -662,7 +851,7 @@ class MPUCCs(BaseEvaluator):
                 entropy_gain = self._calculate_conditional_entropy_gain(
                     combo,
                     base_combo,
-                    syn_data,
+                    combination_keys,
                     identified_indices,
                     all_combinations,
                 )
@@ -677,74 +866,206 @@ class MPUCCs(BaseEvaluator):
                     )
                     pruned_combinations.add(combo)
                     tree_record["is_pruned"] = True
-                    tree_results.append(tree_record)
                     continue
             elif should_check_entropy and (not base_combo_valid or base_is_pruned):
                 # When no valid base combination or base combination is pruned, don't check entropy gain
                 tree_record["entropy_gain"] = None
                 tree_record["is_pruned"] = None
 
-            # Detect unique combinations
-            unique_combinations = self._detect_unique_combinations_with_cnter(
-                syn_data, combo
+            pending.append((combo, tree_record))
+
+        return tree_results, pending
+
+    def _progressive_field_search(
+        self,
+        sorted_columns: list[str],
+        syn_data: pd.DataFrame,
+        ori_data: pd.DataFrame,
+    ) -> tuple[list[dict], set[int], int, list[dict]]:
+        """
+        Progressive field search - Core algorithm (mpUCCs version)
+
+        Entropy and uniqueness detection run one combination size level at a
+        time, in a process pool when n_jobs > 1. Pruning and collision records
+        are decided in search order, so the results do not depend on n_jobs.
+
+        Returns:
+            tuple: (detailed results, identified indices, iteration count, tree results)
+        """
+        details_results = []
+        identified_indices = set()  # Already identified record indices
+        # Size of minimum identifying combination for each syn index, 0 if none
+        maximal_sizes = np.zeros(len(syn_data), dtype=np.int64)
+
+        # All combination set - contains all target size combinations and corresponding entropy values
+        all_combinations = {}  # {combo: entropy_value}
+        # Generated combination list - every combination up to the maximum target size
+        generated_combos = []
+
+        # Factorize once, every combination is then keyed on integer codes
+        combination_keys = _CombinationKeys.from_data(
+            syn_data, ori_data, self.KEY_CACHE_MAX_BYTES
+        )
+
+        columns_num = len(sorted_columns)
+        n_cols = self.config.get("n_cols", None)
+
+        # Determine combination sizes to process
+        if n_cols is None:
+            target_sizes = set(range(self.MIN_COMBO_SIZE, columns_num + 1))
+        elif isinstance(n_cols, int):
+            target_sizes = {n_cols} if n_cols <= columns_num else set()
+        elif isinstance(n_cols, list):
+            target_sizes = {size for size in n_cols if size <= columns_num}
+        else:
+            raise ValueError(
+                f"Invalid n_cols configuration: {n_cols}. Should be None, int or list[int]."
+            )
+
+        # max_target_size should be the maximum value in target_sizes
+        max_target_size = max(target_sizes) if target_sizes else columns_num
+        # Find minimum target size to ensure algorithm can start
+        min_target_size = min(target_sizes) if target_sizes else self.MIN_COMBO_SIZE
+
+        # Pre-calculate all combinations to process
+        all_step_combos = []
+
+        # Progressive field addition
+        for field_idx, current_field in enumerate(sorted_columns):
+            self._logger.info(f"Processing field {field_idx + 1}: {current_field}")
+
+            # Current step combinations to evaluate
+            current_step_combos = []
+
+            # 1. Single current field (always generated, but only processed if in target sizes)
+            single_combo = (current_field,)
+            if self.MIN_COMBO_SIZE in target_sizes:
+                # Single field has no base combination
+                current_step_combos.append(
+                    (single_combo, None)
+                )  # (combination, base combination)
+
+            # Always add single field to generated combinations as base
+            generated_combos.append(single_combo)
+
+            # 2. Current field combined with all previous combinations
+            for existing_combo in list(generated_combos):
+                # Check if current field is already in existing combination
+                if current_field in existing_combo:
+                    continue
+
+                new_combo = tuple(
+                    sorted(
+                        existing_combo + (current_field,),
+                        key=lambda x: sorted_columns.index(x),
+                    )
+                )
+
+                # Always add new combination to generated combinations (for future expansion)
+                if len(new_combo) <= max_target_size:
+                    generated_combos.append(new_combo)
+
+                # Only add combinations that match target sizes to current step processing
+                if len(new_combo) in target_sizes and len(new_combo) <= max_target_size:
+                    # Use new logic to find valid base combination
+                    valid_base_combo = self._find_valid_base_combo(
+                        new_combo, target_sizes, sorted_columns
+                    )
+                    current_step_combos.append((new_combo, valid_base_combo))
+
+            # Add current step combinations to total list with field marking
+            for combo, base_combo in current_step_combos:
+                all_step_combos.append((combo, base_combo, current_field))
+
+        level_times = {}  # {combo_size: wall time in seconds}
+        with self._search_pool(combination_keys) as pool:
+            # Entropy of every target size combination, batched by size level
+            all_combinations.update(
+                self._map_by_level(
+                    "_calculate_entropy_for_combo",
+                    [combo for combo in generated_combos if len(combo) in target_sizes],
+                    combination_keys,
+                    pool,
+                    level_times,
+                )
+            )
+
+            tree_results, pending = self._decide_step_combos(
+                all_step_combos,
+                target_sizes,
+                min_target_size,
+                combination_keys,
+                identified_indices,
+                all_combinations,
+            )
+
+            # Detect unique combinations and their unique matches in ori,
+            # in this process they are detected one by one below instead
+            detections = (
+                self._map_by_level(
+                    "_detect_unique_combinations",
+                    [combo for combo, _ in pending],
+                    combination_keys,
+                    pool,
+                    level_times,
+                )
+                if pool is not None
+                else None
+            )
+
+        for combo, tree_record in pending:
+            mpuccs_cnt, syn_indices, ori_indices = (
+                detections.pop(combo)
+                if detections is not None
+                else self._detect_unique_combinations(combo, combination_keys)
             )
 
             # Set number of mpUCCs in syn
-            tree_record["mpuccs_cnt"] = len(unique_combinations)
+            tree_record["mpuccs_cnt"] = mpuccs_cnt
 
             # Check if there are unique combinations to process
-            if not unique_combinations:
+            if not mpuccs_cnt:
                 tree_record["mpuccs_collision_cnt"] = 0
-                tree_results.append(tree_record)
                 continue
 
-            # Process each unique combination (mpUCCs logic)
-            unique_match_count = 0
-            for value_combo, syn_idx in unique_combinations.items():
-                # Check if a smaller combination has already identified this record (mpUCCs logic)
-                if syn_idx in maximal_combinations:
-                    existing_combo = maximal_combinations[syn_idx]
-                    if len(existing_combo) <= len(combo):
-                        # Already have same or smaller combination, skip current combination
-                        continue
+            # Skip records already identified by a same or smaller combination (mpUCCs logic)
+            existing_sizes = maximal_sizes[syn_indices]
+            keep = (existing_sizes == 0) | (existing_sizes > len(combo))
+            syn_indices, ori_indices = syn_indices[keep], ori_indices[keep]
+
+            # Record or update minimum identifying combination
+            maximal_sizes[syn_indices] = len(combo)
+            identified_indices.update(syn_indices.tolist())
 
-                # Find match in original data
-                ori_idx = self._find_unique_match(ori_data, combo, value_combo)
-
-                if ori_idx is not None:
-                    # Record or update minimum identifying combination
-                    if syn_idx not in maximal_combinations or len(combo) < len(
-                        maximal_combinations[syn_idx]
-                    ):
-                        maximal_combinations[syn_idx] = combo
-
-                        details_results.append(
-                            {
-                                "combo_size": len(combo),
-                                "syn_idx": syn_idx,
-                                "field_combo": str(combo),
-                                "value_combo": str(
-                                    value_combo
-                                    if isinstance(value_combo, tuple)
-                                    else (value_combo,)
-                                ),
-                                "ori_idx": ori_idx,
-                            }
-                        )
-
-                        identified_indices.add(syn_idx)
-                        unique_match_count += 1
+            # Values are only materialized for recorded syn rows
+            combo_rows = syn_data[list(combo)].values[syn_indices]
+            field_combo = str(combo)
+            details_results.extend(
+                {
+                    "combo_size": len(combo),
+                    "syn_idx": syn_idx,
+                    "field_combo": field_combo,
+                    "value_combo": str(tuple(row)),
+                    "ori_idx": ori_idx,
+                }
+                for syn_idx, ori_idx, row in zip(
+                    syn_indices.tolist(), ori_indices, combo_rows, strict=True
+                )
+            )
+            unique_match_count = len(syn_indices)
 
             # Record found mpuccs_collision_cnt count and weighted values
             tree_record["mpuccs_collision_cnt"] = unique_match_count
             tree_record["weighted_mpuccs_collision_cnt"] = (
                 unique_match_count * tree_record["total_weighted"]
             )
-            tree_results.append(tree_record)
 
-            # Only add combinations in target sizes to valid set
-            if len(combo) in target_sizes:
-                valid_combinations.add(combo)
+        # Wall time of the combination size level, in parallel mode
+        if pool is not None:
+            for tree_record in tree_results:
+                tree_record["level_duration_seconds"] = level_times.get(
+                    tree_record["combo_size"], 0.0
+                )
 
         return details_results, identified_indices, 0, tree_results
 
@@ -9,12 +9,15 @@ import pandas as pd
 from petsard.config_base import BaseConfig
 from petsard.evaluator.evaluator_base import BaseEvaluator
 from petsard.evaluator.stats_base import (
+    StatsCramersV,
     StatsJSDivergence,
     StatsMax,
     StatsMean,
     StatsMedian,
     StatsMin,
     StatsNUnique,
+    StatsPearson,
+    StatsSpearman,
     StatsStd,
 )
 from petsard.exceptions import ConfigError, UnsupportedMethodError
@@ -33,6 +36,9 @@ class StatsMap(Enum):
     MAX = auto()
     NUNIQUE = auto()
     JSDIVERGENCE = auto()
+    PEARSON = auto()
+    SPEARMAN = auto()
+    CRAMERS_V = auto()
 
     @classmethod
     def map(cls, method: str) -> int:
@@ -85,6 +91,9 @@ class StatsConfig(BaseConfig):
             "max",
             "nunique",
             "jsdivergence",
+            "pearson",
+            "spearman",
+            "cramers_v",
         ]
     )
     AVAILABLE_COMPARE_METHODS: list[str] = field(
@@ -210,8 +219,10 @@ class Stats(BaseEvaluator):
                 "median",
                 "min",
                 "max",
+                "pearson",
+                "spearman",
             ],
-            "categorical": ["nunique", "jsdivergence"],
+            "categorical": ["nunique", "jsdivergence", "cramers_v"],
         }.items()
         for method in methods
     }
@@ -229,6 +240,11 @@ class Stats(BaseEvaluator):
             "percolumn": [
                 "jsdivergence",
             ],
+            "pairwise": [
+                "pearson",
+                "spearman",
+                "cramers_v",
+            ],
         }.items()
         for method in methods
     }
@@ -240,6 +256,9 @@ class Stats(BaseEvaluator):
         "max": StatsMax,
         "nunique": StatsNUnique,
         "jsdivergence": StatsJSDivergence,
+        "pearson": StatsPearson,
+        "spearman": StatsSpearman,
+        "cramers_v": StatsCramersV,
     }
     COMPARE_METHOD_MAP: dict[str, dict[str, callable]] = {
         "diff": {
@@ -257,7 +276,7 @@ class Stats(BaseEvaluator):
     SUMMARY_METHOD_MAP: dict[str, callable] = {
         "mean": lambda values: safe_round(np.mean(list(values)))
     }
-    AVAILABLE_SCORES_GRANULARITY: list[str] = ["global", "columnwise"]  # "pairwise"
+    AVAILABLE_SCORES_GRANULARITY: list[str] = ["global", "columnwise", "pairwise"]
 
     def __init__(self, config: dict):
         """
@@ -276,38 +295,71 @@ class Stats(BaseEvaluator):
         self._impl: Optional[dict[str, callable]] = None
 
     def _process_columnwise(
-        self, data: dict[str, pd.DataFrame], col: str, info: dict[str, Any], method: str
-    ) -> dict[str, float]:
+        self, data: dict[str, pd.DataFrame]
+    ) -> dict[str, dict[str, float]]:
         """
-        Process column-wise statistics and return updated result
+        Process column-wise statistics of every column and return the results.
+            Columns sharing the same methods are reduced together
+            by one DataFrame.agg() call for each data.
 
         Args:
             data (dict[str, pd.DataFrame]): The data to be evaluated.
-            col (str): Column name
-            info (dict[str, Any]): Column information
-            method (str): Statistical method name
 
         Returns:
-            (dict[str, float]) Updated column result
+            (dict[str, dict[str, float]]) Column results, as '{method}_{source}'.
+                NaN if the column data type does not match the method.
         """
-        infer_type: list[str] = self.INFER_DTYPE_MAP[method]
-        module: callable = self.MODULE_MAP[method]
+        methods: list[str] = [
+            method
+            for method in self.stats_config.stats_method
+            if self.EXEC_GRANULARITY_MAP[method] == "columnwise"
+        ]
+        modules: dict[str, Any] = {
+            method: self.MODULE_MAP[method]() for method in methods
+        }
+
+        # Group the columns by the methods matching their data type
+        column_groups: dict[tuple[str, ...], list[str]] = {}
+        result: dict[str, dict[str, float]] = {}
+        for col, info in self.stats_config.columns_info.items():
+            result[col] = {
+                f"{method}_{source}": np.nan
+                for method in methods
+                for source in ["ori", "syn"]
+            }
+            col_methods: tuple[str, ...] = tuple(
+                method
+                for method in methods
+                if info["infer_dtype_match"]
+                and info["ori_infer_dtype"] in self.INFER_DTYPE_MAP[method]
+            )
+            if col_methods:
+                column_groups.setdefault(col_methods, []).append(col)
 
-        result: dict[str, float] = {}
-        if info["infer_dtype_match"] and info["ori_infer_dtype"] in infer_type:
+        for col_methods, cols in column_groups.items():
             self._logger.debug(
-                f"Column '{col}' data type matches required type for method '{method}'"
+                f"Processing column-wise statistics {list(col_methods)} "
+                f"for {len(cols)} columns"
             )
             for source in ["ori", "syn"]:
-                result[f"{method}_{source}"] = module().eval(
-                    data={"col": data[source][col]}
-                )
-        else:
-            self._logger.debug(
-                f"Column '{col}' data type does not match required type for method '{method}', returning NaN"
-            )
-            result[f"{method}_ori"] = np.nan
-            result[f"{method}_syn"] = np.nan
+                for method in col_methods:
+                    for col in cols:
+                        if not modules[method]._verify_dtype(
+                            {"col": data[source][col]}
+                        ):
+                            error_msg: str = f"Data type verification failed for {modules[method].__class__.__name__}."
+                            self._logger.error(error_msg)
+                            raise TypeError(error_msg)
+
+                reduced: pd.DataFrame = data[source][cols].agg(list(col_methods))
+                for method in col_methods:
+                    for col in cols:
+                        value: Any = reduced.at[method, col]
+                        if method == "nunique":
+                            value = int(value)
+                        result[col][f"{method}_{source}"] = (
+                            safe_round(value) if isinstance(value, float) else value
+                        )
 
         return result
 
@@ -346,60 +398,53 @@ class Stats(BaseEvaluator):
 
         return result
 
-    def process_pairwise(
-        self,
-        data: dict[str, pd.DataFrame],
-        col1: str,
-        info1: dict[str, Any],
-        col2: str,
-        info2: dict[str, Any],
-        method: str,
-    ) -> dict[str, float]:
+    def _process_pairwise(
+        self, data: dict[str, pd.DataFrame], columns: list[str], method: str
+    ) -> dict[tuple[str, str], dict[str, float]]:
         """
-        Process pairwise statistics and return updated result
+        Process pairwise statistics of every column pair
+            from one matrix per data, then reshape into pair results.
 
         Args:
             data (dict[str, pd.DataFrame]): The data to be evaluated.
-            col1 (str): First column name
-            info1 (dict[str, Any]: First column information
-            col2 (str): Second column name
-            info2 (dict[str, Any]): Second column information
+            columns (list[str]): Column names, in the order of the pairs
             method (str): Statistical method name
 
         Returns:
-            (dict[str, float]): Updated pair result
+            (dict[tuple[str, str], dict[str, float]]): Result of each column pair
         """
-        infer_type = self.INFER_DTYPE_MAP[method]
-        module = self.MODULE_MAP[method]
-
-        result = {}
-        # Process original data
-        if (
-            info1["ori_infer_dtype"] in infer_type
-            and info2["ori_infer_dtype"] in infer_type
-        ):
-            result[f"{method}_ori"] = module().eval(
-                {
-                    "col1": data["ori"][col1],
-                    "col2": data["ori"][col2],
-                }
+        infer_type: list[str] = self.INFER_DTYPE_MAP[method]
+        module: callable = self.MODULE_MAP[method]
+
+        matrix: dict[str, pd.DataFrame] = {}
+        for source in ["ori", "syn"]:
+            # columns of other types are NaN, as they are left out of the matrix
+            valid_columns: list[str] = [
+                col
+                for col in columns
+                if self.stats_config.columns_info[col][f"{source}_infer_dtype"]
+                in infer_type
+            ]
+            matrix[source] = (
+                module().eval(data={"data": data[source][valid_columns]})
+                if len(valid_columns) >= 2
+                else pd.DataFrame()
             )
-        else:
-            result[f"{method}_ori"] = np.nan
-
-        # Process synthetic data
-        if (
-            info1["syn_infer_dtype"] in infer_type
-            and info2["syn_infer_dtype"] in infer_type
-        ):
-            result[f"{method}_syn"] = module().eval(
-                {
-                    "col1": data["syn"][col1],
-                    "col2": data["syn"][col2],
-                }
+            self._logger.debug(
+                f"Computed '{method}' matrix of {len(valid_columns)} columns for {source}"
             )
-        else:
-            result[f"{method}_syn"] = np.nan
+
+        result: dict[tuple[str, str], dict[str, float]] = {}
+        for i, col1 in enumerate(columns):
+            for col2 in columns[i + 1 :]:
+                result[(col1, col2)] = {
+                    f"{method}_{source}": (
+                        safe_round(matrix[source].at[col1, col2])
+                        if col1 in matrix[source].index and col2 in matrix[source].index
+                        else np.nan
+                    )
+                    for source in ["ori", "syn"]
+                }
 
         return result
 
@@ -446,7 +491,10 @@ class Stats(BaseEvaluator):
             result[eval_col] = np.where(
                 result[ori_col].astype(float) == 0.0,
                 handle_zero(result[syn_col], result[ori_col]),
-                safe_round(func(result[syn_col], result[ori_col])),
+                # round element-wise, safe_round() takes a single value
+                func(result[syn_col].astype(float), result[ori_col].astype(float))
+                .round(2)
+                .to_numpy(),
             )
 
         self._logger.debug(f"Comparison method '{compare_method}' applied successfully")
@@ -470,6 +518,7 @@ class Stats(BaseEvaluator):
 
         columns_results: dict[str, dict[str, float]] = {}
         pairs_results: dict[str, dict[str, float]] = {}
+        columnwise_results: dict[str, dict[str, float]] = self._process_columnwise(data)
         # Process each column
         for col1, info1 in self.stats_config.columns_info.items():
             columns_results[col1] = {}
@@ -481,7 +530,12 @@ class Stats(BaseEvaluator):
                 # Update results based on granularity
                 if exec_granularity == "columnwise":
                     columns_results[col1].update(
-                        self._process_columnwise(data, col1, info1, method)
+                        {
+                            f"{method}_{source}": columnwise_results[col1][
+                                f"{method}_{source}"
+                            ]
+                            for source in ["ori", "syn"]
+                        }
                     )
                 elif exec_granularity == "percolumn":
                     columns_results[col1].update(
@@ -490,21 +544,15 @@ class Stats(BaseEvaluator):
         self._logger.debug(f"Processed statistics for {len(columns_results)} columns")
 
         # Process pairwise statistics separately to avoid duplication
+        pair_columns: list[str] = [
+            col for col in data["ori"].columns if col in self.stats_config.columns_info
+        ]
         for method in self.stats_config.stats_method:
             if self.EXEC_GRANULARITY_MAP[method] == "pairwise":
-                column_items = list(self.stats_config.columns_info.items())
-                for i in range(len(column_items)):
-                    col1, info1 = column_items[i]
-                    for j in range(i + 1, len(column_items)):
-                        col2, info2 = column_items[j]
-                        pairs_key = (col1, col2)
-                        if pairs_key not in pairs_results:
-                            pairs_results[pairs_key] = {}
-                        pairs_results[pairs_key].update(
-                            self._process_pairwise(
-                                data, col1, info1, col2, info2, method
-                            )
-                        )
+                for pairs_key, pair_result in self._process_pairwise(
+                    data, pair_columns, method
+                ).items():
+                    pairs_results.setdefault(pairs_key, {}).update(pair_result)
         if pairs_results:
             self._logger.debug(
                 f"Processed pair-wise statistics for {len(pairs_results)} column pairs"
@@ -514,7 +562,12 @@ class Stats(BaseEvaluator):
         if columns_results:
             stats_result["columnwise"] = pd.DataFrame(columns_results).T
         if pairs_results:
-            stats_result["pairwise"] = pd.DataFrame(pairs_results).T
+            stats_result["pairwise"] = pd.DataFrame(
+                [
+                    {"column1": col1, "column2": col2, **pair_result}
+                    for (col1, col2), pair_result in pairs_results.items()
+                ]
+            )
 
         # Compare, Aggregated, and Summary results
         compare_method: str = self.stats_config.compare_method
@@ -539,11 +592,12 @@ class Stats(BaseEvaluator):
                     if col.endswith(f"_{compare_method}")
                 ]
                 # add aggregated percolumn method
-                compare_col += [
-                    stats_method
-                    for stats_method in self.stats_config.stats_method
-                    if self.EXEC_GRANULARITY_MAP[stats_method] == "percolumn"
-                ]
+                if granularity == "columnwise":
+                    compare_col += [
+                        stats_method
+                        for stats_method in self.stats_config.stats_method
+                        if self.EXEC_GRANULARITY_MAP[stats_method] == "percolumn"
+                    ]
 
                 # Apply aggregated method
                 global_result.update(
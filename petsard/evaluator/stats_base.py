@@ -301,9 +301,206 @@ class StatsJSDivergence(BaseStats):
         value_cnts_ori = data.get("col_ori").value_counts(normalize=True)
         value_cnts_syn = data.get("col_syn").value_counts(normalize=True)
 
-        all_categories = set(value_cnts_ori.index) | set(value_cnts_syn.index)
+        # align both on the union of categories, missing categories as 0
+        p, q = value_cnts_ori.align(value_cnts_syn, join="outer", fill_value=0)
 
-        p = np.array([value_cnts_ori.get(cat, 0) for cat in all_categories])
-        q = np.array([value_cnts_syn.get(cat, 0) for cat in all_categories])
+        return jensenshannon(p.to_numpy(), q.to_numpy()) ** 2
 
-        return jensenshannon(p, q) ** 2
+
+class StatsPairwiseBase(BaseStats):
+    """
+    Base class of pair-wise statistics computed as one matrix per data.
+        Inherits from BaseStats.
+    """
+
+    def _verify_dtype(self, data: dict[str, pd.DataFrame]) -> bool:
+        """
+        Args:
+            data (dict[str, pd.DataFrame]): The data to be evaluated.
+
+        Returns:
+            (bool): True if every column is numeric, False otherwise.
+        """
+        return all(is_numeric_dtype(dtype) for dtype in data.get("data").dtypes)
+
+
+class StatsPearson(StatsPairwiseBase):
+    """
+    A class of pair-wise statistic for the Pearson correlation.
+        Inherits from StatsPairwiseBase.
+    """
+
+    def _eval(self, data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Args:
+            data (dict[str, pd.DataFrame]): The data to be evaluated.
+
+        Returns:
+            (pd.DataFrame): The Pearson correlation matrix of all columns.
+        """
+        return data.get("data").corr(method="pearson")
+
+
+class StatsSpearman(StatsPairwiseBase):
+    """
+    A class of pair-wise statistic for the Spearman correlation.
+        Inherits from StatsPairwiseBase.
+    """
+
+    def _eval(self, data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Args:
+            data (dict[str, pd.DataFrame]): The data to be evaluated.
+
+        Returns:
+            (pd.DataFrame): The Spearman correlation matrix of all columns.
+        """
+        return data.get("data").corr(method="spearman")
+
+
+class StatsCramersV(StatsPairwiseBase):
+    """
+    A class of pair-wise statistic for Cramér's V.
+        Inherits from StatsPairwiseBase.
+
+    Each column is factorized once. The contingency tables of a column
+        against the following columns are counted by one np.bincount
+        per batch of at most MAX_BATCH_SIZE codes. Pairs whose table alone
+        exceeds MAX_BATCH_SIZE cells count only their observed pairs.
+        Rows with NA in either column of a pair are left out of that pair.
+    """
+
+    MAX_BATCH_SIZE: int = 2**24
+
+    def _verify_dtype(self, data: dict[str, pd.DataFrame]) -> bool:
+        """
+        Args:
+            data (dict[str, pd.DataFrame]): The data to be evaluated.
+
+        Returns:
+            (bool): Always True, any column can be factorized.
+        """
+        return isinstance(data.get("data"), pd.DataFrame)
+
+    @staticmethod
+    def _cramers_v(table: np.ndarray) -> float:
+        """
+        Args:
+            table (np.ndarray): The contingency table of a column pair.
+
+        Returns:
+            (float): Cramér's V without bias correction.
+                NaN if either column has less than two categories.
+        """
+        table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+        if min(table.shape) < 2:
+            return np.nan
+
+        n: int = table.sum()
+        expected: np.ndarray = np.outer(table.sum(axis=1), table.sum(axis=0)) / n
+        chi2: float = ((table - expected) ** 2 / expected).sum()
+        return float(np.sqrt(chi2 / n / (min(table.shape) - 1)))
+
+    @staticmethod
+    def _sparse_cramers_v(
+        codes_i: np.ndarray, codes_j: np.ndarray, n_categories_j: int
+    ) -> float:
+        """
+        Cramér's V counting only the observed pairs, without a dense table.
+            Empty cells add their expected count only, so
+            chi2 = n * (sum(O^2 / (row_sum * col_sum)) - 1) over observed cells.
+
+        Args:
+            codes_i (np.ndarray): The factorized codes of the first column.
+            codes_j (np.ndarray): The factorized codes of the second column.
+            n_categories_j (int): The number of categories of the second column.
+
+        Returns:
+            (float): Cramér's V without bias correction.
+                NaN if either column has less than two categories.
+        """
+        valid: np.ndarray = (codes_i >= 0) & (codes_j >= 0)
+        keys, counts = np.unique(
+            codes_i[valid] * n_categories_j + codes_j[valid], return_counts=True
+        )
+        rows, cols = np.divmod(keys, n_categories_j)
+        row_sums: np.ndarray = np.bincount(rows, weights=counts)
+        col_sums: np.ndarray = np.bincount(cols, weights=counts)
+        n_rows: int = int(np.count_nonzero(row_sums))
+        n_cols: int = int(np.count_nonzero(col_sums))
+        if min(n_rows, n_cols) < 2:
+            return np.nan
+
+        n: int = int(counts.sum())
+        chi2: float = n * (
+            (counts.astype(float) ** 2 / (row_sums[rows] * col_sums[cols])).sum() - 1
+        )
+        return float(np.sqrt(max(chi2, 0.0) / n / (min(n_rows, n_cols) - 1)))
+
+    def _eval(self, data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Args:
+            data (dict[str, pd.DataFrame]): The data to be evaluated.
+
+        Returns:
+            (pd.DataFrame): The Cramér's V matrix of all columns.
+        """
+        df: pd.DataFrame = data.get("data")
+        columns: list[str] = list(df.columns)
+        n_rows: int = df.shape[0]
+
+        codes: list[np.ndarray] = []
+        n_categories: list[int] = []
+        for col in columns:
+            col_codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+            codes.append(col_codes.astype(np.int64))
+            n_categories.append(len(uniques))
+
+        matrix: np.ndarray = np.eye(len(columns))
+        for i in range(len(columns)):
+            valid_i: np.ndarray = codes[i] >= 0
+            j: int = i + 1
+            while j < len(columns):
+                if n_categories[i] * n_categories[j] > self.MAX_BATCH_SIZE:
+                    # too many cells for a dense table, count the observed pairs
+                    matrix[i, j] = matrix[j, i] = self._sparse_cramers_v(
+                        codes[i], codes[j], n_categories[j]
+                    )
+                    j += 1
+                    continue
+
+                # batch the following columns by their number of codes
+                batch: list[int] = [j]
+                size: int = n_rows + n_categories[i] * n_categories[j]
+                while (
+                    batch[-1] + 1 < len(columns)
+                    and size + n_rows + n_categories[i] * n_categories[batch[-1] + 1]
+                    <= self.MAX_BATCH_SIZE
+                ):
+                    batch.append(batch[-1] + 1)
+                    size += n_rows + n_categories[i] * n_categories[batch[-1]]
+
+                offsets: np.ndarray = np.cumsum(
+                    [0] + [n_categories[i] * n_categories[k] for k in batch]
+                )
+                trash: int = int(offsets[-1])  # bin of rows with NA
+                keys: np.ndarray = np.concatenate(
+                    [
+                        np.where(
+                            valid_i & (codes[k] >= 0),
+                            offsets[pos] + codes[i] * n_categories[k] + codes[k],
+                            trash,
+                        )
+                        for pos, k in enumerate(batch)
+                    ]
+                )
+                counts: np.ndarray = np.bincount(keys, minlength=trash + 1)
+
+                for pos, k in enumerate(batch):
+                    table: np.ndarray = counts[offsets[pos] : offsets[pos + 1]].reshape(
+                        n_categories[i], n_categories[k]
+                    )
+                    matrix[i, k] = matrix[k, i] = self._cramers_v(table)
+                j = batch[-1] + 1
+
+        return pd.DataFrame(matrix, index=columns, columns=columns)
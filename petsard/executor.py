@@ -1,15 +1,22 @@
+import hashlib
+import json
 import logging
 import os
+import pickle
 import time
-from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 
+import pandas as pd
 import yaml
 
+from petsard.adapter import BaseAdapter
 from petsard.config import Config
 from petsard.config_base import BaseConfig
 from petsard.exceptions import ConfigError
-from petsard.status import Status
+from petsard.status import Status, TimingLogHandler
 
 
 @dataclass
@@ -31,12 +38,44 @@ class ExecutorConfig(BaseConfig):
             - CRITICAL
         log_dir (str): Directory for storing log files
         log_name (str): Log file name template (can include {timestamp})
+        parallel (str): Execution mode of experiment branches
+            - none: run every branch serially (default)
+            - process: run independent branches concurrently in a process pool
+        max_workers (int, optional): Number of worker processes when parallel is "process".
+            Defaults to the number of CPUs.
+        cache (bool): Reuse the operator of a stage whose config and upstream stages
+            are identical to one already executed. Default is False.
+        cache_dir (str, optional): Directory to persist cached operators,
+            so repeated runs on unchanged inputs skip to the first changed stage.
+            Setting it also enables cache.
+        checkpoint_dir (str, optional): Directory to checkpoint every completed
+            module experiment (operator pickle, result Parquet, metadata JSON).
+        resume (bool): Rebuild Status from checkpoint_dir and continue
+            from the first incomplete step. Default is False.
+        copy_on_write (bool): Run with pandas Copy-on-Write enabled,
+            so results are handed off between modules as shallow copies
+            instead of deep copies. Default is False.
+        memory_budget (int, optional): Upper bound in bytes of the results kept
+            in Status. Results no remaining step reads are released,
+            and still needed ones are spilled to disk beyond the budget.
+            Default is None, keeping every result of the current path.
+        spill_dir (str, optional): Directory for spilled results.
+            Defaults to a temporary directory.
     """
 
     log_output_type: str = "file"
     log_level: str = "INFO"
     log_dir: str = "."
     log_filename: str = "PETsARD_{timestamp}.log"
+    parallel: str = "none"
+    max_workers: int | None = None
+    cache: bool = False
+    cache_dir: str | None = None
+    checkpoint_dir: str | None = None
+    resume: bool = False
+    copy_on_write: bool = False
+    memory_budget: int | None = None
+    spill_dir: str | None = None
 
     def __post_init__(self):
         """
@@ -47,6 +86,509 @@ class ExecutorConfig(BaseConfig):
             raise ConfigError("Invalid log_output_type {self.log_output_type}")
         if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
             raise ConfigError("Invalid log_level {self.log_level}")
+        if self.parallel not in ["none", "process"]:
+            raise ConfigError(f"Invalid parallel {self.parallel}")
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ConfigError(f"Invalid max_workers {self.max_workers}")
+        if self.resume and self.checkpoint_dir is None:
+            raise ConfigError("resume requires checkpoint_dir")
+        if self.memory_budget is not None and self.memory_budget < 1:
+            raise ConfigError(f"Invalid memory_budget {self.memory_budget}")
+        if self.spill_dir is not None and self.memory_budget is None:
+            raise ConfigError("spill_dir requires memory_budget")
+
+
+class StageCache:
+    """
+    Content-addressed cache of executed operators.
+
+    A stage is addressed by the hash of its module, experiment config
+        and the key of its upstream stage on the current path,
+        so a stage is reused only when its whole upstream chain is identical.
+    Local files referenced in the config (e.g. Loader filepath) are fingerprinted
+        by size and modification time, so changed inputs invalidate the chain.
+    """
+
+    # Stages with side effects, always executed
+    UNCACHEABLE_MODULES: list[str] = ["Reporter"]
+    # Stages whose sibling experiments share a config but not a result
+    EXPT_KEYED_MODULES: list[str] = ["Splitter"]
+
+    def __init__(self, yaml_config: dict, sequence: list, cache_dir: str = None):
+        """
+        Args:
+            yaml_config (dict): The experiment configuration, {module: {expt: config}}.
+            sequence (list): The module execution order.
+            cache_dir (str, optional): Directory to persist cached operators.
+                Default is None, keeping them in memory only.
+
+        Attributes:
+            _memory (dict): In-memory store of operators by stage key.
+            _path_keys (dict): Stage key of each module on the current DFS path.
+        """
+        self._logger = logging.getLogger(f"PETsARD.{self.__class__.__name__}")
+        self.yaml_config: dict = yaml_config
+        self.sequence: list = sequence
+        self.cache_dir: str = cache_dir
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._memory: dict[str, BaseAdapter] = {}
+        self._path_keys: dict[str, str] = {}
+
+    def __getstate__(self) -> dict:
+        """Operators kept in memory stay in the process that executed them."""
+        state = self.__dict__.copy()
+        state["_memory"] = {}
+        return state
+
+    @staticmethod
+    def _fingerprint_files(config) -> list:
+        """
+        Collect (path, size, mtime) of the local files referenced in the config.
+        """
+        fingerprints: list = []
+        if isinstance(config, dict):
+            for value in config.values():
+                fingerprints.extend(StageCache._fingerprint_files(value))
+        elif isinstance(config, list | tuple):
+            for value in config:
+                fingerprints.extend(StageCache._fingerprint_files(value))
+        elif isinstance(config, str) and os.path.isfile(config):
+            stat = os.stat(config)
+            fingerprints.append(
+                [os.path.abspath(config), stat.st_size, stat.st_mtime_ns]
+            )
+        return fingerprints
+
+    def get_key(self, module: str, expt: str) -> str | None:
+        """
+        Compute the stage key of a module experiment and record it on the current path.
+
+        Args:
+            module (str): The name of the module.
+            expt (str): The name of the experiment.
+
+        Returns:
+            (str | None): The stage key, or None if the stage is not cacheable.
+        """
+        module_idx: int = self.sequence.index(module)
+        # drop the keys of the previous branch below this module
+        for downstream in self.sequence[module_idx:]:
+            self._path_keys.pop(downstream, None)
+
+        if module in self.UNCACHEABLE_MODULES:
+            return None
+        upstream_key: str = (
+            self._path_keys.get(self.sequence[module_idx - 1], "")
+            if module_idx > 0
+            else ""
+        )
+        if module_idx > 0 and not upstream_key:
+            # upstream stage is not cacheable
+            return None
+
+        expt_config: dict = self.yaml_config[module][expt]
+        content: str = json.dumps(
+            {
+                "module": module,
+                "expt": expt if module in self.EXPT_KEYED_MODULES else None,
+                "config": expt_config,
+                "files": self._fingerprint_files(expt_config),
+                "upstream": upstream_key,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        key: str = hashlib.sha256(content.encode()).hexdigest()
+        self._path_keys[module] = key
+        return key
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key: str) -> BaseAdapter | None:
+        """
+        Retrieve a cached operator.
+
+        Args:
+            key (str): The stage key.
+
+        Returns:
+            (BaseAdapter | None): The executed operator, or None on cache miss.
+        """
+        if key in self._memory:
+            return self._memory[key]
+
+        if self.cache_dir is not None and os.path.isfile(self._get_path(key)):
+            try:
+                with open(self._get_path(key), "rb") as f:
+                    ops: BaseAdapter = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError) as e:
+                self._logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+                return None
+            self._memory[key] = ops
+            return ops
+
+        return None
+
+    def put(self, key: str, ops: BaseAdapter) -> None:
+        """
+        Store an executed operator.
+
+        Args:
+            key (str): The stage key.
+            ops (BaseAdapter): The executed operator.
+        """
+        self._memory[key] = ops
+
+        if self.cache_dir is not None:
+            # write then rename, so concurrent workers never read a partial file
+            path: str = self._get_path(key)
+            tmp_path: str = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(ops, f)
+                os.replace(tmp_path, path)
+            except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+                self._logger.warning(f"Unable to persist cache entry {key}: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+
+class ExecutionCheckpoint:
+    """
+    On-disk checkpoints of completed module experiments.
+
+    Each module experiment is a node of the experiment tree,
+        identified by its full experiment name (e.g. Loader[data]_Splitter[split]),
+        and checkpointed into its own directory:
+        - operator.pkl: the executed operator, used to rebuild Status on resume
+        - result*.parquet: the DataFrame result(s), if a Parquet engine is installed
+        - metadata.json: the SchemaMetadata of Loader, Splitter and Preprocessor
+        - step.json: written last, marks the checkpoint as complete
+    A checkpoint is only restored when the configs along its path are unchanged.
+    Stages with side effects (Reporter) are never checkpointed,
+        so a resumed run writes their output again.
+    """
+
+    # Stages with side effects, always executed
+    UNCHECKPOINTED_MODULES: list[str] = StageCache.UNCACHEABLE_MODULES
+    STEP_FILE: str = "step.json"
+    OPERATOR_FILE: str = "operator.pkl"
+    METADATA_MODULES: list[str] = ["Loader", "Splitter", "Preprocessor"]
+
+    def __init__(
+        self,
+        checkpoint_dir: str,
+        yaml_config: dict,
+        sequence: list,
+        resume: bool = False,
+    ):
+        """
+        Args:
+            checkpoint_dir (str): Directory to store the checkpoints.
+            yaml_config (dict): The experiment configuration, {module: {expt: config}}.
+            sequence (list): The module execution order.
+            resume (bool): Whether to restore completed steps. Default is False.
+        """
+        self._logger = logging.getLogger(f"PETsARD.{self.__class__.__name__}")
+        self.checkpoint_dir: str = checkpoint_dir
+        self.yaml_config: dict = yaml_config
+        self.sequence: list = sequence
+        self.resume: bool = resume
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+
+    def _get_node(self, status: Status, module: str, expt: str) -> tuple[str, str]:
+        """
+        Identify a module experiment by its path in the experiment tree.
+
+        Returns:
+            (tuple[str, str]): The full experiment name and the hash of the configs
+                along the path, including the local files they reference.
+        """
+        module_idx: int = self.sequence.index(module)
+        path: dict = (
+            status.get_full_expt(module=self.sequence[module_idx - 1])
+            if module_idx > 0
+            else {}
+        )
+        path[module] = expt
+
+        node_id: str = "_".join(
+            [f"{path_module}[{path_expt}]" for path_module, path_expt in path.items()]
+        )
+        config_hash: str = hashlib.sha256(
+            json.dumps(
+                [
+                    [
+                        path_module,
+                        path_expt,
+                        self.yaml_config[path_module][path_expt],
+                        StageCache._fingerprint_files(
+                            self.yaml_config[path_module][path_expt]
+                        ),
+                    ]
+                    for path_module, path_expt in path.items()
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+        return node_id, config_hash
+
+    def _get_dir(self, module: str, node_id: str) -> str:
+        digest: str = hashlib.sha256(node_id.encode()).hexdigest()[:16]
+        return os.path.join(self.checkpoint_dir, f"{module}_{digest}")
+
+    def load(self, status: Status, module: str, expt: str) -> BaseAdapter | None:
+        """
+        Restore the operator of a completed module experiment.
+
+        Args:
+            status (Status): The status at the current path.
+            module (str): The name of the module.
+            expt (str): The name of the experiment.
+
+        Returns:
+            (BaseAdapter | None): The executed operator,
+                or None if not resuming, the module is never checkpointed,
+                or the step is incomplete or outdated.
+        """
+        if not self.resume or module in self.UNCHECKPOINTED_MODULES:
+            return None
+
+        node_id, config_hash = self._get_node(status, module, expt)
+        step_dir: str = self._get_dir(module, node_id)
+        step_path: str = os.path.join(step_dir, self.STEP_FILE)
+        if not os.path.isfile(step_path):
+            return None
+
+        try:
+            with open(step_path) as f:
+                step: dict = json.load(f)
+            if step.get("node_id") != node_id or step.get("config_hash") != config_hash:
+                self._logger.info(f"Checkpoint of {node_id} is outdated, re-executing")
+                return None
+            with open(os.path.join(step_dir, self.OPERATOR_FILE), "rb") as f:
+                return pickle.load(f)
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError) as e:
+            self._logger.warning(f"Ignoring unreadable checkpoint of {node_id}: {e}")
+            return None
+
+    def save(self, status: Status, module: str, expt: str, ops: BaseAdapter) -> None:
+        """
+        Checkpoint a completed module experiment.
+
+        Args:
+            status (Status): The status at the current path, before ops is put.
+            module (str): The name of the module.
+            expt (str): The name of the experiment.
+            ops (BaseAdapter): The executed operator.
+        """
+        if module in self.UNCHECKPOINTED_MODULES:
+            return
+
+        node_id, config_hash = self._get_node(status, module, expt)
+        step_dir: str = self._get_dir(module, node_id)
+        os.makedirs(step_dir, exist_ok=True)
+
+        # invalidate first, so a crash while writing never leaves a stale step.json
+        step_path: str = os.path.join(step_dir, self.STEP_FILE)
+        if os.path.exists(step_path):
+            os.remove(step_path)
+
+        with open(os.path.join(step_dir, self.OPERATOR_FILE), "wb") as f:
+            pickle.dump(ops, f)
+
+        self._save_result(step_dir, ops.get_result())
+        if module in self.METADATA_MODULES:
+            with open(os.path.join(step_dir, "metadata.json"), "w") as f:
+                json.dump(asdict(ops.get_metadata()), f, indent=2, default=str)
+
+        with open(step_path, "w") as f:
+            json.dump(
+                {
+                    "node_id": node_id,
+                    "module": module,
+                    "expt": expt,
+                    "config_hash": config_hash,
+                    "completed_at": datetime.now().isoformat(),
+                },
+                f,
+                indent=2,
+            )
+        self._logger.debug(f"Checkpoint of {node_id} saved to {step_dir}")
+
+    def _save_result(self, step_dir: str, result) -> None:
+        """
+        Export the DataFrame result(s) as Parquet.
+            Parquet is for inspection only, operator.pkl is used on resume,
+            so an unavailable engine or an unsupported column only skips the export.
+        """
+        frames: dict[str, pd.DataFrame] = {}
+        if isinstance(result, pd.DataFrame):
+            frames["result"] = result
+        elif isinstance(result, dict):
+            frames = {
+                f"result_{key}": value
+                for key, value in result.items()
+                if isinstance(value, pd.DataFrame)
+            }
+
+        for name, frame in frames.items():
+            try:
+                frame.to_parquet(os.path.join(step_dir, f"{name}.parquet"))
+            except (ImportError, ValueError, TypeError) as e:
+                self._logger.debug(f"Skip exporting {name} as Parquet: {e}")
+
+
+def _run_step(
+    status: Status,
+    module: str,
+    expt: str,
+    ops: BaseAdapter,
+    logger: logging.Logger,
+    cache: StageCache | None = None,
+    checkpoint: ExecutionCheckpoint | None = None,
+    pending: list[str] | None = None,
+):
+    """
+    Run a single module experiment and record it in Status.
+
+    Args:
+        status (Status): The status the operator reads from and is put into.
+        module (str): The name of the module.
+        expt (str): The name of the experiment.
+        ops (BaseAdapter): The operator of the module experiment.
+        logger (logging.Logger): The logger of the caller.
+        cache (StageCache, optional): Reuse the operator of an identical stage.
+        checkpoint (ExecutionCheckpoint, optional): Restore or save the step on disk.
+        pending (list[str], optional): Modules of the steps still to run, in order,
+            so that Status can release results no pending step reads.
+    """
+    key: str | None = cache.get_key(module, expt) if cache is not None else None
+
+    restored_ops: BaseAdapter | None = (
+        checkpoint.load(status, module, expt) if checkpoint is not None else None
+    )
+    if restored_ops is not None:
+        logger.info(f"Restoring {module} with {expt} from checkpoint")
+        status.put(module, expt, restored_ops)
+        if pending is not None:
+            status.release(pending)
+        return
+
+    cached_ops: BaseAdapter | None = cache.get(key) if key is not None else None
+
+    if cached_ops is not None:
+        logger.info(f"Reusing cached {module} with {expt}")
+        ops = cached_ops
+    else:
+        logger.info(f"Executing {module} with {expt}")
+        ops.run(ops.set_input(status=status))
+        if key is not None:
+            cache.put(key, ops)
+
+    if checkpoint is not None:
+        checkpoint.save(status, module, expt, ops)
+    status.put(module, expt, ops)
+    if pending is not None:
+        status.release(pending)
+
+
+def _init_branch_worker(copy_on_write: bool | str | None = None):
+    """
+    Initializer of the worker processes used by Executor(parallel="process").
+
+    Forked workers inherit the TimingLogHandler of the parent Status,
+        detach it so timings are only recorded by the branch Status.
+
+    Args:
+        copy_on_write (bool | str, optional): pandas mode.copy_on_write of the parent,
+            applied to the worker so results are handed off the same way.
+            Default is None, keeping the worker setting.
+    """
+    if copy_on_write is not None:
+        pd.set_option("mode.copy_on_write", copy_on_write)
+
+    petsard_logger = logging.getLogger("PETsARD")
+    for handler in petsard_logger.handlers[:]:
+        if isinstance(handler, TimingLogHandler):
+            petsard_logger.removeHandler(handler)
+
+
+def _run_branch(
+    status_snapshot: bytes,
+    flow: list[tuple[str, str, BaseAdapter]],
+    leaf_module: str | None,
+) -> dict:
+    """
+    Run one experiment branch in a worker process.
+
+    Args:
+        status_snapshot (bytes): Pickled (Status, StageCache, ExecutionCheckpoint)
+            at the fork point, the latter two may be None.
+        flow (list): The (module, expt, operator) flow of the branch in DFS order.
+        leaf_module (str | None): The last module run by the worker.
+            When given, the branch state after each of its experiments is returned
+            so that the JOIN_MODULES can continue from it in the main process.
+
+    Returns:
+        (dict):
+            - result: list of (full_expt_name, result) of the final module
+            - leaf_states: list of Status.get_branch_state() at leaf_module
+            - snapshots: execution snapshots created in this branch
+            - timing_records: timing records completed in this branch
+            - peak_retained_bytes: peak bytes of results kept in the branch Status
+    """
+    # a worker is reused across branches, drop the handler of the previous one
+    _init_branch_worker()
+    status: Status
+    cache: StageCache | None
+    checkpoint: ExecutionCheckpoint | None
+    status, cache, checkpoint = pickle.loads(status_snapshot)
+    status.snapshots.clear()
+    status.timing_records.clear()
+
+    # JOIN_MODULES run on the state after each leaf_module experiment
+    join_modules: list[str] = (
+        status.sequence[status.sequence.index(leaf_module) + 1 :]
+        if leaf_module is not None
+        else []
+    )
+    pending: list[list[str]] = []
+    tail: list[str] = []
+    for module, _, _ in reversed(flow):
+        pending.insert(0, (join_modules if module == leaf_module else []) + tail)
+        tail = [module] + pending[0]
+
+    logger = logging.getLogger("PETsARD.Executor")
+    result: list[tuple[str, object]] = []
+    leaf_states: list[dict] = []
+    for idx, (module, expt, ops) in enumerate(flow):
+        _run_step(status, module, expt, ops, logger, cache, checkpoint, pending[idx])
+
+        if module == status.sequence[-1]:
+            full_expt_name = "_".join(
+                [
+                    f"{full_module}[{full_expt}]"
+                    for full_module, full_expt in status.get_full_expt().items()
+                ]
+            )
+            result.append((full_expt_name, status.get_result(module=module)))
+        if module == leaf_module:
+            leaf_states.append(status.get_branch_state())
+
+    # leaf states hold the spilled operators in memory, so the files can go
+    status.cleanup_spill()
+    return {
+        "result": result,
+        "leaf_states": leaf_states,
+        "snapshots": list(status.snapshots),
+        "timing_records": list(status.timing_records),
+        "peak_retained_bytes": status.get_status_summary()["peak_retained_bytes"],
+    }
 
 
 class Executor:
@@ -54,6 +596,11 @@ class Executor:
     Represents an executor that runs a series of operators based on a given configuration.
     """
 
+    # Modules whose sibling experiments depend on each other
+    SERIAL_MODULES: list[str] = ["Splitter"]
+    # Modules that consume the outcome of every upstream branch
+    JOIN_MODULES: list[str] = ["Reporter"]
+
     def __init__(self, config: str):
         """
         Args:
@@ -79,9 +626,30 @@ class Executor:
 
         self.config = Config(config=yaml_config)
         self.sequence = self.config.sequence
-        self.status = Status(config=self.config)
+        self.status = Status(
+            config=self.config,
+            memory_budget=self.executor_config.memory_budget,
+            spill_dir=self.executor_config.spill_dir,
+        )
         self.result: dict = {}
 
+        self._cache: StageCache | None = None
+        if self.executor_config.cache or self.executor_config.cache_dir:
+            self._cache = StageCache(
+                yaml_config=self.config.yaml,
+                sequence=self.sequence,
+                cache_dir=self.executor_config.cache_dir,
+            )
+
+        self._checkpoint: ExecutionCheckpoint | None = None
+        if self.executor_config.checkpoint_dir:
+            self._checkpoint = ExecutionCheckpoint(
+                checkpoint_dir=self.executor_config.checkpoint_dir,
+                yaml_config=self.config.yaml,
+                sequence=self.sequence,
+                resume=self.executor_config.resume,
+            )
+
         # Execution state tracking
         # NOTE: This attribute will be removed in v2.0.0 and replaced with run() return value
         self._execution_completed: bool = False
@@ -177,30 +745,244 @@ class Executor:
         self._execution_completed = False
         start_time: time = time.time()
         self._logger.info("Starting PETsARD execution workflow")
+        try:
+            with (
+                pd.option_context("mode.copy_on_write", True)
+                if self.executor_config.copy_on_write
+                else nullcontext()
+            ):
+                if self.executor_config.parallel == "process":
+                    self._run_parallel()
+                else:
+                    self._run_serial()
+        finally:
+            self.status.cleanup_spill()
+
+        elapsed_time: time = time.time() - start_time
+        formatted_elapsed_time: str = str(timedelta(seconds=round(elapsed_time)))
+        self._logger.info(
+            f"Completed PETsARD execution workflow (elapsed: {formatted_elapsed_time})"
+        )
+
+        # Mark execution as completed
+        self._execution_completed = True
+
+        # TODO: In v2.0.0, return execution status here
+        # return "success"  # or "failed" based on execution result
+
+    def _run_serial(self):
+        """
+        Run the flow queued by Config one step at a time in this process.
+        """
         while self.config.config.qsize() > 0:
             ops = self.config.config.get()
             module = self.config.module_flow.get()
             expt = self.config.expt_flow.get()
 
-            self._logger.info(f"Executing {module} with {expt}")
-            ops.run(ops.set_input(status=self.status))
-
-            self.status.put(module, expt, ops)
+            _run_step(
+                self.status,
+                module,
+                expt,
+                ops,
+                self._logger,
+                self._cache,
+                self._checkpoint,
+                list(self.config.module_flow.queue)
+                if self.executor_config.memory_budget is not None
+                else None,
+            )
 
             # collect result
             self._set_result(module)
 
-        elapsed_time: time = time.time() - start_time
-        formatted_elapsed_time: str = str(timedelta(seconds=round(elapsed_time)))
+    def _get_parallel_segment(self) -> tuple[int, int] | None:
+        """
+        Locate the part of the module sequence that can be fanned out to workers.
+
+        Sibling experiments of SERIAL_MODULES depend on each other
+            (e.g. Splitter excludes previously sampled train indices),
+            so the fork point is placed after the last of them,
+            at the first module that actually has several experiments.
+        JOIN_MODULES need every upstream branch (e.g. Reporter merges reports),
+            so the segment stops before the first of them.
+
+        Returns:
+            (tuple[int, int] | None): Sequence indices (fork, join) of the segment,
+                or None if there are no independent branches to run concurrently.
+        """
+        fork_idx: int = 0
+        for module in self.SERIAL_MODULES:
+            if module in self.sequence:
+                fork_idx = max(fork_idx, self.sequence.index(module) + 1)
+
+        for idx in range(fork_idx, len(self.sequence)):
+            if len(self.config.yaml[self.sequence[idx]]) > 1:
+                fork_idx = idx
+                break
+
+        join_idx: int = len(self.sequence)
+        for idx in range(fork_idx, len(self.sequence)):
+            if self.sequence[idx] in self.JOIN_MODULES:
+                join_idx = idx
+                break
+
+        num_branches: int = 1
+        for module in self.sequence[: fork_idx + 1]:
+            num_branches *= len(self.config.yaml[module])
+
+        if fork_idx >= join_idx or num_branches < 2:
+            return None
+        return fork_idx, join_idx
+
+    def _run_parallel(self):
+        """
+        Run independent experiment branches concurrently in a process pool.
+
+        The flow queued by Config is walked in DFS order:
+            modules before the fork point run in this process,
+            each subtree rooted at a fork-level experiment is sent to a worker
+            together with a snapshot of Status,
+            and JOIN_MODULES run here afterwards on the restored branch states.
+        Branch results are merged in DFS order,
+            so Status and self.result match a serial run.
+        """
+        flow: list[tuple[str, str, BaseAdapter]] = []
+        while self.config.config.qsize() > 0:
+            flow.append(
+                (
+                    self.config.module_flow.get(),
+                    self.config.expt_flow.get(),
+                    self.config.config.get(),
+                )
+            )
+
+        segment = self._get_parallel_segment()
+        if segment is None:
+            self._logger.info(
+                "No independent experiment branches found, running serially"
+            )
+            for idx, (module, expt, ops) in enumerate(flow):
+                _run_step(
+                    self.status,
+                    module,
+                    expt,
+                    ops,
+                    self._logger,
+                    self._cache,
+                    self._checkpoint,
+                    [item[0] for item in flow[idx + 1 :]],
+                )
+                self._set_result(module)
+            return
+
+        fork_idx, join_idx = segment
         self._logger.info(
-            f"Completed PETsARD execution workflow (elapsed: {formatted_elapsed_time})"
+            f"Running branches from {self.sequence[fork_idx]} "
+            f"to {self.sequence[join_idx - 1]} in parallel "
+            f"(max_workers: {self.executor_config.max_workers or os.cpu_count()})"
         )
 
-        # Mark execution as completed
-        self._execution_completed = True
+        branches: list[tuple[Future, list[tuple[str, str, BaseAdapter]]]] = []
+        with ProcessPoolExecutor(
+            max_workers=self.executor_config.max_workers,
+            initializer=_init_branch_worker,
+            initargs=(pd.get_option("mode.copy_on_write"),),
+        ) as pool:
+            try:
+                status_snapshot: bytes | None = None
+                idx: int = 0
+                while idx < len(flow):
+                    module, expt, ops = flow[idx]
+                    if self.sequence.index(module) < fork_idx:
+                        _run_step(
+                            self.status,
+                            module,
+                            expt,
+                            ops,
+                            self._logger,
+                            self._cache,
+                            self._checkpoint,
+                            [item[0] for item in flow[idx + 1 :]],
+                        )
+                        status_snapshot = None
+                        idx += 1
+                        continue
 
-        # TODO: In v2.0.0, return execution status here
-        # return "success"  # or "failed" based on execution result
+                    # the subtree ends at the next experiment of the same or upper level
+                    end: int = idx + 1
+                    while (
+                        end < len(flow) and self.sequence.index(flow[end][0]) > fork_idx
+                    ):
+                        end += 1
+                    subtree = flow[idx:end]
+
+                    # siblings share the same upstream state, pickle it once
+                    if status_snapshot is None:
+                        self.status.share_spill_files()
+                        status_snapshot = pickle.dumps(
+                            (self.status, self._cache, self._checkpoint)
+                        )
+                    future = pool.submit(
+                        _run_branch,
+                        status_snapshot,
+                        [
+                            item
+                            for item in subtree
+                            if self.sequence.index(item[0]) < join_idx
+                        ],
+                        self.sequence[join_idx - 1]
+                        if join_idx < len(self.sequence)
+                        else None,
+                    )
+                    branches.append((future, subtree))
+                    idx = end
+
+                for future, subtree in branches:
+                    self._merge_branch(future.result(), subtree, join_idx)
+            except BaseException:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    def _merge_branch(
+        self,
+        branch: dict,
+        subtree: list[tuple[str, str, BaseAdapter]],
+        join_idx: int,
+    ):
+        """
+        Merge the outcome of a worker branch and run its JOIN_MODULES.
+
+        Args:
+            branch (dict): The return value of _run_branch().
+            subtree (list): The (module, expt, operator) flow of the branch.
+            join_idx (int): Sequence index of the first module run in this process.
+        """
+        self.status.merge_records(
+            snapshots=branch["snapshots"],
+            timing_records=branch["timing_records"],
+            peak_retained_bytes=branch["peak_retained_bytes"],
+        )
+        self.result.update(branch["result"])
+
+        if join_idx == len(self.sequence):
+            return
+
+        leaf_states = iter(branch["leaf_states"])
+        for module, expt, ops in subtree:
+            module_idx: int = self.sequence.index(module)
+            if module_idx == join_idx - 1:
+                self.status.set_branch_state(next(leaf_states))
+            elif module_idx >= join_idx:
+                _run_step(
+                    self.status,
+                    module,
+                    expt,
+                    ops,
+                    self._logger,
+                    self._cache,
+                    self._checkpoint,
+                )
+                self._set_result(module)
 
     def _set_result(self, module: str):
         """
@@ -1,6 +1,7 @@
 import logging
 import re
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 import pandas as pd
@@ -15,6 +16,7 @@ from petsard.exceptions import (
 )
 from petsard.loader.benchmarker import BenchmarkerConfig, BenchmarkerRequests
 from petsard.metadater import FieldConfig, Metadater, SchemaConfig, SchemaMetadata
+from petsard.metadater.field.field_functions import build_field_metadata
 
 
 class LoaderFileExt:
@@ -24,6 +26,8 @@ class LoaderFileExt:
 
     CSVTYPE: int = 1
     EXCELTYPE: int = 2
+    PARQUETTYPE: int = 3
+    ARROWTYPE: int = 4
 
     CSV: int = 10
     XLS: int = 20
@@ -33,6 +37,10 @@ class LoaderFileExt:
     ODF: int = 24
     ODS: int = 25
     ODT: int = 26
+    PARQUET: int = 30
+    FEATHER: int = 40
+    ARROW: int = 41
+    IPC: int = 42
 
     @classmethod
     def get(cls, file_ext: str) -> int:
@@ -60,6 +68,8 @@ class LoaderConfig(BaseConfig):
         na_values (str | list | dict): Extra string to recognized as NA/NaN.
         schema (SchemaConfig): Schema configuration object with field definitions and global parameters.
         schema_path (str): The path to schema file if loaded from YAML file.
+        chunksize (int): Number of rows read at a time from a CSV file.
+        downcast (bool): Cast each chunk to the dtype optimized by Metadater.
         dir_name (str): The directory name of the file path.
         base_name (str): The base name of the file path.
         file_name (str): The file name of the file path.
@@ -81,6 +91,8 @@ class LoaderConfig(BaseConfig):
     )
     schema: SchemaConfig | None = None
     schema_path: str | None = None  # 記錄 schema 來源路徑（如果從檔案載入）
+    chunksize: int | None = None
+    downcast: bool = False
 
     # Filepath related
     dir_name: str | None = None
@@ -149,7 +161,24 @@ class LoaderConfig(BaseConfig):
             f"File path information - dir: {self.dir_name}, name: {self.file_name}, ext: {self.file_ext}, ext code: {self.file_ext_code}"
         )
 
-        # 4. validate column_types (using new Metadater architecture)
+        # 4. validate chunked loading
+        if self.chunksize is not None:
+            if self.chunksize < 1:
+                error_msg = f"Invalid chunksize: {self.chunksize}"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            if self.file_ext_code != LoaderFileExt.CSVTYPE:
+                error_msg = (
+                    f"chunksize is only supported for CSV files, got {self.file_ext}"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+        if self.downcast and self.chunksize is None:
+            error_msg = "downcast requires chunksize"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        # 5. validate column_types (using new Metadater architecture)
         if self.column_types is not None:
             self._logger.debug(f"Validating column types: {self.column_types}")
             valid_column_types = ["category", "datetime"]
@@ -160,12 +189,30 @@ class LoaderConfig(BaseConfig):
                     raise UnsupportedMethodError(error_msg)
             self._logger.debug("Column types validation passed")
 
-        # 5. validate schema parameter and check for conflicts
+        # 6. validate schema parameter and check for conflicts
         if self.schema is not None:
             self._logger.debug("Schema configuration provided")
             # SchemaConfig validation is handled by its own dataclass validation
             self._logger.debug("Schema configuration validation passed")
 
+            # Column projection and row filters are read from schema properties
+            properties = getattr(self.schema, "properties", None) or {}
+            columns = properties.get("columns")
+            if columns is not None and not (
+                isinstance(columns, list)
+                and all(isinstance(col, str) for col in columns)
+            ):
+                error_msg = f"Schema property columns must be a list of column names, got {columns}"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            if properties.get("filters") and self.file_ext_code not in (
+                LoaderFileExt.PARQUETTYPE,
+                LoaderFileExt.ARROWTYPE,
+            ):
+                error_msg = f"Schema property filters are only supported for Parquet, Feather and Arrow IPC files, got {self.file_ext}"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+
             # Check for conflicts between schema and column_types
             if self.column_types is not None:
                 self._logger.debug(
@@ -214,6 +261,8 @@ class Loader:
         | dict[str, str]
         | None = None,  # TODO: Deprecated in v2.0.0
         schema: SchemaConfig | dict | str | None = None,
+        chunksize: int | None = None,
+        downcast: bool = False,
     ):
         """
         Args:
@@ -242,6 +291,19 @@ class Loader:
                 - dict: Dictionary that will be converted to SchemaConfig using from_dict()
                 - str: Path to YAML file containing schema configuration
                 Contains field definitions and global parameters for data processing.
+                Its properties may hold "columns" (columns to read) and, for
+                Parquet/Feather/Arrow IPC files, "filters" (pyarrow DNF row filters).
+            chunksize (int, optional): Number of rows read at a time from a CSV file.
+                NA normalization (and downcast) is applied per chunk,
+                so the whole file is never parsed at once.
+                load() still returns the whole data, use load_chunks()
+                to hold only one chunk at a time.
+                Default is None, reading the whole file at once.
+            downcast (bool, optional): Cast every chunk to the dtype optimized by
+                Metadater (e.g. int64 to int8, float64 to float32, str to category).
+                The dtypes are decided once in a first pass over the file.
+                Fields with a type in schema are kept. Requires chunksize.
+                Default is False.
 
         Attributes:
             _logger (logging.Logger): The logger object.
@@ -266,6 +328,8 @@ class Loader:
             na_values=na_values,
             schema=processed_schema,
             schema_path=schema_path,
+            chunksize=chunksize,
+            downcast=downcast,
         )
         self._logger.debug("LoaderConfig successfully initialized")
 
@@ -383,6 +447,38 @@ class Loader:
         self._logger.info("Data loading completed successfully")
         return data, schema_metadata
 
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Load data from the specified file path chunk by chunk.
+
+        Unlike load(), only one chunk of chunksize rows is held at a time,
+        so a file larger than memory can be consumed in one pass.
+        Every chunk is NA-normalized, and with downcast all chunks share
+        the dtypes decided once over the whole file. Requires chunksize.
+
+        Returns:
+            (Iterator[pd.DataFrame]) Chunks of the data
+        """
+        if self.config.chunksize is None:
+            error_msg = "load_chunks requires chunksize"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        self._logger.info(f"Loading data from {self.config.filepath} in chunks")
+
+        if self.config.benchmarker_config:
+            self._handle_benchmark_download()
+
+        merged_schema_config = self._merge_legacy_to_schema()
+        loader_class, config = self._build_reader_config(merged_schema_config)
+
+        try:
+            yield from self._iter_chunks(loader_class(config), merged_schema_config)
+        except Exception as e:
+            error_msg = f"Failed to load data from {self.config.filepath}: {str(e)}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg) from e
+
     def _handle_benchmark_download(self):
         """Handle benchmark dataset download."""
         self._logger.info(
@@ -496,6 +592,34 @@ class Loader:
         Returns:
             pd.DataFrame: Loaded dataframe
         """
+        loader_class, config = self._build_reader_config(schema_config)
+
+        try:
+            # Create loader instance and load data
+            loader = loader_class(config)
+            if self.config.chunksize is not None:
+                data = self._read_chunks(loader, schema_config)
+            else:
+                data = loader.load().fillna(pd.NA)
+            self._logger.info(f"Successfully loaded data with shape: {data.shape}")
+            return data
+
+        except Exception as e:
+            error_msg = f"Failed to load data from {self.config.filepath}: {str(e)}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg) from e
+
+    def _build_reader_config(self, schema_config: SchemaConfig) -> tuple[type, dict]:
+        """
+        Select the pandas loader class and build its configuration.
+
+        Args:
+            schema_config: Merged schema configuration
+
+        Returns:
+            tuple: (loader_class, config)
+        """
+        from petsard.loader.loader_arrow import LoaderArrowIpc, LoaderArrowParquet
         from petsard.loader.loader_pandas import LoaderPandasCsv, LoaderPandasExcel
 
         self._logger.info("Reading data using pandas loader classes")
@@ -504,6 +628,8 @@ class Loader:
         loaders_map = {
             LoaderFileExt.CSVTYPE: LoaderPandasCsv,
             LoaderFileExt.EXCELTYPE: LoaderPandasExcel,
+            LoaderFileExt.PARQUETTYPE: LoaderArrowParquet,
+            LoaderFileExt.ARROWTYPE: LoaderArrowIpc,
         }
 
         if self.config.file_ext_code not in loaders_map:
@@ -518,6 +644,15 @@ class Loader:
             "filepath": str(self.config.filepath),
             "header_names": self.config.header_names,
         }
+        if self.config.chunksize is not None:
+            config["chunksize"] = self.config.chunksize
+
+        # Handle schema-based column projection and row filters
+        properties = getattr(schema_config, "properties", None) or {}
+        if properties.get("columns") is not None:
+            config["columns"] = properties["columns"]
+        if properties.get("filters"):
+            config["filters"] = properties["filters"]
 
         # Handle legacy na_values (takes precedence over schema na_values for backward compatibility)
         if self.config.na_values is not None:
@@ -575,17 +710,180 @@ class Loader:
                 config["na_values"] = na_values_dict
                 self._logger.debug(f"Using schema-based na_values: {na_values_dict}")
 
-        try:
-            # Create loader instance and load data
-            loader = loader_class(config)
-            data = loader.load().fillna(pd.NA)
-            self._logger.info(f"Successfully loaded data with shape: {data.shape}")
-            return data
+        return loader_class, config
 
-        except Exception as e:
-            error_msg = f"Failed to load data from {self.config.filepath}: {str(e)}"
-            self._logger.error(error_msg)
-            raise UnableToFollowMetadataError(error_msg) from e
+    def _read_chunks(self, loader, schema_config: SchemaConfig) -> pd.DataFrame:
+        """
+        Read data chunk by chunk and concatenate the chunks.
+
+        Only the parsing is bounded by chunksize: the returned dataframe
+        holds the whole file, use load_chunks() to consume it chunk by chunk.
+
+        Args:
+            loader: Loader class instance providing load_chunks()
+            schema_config: Merged schema configuration
+
+        Returns:
+            pd.DataFrame: Loaded dataframe
+        """
+        chunks: list[pd.DataFrame] = list(self._iter_chunks(loader, schema_config))
+        self._logger.debug(
+            f"Read {len(chunks)} chunks of up to {self.config.chunksize} rows"
+        )
+
+        if not chunks:
+            return loader.load().fillna(pd.NA)
+
+        return pd.concat(chunks, ignore_index=True)
+
+    def _iter_chunks(
+        self, loader, schema_config: SchemaConfig
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield NA-normalized chunks, cast to the planned dtypes when downcasting.
+
+        Args:
+            loader: Loader class instance providing load_chunks()
+            schema_config: Merged schema configuration
+
+        Returns:
+            (Iterator[pd.DataFrame]) Chunks sharing the same dtypes
+        """
+        target_dtypes: dict = {}
+        if self.config.downcast:
+            read_dtypes, target_dtypes = self._plan_downcast(loader, schema_config)
+            if read_dtypes:
+                loader.config["dtype"] = {
+                    **(loader.config.get("dtype") or {}),
+                    **read_dtypes,
+                }
+
+        for chunk in loader.load_chunks():
+            chunk = chunk.fillna(pd.NA)
+            if target_dtypes:
+                chunk = chunk.astype(target_dtypes)
+            yield chunk
+
+    def _plan_downcast(self, loader, schema_config: SchemaConfig) -> tuple[dict, dict]:
+        """
+        Decide the downcast dtype of every column once, in a first pass.
+
+        Each chunk is inspected by Metadater, and the targets of all chunks
+        are merged into the narrowest dtype holding every chunk, so that
+        all chunks are cast alike. Categorical columns get the categories
+        seen in the whole file. Columns left as they are but parsed with
+        different dtypes across chunks (e.g. "001" as int, then as str)
+        are read as str.
+
+        Args:
+            loader: Loader class instance providing load_chunks()
+            schema_config: Merged schema configuration
+
+        Returns:
+            tuple: (read_dtypes, target_dtypes)
+                - read_dtypes: dtype passed to the reader for each column
+                - target_dtypes: Target dtype of each downcast column
+        """
+        targets: dict[str, str | None] = {}
+        categories: dict[str, pd.Index] = {}
+        parsed_dtypes: dict[str, set[str]] = {}
+        for chunk in loader.load_chunks():
+            for column, dtype in chunk.dtypes.items():
+                parsed_dtypes.setdefault(column, set()).add(str(dtype))
+            chunk = chunk.fillna(pd.NA)
+            for column, target_dtype in self._chunk_target_dtypes(
+                chunk, schema_config
+            ).items():
+                if column in targets:
+                    target_dtype = self._merge_target_dtypes(
+                        targets[column], target_dtype
+                    )
+                targets[column] = target_dtype
+                if target_dtype == "category":
+                    values = pd.Index(chunk[column].dropna().unique())
+                    categories[column] = (
+                        categories[column].union(values)
+                        if column in categories
+                        else values
+                    )
+
+        read_dtypes: dict = {}
+        target_dtypes: dict = {}
+        for column, target_dtype in targets.items():
+            if target_dtype == "category":
+                target_dtypes[column] = pd.CategoricalDtype(categories[column])
+            elif target_dtype is not None:
+                target_dtypes[column] = target_dtype
+            elif len(parsed_dtypes[column]) > 1:
+                read_dtypes[column] = str
+        self._logger.debug(
+            f"Planned read dtypes: {read_dtypes}, downcast dtypes: {target_dtypes}"
+        )
+        return read_dtypes, target_dtypes
+
+    def _chunk_target_dtypes(
+        self, chunk: pd.DataFrame, schema_config: SchemaConfig
+    ) -> dict[str, str | None]:
+        """
+        Get the numeric or category dtype optimized by Metadater for a chunk.
+
+        Args:
+            chunk: A chunk of the loaded data
+            schema_config: Merged schema configuration
+
+        Returns:
+            dict: Target dtype of each column, None if it is not downcast
+        """
+        target_dtypes: dict[str, str | None] = {}
+        for column in chunk.columns:
+            field_config = schema_config.get_field_config(column)
+            if field_config is not None and field_config.type:
+                # The dtype is decided by the schema
+                target_dtypes[column] = None
+                continue
+            if field_config is None:
+                field_config = FieldConfig(leading_zeros=schema_config.leading_zeros)
+
+            target_dtype: str | None = build_field_metadata(
+                field_data=chunk[column],
+                field_name=column,
+                config=field_config,
+                compute_stats=False,
+                infer_logical_type=False,
+                optimize_dtype=True,
+            ).target_dtype
+            if target_dtype is not None and not (
+                target_dtype == "category"
+                or target_dtype.lower().startswith(("int", "float"))
+            ):
+                target_dtype = None
+            target_dtypes[column] = target_dtype
+
+        return target_dtypes
+
+    @staticmethod
+    def _merge_target_dtypes(first: str | None, second: str | None) -> str | None:
+        """
+        Merge the target dtypes of two chunks into one holding both.
+
+        Args:
+            first: Target dtype of the previous chunks
+            second: Target dtype of the current chunk
+
+        Returns:
+            str | None: Merged target dtype, None if the column is not downcast
+        """
+        if first == second:
+            return first
+        if first is None or second is None or "category" in (first, second):
+            return None
+
+        if all(dtype.lower().startswith("int") for dtype in (first, second)):
+            bits: int = max(int(dtype.lower()[3:]) for dtype in (first, second))
+            # Nullable if any chunk has missing values
+            prefix: str = "Int" if "I" in (first[0], second[0]) else "int"
+            return f"{prefix}{bits}"
+        return "float64"
 
     def _process_with_metadater(
         self, data: pd.DataFrame, schema_config: SchemaConfig
@@ -602,6 +900,15 @@ class Loader:
         """
         self._logger.info("Processing with metadater")
 
+        if (
+            self.config.file_ext_code
+            in (LoaderFileExt.PARQUETTYPE, LoaderFileExt.ARROWTYPE)
+            and schema_config.optimize_dtypes
+        ):
+            # Column types are declared by the file schema, skip re-inferring them
+            schema_config = replace(schema_config, optimize_dtypes=False)
+            self._logger.debug("Using column types declared by the file schema")
+
         # Build schema metadata using Metadater with the SchemaConfig directly
         try:
             # Get schema_id safely without depending on internal structure
@@ -0,0 +1,335 @@
+import logging
+from abc import abstractmethod
+
+import pandas as pd
+
+from petsard.exceptions import ConfigError
+from petsard.loader.loader_base import LoaderBase
+
+
+def _import_pyarrow():
+    """
+    Import pyarrow, raising ConfigError with the install hint if missing.
+
+    Return:
+        (module) The pyarrow module.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ConfigError(
+            "pyarrow is required to read Parquet, Feather and Arrow IPC files. "
+            "Please install it with: pip install petsard[load-arrow]"
+        ) from e
+
+    return pyarrow
+
+
+class LoaderArrowBase(LoaderBase):
+    """
+    LoaderArrowBase
+        Shared pyarrow.Table to pd.DataFrame conversion of columnar Loaders.
+
+    Integer columns become pandas nullable integers (e.g. Int32),
+        so the dtype declared by the file survives missing values.
+    """
+
+    def __init__(self, config: dict):
+        """
+        Args:
+            config (dict): The configuration for the loader modules.
+                columns (list, optional): Columns to read (projection).
+                filters (list, optional): Row filters in pyarrow DNF format,
+                    e.g. [("age", ">", 30)].
+
+        Attr:
+            config (dict): The configuration for the loader modules.
+            _logger (logging.Logger): The logger object.
+        """
+        super().__init__(config)
+        self._logger: logging.Logger = logging.getLogger(
+            f"PETsARD.{self.__class__.__name__}"
+        )
+
+    def load(self) -> pd.DataFrame:
+        """
+        Load and return the data
+
+        header_names rename the columns of the file before projecting,
+            so columns and filters refer to the header names, as for CSV.
+
+        Return:
+            (pd.DataFrame)
+                Data in columnar file by pd.DataFrame format.
+        """
+        pa = _import_pyarrow()
+
+        file_names: dict[str, str] = {}
+        if self.config.get("header_names") is not None:
+            file_names = self._map_header_names(pa)
+
+        try:
+            table = self._read_table(
+                pa,
+                columns=self._get_columns(file_names),
+                filters=self._get_filters(file_names),
+            )
+        except Exception as e:
+            raise FileNotFoundError from e
+
+        if file_names:
+            header_names = {name: header for header, name in file_names.items()}
+            table = table.rename_columns(
+                [header_names[name] for name in table.column_names]
+            )
+
+        return self._to_pandas(pa, table)
+
+    @abstractmethod
+    def _read_table(self, pa, columns, filters):
+        """
+        Read the file as a pyarrow.Table, applying projection and filters.
+
+        Args:
+            pa (module): The pyarrow module.
+            columns (list | None): Columns of the file to read.
+            filters (list | None): Row filters in pyarrow DNF format.
+
+        Return:
+            (pyarrow.Table)
+
+        Raises:
+            NotImplementedError: If the method is not implemented.
+        """
+        error_msg: str = (
+            f"Method _read_table is not implemented for {self.__class__.__name__}."
+        )
+        self._logger.error(error_msg)
+        raise NotImplementedError(error_msg)
+
+    @abstractmethod
+    def _read_column_names(self, pa) -> list[str]:
+        """
+        Read the column names declared by the file schema.
+
+        Args:
+            pa (module): The pyarrow module.
+
+        Return:
+            (list[str])
+
+        Raises:
+            NotImplementedError: If the method is not implemented.
+        """
+        error_msg: str = (
+            f"Method _read_column_names is not implemented for "
+            f"{self.__class__.__name__}."
+        )
+        self._logger.error(error_msg)
+        raise NotImplementedError(error_msg)
+
+    def _map_header_names(self, pa) -> dict[str, str]:
+        """
+        Map each of header_names to the column of the file it renames.
+
+        Args:
+            pa (module): The pyarrow module.
+
+        Return:
+            (dict[str, str]) {header_name: column name in file}
+        """
+        header_names: list[str] = self.config["header_names"]
+        column_names: list[str] = self._read_column_names(pa)
+        if len(header_names) != len(column_names):
+            error_msg: str = (
+                f"header_names has {len(header_names)} names, "
+                f"but the file has {len(column_names)} columns"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        return dict(zip(header_names, column_names, strict=True))
+
+    def _get_columns(self, file_names: dict[str, str]):
+        """
+        Get the columns of config to project, as named in the file.
+
+        Args:
+            file_names (dict[str, str]): {header_name: column name in file}.
+
+        Return:
+            (list | None)
+        """
+        columns = self.config.get("columns")
+        if columns is None or not file_names:
+            return columns
+
+        unknown: list[str] = [col for col in columns if col not in file_names]
+        if unknown:
+            error_msg: str = f"Columns {unknown} are not in header_names"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        return [file_names[col] for col in columns]
+
+    def _get_filters(self, file_names: dict[str, str]):
+        """
+        Convert the filters of config to a pyarrow DNF list, as named in the file.
+            Lists from YAML (e.g. ["age", ">", 30]) are turned into tuples.
+
+        Args:
+            file_names (dict[str, str]): {header_name: column name in file}.
+
+        Return:
+            (list | None)
+        """
+        filters = self.config.get("filters")
+        if not filters:
+            return None
+
+        def to_tuple(f) -> tuple:
+            return (file_names.get(f[0], f[0]), *f[1:])
+
+        if isinstance(filters[0][0], str):
+            return [to_tuple(f) for f in filters]
+        return [[to_tuple(f) for f in group] for group in filters]
+
+    def _to_pandas(self, pa, table) -> pd.DataFrame:
+        """
+        Convert the pyarrow.Table to pd.DataFrame, then apply
+            na_values and dtype of config.
+
+        Args:
+            pa (module): The pyarrow module.
+            table (pyarrow.Table): Loaded table.
+
+        Return:
+            (pd.DataFrame)
+        """
+        nullable_int = {
+            pa.int8(): pd.Int8Dtype(),
+            pa.int16(): pd.Int16Dtype(),
+            pa.int32(): pd.Int32Dtype(),
+            pa.int64(): pd.Int64Dtype(),
+            pa.uint8(): pd.UInt8Dtype(),
+            pa.uint16(): pd.UInt16Dtype(),
+            pa.uint32(): pd.UInt32Dtype(),
+            pa.uint64(): pd.UInt64Dtype(),
+        }
+        data = table.to_pandas(types_mapper=nullable_int.get)
+
+        # 1. assign na_values
+        na_values = self.config.get("na_values")
+        if na_values is not None:
+            if not isinstance(na_values, dict):
+                na_values = dict.fromkeys(data.columns, na_values)
+            for col, values in na_values.items():
+                if col not in data.columns:
+                    continue
+                if not isinstance(values, list | tuple | set):
+                    values = [values]
+                data[col] = data[col].mask(data[col].isin(values))
+
+        # 2. assign dtype
+        dtype = self.config.get("dtype")
+        if dtype:
+            data = data.astype(
+                {col: col_type for col, col_type in dtype.items() if col in data}
+            )
+
+        return data
+
+
+class LoaderArrowParquet(LoaderArrowBase):
+    """
+    LoaderArrowParquet
+        pyarrow.parquet implementing of Loader.
+        Filters are pushed down to row groups by their statistics.
+    """
+
+    def _read_table(self, pa, columns, filters):
+        """
+        Read the Parquet file memory-mapped.
+
+        Args:
+            pa (module): The pyarrow module.
+            columns (list | None): Columns of the file to read.
+            filters (list | None): Row filters in pyarrow DNF format.
+
+        Return:
+            (pyarrow.Table)
+        """
+        return pa.parquet.read_table(
+            self.config["filepath"],
+            columns=columns,
+            filters=filters,
+            memory_map=True,
+        )
+
+    def _read_column_names(self, pa) -> list[str]:
+        """
+        Read the column names from the Parquet footer.
+
+        Args:
+            pa (module): The pyarrow module.
+
+        Return:
+            (list[str])
+        """
+        return pa.parquet.read_schema(self.config["filepath"], memory_map=True).names
+
+
+class LoaderArrowIpc(LoaderArrowBase):
+    """
+    LoaderArrowIpc
+        pyarrow.feather implementing of Loader for Feather (V1/V2) and Arrow IPC files.
+        Uncompressed files are memory-mapped without copying.
+    """
+
+    def _read_table(self, pa, columns, filters):
+        """
+        Read the Feather / Arrow IPC file memory-mapped.
+
+        Args:
+            pa (module): The pyarrow module.
+            columns (list | None): Columns of the file to read.
+            filters (list | None): Row filters in pyarrow DNF format.
+
+        Return:
+            (pyarrow.Table)
+        """
+        import pyarrow.feather
+
+        table = pyarrow.feather.read_table(
+            self.config["filepath"],
+            columns=columns,
+            memory_map=True,
+        )
+
+        if filters:
+            table = table.filter(pa.parquet.filters_to_expression(filters))
+
+        return table
+
+    def _read_column_names(self, pa) -> list[str]:
+        """
+        Read the column names from the Feather / Arrow IPC schema.
+            Feather V1 files have no IPC schema and are read memory-mapped.
+
+        Args:
+            pa (module): The pyarrow module.
+
+        Return:
+            (list[str])
+        """
+        import pyarrow.feather
+        import pyarrow.ipc
+
+        try:
+            with pa.memory_map(self.config["filepath"]) as source:
+                return pyarrow.ipc.open_file(source).schema.names
+        except pa.ArrowInvalid:
+            return pyarrow.feather.read_table(
+                self.config["filepath"], memory_map=True
+            ).column_names
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 import pandas as pd
 
 from petsard.loader.loader_base import LoaderBase
@@ -27,28 +29,59 @@ class LoaderPandasCsv(LoaderBase):
             (pd.DataFrame)
                 Data in csv by pd.DataFrame format.
         """
-        # 1. set the filepath as first positional argument
-        filepath = self.config["filepath"]
+        try:
+            return pd.read_csv(self.config["filepath"], **self._get_pandas_config())
+        except Exception as e:
+            raise FileNotFoundError from e
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Load the data in chunks of config["chunksize"] rows,
+            so only one chunk is parsed at a time.
 
+        Return:
+            (Iterator[pd.DataFrame])
+                Chunks of data in csv by pd.DataFrame format.
+        """
+        try:
+            reader = pd.read_csv(
+                self.config["filepath"],
+                chunksize=self.config["chunksize"],
+                **self._get_pandas_config(),
+            )
+        except Exception as e:
+            raise FileNotFoundError from e
+
+        with reader:
+            yield from reader
+
+    def _get_pandas_config(self) -> dict:
+        """
+        Build the keyword arguments of pd.read_csv from the config.
+
+        Return:
+            (dict) Keyword arguments of pd.read_csv.
+        """
         pandas_config = {}
 
-        # 2. If header_names is not None, setting custom header names
+        # 1. If header_names is not None, setting custom header names
         if self.config.get("header_names") is not None:
             pandas_config.update({"header": 0, "names": self.config["header_names"]})
         else:
             # Default header settings to match original behavior
             pandas_config.update({"header": "infer", "names": None})
 
-        # 3. assign dtype and na_values
+        # 2. assign dtype and na_values
         list_setting = ["dtype", "na_values"]
         pandas_config.update(
             {k: self.config[k] for k in list_setting if k in self.config}
         )
 
-        try:
-            return pd.read_csv(filepath, **pandas_config)
-        except Exception as e:
-            raise FileNotFoundError from e
+        # 3. read only the projected columns
+        if self.config.get("columns") is not None:
+            pandas_config["usecols"] = self.config["columns"]
+
+        return pandas_config
 
 
 class LoaderPandasExcel(LoaderBase):
@@ -104,6 +137,10 @@ class LoaderPandasExcel(LoaderBase):
             {k: self.config[k] for k in list_setting if k in self.config}
         )
 
+        # 4. read only the projected columns
+        if self.config.get("columns") is not None:
+            pandas_config["usecols"] = self.config["columns"]
+
         try:
             return pd.read_excel(filepath, **pandas_config)
         except Exception as e:
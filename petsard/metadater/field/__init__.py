@@ -3,6 +3,7 @@
 from petsard.metadater.field.field_functions import (
     build_field_metadata,
     calculate_field_stats,
+    calculate_fields_stats,
     infer_field_logical_type,
     optimize_field_dtype,
 )
@@ -24,6 +25,7 @@ __all__ = [
     "FieldStats",
     "FieldOperations",
     "calculate_field_stats",
+    "calculate_fields_stats",
     "infer_field_logical_type",
     "optimize_field_dtype",
     "detect_logical_type_patterns",
@@ -1,7 +1,10 @@
 """Pure functions for field-level operations"""
 
 import re
+from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from statistics import NormalDist
 from typing import Any
 
 import numpy as np
@@ -29,6 +32,8 @@ def build_field_metadata(
     infer_logical_type: bool = True,
     optimize_dtype: bool = True,
     sample_size: int | None = 1000,
+    inference_sample_size: int | None = None,
+    inference_confidence: float = 0.95,
 ) -> FieldMetadata:
     """
     Pure function to build FieldMetadata from a pandas Series
@@ -41,6 +46,8 @@ def build_field_metadata(
         infer_logical_type: Whether to infer logical type
         optimize_dtype: Whether to optimize dtype
         sample_size: Sample size for analysis
+        inference_sample_size: Sample size for dtype inference (None means use all data)
+        inference_confidence: Confidence level for decisions made on the sample
 
     Returns:
         FieldMetadata object
@@ -155,7 +162,13 @@ def build_field_metadata(
 
     # Determine optimal target dtype
     if optimize_dtype:
-        target_dtype = optimize_field_dtype(field_data, field_metadata, config)
+        target_dtype = optimize_field_dtype(
+            field_data,
+            field_metadata,
+            config,
+            sample_size=inference_sample_size,
+            confidence=inference_confidence,
+        )
         field_metadata = field_metadata.with_target_dtype(target_dtype)
 
     return field_metadata
@@ -398,6 +411,108 @@ def calculate_field_stats(
     return stats
 
 
+NUMERIC_DATA_TYPES: list[DataType] = [
+    DataType.INT8,
+    DataType.INT16,
+    DataType.INT32,
+    DataType.INT64,
+    DataType.FLOAT32,
+    DataType.FLOAT64,
+]
+QUANTILE_LEVELS: list[float] = [0.25, 0.5, 0.75]
+
+
+def calculate_fields_stats(
+    data: pd.DataFrame,
+    fields_metadata: list[FieldMetadata],
+    max_workers: int | None = None,
+) -> dict[str, FieldStats]:
+    """
+    Pure function to calculate statistics of many fields at once
+
+    Gives the same FieldStats as calculate_field_stats on each column, but
+    numeric reductions run once per dtype block instead of once per column,
+    and one value_counts per column yields both distinct and most frequent
+    values. The value counts of columns are computed across threads.
+
+    Args:
+        data: The DataFrame to analyze
+        fields_metadata: Field metadata of the columns to analyze
+        max_workers: Maximum number of threads, None for the executor default
+
+    Returns:
+        Mapping of field name to FieldStats object
+    """
+    row_count = len(data)
+    names = [field_metadata.name for field_metadata in fields_metadata]
+    na_counts = data[names].isna().sum()
+
+    # Numeric statistics, one vectorized pass per homogeneous dtype block
+    numeric_by_dtype: dict[Any, list[str]] = defaultdict(list)
+    fallback: list[FieldMetadata] = []
+    for field_metadata in fields_metadata:
+        if field_metadata.data_type not in NUMERIC_DATA_TYPES:
+            continue
+        dtype = data[field_metadata.name].dtype
+        if is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            numeric_by_dtype[dtype].append(field_metadata.name)
+        else:
+            # e.g. numeric type hint on text data, keep the per-column behaviour
+            fallback.append(field_metadata)
+
+    numeric_stats: dict[str, dict[str, Any]] = {}
+    for columns in numeric_by_dtype.values():
+        block = data[columns]
+        non_na_counts = block.count()
+        quantiles = block.quantile(QUANTILE_LEVELS)
+        mins, maxs = block.min(), block.max()
+        means, stds = block.mean(), block.std()
+        for name in columns:
+            if non_na_counts[name] == 0:
+                continue
+            numeric_stats[name] = {
+                "min_value": mins[name],
+                "max_value": maxs[name],
+                "mean_value": float(means[name]),
+                "std_value": float(stds[name]),
+                "quantiles": {q: quantiles.at[q, name] for q in QUANTILE_LEVELS},
+            }
+
+    # Distinct and most frequent values, one hash pass per column
+    fallback_names = {field_metadata.name for field_metadata in fallback}
+    hashed = [name for name in names if name not in fallback_names]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        value_counts_list = list(
+            executor.map(lambda name: data[name].value_counts(), hashed)
+        )
+
+    stats: dict[str, FieldStats] = {}
+    for name, value_counts in zip(hashed, value_counts_list, strict=True):
+        na_count = int(na_counts[name])
+        na_percentage = (na_count / row_count) * 100 if row_count > 0 else 0.0
+        top = value_counts.head(10)
+        stats[name] = FieldStats(
+            row_count=row_count,
+            na_count=na_count,
+            na_percentage=round(na_percentage, 4),
+            # Unused categories of categorical columns are counted as 0
+            distinct_count=int((value_counts > 0).sum()),
+            most_frequent=(
+                list(zip(top.index, top.values, strict=False))
+                if not top.empty
+                else None
+            ),
+            **numeric_stats.get(name, {}),
+        )
+
+    for field_metadata in fallback:
+        stats[field_metadata.name] = calculate_field_stats(
+            data[field_metadata.name], field_metadata
+        )
+
+    return stats
+
+
 def infer_field_logical_type(
     field_data: pd.Series, field_metadata: FieldMetadata
 ) -> LogicalType | None:
@@ -520,6 +635,8 @@ def optimize_field_dtype(
     field_data: pd.Series,
     field_metadata: FieldMetadata,
     config: FieldConfig | None = None,
+    sample_size: int | None = None,
+    confidence: float = 0.95,
 ) -> str:
     """
     Pure function to determine optimal dtype for storage
@@ -528,6 +645,8 @@ def optimize_field_dtype(
         field_data: The pandas Series to analyze
         field_metadata: Field metadata for context
         config: Optional field configuration
+        sample_size: Sample size for text data inference (None means use all data)
+        confidence: Confidence level for decisions made on the sample
 
     Returns:
         Optimal dtype string
@@ -542,7 +661,9 @@ def optimize_field_dtype(
         return "category"
 
     # 使用完整的類型分析邏輯
-    return _comprehensive_type_analysis(field_data, config)
+    return _comprehensive_type_analysis(
+        field_data, config, sample_size=sample_size, confidence=confidence
+    )
 
 
 # Helper functions (pure)
@@ -754,13 +875,130 @@ def _is_float_with_integer_values(field_data: pd.Series) -> bool:
 
     # 檢查所有值是否都是整數
     try:
-        return all(val.is_integer() for val in clean_data)
+        return _all_integer_values(clean_data)
     except (AttributeError, TypeError):
         return False
 
 
+def _all_integer_values(numeric_data: pd.Series) -> bool:
+    """
+    檢查無空值的浮點數序列是否都是整數值（向量化，inf 不視為整數）
+
+    Args:
+        numeric_data: 無空值的數值 Series
+
+    Returns:
+        True 如果所有值都是整數
+    """
+    values = numeric_data.to_numpy(dtype=float)
+    return bool(np.all(np.mod(values, 1) == 0))
+
+
+def _stratified_sample(field_data: pd.Series, sample_size: int) -> pd.Series:
+    """
+    取頭、尾與中間隨機列組成的分層樣本，保留原始順序
+
+    頭部列放在最前面，讓樣本的格式推論（如 pd.to_datetime）與完整資料相同。
+
+    Args:
+        field_data: 要抽樣的 Series
+        sample_size: 樣本大小
+
+    Returns:
+        樣本 Series
+    """
+    if len(field_data) <= sample_size:
+        return field_data
+
+    edge_size = sample_size // 4
+    middle = field_data.iloc[edge_size : len(field_data) - edge_size]
+    middle_sample = middle.sample(
+        n=sample_size - 2 * edge_size, random_state=42
+    ).sort_index()
+    return pd.concat(
+        [
+            field_data.iloc[:edge_size],
+            middle_sample,
+            field_data.iloc[len(field_data) - edge_size :],
+        ]
+    )
+
+
+def _wilson_interval(
+    successes: int, trials: int, confidence: float
+) -> tuple[float, float]:
+    """
+    Wilson score interval of a proportion
+
+    Args:
+        successes: Number of successes in the sample
+        trials: Sample size
+        confidence: Confidence level, e.g. 0.95
+
+    Returns:
+        (lower, upper) bounds of the proportion
+    """
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    p_hat = successes / trials
+    denominator = 1 + z**2 / trials
+    center = (p_hat + z**2 / (2 * trials)) / denominator
+    margin = (
+        z * np.sqrt(p_hat * (1 - p_hat) / trials + z**2 / (4 * trials**2))
+    ) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def _sampled_type_analysis(
+    field_data: pd.Series, sample_size: int, confidence: float
+) -> str | None:
+    """
+    以分層樣本判斷文字欄位的類型，樣本無法確定時回傳 None 改用完整掃描
+
+    - 可轉數值比例的 Wilson 信賴區間完全低於 80% 時才判定為非數值，
+      落在 80% 以上或跨越 80% 時需要完整資料決定整數寬度，回傳 None
+    - 非數值欄位不再對完整資料做數值轉換；樣本中有無法解析的日期即確定
+      不是 datetime，樣本全部可解析時才以完整資料驗證
+
+    Args:
+        field_data: object 類型的 Series
+        sample_size: 樣本大小
+        confidence: 信賴水準
+
+    Returns:
+        dtype 字串，或 None 表示需要完整掃描
+    """
+    sample = _stratified_sample(field_data, sample_size).dropna()
+    if len(sample) == 0:
+        return None
+
+    numeric_count = int(pd.to_numeric(sample, errors="coerce").notna().sum())
+    _, upper = _wilson_interval(numeric_count, len(sample), confidence)
+    if upper >= 0.8:
+        return None
+
+    # 非數值文字，與完整掃描相同：前 10 個非空值判斷是否可能為 datetime
+    head_data = field_data.head(1000).dropna()
+    if len(head_data) < 10:
+        head_data = field_data.dropna()
+    if not _might_be_datetime(head_data):
+        return "category"
+
+    try:
+        if pd.to_datetime(sample, errors="coerce").isna().any():
+            return "category"
+        if pd.to_datetime(field_data.dropna(), errors="coerce").isna().any():
+            return "category"
+    except Exception:
+        return "category"
+
+    return "datetime64[s]"
+
+
 def _comprehensive_type_analysis(
-    field_data: pd.Series, config: FieldConfig | None = None
+    field_data: pd.Series,
+    config: FieldConfig | None = None,
+    sample_size: int | None = None,
+    confidence: float = 0.95,
 ) -> str:
     """
     完整的類型分析邏輯，按照以下順序：
@@ -772,6 +1010,8 @@ def _comprehensive_type_analysis(
     Args:
         field_data: 要分析的 Series
         config: 欄位配置
+        sample_size: 文字欄位的推論樣本大小，None 表示使用全部資料
+        confidence: 以樣本判斷時的信賴水準
 
     Returns:
         最佳的 dtype 字串
@@ -783,6 +1023,16 @@ def _comprehensive_type_analysis(
     if config.leading_zeros != "never" and _has_leading_zeros(field_data):
         return "string"
 
+    # 文字欄位先以分層樣本判斷，樣本無法確定時才完整掃描
+    if (
+        sample_size is not None
+        and is_object_dtype(field_data)
+        and len(field_data) > sample_size
+    ):
+        sampled_dtype = _sampled_type_analysis(field_data, sample_size, confidence)
+        if sampled_dtype is not None:
+            return sampled_dtype
+
     # 2. 統一嘗試數值轉換（無論原始類型為何）
     try:
         # 嘗試轉換為數值（保留 NaN）
@@ -807,9 +1057,7 @@ def _comprehensive_type_analysis(
                             all_integers = True
                         else:
                             # 如果是浮點類型，檢查是否都是整數值
-                            all_integers = all(
-                                val.is_integer() for val in valid_numeric_values
-                            )
+                            all_integers = _all_integer_values(valid_numeric_values)
                     except (AttributeError, TypeError):
                         # 如果無法判斷，假設不是整數
                         all_integers = False
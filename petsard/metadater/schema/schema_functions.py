@@ -4,7 +4,10 @@ from typing import Any
 
 import pandas as pd
 
-from petsard.metadater.field.field_functions import build_field_metadata
+from petsard.metadater.field.field_functions import (
+    build_field_metadata,
+    calculate_fields_stats,
+)
 from petsard.metadater.field.field_types import FieldMetadata
 from petsard.metadater.schema.schema_types import (
     SchemaConfig,
@@ -79,19 +82,33 @@ def build_schema_metadata(
                     datetime_format=field_config.datetime_format,
                 )
 
-        # Build field metadata
+        # Build field metadata, statistics are calculated for all fields below
         field_metadata = build_field_metadata(
             field_data=data[field_name],
             field_name=field_name,
             config=field_config,
-            compute_stats=config.compute_stats,
+            compute_stats=False,
             infer_logical_type=config.infer_logical_types,
             optimize_dtype=config.optimize_dtypes,
             sample_size=config.sample_size,
+            inference_sample_size=config.inference_sample_size,
+            inference_confidence=config.inference_confidence,
         )
 
         fields.append(field_metadata)
 
+    # Calculate field statistics in one vectorized pass over the DataFrame
+    if config.compute_stats and fields:
+        sample_data = data
+        if config.sample_size and len(data) > config.sample_size:
+            # Same rows as sampling each field with the same random_state
+            sample_data = data.sample(n=config.sample_size, random_state=42)
+        fields_stats = calculate_fields_stats(sample_data, fields)
+        fields = [
+            field_metadata.with_stats(fields_stats[field_metadata.name])
+            for field_metadata in fields
+        ]
+
     # Calculate schema-level statistics
     schema_stats = None
     if config.compute_stats:
@@ -39,6 +39,10 @@ class SchemaConfig:
         infer_logical_types: Whether to automatically infer logical types (conflicts with field-level logical_type)
         optimize_dtypes: Whether to optimize data types for storage
         sample_size: Sample size for type inference (None means use all data)
+        inference_sample_size: Rows of a stratified sample (head, tail and random rows)
+            used to infer dtypes of text fields, falling back to all data when the
+            sample is ambiguous (None means always use all data)
+        inference_confidence: Confidence level for dtype decisions made on the sample
         leading_zeros: How to handle leading zeros/characters ("never", "num-auto", "leading_n")
         nullable_int: How to handle nullable integers ("force", "never")
         properties: Additional schema-level properties
@@ -52,6 +56,8 @@ class SchemaConfig:
     infer_logical_types: bool = False
     optimize_dtypes: bool = True
     sample_size: int | None = None
+    inference_sample_size: int | None = None
+    inference_confidence: float = 0.95
     leading_zeros: str = "never"
     nullable_int: str = "force"
     properties: dict[str, Any] = field(default_factory=dict)
@@ -64,6 +70,12 @@ class SchemaConfig:
         if self.sample_size is not None and self.sample_size <= 0:
             raise ValueError("sample_size must be positive or None")
 
+        if self.inference_sample_size is not None and self.inference_sample_size <= 0:
+            raise ValueError("inference_sample_size must be positive or None")
+
+        if not 0 < self.inference_confidence < 1:
+            raise ValueError("inference_confidence must be between 0 and 1")
+
         # Validate leading_zeros parameter
         valid_leading_zeros = ["never", "num-auto"]
         if not (
@@ -114,6 +126,8 @@ class SchemaConfig:
             infer_logical_types=self.infer_logical_types,
             optimize_dtypes=self.optimize_dtypes,
             sample_size=self.sample_size,
+            inference_sample_size=self.inference_sample_size,
+            inference_confidence=self.inference_confidence,
             leading_zeros=self.leading_zeros,
             nullable_int=self.nullable_int,
             properties=self.properties,
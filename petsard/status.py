@@ -1,13 +1,19 @@
 import logging
+import os
+import pickle
 import re
+import shutil
+import tempfile
+import uuid
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from petsard.adapter import BaseAdapter
+from petsard.adapter import BaseAdapter, DescriberAdapter
 from petsard.exceptions import SnapshotError, StatusError, TimingError, UnexecutedError
 from petsard.metadater import MetadataChange, Metadater, SchemaMetadata
 from petsard.processor import Processor
@@ -121,12 +127,24 @@ class Status:
     保持與原有 Status 介面的相容性。
     """
 
+    # 除了序列中的前一個模組外，各模組還會讀取的模組
+    RESULT_DEPENDENCIES: dict[str, list[str]] = {
+        "Postprocessor": ["Preprocessor"],
+        "Constrainer": ["Synthesizer", "Preprocessor"],
+        "Evaluator": ["Splitter", "Loader"],
+        "Describer": DescriberAdapter.INPUT_PRIORITY,
+    }
+    # 會讀取路徑上所有模組的模組
+    FULL_PATH_MODULES: list[str] = ["Reporter"]
+
     def __init__(
         self,
         config,
         max_snapshots: int = 1000,
         max_changes: int = 5000,
         max_timings: int = 10000,
+        memory_budget: int | None = None,
+        spill_dir: str | None = None,
     ):
         """
         初始化狀態管理器
@@ -136,6 +154,8 @@ class Status:
             max_snapshots: 最大快照數量，防止記憶體洩漏
             max_changes: 最大變更記錄數量
             max_timings: 最大計時記錄數量
+            memory_budget: 保留結果的記憶體上限（bytes），None 表示不限制
+            spill_dir: 超出上限時溢寫操作器的目錄，None 表示使用暫存目錄
         """
         self.config = config
         self.sequence: list = config.sequence
@@ -180,6 +200,41 @@ class Status:
         # 儲存當前實驗名稱的映射
         self._current_experiments: dict[str, str] = {}
 
+        # 記憶體上限 - 釋放不再需要的結果，並溢寫仍需要的結果
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self._retained_bytes: dict[str, int] = {}
+        self._peak_retained_bytes = 0
+        self._spilled: dict[str, str] = {}
+        self._spill_files: set[str] = set()  # 由此實例建立、可自行刪除的溢寫檔案
+        self._shared_spill_files: set[str] = set()  # 已交給工作程序讀取，結束時才刪除
+        self._spill_tmpdir: str | None = None  # 由此實例建立的暫存溢寫目錄
+        self._evicted: set[str] = set()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        序列化狀態，供平行執行時傳遞給工作程序
+
+        Config 內含 queue.Queue，logging handler 內含鎖，兩者都無法 pickle，
+        因此序列化時略過，並於 __setstate__ 重新建立計時 handler。
+        溢寫檔案與暫存目錄仍屬於原實例，還原的實例不會刪除它們；
+        原實例須先呼叫 share_spill_files()，避免在工作程序讀取前刪除。
+        """
+        state = self.__dict__.copy()
+        state["config"] = None
+        state["_spill_files"] = set()
+        state["_shared_spill_files"] = set()
+        state["_spill_tmpdir"] = None
+        state.pop("_timing_handler", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """還原序列化的狀態，並將新的計時 handler 掛到 PETsARD logger"""
+        self.__dict__.update(state)
+        self._timing_handler = TimingLogHandler(self)
+        self._timing_handler.setLevel(logging.INFO)
+        logging.getLogger("PETsARD").addHandler(self._timing_handler)
+
     def _generate_id(self, prefix: str, counter_attr: str) -> str:
         """
         統一的 ID 生成方法，避免程式碼重複
@@ -507,6 +562,8 @@ class Status:
             keys_to_remove = [key for key in self.status if key not in module_to_keep]
             for exist_module in keys_to_remove:
                 del self.status[exist_module]
+                self._forget(exist_module)
+        self._forget(module)
 
         # 使用 Metadater 管理元資料
         if module in ["Loader", "Splitter", "Preprocessor"]:
@@ -563,6 +620,12 @@ class Status:
         temp["operator"] = operator
         self.status[module] = temp
 
+        if self.memory_budget is not None:
+            self._retained_bytes[module] = self._estimate_bytes(operator)
+            self._peak_retained_bytes = max(
+                self._peak_retained_bytes, self.get_retained_bytes()
+            )
+
         self._logger.info(
             f"狀態已更新: {module}[{expt}] - 快照數量: {len(self.snapshots)}"
         )
@@ -587,7 +650,7 @@ class Status:
 
     def get_result(self, module: str) -> dict | pd.DataFrame:
         """取得特定模組的結果"""
-        return self.status[module]["operator"].get_result()
+        return self._get_operator(module).get_result()
 
     def get_full_expt(self, module: str = None) -> dict:
         """取得模組名稱和對應實驗名稱的字典"""
@@ -640,14 +703,14 @@ class Status:
     def get_synthesizer(self) -> Synthesizer:
         """取得合成器實例"""
         if "Synthesizer" in self.status:
-            return self.status["Synthesizer"]["operator"].synthesizer
+            return self._get_operator("Synthesizer").synthesizer
         else:
             raise UnexecutedError
 
     def get_processor(self) -> Processor:
         """取得資料集的處理器"""
         if "Preprocessor" in self.status:
-            return self.status["Preprocessor"]["operator"].processor
+            return self._get_operator("Preprocessor").processor
         else:
             raise UnexecutedError
 
@@ -657,6 +720,229 @@ class Status:
             raise UnexecutedError
         return self.report
 
+    # === 平行執行支援 ===
+
+    def get_branch_state(self) -> dict[str, Any]:
+        """
+        取得目前分支的狀態，供工作程序回傳給主程序
+
+        Returns:
+            Dict[str, Any]: 目前路徑上各模組的操作器、元資料與實驗名稱
+        """
+        status = {
+            module: {"expt": entry["expt"], "operator": self._get_operator(module)}
+            if module in self._spilled
+            else entry
+            for module, entry in self.status.items()
+        }
+        return {
+            "status": status,
+            "metadata": self.metadata.copy(),
+            "current_experiments": self._current_experiments.copy(),
+        }
+
+    def set_branch_state(self, state: dict[str, Any]) -> None:
+        """
+        還原由 get_branch_state() 取得的分支狀態
+
+        Args:
+            state: get_branch_state() 的回傳值
+        """
+        for module in list(self.status):
+            self._forget(module)
+        self.status = state["status"].copy()
+        self.metadata = state["metadata"].copy()
+        self._current_experiments = state["current_experiments"].copy()
+        for module, entry in self.status.items():
+            if entry["operator"] is None:
+                self._evicted.add(module)
+            elif self.memory_budget is not None:
+                self._retained_bytes[module] = self._estimate_bytes(entry["operator"])
+
+    def merge_records(
+        self,
+        snapshots: list[ExecutionSnapshot],
+        timing_records: list[TimingRecord],
+        peak_retained_bytes: int = 0,
+    ) -> None:
+        """
+        合併工作程序產生的快照、計時記錄與保留記憶體峰值
+
+        各工作程序由相同的計數器產生 ID，同一秒內完成的分支會得到相同的 ID，
+        因此合併時由主程序依合併順序重新編號，並推進主程序的計數器。
+
+        Args:
+            snapshots: 工作程序中建立的快照
+            timing_records: 工作程序中完成的計時記錄
+            peak_retained_bytes: 工作程序中保留結果的記憶體峰值（bytes）
+        """
+        self._peak_retained_bytes = max(self._peak_retained_bytes, peak_retained_bytes)
+        for snapshot in snapshots:
+            snapshot = replace(snapshot, snapshot_id=self._generate_snapshot_id())
+            self.snapshots.append(snapshot)
+            self._snapshot_index[snapshot.snapshot_id] = snapshot
+        if len(self._snapshot_index) > self.max_snapshots:
+            valid_ids = {s.snapshot_id for s in self.snapshots}
+            self._snapshot_index = {
+                k: v for k, v in self._snapshot_index.items() if k in valid_ids
+            }
+
+        self.timing_records.extend(
+            replace(record, record_id=self._generate_timing_id())
+            for record in timing_records
+        )
+
+    # === 記憶體上限 ===
+
+    def release(self, pending: list[str]) -> None:
+        """
+        依記憶體上限釋放目前路徑上的結果
+
+        尚未執行的步驟不再讀取的結果直接釋放；
+        若仍超出 memory_budget，則將仍需要的較大結果溢寫至 spill_dir，
+        待讀取時再載入。剛加入的模組供 Executor 收集結果，不會被釋放。
+
+        Args:
+            pending: 尚待執行步驟的模組名稱，依執行順序排列
+        """
+        if self.memory_budget is None or not self.status:
+            return
+
+        current = max(self.status, key=self.sequence.index)
+        for module in self.status:
+            if module == current or module in self._evicted:
+                continue
+            if not self._is_needed(module, pending):
+                self._evict(module)
+
+        candidates = sorted(
+            (module for module in self._retained_bytes if module != current),
+            key=self._retained_bytes.get,
+            reverse=True,
+        )
+        for module in candidates:
+            if self.get_retained_bytes() <= self.memory_budget:
+                break
+            self._spill(module)
+
+    def share_spill_files(self) -> None:
+        """
+        將目前的溢寫檔案標記為與工作程序共用
+
+        序列化給工作程序前呼叫。共用的檔案在結果被取代時不立即刪除，
+        而是延至 cleanup_spill() 才刪除，避免仍在執行的工作程序讀取失敗。
+        """
+        self._shared_spill_files.update(self._spill_files)
+        self._spill_files.clear()
+
+    def cleanup_spill(self) -> None:
+        """
+        刪除此實例建立的溢寫檔案與暫存目錄，於執行結束時呼叫
+
+        仍為溢寫狀態的結果視為已釋放，之後讀取會引發 StatusError。
+        """
+        for module in list(self._spilled):
+            self._spilled.pop(module)
+            self._evicted.add(module)
+        for path in self._spill_files | self._shared_spill_files:
+            if os.path.exists(path):
+                os.remove(path)
+        self._spill_files.clear()
+        self._shared_spill_files.clear()
+        if self._spill_tmpdir is not None:
+            shutil.rmtree(self._spill_tmpdir, ignore_errors=True)
+            if self.spill_dir == self._spill_tmpdir:
+                self.spill_dir = None
+            self._spill_tmpdir = None
+
+    def get_retained_bytes(self) -> int:
+        """取得目前保留在記憶體中的結果大小（bytes），僅在設定 memory_budget 時統計"""
+        return sum(self._retained_bytes.values())
+
+    def _is_needed(self, module: str, pending: list[str]) -> bool:
+        """
+        判斷尚待執行的步驟是否會讀取目前路徑上的模組
+
+        待執行步驟回到該模組或其上游時，路徑上的模組即被取代，其後的步驟不再讀取。
+        """
+        module_idx = self.sequence.index(module)
+        for pending_module in pending:
+            pending_idx = self.sequence.index(pending_module)
+            if pending_idx <= module_idx:
+                return False
+            if (
+                pending_module in self.FULL_PATH_MODULES
+                or self.sequence[pending_idx - 1] == module
+                or module in self.RESULT_DEPENDENCIES.get(pending_module, [])
+            ):
+                return True
+        return False
+
+    def _evict(self, module: str) -> None:
+        """釋放不再需要的模組操作器"""
+        self._forget(module)
+        self.status[module]["operator"] = None
+        self._evicted.add(module)
+        self._logger.debug(f"已釋放 {module} 的結果")
+
+    def _spill(self, module: str) -> None:
+        """將仍需要的模組操作器溢寫至磁碟"""
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="PETsARD_spill_")
+            self._spill_tmpdir = self.spill_dir
+        os.makedirs(self.spill_dir, exist_ok=True)
+
+        path = os.path.join(self.spill_dir, f"{module}_{uuid.uuid4().hex}.pkl")
+        with open(path, "wb") as f:
+            pickle.dump(self.status[module]["operator"], f, pickle.HIGHEST_PROTOCOL)
+
+        size = self._retained_bytes.pop(module)
+        self.status[module]["operator"] = None
+        self._spilled[module] = path
+        self._spill_files.add(path)
+        self._logger.debug(f"已溢寫 {module} 的結果 ({size} bytes) 至 {path}")
+
+    def _forget(self, module: str) -> None:
+        """移除模組的記憶體追蹤與溢寫檔案"""
+        self._retained_bytes.pop(module, None)
+        self._evicted.discard(module)
+        path = self._spilled.pop(module, None)
+        if path in self._spill_files:
+            self._spill_files.discard(path)
+            os.remove(path)
+
+    def _get_operator(self, module: str) -> BaseAdapter:
+        """取得模組操作器，已溢寫者自磁碟載入"""
+        if module in self._spilled:
+            with open(self._spilled[module], "rb") as f:
+                return pickle.load(f)
+        if module in self._evicted:
+            raise StatusError(f"{module} 的結果已因記憶體上限釋放")
+        return self.status[module]["operator"]
+
+    @staticmethod
+    def _estimate_bytes(operator: BaseAdapter) -> int:
+        """估計操作器所持有的 DataFrame、Series 與陣列大小（bytes）"""
+        seen: set[int] = set()
+
+        def _sizeof(obj, depth: int) -> int:
+            if id(obj) in seen or depth > 3:
+                return 0
+            seen.add(id(obj))
+            if isinstance(obj, pd.DataFrame):
+                return int(obj.memory_usage(index=True, deep=True).sum())
+            if isinstance(obj, pd.Series):
+                return int(obj.memory_usage(index=True, deep=True))
+            if isinstance(obj, np.ndarray):
+                return obj.nbytes
+            if isinstance(obj, dict):
+                return sum(_sizeof(value, depth + 1) for value in obj.values())
+            if isinstance(obj, (list, tuple)):
+                return sum(_sizeof(value, depth + 1) for value in obj)
+            return 0
+
+        return sum(_sizeof(value, 0) for value in vars(operator).values())
+
     # === 新增的快照和變更追蹤方法 ===
 
     def get_snapshots(self, module: str = None) -> list[ExecutionSnapshot]:
@@ -785,6 +1071,11 @@ class Status:
             "last_change": change_summary["latest_change"],
             "change_types": change_summary["change_types"],
             "target_types": change_summary["target_types"],
+            "memory_budget": self.memory_budget,
+            "retained_bytes": self.get_retained_bytes(),
+            "peak_retained_bytes": self._peak_retained_bytes,
+            "spilled_modules": list(self._spilled.keys()),
+            "evicted_modules": sorted(self._evicted, key=self.sequence.index),
         }
 
     def get_timing_records(self, module: str = None) -> list[TimingRecord]:
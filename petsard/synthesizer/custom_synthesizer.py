@@ -90,3 +90,18 @@ class CustomSynthesizer(BaseSynthesizer):
             (pd.DataFrame): The synthesized data.
         """
         return self._impl.sample()
+
+    def _sample_from_conditions(self, conditions: list[dict]) -> pd.DataFrame:
+        """
+        Sample from the fitted synthesizer with the given conditions,
+            if the custom synthesizer implements sample_from_conditions(conditions).
+
+        Args:
+            conditions (list[dict]): same as sample_from_conditions method.
+
+        Return:
+            (pd.DataFrame): The synthesized data.
+        """
+        if not hasattr(self._impl, "sample_from_conditions"):
+            return super()._sample_from_conditions(conditions)
+        return self._impl.sample_from_conditions(conditions)
@@ -6,6 +6,7 @@ from typing import Any
 import pandas as pd
 from scipy.stats._warnings_errors import FitError
 from sdv.metadata import Metadata as SDV_Metadata
+from sdv.sampling import Condition
 from sdv.single_table import (
     CopulaGANSynthesizer,
     CTGANSynthesizer,
@@ -204,3 +205,47 @@ class SDVSingleTableSynthesizer(BaseSynthesizer):
             error_msg: str = f"SDV synthesizer couldn't sample the data: {ex}"
             self._logger.error(error_msg)
             raise UnableToSynthesizeError(error_msg) from ex
+
+    def _sample_from_conditions(self, conditions: list[dict]) -> pd.DataFrame:
+        """
+        Sample from the fitted synthesizer with SDV conditions.
+
+        Args:
+            conditions (list[dict]): The conditions, each containing:
+                - num_rows (int): The number of rows to be synthesized.
+                - column_values (dict): The value of each conditioned column.
+
+        Return:
+            (pd.DataFrame): The synthesized data.
+
+        Raises:
+            UnableToSynthesizeError: If the synthesizer couldn't synthesize the data.
+        """
+        num_rows: int = sum(condition["num_rows"] for condition in conditions)
+        self._logger.info(
+            f"Sampling {num_rows} rows from synthesizer with {len(conditions)} conditions"
+        )
+
+        batch_size: int = None
+        if "batch_size" in self.config:
+            batch_size = int(self.config["batch_size"])
+
+        try:
+            synthetic_data = self._impl.sample_from_conditions(
+                conditions=[
+                    Condition(
+                        num_rows=condition["num_rows"],
+                        column_values=condition["column_values"],
+                    )
+                    for condition in conditions
+                ],
+                batch_size=batch_size,
+            )
+            self._logger.info(f"Successfully sampled {len(synthetic_data)} rows")
+            return synthetic_data
+        except Exception as ex:
+            error_msg: str = (
+                f"SDV synthesizer couldn't sample the data with conditions: {ex}"
+            )
+            self._logger.error(error_msg)
+            raise UnableToSynthesizeError(error_msg) from ex
@@ -351,6 +351,43 @@ class Synthesizer:
             self._logger.error(f"Error during sampling: {str(e)}")
             raise
 
+    def sample_from_conditions(self, conditions: list[dict]) -> pd.DataFrame:
+        """
+        Generates a sample whose columns take the given values,
+            used by Constrainer to push equality constraints into sampling.
+
+        Args:
+            conditions (list[dict]): The conditions, each containing:
+                - num_rows (int): The number of rows to be synthesized.
+                - column_values (dict): The value of each conditioned column.
+
+        Return:
+            pd.DataFrame: The synthesized data.
+
+        Raises:
+            UncreatedError: If the synthesizer has not been created yet
+            UnsupportedMethodError: If the method does not support conditional sampling
+        """
+        if self._impl is None:
+            error_msg: str = "Synthesizer not created yet, call create() first"
+            self._logger.warning(error_msg)
+            raise UncreatedError(error_msg)
+
+        time_start: time = time.time()
+
+        self._logger.info(
+            f"Sampling {sum(condition['num_rows'] for condition in conditions)} rows "
+            f"with {len(conditions)} conditions using {self.config.syn_method}"
+        )
+
+        data: pd.DataFrame = self._impl.sample_from_conditions(conditions)
+        time_spent: float = round(time.time() - time_start, 4)
+        self._logger.info(
+            f"Successfully sampled {len(data)} rows in {time_spent} seconds"
+        )
+
+        return data.reset_index(drop=True)
+
     def fit_sample(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Fit and sample from the synthesizer.
@@ -4,7 +4,7 @@ from typing import Any
 
 import pandas as pd
 
-from petsard.exceptions import ConfigError, UnfittedError
+from petsard.exceptions import ConfigError, UnfittedError, UnsupportedMethodError
 from petsard.metadater import SchemaMetadata
 
 
@@ -125,3 +125,51 @@ class BaseSynthesizer(ABC):
         sampled_data: pd.DataFrame = self._sample()
         self._logger.info(f"Successfully sampling {self.__class__.__name__}")
         return sampled_data
+
+    def _sample_from_conditions(self, conditions: list[dict]) -> pd.DataFrame:
+        """
+        Sample from the fitted synthesizer with the given conditions.
+            Synthesizers supporting conditional sampling override this method.
+
+        Args:
+            conditions (list[dict]): same as sample_from_conditions method.
+
+        Return:
+            (pd.DataFrame): The synthesized data.
+
+        Raises:
+            UnsupportedMethodError: If the subclass does not support conditional sampling
+        """
+        error_msg: str = (
+            f"{self.__class__.__name__} does not support conditional sampling."
+        )
+        self._logger.debug(error_msg)
+        raise UnsupportedMethodError(error_msg)
+
+    def sample_from_conditions(self, conditions: list[dict]) -> pd.DataFrame:
+        """
+        Generate synthetic data whose columns take the given values.
+
+        Args:
+            conditions (list[dict]): The conditions, each containing:
+                - num_rows (int): The number of rows to be synthesized.
+                - column_values (dict): The value of each conditioned column.
+
+        Returns:
+            pd.DataFrame: Generated synthetic data
+
+        Raises:
+            UnfittedError: If the synthesizer has not been fitted yet
+            UnsupportedMethodError: If the synthesizer does not support conditional sampling
+        """
+        if not hasattr(self, "_impl") or self._impl is None:
+            error_msg: str = "The synthesizer has not been fitted."
+            self._logger.error(error_msg)
+            raise UnfittedError(error_msg)
+
+        self._logger.info(
+            f"Sampling {self.__class__.__name__} with {len(conditions)} conditions"
+        )
+        sampled_data: pd.DataFrame = self._sample_from_conditions(conditions)
+        self._logger.info(f"Successfully sampling {self.__class__.__name__}")
+        return sampled_data
@@ -1,8 +1,11 @@
+import time
+
 import numpy as np
 import pandas as pd
 import pytest
 
 from petsard.constrainer import Constrainer
+from petsard.exceptions import UnsupportedMethodError
 
 
 class MockSynthesizer:
@@ -492,3 +495,408 @@ def test_field_proportions_edge_cases_integration():
     result_empty = constrainer_empty.apply(small_data, target_rows=3)
     # 應該返回原始資料（無約束）
     pd.testing.assert_frame_equal(result_empty, small_data)
+
+
+class RecordingSynthesizer(MockSynthesizer):
+    """MockSynthesizer recording the requested batch sizes"""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+
+    def sample(self, num_rows: int = None) -> pd.DataFrame:
+        self.batch_sizes.append(self.config.get("sample_num_rows"))
+        return super().sample(num_rows)
+
+
+def test_resample_adaptive_batch_size(sample_df):
+    """Test later batches are sized by the estimated acceptance rate"""
+    np.random.seed(0)
+    constrainer = Constrainer({"field_constraints": ["age >= 60"]})
+    synthesizer = RecordingSynthesizer()
+
+    result = constrainer.resample_until_satisfy(
+        data=sample_df,
+        target_rows=500,
+        synthesizer=synthesizer,
+        sampling_ratio=1.0,
+        verbose_step=0,
+    )
+
+    assert len(result) == 500
+    assert all(result["age"] >= 60)
+    assert not result.duplicated().any()
+    # About 20% of the rows are accepted, the second batch completes the target
+    assert synthesizer.batch_sizes[0] == 500
+    assert synthesizer.batch_sizes[1] > 5 * 400
+    assert constrainer.resample_trails == 2
+
+
+def test_resample_batch_growth_is_bounded(sample_df):
+    """Test batches grow by at most RESAMPLE_MAX_GROWTH when nothing is accepted"""
+    constrainer = Constrainer({"field_constraints": ["age > 100"]})
+    synthesizer = RecordingSynthesizer()
+
+    with pytest.warns(UserWarning, match="Maximum trials"):
+        result = constrainer.resample_until_satisfy(
+            data=sample_df,
+            target_rows=100,
+            synthesizer=synthesizer,
+            sampling_ratio=0.01,
+            max_trials=4,
+            verbose_step=0,
+        )
+
+    assert result.empty
+    assert synthesizer.batch_sizes == [1, 10, 100]
+
+
+def test_resample_stops_without_new_rows(sample_df):
+    """Test batches are capped and resampling stops when no new rows appear"""
+
+    class FewRowsSynthesizer(RecordingSynthesizer):
+        def sample(self, num_rows: int = None) -> pd.DataFrame:
+            self.batch_sizes.append(self.config["sample_num_rows"])
+            # Only 20 distinct rows, fewer than the target
+            return pd.DataFrame(
+                {"age": np.random.randint(0, 20, self.config["sample_num_rows"])}
+            )
+
+    np.random.seed(0)
+    constrainer = Constrainer({"field_constraints": ["age >= 0"]})
+    synthesizer = FewRowsSynthesizer()
+
+    with pytest.warns(UserWarning, match="No new rows in 5 consecutive trials"):
+        result = constrainer.resample_until_satisfy(
+            data=sample_df[["age"]],
+            target_rows=100,
+            synthesizer=synthesizer,
+            sampling_ratio=2.0,
+            verbose_step=0,
+        )
+
+    assert len(result) == 20
+    assert constrainer.resample_trails == 6
+    assert max(synthesizer.batch_sizes) == 200 * Constrainer.RESAMPLE_MAX_GROWTH
+
+
+def test_resample_forwards_batch_size_to_impl(sample_df):
+    """Test the batch size reaches the fitted implementation and is restored"""
+
+    class Impl:
+        def __init__(self):
+            self.config = {"sample_num_rows": 5}
+
+        def update_config(self, config):
+            self.config.update(config)
+
+    class ImplSynthesizer(MockSynthesizer):
+        def __init__(self):
+            super().__init__()
+            self._impl = Impl()
+            self.impl_sizes = []
+
+        def sample(self, num_rows: int = None) -> pd.DataFrame:
+            self.impl_sizes.append(self._impl.config["sample_num_rows"])
+            return super().sample(self._impl.config["sample_num_rows"])
+
+    np.random.seed(0)
+    synthesizer = ImplSynthesizer()
+    result = Constrainer({"field_constraints": ["age >= 60"]}).resample_until_satisfy(
+        data=sample_df,
+        target_rows=50,
+        synthesizer=synthesizer,
+        sampling_ratio=4.0,
+        verbose_step=0,
+    )
+
+    assert len(result) == 50
+    assert synthesizer.impl_sizes[0] == 200
+    assert synthesizer._impl.config["sample_num_rows"] == 5
+
+
+def test_resample_parallel(sample_df, config):
+    """Test batches generated by worker processes"""
+    constrainer = Constrainer(config)
+
+    result = constrainer.resample_until_satisfy(
+        data=sample_df,
+        target_rows=200,
+        synthesizer=MockSynthesizer(),
+        sampling_ratio=5.0,
+        verbose_step=0,
+        n_jobs=2,
+    )
+
+    assert len(result) == 200
+    assert all(result["age"].between(20, 60))
+    assert all(result["performance"] >= 4)
+    assert not result.duplicated().any()
+
+
+@pytest.mark.parametrize("n_jobs", [0, -2, 1.5])
+def test_resample_invalid_n_jobs(sample_df, config, n_jobs):
+    """Test invalid n_jobs of resample_until_satisfy"""
+    with pytest.raises(ValueError, match="n_jobs"):
+        Constrainer(config).resample_until_satisfy(
+            data=sample_df,
+            target_rows=5,
+            synthesizer=MockSynthesizer(),
+            n_jobs=n_jobs,
+        )
+
+
+class ConditionalMockSynthesizer(MockSynthesizer):
+    """MockSynthesizer supporting conditional sampling"""
+
+    def __init__(self):
+        super().__init__()
+        self.conditions = []
+
+    def sample_from_conditions(self, conditions: list[dict]) -> pd.DataFrame:
+        self.conditions.append(conditions)
+        batches = []
+        for condition in conditions:
+            batch = super().sample(condition["num_rows"])
+            for column, value in condition["column_values"].items():
+                batch[column] = value
+            batches.append(batch)
+        return pd.concat(batches, ignore_index=True)
+
+
+def test_resample_pushdown(sample_df, config):
+    """Test field combinations are pushed down into conditional sampling"""
+    results = {}
+    for pushdown in [False, True]:
+        np.random.seed(0)
+        constrainer = Constrainer(config)
+        synthesizer = ConditionalMockSynthesizer()
+        result = constrainer.resample_until_satisfy(
+            data=sample_df,
+            target_rows=1000,
+            synthesizer=synthesizer,
+            sampling_ratio=1.0,
+            verbose_step=0,
+            pushdown=pushdown,
+        )
+        results[pushdown] = (constrainer, synthesizer, result)
+
+    constrainer, synthesizer, result = results[True]
+    assert constrainer.resample_pushdown_fields == ["education", "performance"]
+    assert len(synthesizer.conditions) > 0
+    allowed = {"PhD": [4, 5], "Master": [4, 5], "Bachelor": [3, 4, 5]}
+    for conditions in synthesizer.conditions:
+        for condition in conditions:
+            values = condition["column_values"]
+            assert values["performance"] in allowed.get(
+                values["education"], range(1, 6)
+            )
+
+    assert len(result) == 1000
+    assert all(result["age"].between(20, 60))
+    assert all(result["performance"] >= 4)
+    assert all(result.loc[result["education"] == "PhD", "performance"].isin([4, 5]))
+    assert not result.duplicated().any()
+
+    rejection, rejection_synthesizer, _ = results[False]
+    assert rejection.resample_pushdown_fields == []
+    assert rejection_synthesizer.conditions == []
+    assert (
+        constrainer.resample_acceptance_rate > rejection.resample_acceptance_rate * 1.2
+    )
+
+
+def test_resample_pushdown_fallback(sample_df, config):
+    """Test rejection sampling is used when conditional sampling fails"""
+
+    class UnsupportedSynthesizer(MockSynthesizer):
+        def sample_from_conditions(self, conditions):
+            raise UnsupportedMethodError("no conditional sampling")
+
+    np.random.seed(0)
+    constrainer = Constrainer(config)
+    with pytest.warns(UserWarning, match="falling back to rejection sampling"):
+        result = constrainer.resample_until_satisfy(
+            data=sample_df,
+            target_rows=1000,
+            synthesizer=UnsupportedSynthesizer(),
+            sampling_ratio=1.0,
+            verbose_step=0,
+            pushdown=True,
+        )
+
+    assert len(result) == 1000
+    assert all(result["performance"] >= 4)
+
+
+class DependentMockSynthesizer:
+    """Synthesizer where c depends on a, supporting conditional sampling"""
+
+    MEANS = {"x": -0.5, "y": 1.0, "z": 0.0}
+
+    def __init__(self):
+        self.config = {}
+
+    def _sample_c(self, a: np.ndarray) -> np.ndarray:
+        return np.random.normal(pd.Series(a).map(self.MEANS).to_numpy(), 1.0)
+
+    def sample(self) -> pd.DataFrame:
+        num_rows = self.config.get("sample_num_rows", 10)
+        a = np.random.choice(["x", "y", "z"], num_rows, p=[0.4, 0.4, 0.2])
+        return pd.DataFrame(
+            {
+                "a": a,
+                "b": np.random.choice(["k", "m"], num_rows),
+                "c": self._sample_c(a),
+                "id": np.random.random(num_rows),
+            }
+        )
+
+    def sample_from_conditions(self, conditions: list[dict]) -> pd.DataFrame:
+        batches = []
+        for condition in conditions:
+            num_rows = condition["num_rows"]
+            a = np.full(num_rows, condition["column_values"]["a"])
+            batches.append(
+                pd.DataFrame(
+                    {
+                        "a": a,
+                        "b": condition["column_values"]["b"],
+                        "c": self._sample_c(a),
+                        "id": np.random.random(num_rows),
+                    }
+                )
+            )
+        return pd.concat(batches, ignore_index=True)
+
+
+def test_resample_pushdown_keeps_distribution():
+    """Test pushed down fields follow the distribution of rejection sampling"""
+    config = {
+        "field_constraints": ["c > 0"],
+        "field_combinations": [({"a": "b"}, {"x": ["k"], "y": ["k"]})],
+    }
+    data = pd.DataFrame({"a": ["x"], "b": ["k"], "c": [1.0], "id": [0.0]})
+
+    shares = {}
+    for pushdown in [False, True]:
+        np.random.seed(0)
+        constrainer = Constrainer(config)
+        result = constrainer.resample_until_satisfy(
+            data=data,
+            target_rows=5000,
+            synthesizer=DependentMockSynthesizer(),
+            sampling_ratio=1.0,
+            verbose_step=0,
+            pushdown=pushdown,
+        )
+        assert len(result) == 5000
+        assert all(result["c"] > 0)
+        assert all(result.loc[result["a"] != "z", "b"] == "k")
+        shares[pushdown] = result["a"].value_counts(normalize=True)
+
+    assert constrainer.resample_pushdown_fields == ["a", "b"]
+    # About 0.19 / 0.51 / 0.30 for x / y / z
+    for value in ["x", "y", "z"]:
+        assert abs(shares[True][value] - shares[False][value]) < 0.04
+
+
+def _apply_sequentially(constrainer: Constrainer, df: pd.DataFrame) -> pd.DataFrame:
+    """Apply each constraint type on the output of the previous one"""
+    result = df.copy()
+    for single in constrainer._constrainers.values():
+        result = single.apply(result)
+    return result
+
+
+# nan_groups erases salary before the field constraint reads it
+DEPENDENT_CONSTRAINTS = {
+    "nan_groups": {"job": {"erase": ["salary", "bonus"]}},
+    "field_constraints": ["salary IS pd.NA | salary > 55000"],
+}
+
+
+@pytest.mark.parametrize("dependent", [False, True])
+def test_apply_fused_matches_sequential(sample_df, config, dependent):
+    """Test the fused keep-mask gives the same result as constraint by constraint"""
+    constrainer = Constrainer(DEPENDENT_CONSTRAINTS if dependent else config)
+    original = sample_df.copy()
+
+    result = constrainer.apply(sample_df)
+
+    pd.testing.assert_frame_equal(result, _apply_sequentially(constrainer, sample_df))
+    pd.testing.assert_frame_equal(sample_df, original)
+    if dependent:
+        # Engineer/Teacher rows with salary <= 55000 would survive if the
+        # constraint were evaluated before the erase
+        assert result["salary"].dropna().gt(55000).all()
+
+
+@pytest.mark.parametrize("dependent, n_copies", [(False, 1), (True, 2)])
+def test_apply_materializes_once(sample_df, config, monkeypatch, dependent, n_copies):
+    """Test filtering constraints are combined before the data is copied"""
+    constrainer = Constrainer(DEPENDENT_CONSTRAINTS if dependent else config)
+    for single in constrainer._constrainers.values():
+        monkeypatch.setattr(single, "apply", None)
+
+    copies = []
+    materialize = Constrainer._materialize
+
+    def counting_materialize(result, mask, pending):
+        if mask is not None:
+            copies.append(len(pending))
+        return materialize(result, mask, pending)
+
+    monkeypatch.setattr(Constrainer, "_materialize", staticmethod(counting_materialize))
+    constrainer.apply(sample_df)
+
+    assert len(copies) == n_copies
+
+
+@pytest.mark.stress
+class TestConstrainerApplyBenchmark:
+    def test_apply_5m_rows(self):
+        """Benchmark fused apply against constraint-by-constraint apply on 5M rows"""
+        n_rows = 5_000_000
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "name": rng.choice(["a", "b", None], size=n_rows, p=[0.45, 0.45, 0.1]),
+                "job": rng.choice(["x", "y", None], size=n_rows, p=[0.4, 0.4, 0.2]),
+                "salary": rng.normal(50000, 10000, size=n_rows),
+                "bonus": rng.normal(1000, 500, size=n_rows),
+                "age": rng.integers(0, 100, size=n_rows).astype(float),
+                "education": rng.choice(["PhD", "Master", "Bachelor"], size=n_rows),
+                "performance": rng.integers(1, 6, size=n_rows),
+            }
+        )
+        constrainer = Constrainer(
+            {
+                "nan_groups": {
+                    "name": "delete",
+                    "job": {"erase": ["salary", "bonus"]},
+                },
+                "field_constraints": ["age >= 20 & age <= 60", "performance >= 2"],
+                "field_combinations": [
+                    (
+                        {"education": "performance"},
+                        {"PhD": [4, 5], "Master": [3, 4, 5]},
+                    )
+                ],
+            }
+        )
+
+        timings = {}
+        for name, apply in [
+            ("fused", constrainer.apply),
+            ("sequential", lambda data: _apply_sequentially(constrainer, data)),
+        ]:
+            start = time.perf_counter()
+            timings[name] = (apply(df), time.perf_counter() - start)
+        print(
+            f"Constrainer.apply on {n_rows} rows: "
+            f"fused {timings['fused'][1]:.3f}s, "
+            f"sequential {timings['sequential'][1]:.3f}s"
+        )
+
+        pd.testing.assert_frame_equal(timings["fused"][0], timings["sequential"][0])
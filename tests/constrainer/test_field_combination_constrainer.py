@@ -285,3 +285,66 @@ class TestFieldCombinationConstrainer:
         )
         if not result[it_senior_nyc].empty:
             assert all(result.loc[it_senior_nyc, "salary"] == 90000)
+
+    def test_rule_table_compiled(self):
+        """Test constraint groups are compiled into lookup frames at construction"""
+        constraints = [
+            ({"job": "grade"}, {"Engineer": ["A", "B"], "pd.NA": "C"}),
+            ({("job", "level"): "salary"}, {("Analyst", "Senior"): 60000}),
+        ]
+        constrainer = FieldCombinationConstrainer(constraints)
+
+        first, second = constrainer._rule_tables
+        assert first["source_fields"] == ("job",)
+        assert first["sources"][0].tolist() == ["Engineer", "pd.NA"]
+        assert first["rules"].values.tolist() == [
+            ["Engineer", "A"],
+            ["Engineer", "B"],
+            ["pd.NA", "C"],
+        ]
+        assert second["rules"].values.tolist() == [["Analyst", "Senior", 60000]]
+
+    def test_pushdown_fields(self):
+        """Test source and target fields of all groups are pushed down"""
+        constraints = [
+            ({"job": "grade"}, {"Engineer": ["A", "B"]}),
+            ({("job", "level"): "salary"}, {("Analyst", "Senior"): 60000}),
+        ]
+        constrainer = FieldCombinationConstrainer(constraints)
+        assert constrainer.pushdown_fields() == ["job", "grade", "level", "salary"]
+
+    def test_large_rule_table_matches_row_check(self):
+        """Test join-based validation against a row-by-row check of a large rule table"""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "dept": rng.integers(0, 40, size=2000),
+                "level": pd.Categorical(rng.choice(["J", "S", "T"], size=2000)),
+                "job": rng.choice(["E", "A", None], size=2000),
+                "grade": rng.integers(0, 10, size=2000),
+            }
+        )
+        conditions = {
+            (dept, level): list(rng.choice(10, size=4, replace=False))
+            for dept in range(40)
+            for level in ["J", "S"]
+        }
+        job_conditions = {"E": [1, 2, 3], "pd.NA": [0, 9]}
+        constrainer = FieldCombinationConstrainer(
+            [
+                ({("dept", "level"): "grade"}, conditions),
+                ({"job": "grade"}, job_conditions),
+            ]
+        )
+        result = constrainer.apply(df)
+
+        def is_valid(row) -> bool:
+            allowed = conditions.get((row["dept"], row["level"]))
+            if allowed is not None and row["grade"] not in allowed:
+                return False
+            job = "pd.NA" if pd.isna(row["job"]) else row["job"]
+            allowed = job_conditions.get(job)
+            return allowed is None or row["grade"] in allowed
+
+        expected = df[df.apply(is_valid, axis=1)].reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected)
@@ -1,3 +1,7 @@
+import pickle
+import time
+
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -174,3 +178,127 @@ class TestFieldConstrainerValidation:
         assert all(result["age"] >= 25)
         assert all(result["salary"] >= 50000)
         assert all(result["id"] <= 3)
+
+    def test_constraints_compiled_once(self, sample_df):
+        """Test constraints are parsed at construction, not on every apply"""
+        constrainer = FieldConstrainer(["age > 20", "(salary < 55000) | (id == 3)"])
+        assert len(constrainer._predicates) == 2
+
+        def fail_tokenize(*args, **kwargs):
+            raise AssertionError("constraint re-tokenized in apply")
+
+        constrainer._tokenize = fail_tokenize
+        for _ in range(3):
+            result = constrainer.apply(sample_df)
+        assert result["id"].tolist() == [1, 3]
+
+    def test_pickle_recompiles_constraints(self, sample_df):
+        """Test a pickled constrainer drops its predicates and recompiles them"""
+        constrainer = FieldConstrainer(["age > 20", "(salary < 55000) | (id == 3)"])
+
+        restored = pickle.loads(pickle.dumps(constrainer))
+
+        assert len(restored._predicates) == 2
+        pd.testing.assert_frame_equal(
+            restored.apply(sample_df), constrainer.apply(sample_df)
+        )
+
+    def test_fused_mask_matches_sequential_filtering(self):
+        """Test one fused mask gives the same rows as filtering constraint by constraint"""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "age": rng.integers(0, 100, size=500).astype(float),
+                "bonus": rng.normal(1000, 500, size=500),
+                "job": rng.choice(["a", "b", "c"], size=500),
+                "start": pd.Timestamp("2020-01-01")
+                + pd.to_timedelta(rng.integers(0, 1000, size=500), unit="D"),
+                "days": rng.integers(0, 400, size=500),
+            }
+        )
+        df.loc[rng.random(500) < 0.1, "bonus"] = np.nan
+        constraints = [
+            "age >= 18",
+            "bonus IS pd.NA | bonus > 0",
+            "job != 'c'",
+            "start + days < DATE(2022-06-01)",
+        ]
+
+        expected = df
+        for constraint in constraints:
+            expected = FieldConstrainer([constraint]).apply(expected)
+
+        result = FieldConstrainer(constraints).apply(df)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_pushdown_fields(self):
+        """Test only constraints made of equality tests are pushed down"""
+        constrainer = FieldConstrainer(
+            [
+                "job == 'Engineer'",
+                "(education == 'PhD') | (education IS pd.NA)",
+                "(level == 3) & (job == 'Doctor')",
+                "age >= 20",
+                "bonus IS NOT pd.NA",
+                "salary == bonus",
+                "(region == 'North') | (age > 60)",
+            ]
+        )
+        assert constrainer.pushdown_fields() == ["job", "education", "level"]
+
+        df = pd.DataFrame(
+            {
+                "job": ["Engineer", "Engineer", "Doctor"],
+                "education": ["PhD", "Master", "PhD"],
+                "level": [3, 3, 3],
+                "age": [10, 30, 30],
+                "bonus": [1.0, 1.0, 1.0],
+                "salary": [1.0, 1.0, 1.0],
+                "region": ["South", "South", "South"],
+            }
+        )
+        # Only constraints of the pushdown fields are in the pushdown mask
+        assert FieldConstrainer(["age >= 20"]).pushdown_mask(df) is None
+        assert FieldConstrainer(
+            ["(education == 'PhD') | (education IS pd.NA)", "age >= 20"]
+        ).pushdown_mask(df).tolist() == [True, False, True]
+
+
+@pytest.mark.stress
+class TestFieldConstrainerBenchmark:
+    def test_apply_10m_rows(self):
+        """Benchmark per-apply cost of compiled constraints on 10M rows"""
+        n_rows = 10_000_000
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "age": rng.integers(0, 100, size=n_rows).astype(float),
+                "salary": rng.normal(50000, 10000, size=n_rows),
+                "bonus": rng.normal(1000, 500, size=n_rows),
+                "job": rng.choice(["a", "b", "c"], size=n_rows),
+            }
+        )
+        constrainer = FieldConstrainer(
+            [
+                "age >= 18",
+                "(salary > 30000) & (salary < 90000)",
+                "job != 'c'",
+                "age + bonus > 100",
+            ]
+        )
+
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            result = constrainer.apply(df)
+            timings.append(time.perf_counter() - start)
+        print(f"FieldConstrainer.apply on {n_rows} rows: {min(timings):.3f}s")
+
+        expected = df[
+            (df["age"] >= 18)
+            & (df["salary"] > 30000)
+            & (df["salary"] < 90000)
+            & (df["job"] != "c")
+            & (df["age"] + df["bonus"] > 100)
+        ]
+        assert len(result) == len(expected)
@@ -1,3 +1,6 @@
+import time
+
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -734,3 +737,98 @@ class TestFieldProportionsConstrainerExtremeEdgeCases:
 
         with pytest.raises(ValueError):
             constrainer.apply(data)  # No target_rows provided
+
+
+def _make_skewed_data(n_rows: int, seed: int = 0) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Create original data and synthetic data skewed towards category A"""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        {
+            "category": rng.choice(
+                list("ABCDE"), size=n_rows, p=[0.4, 0.3, 0.15, 0.1, 0.05]
+            ),
+            "gender": rng.choice(["M", "F"], size=n_rows),
+            "age_group": rng.choice(["Young", "Middle", "Old"], size=n_rows),
+            "income": np.where(
+                rng.random(n_rows) < 0.3, np.nan, rng.normal(size=n_rows)
+            ),
+        }
+    )
+    synthetic = data.copy()
+    synthetic.loc[: n_rows // 3, "category"] = "A"
+    return data, synthetic
+
+
+SKEWED_FIELD_PROPORTIONS = [
+    {"fields": "category", "mode": "all", "tolerance": 0.05},
+    {"fields": ["gender", "age_group"], "mode": "all", "tolerance": 0.05},
+    {"fields": ["category", "income"], "mode": "missing", "tolerance": 0.05},
+]
+
+
+class TestFieldProportionsQuotaSelection:
+    """Test quota based single-pass selection of FieldProportionsConstrainer"""
+
+    def test_selection_matches_row_by_row_greedy(self):
+        """Test vectorized selection equals checking quotas row by row"""
+        data, synthetic = _make_skewed_data(3000)
+        constrainer = FieldProportionsConstrainer(SKEWED_FIELD_PROPORTIONS)
+        config = constrainer.proportions_config
+        config.verify_data(data, 500)
+
+        quota_groups = constrainer._get_quota_groups(synthetic, config)
+        selected = constrainer._select_within_quotas(quota_groups, len(synthetic))
+
+        expected = np.zeros(len(synthetic), dtype=bool)
+        counts = [np.zeros(len(group["caps"])) for group in quota_groups]
+        for row in np.random.default_rng(42).permutation(len(synthetic)):
+            codes = [group["codes"][row] for group in quota_groups]
+            if all(
+                count[code] < group["caps"][code]
+                for count, code, group in zip(counts, codes, quota_groups, strict=True)
+            ):
+                expected[row] = True
+                for count, code in zip(counts, codes, strict=True):
+                    count[code] += 1
+
+        np.testing.assert_array_equal(selected, expected)
+
+    def test_all_quotas_satisfied_jointly(self):
+        """Test the filtered data satisfies every rule at once"""
+        data, synthetic = _make_skewed_data(5000)
+        constrainer = FieldProportionsConstrainer(SKEWED_FIELD_PROPORTIONS)
+        constrainer.proportions_config.verify_data(data, 800)
+
+        result, ops = constrainer._constraint_filter_field_proportions(
+            synthetic, constrainer.proportions_config
+        )
+
+        satisfied, violations = constrainer.proportions_config.check_proportions(result)
+        assert satisfied, violations
+        assert len(result) < len(synthetic)
+        assert not ops.empty
+        assert (ops["實際移除筆數"] >= ops["需移除計數"]).all()
+        assert (ops["剩餘行數"] == len(result)).all()
+
+
+@pytest.mark.stress
+class TestFieldProportionsConstrainerBenchmark:
+    @pytest.mark.parametrize("n_rows", [100_000, 1_000_000, 10_000_000])
+    def test_filter_scaling(self, n_rows):
+        """Benchmark quota based selection from 1e5 to 1e7 rows"""
+        data, synthetic = _make_skewed_data(n_rows)
+        constrainer = FieldProportionsConstrainer(SKEWED_FIELD_PROPORTIONS)
+        constrainer.proportions_config.verify_data(data, n_rows // 10)
+
+        start = time.perf_counter()
+        result, _ = constrainer._constraint_filter_field_proportions(
+            synthetic, constrainer.proportions_config
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"FieldProportionsConstrainer on {n_rows} rows: "
+            f"{elapsed:.3f}s, {len(result)} rows kept"
+        )
+
+        satisfied, _ = constrainer.proportions_config.check_proportions(result)
+        assert satisfied
@@ -236,3 +236,16 @@ class TestNaNGroupConstrainer:
 
         # Should delete all rows since all source values are NaN
         assert result.empty
+
+    def test_mask_and_transform_fields(self):
+        """Test fields read by the delete mask and written by the transforms"""
+        config = {
+            "name": "delete",
+            "job": {"erase": ["salary", "bonus"]},
+            "salary": {"copy": "bonus"},
+            "workclass": {"nan_if_condition": {"occupation": "Unemployed"}},
+        }
+        constrainer = NaNGroupConstrainer(config)
+
+        assert constrainer.mask_fields() == ["name"]
+        assert constrainer.transform_fields() == ["salary", "bonus", "workclass"]
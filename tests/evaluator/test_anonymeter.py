@@ -4,6 +4,7 @@ from unittest.mock import patch
 import pandas as pd
 
 from petsard.evaluator.anonymeter import Anonymeter
+from petsard.exceptions import ConfigError
 
 
 class TestAnonymeter(unittest.TestCase):
@@ -109,6 +110,67 @@ class TestAnonymeter(unittest.TestCase):
         self.assertIsNotNone(risk_value)
         self.assertFalse(pd.isna(risk_value))
 
+    def test_eval_inference_batch(self):
+        """Test Inference of a list of secrets in one batch."""
+        config = {
+            "eval_method": "anonymeter-inference",
+            "n_attacks": 10,
+            "secret": ["col1", "col2"],
+            "n_jobs": 2,
+        }
+
+        evaluator = Anonymeter(config=config)
+        result = evaluator.eval(self.data)
+
+        # each secret is attacked by the other columns
+        self.assertEqual(
+            [run["aux_cols"] for run in evaluator.anonymeter_config.batch],
+            [["col2", "col3"], ["col1", "col3"]],
+        )
+        details = result["details"]
+        self.assertEqual(list(details["secret"]), ["col1", "col2"])
+        self.assertFalse(details["risk"].isna().any())
+
+        global_data = result["global"]
+        self.assertEqual(len(global_data), 1)
+        self.assertEqual(global_data.iloc[0]["risk"], details["risk"].max())
+
+    def test_eval_linkability_batch(self):
+        """Test Linkability of a list of aux_cols pairs in one batch."""
+        config = {
+            "eval_method": "anonymeter-linkability",
+            "n_attacks": 10,
+            "aux_cols": [[["col1"], ["col3"]], [["col1", "col2"], ["col3"]]],
+        }
+
+        result = Anonymeter(config=config).eval(self.data)
+
+        details = result["details"]
+        self.assertEqual(len(details), 2)
+        self.assertEqual(details["aux_cols"].iloc[1], (["col1", "col2"], ["col3"]))
+        self.assertFalse(details["risk"].isna().any())
+
+    def test_invalid_batch(self):
+        """Test invalid secrets and aux_cols pairs of a batch."""
+        with self.assertRaises(ConfigError):
+            Anonymeter(
+                config={
+                    "eval_method": "anonymeter-inference",
+                    "secret": ["col1", "col1"],
+                }
+            )
+        with self.assertRaises(ConfigError):
+            Anonymeter(
+                config={
+                    "eval_method": "anonymeter-linkability",
+                    "aux_cols": [[["col1"], ["col3"]], [["col1"], ["col1"]]],
+                }
+            )
+        with self.assertRaises(ConfigError):
+            Anonymeter(
+                config={"eval_method": "anonymeter-inference", "secret": ["col9"]}
+            ).eval(self.data)
+
     def test_invalid_method(self):
         """Test with invalid evaluation method."""
         with self.assertRaises(Exception):
@@ -0,0 +1,160 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from petsard.evaluator.data_describer import DataDescriber, DataDescriberConfig
+from petsard.evaluator.data_describer_sketch import (
+    DataDescriberSketch,
+    HyperLogLogSketch,
+    KLLSketch,
+)
+from petsard.evaluator.describer import Describer
+from petsard.exceptions import ConfigError
+from petsard.loader import Loader
+
+
+class TestDataDescriberStreaming(unittest.TestCase):
+    """Test for streaming mode of DataDescriber."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        rng = np.random.default_rng(0)
+        n = 150
+        self.data = pd.DataFrame(
+            {
+                "num1": rng.normal(1e6, 3, size=n),
+                "num2": rng.exponential(2, size=n),
+                "int1": rng.integers(0, 100, size=n),
+                "cat1": rng.choice(["a", "b", "c"], size=n),
+            }
+        )
+        self.data.loc[::7, "num1"] = np.nan
+        self.data.loc[::11, "cat1"] = None
+        self.config = {
+            "eval_method": "describe",
+            "describe_method": [
+                "row_count",
+                "col_count",
+                "global_na_count",
+                "mean",
+                "median",
+                "std",
+                "var",
+                "min",
+                "max",
+                "kurtosis",
+                "skew",
+                "q1",
+                "q3",
+                "percentile",
+                "col_na_count",
+                "nunique",
+                "corr",
+                "cov",
+            ],
+            "percentile": 0.9,
+        }
+
+    def test_streaming_matches_exact(self):
+        """Test streaming results equal the exact ones while sketches hold all rows."""
+        exact = DataDescriber(config=dict(self.config))._eval({"data": self.data})
+        streaming = DataDescriber(
+            config={**self.config, "streaming": True, "chunk_size": 40}
+        )._eval({"data": self.data})
+
+        self.assertEqual(set(streaming), set(exact))
+        pd.testing.assert_frame_equal(streaming["global"], exact["global"])
+        pd.testing.assert_frame_equal(streaming["columnwise"], exact["columnwise"])
+        pd.testing.assert_frame_equal(
+            streaming["pairwise"], exact["pairwise"], check_exact=False
+        )
+
+    def test_streaming_chunk_iterable(self):
+        """Test streaming from Loader.load_chunks() equals streaming a DataFrame."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "data.csv")
+            self.data.to_csv(path, index=False)
+            data, _ = Loader(filepath=path).load()
+            chunks = Loader(filepath=path, chunksize=40).load_chunks()
+
+            config = {**self.config, "streaming": True, "chunk_size": 40}
+            expected = DataDescriber(config=dict(config)).eval({"data": data})
+            describer = Describer(
+                method="default",
+                **{k: v for k, v in config.items() if k != "eval_method"},
+            )
+            describer.create()
+            result = describer.eval({"data": chunks})
+
+        self.assertEqual(set(result), set(expected))
+        for granularity, desc in expected.items():
+            pd.testing.assert_frame_equal(result[granularity], desc)
+
+        describer = DataDescriber(config=dict(config))
+        with self.assertRaises(ConfigError):
+            describer.eval({"data": iter([])})
+        with self.assertRaises(ConfigError):
+            describer.eval({"data": [self.data, "not a chunk"]})
+
+    def test_sketch_merge(self):
+        """Test merging sketches of partitions equals sketching all rows."""
+        methods = ["mean", "std", "skew", "kurtosis", "cov", "nunique"]
+        whole = DataDescriberSketch(describe_method=methods)
+        whole.update(self.data)
+
+        merged = DataDescriberSketch(describe_method=methods)
+        for part in (self.data.iloc[:60], self.data.iloc[60:]):
+            sketch = DataDescriberSketch(describe_method=methods)
+            sketch.update(part)
+            merged.merge(sketch)
+
+        for method in ["mean", "std", "skew", "kurtosis", "nunique"]:
+            for col, value in whole.describe(method)[method].items():
+                self.assertAlmostEqual(merged.describe(method)[method][col], value)
+        for pair, value in whole.describe("cov")["cov"].items():
+            self.assertAlmostEqual(merged.describe("cov")["cov"][pair], value)
+
+    def test_kll_rank_error(self):
+        """Test KLL quantiles are within the documented rank error."""
+        values = np.random.default_rng(1).normal(size=200000)
+        sketch = KLLSketch(k=200)
+        for chunk in np.array_split(values, 20):
+            sketch.update(chunk)
+
+        self.assertLess(sum(c.size for c in sketch.compactors), 2000)
+        sorted_values = np.sort(values)
+        for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+            rank = np.searchsorted(sorted_values, sketch.quantile(q)) / values.size
+            self.assertLess(abs(rank - q), 0.017)
+
+    def test_hll_error(self):
+        """Test HyperLogLog distinct counts are within the documented error."""
+        values = pd.Series([f"id{i}" for i in range(50000)] * 2)
+        sketch = HyperLogLogSketch(precision=14)
+        for start in range(0, values.size, 30000):
+            sketch.update(values.iloc[start : start + 30000])
+
+        # 4 standard errors of 0.81%
+        self.assertLess(abs(sketch.count() / 50000 - 1), 0.033)
+
+        small = HyperLogLogSketch()
+        small.update(pd.Series(["a", "b", None, "a"]))
+        self.assertEqual(small.count(), 2)
+
+    def test_invalid_streaming_config(self):
+        """Test invalid streaming parameters."""
+        for params in [
+            {"streaming": "yes"},
+            {"chunk_size": 0},
+            {"sketch_k": 2},
+            {"hll_precision": 20},
+        ]:
+            with self.assertRaises(ConfigError):
+                DataDescriberConfig(eval_method="describe", **params)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,8 +3,11 @@ from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
+from sklearn.linear_model import LogisticRegression
 
 from petsard.evaluator.mlutlity import MLUtility, MLUtilityConfig
+from petsard.exceptions import ConfigError
 
 
 class TestMLUtility(unittest.TestCase):
@@ -156,6 +159,152 @@ class TestMLUtility(unittest.TestCase):
             self.assertIn("global", result)
             self.assertIn("details", result)
 
+    def test_classification_fits_each_model_once(self):
+        """Test each classification model is fitted once per data and timed."""
+        with patch.object(
+            LogisticRegression,
+            "fit",
+            autospec=True,
+            side_effect=LogisticRegression.fit,
+        ) as mock_fit:
+            evaluator = MLUtility(config=self.config_classification)
+            result = evaluator.eval(self.data_classification)
+
+        # once for ori and once for syn
+        self.assertEqual(mock_fit.call_count, 2)
+
+        timing = result["details"]["timing"]
+        self.assertEqual(
+            list(timing.columns),
+            ["data_type", "model", "fit_seconds", "predict_seconds"],
+        )
+        self.assertEqual(len(timing), 8)
+        self.assertEqual(
+            set(timing["model"]),
+            {"logistic_regression", "svc", "random_forest", "gradient_boosting"},
+        )
+        self.assertTrue((timing[["fit_seconds", "predict_seconds"]] >= 0).all().all())
+
+    def test_parallel_model_sets(self):
+        """Test ori and syn model sets run by joblib workers give the same scores."""
+        serial = MLUtility(config=self.config_cluster).eval(self.data_cluster)
+        parallel = MLUtility(config={**self.config_cluster, "n_jobs": 2}).eval(
+            self.data_cluster
+        )
+
+        self.assertEqual(serial["details"]["ori"], parallel["details"]["ori"])
+        self.assertEqual(serial["details"]["syn"], parallel["details"]["syn"])
+        pd.testing.assert_frame_equal(serial["global"], parallel["global"])
+        self.assertEqual(
+            list(parallel["details"]["timing"]["data_type"]),
+            ["ori", "ori", "syn", "syn"],
+        )
+
+    def test_invalid_n_jobs(self):
+        """Test n_jobs of zero or not an integer."""
+        for n_jobs in [0, 1.5]:
+            with self.assertRaises(ConfigError):
+                MLUtility(config={**self.config_cluster, "n_jobs": n_jobs})
+
+    def test_sparse_encoding(self):
+        """Test sparse one-hot features give scores for every method."""
+        cases = [
+            (self.config_classification, self.data_classification),
+            (self.config_regression, self.data_regression),
+            (self.config_cluster, self.data_cluster),
+        ]
+        for config, data in cases:
+            with self.subTest(eval_method=config["eval_method"]):
+                evaluator = MLUtility(config={**config, "encoding": "sparse"})
+                evaluator.mlutility_config.update_data(data)
+                preprocessed_data, _ = evaluator._preprocessing(data)
+                # 2 numeric + 2 one-hot columns with drop="first"
+                self.assertTrue(sp.issparse(preprocessed_data["ori"]["X"]))
+                self.assertEqual(preprocessed_data["ori"]["X"].shape, (100, 4))
+
+                result = evaluator.eval(data)
+                self.assertFalse(result["global"].isna().any().any())
+
+    def test_native_encoding(self):
+        """Test native categories use histogram-based gradient boosting only."""
+        for config, data in [
+            (self.config_classification, self.data_classification),
+            (self.config_regression, self.data_regression),
+        ]:
+            with self.subTest(eval_method=config["eval_method"]):
+                evaluator = MLUtility(config={**config, "encoding": "native"})
+                result = evaluator.eval(data)
+
+                self.assertEqual(
+                    list(result["details"]["ori"]), ["hist_gradient_boosting"]
+                )
+                self.assertEqual(evaluator._categorical_features, [False, False, True])
+
+    def test_native_encoding_high_cardinality(self):
+        """Test categories over NATIVE_MAX_CATEGORIES are used as ordinal codes."""
+        evaluator = MLUtility(
+            config={**self.config_classification, "encoding": "native"}
+        )
+        evaluator.NATIVE_MAX_CATEGORIES = 2
+        evaluator.eval(self.data_classification)
+
+        self.assertEqual(evaluator._categorical_features, [False, False, False])
+
+    def test_invalid_encoding(self):
+        """Test unknown encoding, and native encoding for clustering."""
+        with self.assertRaises(ConfigError):
+            MLUtility(config={**self.config_classification, "encoding": "dense"})
+        with self.assertRaises(ConfigError):
+            MLUtility(config={**self.config_cluster, "encoding": "native"})
+
+    def test_bootstrap(self):
+        """Test bootstrap subsamples give mean scores and confidence intervals."""
+        config = {**self.config_cluster, "sample_size": 60, "n_bootstrap": 3}
+        result = MLUtility(config=config).eval(self.data_cluster)
+
+        for name in ["ori", "syn", "diff"]:
+            self.assertLessEqual(
+                result["global"][f"{name}_CI_btm"].iloc[0],
+                result["global"][f"{name}_CI_top"].iloc[0],
+            )
+        scores = result["details"]["bootstrap"]
+        self.assertEqual(list(scores["repetition"].unique()), [0, 1, 2])
+        self.assertAlmostEqual(
+            result["details"]["ori"]["KMeans_cluster2"],
+            scores.query("data_type == 'ori' and model == 'KMeans_cluster2'")[
+                "score"
+            ].mean(),
+        )
+        self.assertEqual(len(result["details"]["timing"]), 3 * 2 * 2)
+
+        # repetitions run by joblib workers draw the same subsamples
+        parallel = MLUtility(config={**config, "n_jobs": 2}).eval(self.data_cluster)
+        pd.testing.assert_frame_equal(result["global"], parallel["global"])
+
+    def test_bootstrap_stratified_subsample(self):
+        """Test classification subsamples keep the class proportions."""
+        data = {
+            key: df.assign(target=[0] * 80 + [1] * 20)
+            for key, df in self.data_classification.items()
+        }
+        evaluator = MLUtility(config={**self.config_classification, "sample_size": 50})
+        subsample = evaluator._subsample(data, np.random.default_rng(0))
+
+        for key in ["ori", "syn", "control"]:
+            self.assertEqual(
+                subsample[key]["target"].value_counts().to_dict(), {0: 40, 1: 10}
+            )
+
+    def test_invalid_bootstrap(self):
+        """Test invalid sample_size, n_bootstrap and confidence_level."""
+        for params in [
+            {"sample_size": 0},
+            {"sample_size": 10, "n_bootstrap": 0},
+            {"sample_size": 10, "confidence_level": 1.5},
+        ]:
+            with self.assertRaises(ConfigError):
+                MLUtility(config={**self.config_cluster, **params})
+
     def test_invalid_method(self):
         """Test with invalid evaluation method."""
         with self.assertRaises(Exception):
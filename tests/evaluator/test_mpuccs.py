@@ -10,6 +10,7 @@ MPUCCs (Maximal Partial Unique Column Combinations) Evaluator 綜合測試
 - 完整整合測試
 """
 
+import ast
 import logging
 from collections import Counter
 from datetime import datetime, timedelta
@@ -18,7 +19,8 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from petsard.evaluator.mpuccs import MPUCCs
+from petsard.evaluator.mpuccs import MPUCCs, _CombinationKeys
+from petsard.exceptions import ConfigError
 
 # 設定測試日誌
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -590,6 +592,152 @@ class TestMPUCCsIntegration:
         assert total_ori_records <= len(ori_data)
 
 
+class TestMPUCCsFactorizedKeys:
+    """MPUCCs 整數編碼組合鍵測試"""
+
+    def test_matches_brute_force_uniqueness(self):
+        """測試組合唯一性與 pandas duplicated 逐一比對結果一致"""
+        rng = np.random.default_rng(0)
+
+        def make(n):
+            return pd.DataFrame(
+                {
+                    "age": rng.integers(18, 80, n),
+                    "sex": rng.choice(["M", "F"], n),
+                    "zip": rng.choice(["z1", "z2", "z3", "z4", "z5"], n),
+                }
+            )
+
+        ori_data, syn_data = make(150), make(150)
+
+        mpuccs = MPUCCs({"eval_method": "mpuccs", "n_cols": [2]})
+        results = mpuccs.eval({"ori": ori_data, "syn": syn_data})
+
+        syn_dedup = syn_data.drop_duplicates().reset_index(drop=True)
+        ori_dedup = ori_data.drop_duplicates().reset_index(drop=True)
+
+        expected_identified = set()
+        for combo, mpuccs_cnt in zip(
+            results["tree"]["field_combo"], results["tree"]["mpuccs_cnt"], strict=True
+        ):
+            fields = list(ast.literal_eval(combo))
+            syn_unique = syn_dedup.loc[
+                ~syn_dedup.duplicated(subset=fields, keep=False), fields
+            ]
+            ori_unique = ori_dedup.loc[
+                ~ori_dedup.duplicated(subset=fields, keep=False), fields
+            ]
+            assert mpuccs_cnt == len(syn_unique)
+
+            matched = syn_unique.reset_index().merge(ori_unique, on=fields)
+            expected_identified.update(matched["index"])
+
+        assert expected_identified
+        assert set(results["details"]["syn_idx"]) == expected_identified
+
+    def test_missing_values_grouped_as_one_value(self):
+        """測試缺失值視為同一個值，不會各自成為唯一組合"""
+        ori_data = pd.DataFrame({"A": [np.nan, 1.0, 5.0, 2.0], "B": [1, 2, 3, 4]})
+        syn_data = pd.DataFrame({"A": [np.nan, np.nan, 1.0, 2.0], "B": [1, 2, 3, 4]})
+
+        mpuccs = MPUCCs({"eval_method": "mpuccs", "n_cols": [1]})
+        results = mpuccs.eval({"ori": ori_data, "syn": syn_data})
+
+        tree_df = results["tree"].set_index("field_combo")
+        # 兩筆 NaN 互相碰撞，只有 1.0 與 2.0 為唯一值
+        assert tree_df.loc["('A',)", "mpuccs_cnt"] == 2
+
+    def test_high_cardinality_combo_keys(self):
+        """測試高基數多欄位組合鍵不會溢位"""
+        n = 5000
+        rng = np.random.default_rng(1)
+        data = pd.DataFrame({f"col_{i}": rng.permutation(n) for i in range(6)})
+
+        mpuccs = MPUCCs({"eval_method": "mpuccs", "n_cols": [6]})
+        results = mpuccs.eval({"ori": data, "syn": data.copy()})
+
+        tree_df = results["tree"]
+        assert tree_df["mpuccs_cnt"].iloc[0] == n
+        assert tree_df["mpuccs_collision_cnt"].iloc[0] == n
+
+
+class TestMPUCCsCollisionIndex:
+    """MPUCCs 原始資料雜湊索引測試"""
+
+    def test_ori_index_marks_unique_absent_and_collision(self):
+        """測試原始資料索引標記唯一列、不存在與碰撞，且能處理缺失值"""
+        syn_data = pd.DataFrame({"A": [1.0, 2.0, 3.0, np.nan]})
+        ori_data = pd.DataFrame({"A": [np.nan, 2.0, 2.0, 1.0]})
+
+        combination_keys = _CombinationKeys.from_data(
+            syn_data, ori_data, max_cache_bytes=0
+        )
+        keys = combination_keys.keys(("A",))
+        ori_match = combination_keys.ori_index(keys)[keys[:4]]
+
+        assert ori_match.tolist() == [
+            3,
+            _CombinationKeys.ORI_COLLISION,
+            _CombinationKeys.ORI_ABSENT,
+            0,
+        ]
+
+    def test_cached_prefix_keys_match_uncached_keys(self):
+        """測試使用快取前綴建立的組合鍵與不快取時一致"""
+        rng = np.random.default_rng(2)
+        data = pd.DataFrame(
+            {col: rng.integers(0, 5, 200) for col in ["A", "B", "C", "D"]}
+        )
+
+        cached = _CombinationKeys.from_data(data, data, max_cache_bytes=10**8)
+        uncached = _CombinationKeys.from_data(data, data, max_cache_bytes=0)
+
+        for combo in [("A", "B"), ("A", "B", "C"), ("A", "B", "C", "D")]:
+            np.testing.assert_array_equal(cached.keys(combo), uncached.keys(combo))
+        assert ("A", "B", "C") in cached._cache
+        assert not uncached._cache
+
+
+class TestMPUCCsParallelSearch:
+    """MPUCCs 多行程漸進式搜尋測試"""
+
+    def test_parallel_matches_serial(self):
+        """測試多行程搜尋的結果與單行程完全相同，並回報各層級耗時"""
+        rng = np.random.default_rng(3)
+
+        def make(n):
+            return pd.DataFrame(
+                {
+                    "age": rng.integers(18, 80, n),
+                    "sex": rng.choice(["M", "F"], n),
+                    "zip": rng.choice(["z1", "z2", "z3", "z4", "z5"], n),
+                    "edu": rng.integers(0, 6, n),
+                }
+            )
+
+        data = {"ori": make(300), "syn": make(300)}
+        config = {"eval_method": "mpuccs", "min_entropy_delta": 0.01}
+
+        serial = MPUCCs(dict(config)).eval(data)
+        parallel = MPUCCs({**config, "n_jobs": 2}).eval(data)
+
+        pd.testing.assert_frame_equal(serial["global"], parallel["global"])
+        pd.testing.assert_frame_equal(serial["details"], parallel["details"])
+        pd.testing.assert_frame_equal(
+            serial["tree"],
+            parallel["tree"].drop(columns="level_duration_seconds"),
+        )
+        level_times = parallel["tree"].groupby("combo_size")["level_duration_seconds"]
+        assert (level_times.nunique() == 1).all()
+        assert (parallel["tree"]["level_duration_seconds"] > 0).all()
+
+    @pytest.mark.parametrize("n_jobs", [0, -2, 1.5])
+    def test_invalid_n_jobs(self, n_jobs):
+        """測試無效的 n_jobs 會拋出 ConfigError"""
+        with pytest.raises(ConfigError):
+            MPUCCs({"eval_method": "mpuccs", "n_jobs": n_jobs})
+
+
 class TestMPUCCsEdgeCases:
     """MPUCCs 邊界情況測試"""
 
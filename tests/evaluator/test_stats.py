@@ -1,9 +1,19 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
+from scipy.stats.contingency import association, crosstab
 
 from petsard.evaluator.stats import Stats, StatsConfig, StatsJSDivergence, StatsMean
+from petsard.evaluator.stats_base import (
+    StatsCramersV,
+    StatsMax,
+    StatsMedian,
+    StatsMin,
+    StatsNUnique,
+    StatsStd,
+)
 
 
 class TestStats(unittest.TestCase):
@@ -152,6 +162,189 @@ class TestStats(unittest.TestCase):
                 if len(valid_values) > 0:
                     self.assertTrue((valid_values.abs() > 0).any())
 
+    def test_eval_pairwise(self):
+        """Test pairwise correlations from one matrix per data, in the pair layout."""
+        rng = np.random.default_rng(0)
+        data = {
+            source: pd.DataFrame(
+                {
+                    "num1": rng.normal(size=200),
+                    "num2": rng.normal(size=200),
+                    "cat1": rng.choice(["a", "b"], size=200),
+                    "cat2": rng.choice(["x", "y", "z"], size=200),
+                }
+            )
+            for source in ["ori", "syn"]
+        }
+
+        def mock_create_field_side_effect(*args, **kwargs):
+            mock_field = MagicMock()
+            mock_field.data_type.value = (
+                "NUMERICAL" if kwargs["field_name"].startswith("num") else "CATEGORICAL"
+            )
+            return mock_field
+
+        with patch(
+            "petsard.metadater.Metadater.create_field",
+            side_effect=mock_create_field_side_effect,
+        ):
+            config = {
+                **self.config,
+                "stats_method": ["pearson", "spearman", "cramers_v"],
+            }
+            result = Stats(config=config).eval(data)
+
+        pairwise = result["pairwise"].set_index(["column1", "column2"])
+        # pairs follow the column order of ori
+        self.assertEqual(
+            list(pairwise.index),
+            [
+                ("num1", "num2"),
+                ("num1", "cat1"),
+                ("num1", "cat2"),
+                ("num2", "cat1"),
+                ("num2", "cat2"),
+                ("cat1", "cat2"),
+            ],
+        )
+        for source in ["ori", "syn"]:
+            df = data[source]
+            self.assertAlmostEqual(
+                pairwise.loc[("num1", "num2"), f"pearson_{source}"],
+                round(df["num1"].corr(df["num2"]), 2),
+            )
+            self.assertAlmostEqual(
+                pairwise.loc[("num1", "num2"), f"spearman_{source}"],
+                round(df["num1"].corr(df["num2"], method="spearman"), 2),
+            )
+            self.assertAlmostEqual(
+                pairwise.loc[("cat1", "cat2"), f"cramers_v_{source}"],
+                round(association(crosstab(df["cat1"], df["cat2"]).count), 2),
+            )
+        # mixed type pairs are left out
+        self.assertTrue(pairwise.loc[("num1", "cat1")].isna().all())
+        self.assertIn("pearson_pct_change", result["global"].columns)
+
+    def test_eval_columnwise_engine(self):
+        """Test one-pass column-wise statistics against the per-column modules."""
+        rng = np.random.default_rng(0)
+        data = {
+            source: pd.DataFrame(
+                {
+                    "num1": rng.normal(size=100),
+                    "num2": rng.integers(0, 50, size=100).astype(float),
+                    "cat1": rng.choice(["a", "b", "c"], size=100),
+                    "cat2": rng.choice(["x", "y"], size=100),
+                }
+            )
+            for source in ["ori", "syn"]
+        }
+        data["ori"].loc[::7, "num1"] = np.nan
+        data["syn"].loc[::5, "cat1"] = np.nan
+
+        def mock_create_field_side_effect(*args, **kwargs):
+            mock_field = MagicMock()
+            mock_field.data_type.value = (
+                "NUMERICAL" if kwargs["field_name"].startswith("num") else "CATEGORICAL"
+            )
+            return mock_field
+
+        with patch(
+            "petsard.metadater.Metadater.create_field",
+            side_effect=mock_create_field_side_effect,
+        ):
+            config = {
+                **self.config,
+                "stats_method": [
+                    "mean",
+                    "std",
+                    "median",
+                    "min",
+                    "max",
+                    "nunique",
+                    "jsdivergence",
+                ],
+            }
+            result = Stats(config=config).eval(data)
+
+        columnwise = result["columnwise"]
+        modules = {
+            "mean": StatsMean,
+            "std": StatsStd,
+            "median": StatsMedian,
+            "min": StatsMin,
+            "max": StatsMax,
+            "nunique": StatsNUnique,
+        }
+        for method, module in modules.items():
+            cols = ["cat1", "cat2"] if method == "nunique" else ["num1", "num2"]
+            for col in cols:
+                for source in ["ori", "syn"]:
+                    self.assertAlmostEqual(
+                        columnwise.loc[col, f"{method}_{source}"],
+                        round(module().eval({"col": data[source][col]}), 2),
+                    )
+            # ineligible columns are left as NaN
+            other = ["num1"] if method == "nunique" else ["cat1"]
+            self.assertTrue(columnwise.loc[other, f"{method}_ori"].isna().all())
+
+        # JS divergence on the union of categories
+        for col in ["cat1", "cat2"]:
+            self.assertAlmostEqual(
+                columnwise.loc[col, "jsdivergence"],
+                round(
+                    StatsJSDivergence().eval(
+                        {"col_ori": data["ori"][col], "col_syn": data["syn"][col]}
+                    ),
+                    2,
+                ),
+            )
+
+    def test_cramers_v_batches(self):
+        """Test Cramér's V of batched contingency counting with NA."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {f"col{k}": rng.choice(list("abcdef")[:k], size=300) for k in range(2, 7)}
+        )
+        df.loc[rng.choice(300, size=30), "col3"] = None
+
+        module = StatsCramersV()
+        module.MAX_BATCH_SIZE = 700  # two columns per batch at most
+        matrix = module.eval({"data": df})
+
+        for i, col1 in enumerate(df.columns):
+            for col2 in df.columns[i + 1 :]:
+                pair = df[[col1, col2]].dropna()
+                expected = association(crosstab(pair[col1], pair[col2]).count)
+                self.assertAlmostEqual(matrix.at[col1, col2], expected)
+                self.assertAlmostEqual(matrix.at[col2, col1], expected)
+
+    def test_cramers_v_high_cardinality(self):
+        """Test Cramér's V of pairs too large for a dense contingency table."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "col1": rng.integers(0, 40, size=500),
+                "col2": rng.integers(0, 30, size=500),
+                "col3": rng.choice(list("abc"), size=500),
+            }
+        )
+        df["col2"] = df["col2"] + df["col1"] % 3
+        df.loc[rng.choice(500, size=50), "col2"] = None
+
+        expected = StatsCramersV().eval({"data": df})
+        module = StatsCramersV()
+        module.MAX_BATCH_SIZE = 100  # col1 x col2 counts the observed pairs
+        pd.testing.assert_frame_equal(module.eval({"data": df}), expected)
+
+        # 50k levels each would need a 20 GB dense table
+        n_rows = 100_000
+        codes = rng.permutation(n_rows) % 50_000
+        df = pd.DataFrame({"col1": codes, "col2": codes, "col3": codes % 7})
+        matrix = StatsCramersV().eval({"data": df})
+        self.assertAlmostEqual(matrix.at["col1", "col2"], 1.0)
+        self.assertAlmostEqual(matrix.at["col1", "col3"], 1.0)
+
     def test_invalid_stats_method(self):
         """Test with invalid stats method."""
         invalid_config = self.config.copy()
@@ -12,9 +12,14 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from petsard.exceptions import ConfigError, UnsupportedMethodError
+from petsard.exceptions import (
+    ConfigError,
+    UnableToFollowMetadataError,
+    UnsupportedMethodError,
+)
 from petsard.loader.benchmarker import BenchmarkerConfig
 from petsard.loader.loader import Loader, LoaderConfig, LoaderFileExt
+from petsard.loader.loader_arrow import LoaderArrowBase
 from petsard.metadater import FieldConfig, SchemaConfig
 
 
@@ -912,6 +917,10 @@ class TestLoaderFileExt:
             (".xlsb", LoaderFileExt.EXCELTYPE),
             (".ods", LoaderFileExt.EXCELTYPE),
             (".odt", LoaderFileExt.EXCELTYPE),
+            (".parquet", LoaderFileExt.PARQUETTYPE),
+            (".feather", LoaderFileExt.ARROWTYPE),
+            (".arrow", LoaderFileExt.ARROWTYPE),
+            (".ipc", LoaderFileExt.ARROWTYPE),
         ],
     )
     def test_get_file_ext_code(self, file_ext, expected_code):
@@ -928,6 +937,292 @@ class TestLoaderFileExt:
             LoaderFileExt.get(".unsupported")
 
 
+class TestLoaderColumnar:
+    """Test cases for Parquet, Feather and Arrow IPC loading
+    Parquet、Feather 與 Arrow IPC 載入測試案例
+    """
+
+    @pytest.fixture
+    def sample_frame(self):
+        """Create a frame with declared integer widths and a missing value
+        建立具指定整數寬度與缺失值的資料框
+        """
+        data = pd.DataFrame(
+            {
+                "id": np.arange(1000, dtype="int32"),
+                "age": pd.array(np.arange(1000) % 90, dtype="Int16"),
+                "score": np.linspace(0, 1, 1000),
+                "city": ["Taipei", "Tainan", "?", "Hsinchu"] * 250,
+            }
+        )
+        data.loc[3, "age"] = pd.NA
+        return data
+
+    @pytest.fixture(params=["parquet", "feather"])
+    def columnar_path(self, request, sample_frame, tmp_path):
+        """Write the sample frame as a Parquet or Feather file
+        將範例資料寫入 Parquet 或 Feather 檔案
+        """
+        pytest.importorskip("pyarrow")
+        path = tmp_path / f"sample.{request.param}"
+        if request.param == "parquet":
+            sample_frame.to_parquet(path, row_group_size=100)
+        else:
+            sample_frame.to_feather(path)
+        return str(path)
+
+    def test_load_columnar(self, columnar_path, sample_frame):
+        """Test column types are read from the file schema
+        測試欄位型別取自檔案架構
+        """
+        data, schema = Loader(filepath=columnar_path, na_values={"city": "?"}).load()
+
+        assert data.shape == sample_frame.shape
+        assert data["id"].dtype == pd.Int32Dtype()
+        assert data["age"].dtype == pd.Int16Dtype()
+        assert data["age"].isna().sum() == 1
+        assert data["city"].isna().sum() == 250
+        assert schema.get_field("id").data_type.value == "int32"
+        assert schema.get_field("age").data_type.value == "int16"
+        # No re-inference of dtypes for columnar files
+        assert all(field.target_dtype is None for field in schema.fields)
+
+    def test_projection_and_filters(self, columnar_path):
+        """Test column projection and row filters from schema properties
+        測試由 schema properties 指定欄位投影與列篩選
+        """
+        schema = {
+            "properties": {
+                "columns": ["id", "city"],
+                "filters": [["id", ">=", 100], ["id", "<", 300]],
+            }
+        }
+        data, metadata = Loader(filepath=columnar_path, schema=schema).load()
+
+        assert list(data.columns) == ["id", "city"]
+        assert data["id"].tolist() == list(range(100, 300))
+        assert metadata.get_field_names() == ["id", "city"]
+
+    def test_header_names_with_projection(self, columnar_path):
+        """Test header_names rename the file columns before projecting
+        測試 header_names 於欄位投影前重新命名檔案欄位
+        """
+        schema = {
+            "properties": {
+                "columns": ["score_renamed", "id_renamed"],
+                "filters": [["id_renamed", "<", 10]],
+            }
+        }
+        data, _ = Loader(
+            filepath=columnar_path,
+            header_names=["id_renamed", "age_renamed", "score_renamed", "city_renamed"],
+            schema=schema,
+        ).load()
+
+        assert list(data.columns) == ["score_renamed", "id_renamed"]
+        assert data["id_renamed"].tolist() == list(range(10))
+
+    def test_header_names_length_mismatch(self, columnar_path):
+        """Test header_names must name every column of the file
+        測試 header_names 須對應檔案所有欄位
+        """
+        with pytest.raises(UnableToFollowMetadataError, match="header_names"):
+            Loader(filepath=columnar_path, header_names=["a", "b"]).load()
+
+    def test_arrow_base_is_abstract(self):
+        """Test the columnar base loader cannot be instantiated
+        測試無法直接建立欄式基礎載入器
+        """
+        with pytest.raises(TypeError):
+            LoaderArrowBase({"filepath": "data.parquet"})
+
+    def test_csv_projection(self, sample_frame, tmp_path):
+        """Test column projection also applies to CSV files
+        測試欄位投影同樣適用於 CSV 檔案
+        """
+        path = tmp_path / "sample.csv"
+        sample_frame.to_csv(path, index=False)
+
+        data, _ = Loader(
+            filepath=str(path), schema={"properties": {"columns": ["id", "score"]}}
+        ).load()
+
+        assert list(data.columns) == ["id", "score"]
+
+    def test_filters_require_columnar_file(self):
+        """Test row filters are rejected for CSV files
+        測試 CSV 檔案不接受列篩選
+        """
+        with pytest.raises(ConfigError):
+            Loader(
+                filepath="data.csv",
+                schema={"properties": {"filters": [["id", ">", 1]]}},
+            )
+
+    def test_missing_pyarrow(self, columnar_path):
+        """Test a ConfigError with install hint when pyarrow is missing
+        測試缺少 pyarrow 時拋出含安裝提示的 ConfigError
+        """
+        with patch.dict("sys.modules", {"pyarrow": None}):
+            with pytest.raises(
+                UnableToFollowMetadataError, match="pyarrow is required"
+            ):
+                Loader(filepath=columnar_path).load()
+
+
+class TestLoaderChunked:
+    """Test cases for chunked CSV loading
+    分塊 CSV 載入測試案例
+    """
+
+    @pytest.fixture
+    def chunked_csv_path(self, tmp_path):
+        """Create a CSV whose missing values and categories differ across chunks
+        建立缺失值與類別在各分塊間不同的 CSV
+        """
+        rng = np.random.default_rng(42)
+        data = pd.DataFrame(
+            {
+                "id": np.arange(1000),
+                "small": np.arange(1000) % 100,
+                "score": rng.random(1000),
+                "city": ["Taipei"] * 500 + ["Tainan", "Hsinchu"] * 250,
+                "note": ["?" if i % 7 == 0 else "ok" for i in range(1000)],
+            }
+        )
+        data.loc[900, "small"] = None
+        path = tmp_path / "chunked.csv"
+        data.to_csv(path, index=False)
+        return str(path)
+
+    def test_chunksize_validation(self, chunked_csv_path):
+        """Test chunksize and downcast validation
+        測試 chunksize 與 downcast 驗證
+        """
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath=chunked_csv_path, chunksize=0)
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="data.xlsx", chunksize=100)
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath=chunked_csv_path, downcast=True)
+
+    def test_chunked_load_matches_full_load(self, chunked_csv_path):
+        """Test chunked loading returns the same data and schema as a full read
+        測試分塊載入與完整讀取結果一致
+        """
+        data, schema = Loader(filepath=chunked_csv_path, na_values="?").load()
+        chunked_data, chunked_schema = Loader(
+            filepath=chunked_csv_path, na_values="?", chunksize=128
+        ).load()
+
+        pd.testing.assert_frame_equal(chunked_data, data)
+        assert chunked_data["note"].isna().sum() == data["note"].isna().sum() > 0
+        assert [field.name for field in chunked_schema.fields] == [
+            field.name for field in schema.fields
+        ]
+
+    def test_chunked_load_with_schema(self, chunked_csv_path):
+        """Test schema dtypes are applied to every chunk and kept by downcast
+        測試 schema 型別套用至每個分塊且不受 downcast 影響
+        """
+        loader = Loader(
+            filepath=chunked_csv_path,
+            chunksize=100,
+            downcast=True,
+            schema={"fields": {"small": {"type": "int"}, "city": {"type": "str"}}},
+        )
+        data, _ = loader.load()
+
+        assert data["small"].dtype == pd.Int64Dtype()
+        assert data["small"].isna().sum() == 1
+        assert data["city"].dtype == object
+
+    def test_chunked_downcast(self, chunked_csv_path):
+        """Test downcast shrinks dtypes while keeping values
+        測試 downcast 縮小型別並保留數值
+        """
+        data, _ = Loader(filepath=chunked_csv_path).load()
+        downcast_data, _ = Loader(
+            filepath=chunked_csv_path, chunksize=128, downcast=True
+        ).load()
+
+        assert downcast_data["id"].dtype == np.int16
+        # NA only appears in one chunk; the concatenated column keeps it
+        assert downcast_data["small"].dtype == pd.Int8Dtype()
+        assert downcast_data["small"].isna().sum() == 1
+        assert downcast_data["score"].dtype == np.float32
+        assert isinstance(downcast_data["city"].dtype, pd.CategoricalDtype)
+        assert set(downcast_data["city"].cat.categories) == {
+            "Taipei",
+            "Tainan",
+            "Hsinchu",
+        }
+        assert (
+            downcast_data.memory_usage(deep=True).sum()
+            < data.memory_usage(deep=True).sum()
+        )
+        assert downcast_data["id"].tolist() == data["id"].tolist()
+        assert downcast_data["city"].astype(str).tolist() == data["city"].tolist()
+
+    def test_load_chunks_share_dtypes(self, chunked_csv_path):
+        """Test every chunk is cast to the dtypes decided over the whole file
+        測試每個分塊皆轉換為依整個檔案決定的型別
+        """
+        chunks = list(
+            Loader(
+                filepath=chunked_csv_path, na_values="?", chunksize=128, downcast=True
+            ).load_chunks()
+        )
+
+        assert len(chunks) == 8
+        assert sum(len(chunk) for chunk in chunks) == 1000
+        # The first chunk alone would give id int8, small int8 and city one category
+        for chunk in chunks:
+            assert chunk.dtypes.to_dict() == chunks[-1].dtypes.to_dict()
+            assert chunk["id"].dtype == np.int16
+            assert chunk["small"].dtype == pd.Int8Dtype()
+            assert set(chunk["city"].cat.categories) == {"Taipei", "Tainan", "Hsinchu"}
+
+    def test_chunked_downcast_inconsistent_chunks(self, tmp_path):
+        """Test columns parsed differently across chunks are merged, not mixed
+        測試各分塊解析型別不同的欄位會合併而非混用
+        """
+        path = tmp_path / "inconsistent.csv"
+        pd.DataFrame(
+            {
+                "value": list(range(128)) + [1.5] * 128,
+                "code": ["001"] * 128 + ["abc"] * 128,
+            }
+        ).to_csv(path, index=False)
+
+        data, _ = Loader(filepath=str(path), chunksize=128, downcast=True).load()
+
+        assert data["value"].dtype == np.float64
+        assert data["value"].iloc[-1] == 1.5
+        # "001" would be parsed as 1 in the first chunk alone
+        assert data["code"].dtype == object
+        assert data["code"].iloc[0] == "001"
+
+    def test_chunked_load_empty_file(self, tmp_path):
+        """Test chunked loading of a file without rows
+        測試分塊載入沒有資料列的檔案
+        """
+        path = tmp_path / "empty.csv"
+        path.write_text("a,b\n")
+
+        data, _ = Loader(filepath=str(path), chunksize=10, downcast=True).load()
+
+        assert list(data.columns) == ["a", "b"]
+        assert data.empty
+
+    def test_load_chunks_requires_chunksize(self, chunked_csv_path):
+        """Test load_chunks without chunksize
+        測試未設定 chunksize 時呼叫 load_chunks
+        """
+        with pytest.raises(ConfigError):
+            next(Loader(filepath=chunked_csv_path).load_chunks())
+
+
 # ============================================================================
 # 壓力測試 Stress Tests
 # ============================================================================
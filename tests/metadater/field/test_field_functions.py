@@ -2,15 +2,25 @@
 測試欄位函數模組
 """
 
+import time
+
 import numpy as np
 import pandas as pd
+import pytest
 
 from petsard.metadater.field.field_functions import (
     _comprehensive_type_analysis,
     _has_leading_zeros,
+    _sampled_type_analysis,
+    _stratified_sample,
+    _wilson_interval,
     build_field_metadata,
+    calculate_field_stats,
+    calculate_fields_stats,
 )
 from petsard.metadater.field.field_types import FieldConfig
+from petsard.metadater.schema.schema_functions import build_schema_metadata
+from petsard.metadater.schema.schema_types import SchemaConfig
 
 
 class TestComprehensiveTypeAnalysis:
@@ -313,3 +323,228 @@ class TestEdgeCases:
 
         result = _comprehensive_type_analysis(data, None)
         assert result.startswith("int"), "None config 應該使用預設配置"
+
+
+class TestFieldsStats:
+    """Test cases for DataFrame-level field statistics
+    資料框層級欄位統計的測試案例
+    """
+
+    @staticmethod
+    def _mixed_frame() -> pd.DataFrame:
+        rng = np.random.default_rng(0)
+        n = 500
+        data = pd.DataFrame(
+            {
+                "int": rng.integers(0, 100, n),
+                "float": rng.normal(size=n),
+                "float32": rng.normal(size=n).astype("float32"),
+                "uint8": rng.integers(0, 200, n).astype("uint8"),
+                "nullable_int": pd.array(rng.integers(0, 5, n), dtype="Int64"),
+                "float_na": np.where(rng.random(n) < 0.2, np.nan, rng.random(n)),
+                "all_na": np.full(n, np.nan),
+                "bool": rng.random(n) < 0.5,
+                "str": rng.choice(np.array(["a", "b", "c", None], dtype=object), n),
+                "category": pd.Categorical(rng.choice(["x", "y"], n)),
+                "category_unused": pd.Categorical(
+                    rng.choice(["x", "y"], n), categories=["w", "x", "y", "z"]
+                ),
+            }
+        )
+        data.loc[3, "nullable_int"] = pd.NA
+        return data
+
+    def test_matches_per_field_stats(self):
+        """Test vectorized stats equal the per-column calculation
+        測試向量化統計與逐欄計算結果一致
+        """
+        data = self._mixed_frame()
+        fields = [
+            build_field_metadata(data[col], col, compute_stats=False)
+            for col in data.columns
+        ]
+
+        stats = calculate_fields_stats(data, fields, max_workers=2)
+
+        for field_metadata in fields:
+            expected = calculate_field_stats(data[field_metadata.name], field_metadata)
+            assert repr(stats[field_metadata.name]) == repr(expected), (
+                field_metadata.name
+            )
+
+    def test_unused_categories(self):
+        """Test unused categories are not counted as distinct values
+        測試未使用的類別不計入相異值數量
+        """
+        data = pd.DataFrame(
+            {"col": pd.Categorical(["a", "b", "a"], categories=list("abcd"))}
+        )
+        field_metadata = build_field_metadata(data["col"], "col", compute_stats=False)
+
+        stats = calculate_fields_stats(data, [field_metadata])
+
+        assert stats["col"].distinct_count == 2
+        assert stats["col"].distinct_count == data["col"].nunique()
+        assert calculate_field_stats(data["col"], field_metadata).distinct_count == 2
+
+    def test_build_schema_metadata_stats(self):
+        """Test schema metadata carries stats of every field, also when sampled
+        測試結構描述包含每個欄位的統計，抽樣時亦同
+        """
+        data = self._mixed_frame()
+
+        schema = build_schema_metadata(data, SchemaConfig(schema_id="test"))
+        assert schema.get_field("int").stats.row_count == len(data)
+        assert schema.get_field("float_na").stats.na_count == int(
+            data["float_na"].isna().sum()
+        )
+        assert schema.get_field("all_na").stats.mean_value is None
+
+        sampled = build_schema_metadata(
+            data, SchemaConfig(schema_id="test", sample_size=100)
+        )
+        for col in data.columns:
+            expected = calculate_field_stats(
+                data[col].sample(n=100, random_state=42), sampled.get_field(col)
+            )
+            assert repr(sampled.get_field(col).stats) == repr(expected), col
+
+    def test_no_stats(self):
+        """Test compute_stats=False leaves stats empty
+        測試 compute_stats=False 時不計算統計
+        """
+        schema = build_schema_metadata(
+            self._mixed_frame(), SchemaConfig(schema_id="test", compute_stats=False)
+        )
+        assert all(field.stats is None for field in schema.fields)
+
+
+def _mixed_text_frame(n: int) -> pd.DataFrame:
+    """Build text columns of different inferred types
+    建立推論為不同類型的文字欄位
+    """
+    rng = np.random.default_rng(0)
+    levels = np.array([f"level_{i}" for i in range(50)], dtype=object)
+    dates = pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 1000, n), "D")
+    mostly_date = pd.Series(dates.strftime("%Y-%m-%d"), dtype=object)
+    mostly_date.iloc[n // 2] = "unknown"
+    return pd.DataFrame(
+        {
+            "int": rng.integers(0, 1000, n),
+            "float": rng.normal(size=n),
+            "category": levels[rng.integers(0, 50, n)],
+            "numeric_text": rng.integers(0, 30000, n).astype(str).astype(object),
+            "date_text": pd.Series(dates.strftime("%Y-%m-%d"), dtype=object),
+            "mostly_date": mostly_date,
+        }
+    )
+
+
+class TestSampledTypeAnalysis:
+    """Test cases for sampling-based type inference
+    抽樣類型推論的測試案例
+    """
+
+    def test_stratified_sample(self):
+        """Test the sample keeps head and tail rows in order
+        測試樣本保留頭尾列且維持順序
+        """
+        data = pd.Series(range(1000))
+
+        sample = _stratified_sample(data, 100)
+
+        assert len(sample) == 100
+        assert sample.iloc[:25].tolist() == list(range(25))
+        assert sample.iloc[-25:].tolist() == list(range(975, 1000))
+        assert sample.index.is_monotonic_increasing
+        assert _stratified_sample(data, 2000) is data
+
+    def test_wilson_interval(self):
+        """Test Wilson interval bounds
+        測試 Wilson 信賴區間
+        """
+        lower, upper = _wilson_interval(0, 1000, 0.95)
+        assert lower == pytest.approx(0.0)
+        assert upper < 0.01
+
+        lower, upper = _wilson_interval(800, 1000, 0.95)
+        assert lower < 0.8 < upper
+
+        narrow = _wilson_interval(500, 1000, 0.9)
+        wide = _wilson_interval(500, 1000, 0.99)
+        assert wide[0] < narrow[0] and narrow[1] < wide[1]
+
+    def test_sampled_matches_full(self):
+        """Test sampled inference gives the full scan dtype
+        測試抽樣推論與完整掃描結果一致
+        """
+        data = _mixed_text_frame(20000)
+        config = FieldConfig()
+
+        for col in data.columns:
+            full = _comprehensive_type_analysis(data[col], config)
+            sampled = _comprehensive_type_analysis(data[col], config, sample_size=1000)
+            assert sampled == full, col
+
+        assert _comprehensive_type_analysis(data["date_text"], config) == (
+            "datetime64[s]"
+        )
+        # One unparsable row outside the sample is still found by verification
+        assert (
+            _comprehensive_type_analysis(data["mostly_date"], config, sample_size=1000)
+            == "category"
+        )
+
+    def test_ambiguous_sample_falls_back(self):
+        """Test a sample near the 80% numeric threshold defers to the full scan
+        測試可轉數值比例接近 80% 時改用完整掃描
+        """
+        values = ["1", "2", "3", "4", "x"] * 2000
+        data = pd.Series(values, dtype=object)
+
+        assert _sampled_type_analysis(data, 1000, 0.95) is None
+        assert _comprehensive_type_analysis(
+            data, FieldConfig(), sample_size=1000
+        ) == _comprehensive_type_analysis(data, FieldConfig())
+
+    def test_schema_config_inference_parameters(self):
+        """Test inference sampling parameters of SchemaConfig
+        測試 SchemaConfig 的抽樣推論參數
+        """
+        data = _mixed_text_frame(5000)
+        schema = build_schema_metadata(
+            data,
+            SchemaConfig(
+                schema_id="test", inference_sample_size=500, compute_stats=False
+            ),
+        )
+        assert schema.get_field("category").target_dtype == "category"
+        assert schema.get_field("date_text").target_dtype == "datetime64[s]"
+
+        with pytest.raises(ValueError):
+            SchemaConfig(schema_id="test", inference_sample_size=0)
+        with pytest.raises(ValueError):
+            SchemaConfig(schema_id="test", inference_confidence=1.0)
+
+    @pytest.mark.stress
+    def test_sampled_inference_benchmark(self):
+        """Benchmark sampled against full inference on a 5M-row mixed-type table
+        在五百萬列混合類型資料上比較抽樣與完整推論
+        """
+        data = _mixed_text_frame(5_000_000)
+        config = FieldConfig()
+
+        full_time, sampled_time = 0.0, 0.0
+        for col in data.columns:
+            start = time.perf_counter()
+            full = _comprehensive_type_analysis(data[col], config)
+            full_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            sampled = _comprehensive_type_analysis(data[col], config, sample_size=10000)
+            sampled_time += time.perf_counter() - start
+
+            assert sampled == full, col
+
+        print(f"full: {full_time:.2f}s, sampled: {sampled_time:.2f}s")
+        assert sampled_time < full_time / 2
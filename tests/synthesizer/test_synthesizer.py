@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -63,3 +64,38 @@ class TestSynthesizer:
         result = synthesizer.sample()
         assert isinstance(result, pd.DataFrame)
         assert result.empty
+
+    # 測試 sample_from_conditions 在未 create 時引發 UncreatedError
+    def test_sample_from_conditions_without_create(self):
+        synthesizer = Synthesizer(method="sdv-single_table-gaussiancopula")
+        with pytest.raises(UncreatedError):
+            synthesizer.sample_from_conditions(
+                [{"num_rows": 5, "column_values": {"job": "a"}}]
+            )
+
+    # 測試 SDV 合成器依條件採樣
+    def test_sample_from_conditions(self):
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {
+                "job": rng.choice(["a", "b", "c"], size=200),
+                "level": rng.choice(["x", "y"], size=200),
+                "age": rng.normal(40, 10, size=200),
+            }
+        )
+        synthesizer = Synthesizer(method="sdv-single_table-gaussiancopula")
+        synthesizer.create()
+        synthesizer.fit(data=data)
+
+        result = synthesizer.sample_from_conditions(
+            [
+                {"num_rows": 30, "column_values": {"job": "a", "level": "y"}},
+                {"num_rows": 20, "column_values": {"job": "c", "level": "x"}},
+            ]
+        )
+        assert len(result) == 50
+        assert result.index.tolist() == list(range(50))
+        assert result.groupby(["job", "level"]).size().to_dict() == {
+            ("a", "y"): 30,
+            ("c", "x"): 20,
+        }
@@ -1,5 +1,9 @@
+import subprocess
+import sys
+import textwrap
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -615,6 +619,109 @@ class TestSynthesizerAdapter:
             assert result.equals(synthetic_data)
 
 
+class TestAdapterHandoff:
+    """測試模組間的結果傳遞"""
+
+    def test_deepcopy_by_default(self):
+        """測試預設以深複製傳遞結果"""
+        synthetic_data = pd.DataFrame({"A": [1, 2, 3]})
+
+        operator = SynthesizerAdapter({"method": "sdv"})
+        operator.data_syn = synthetic_data
+
+        with pd.option_context("mode.copy_on_write", False):
+            result = operator.get_result()
+
+        assert result.equals(synthetic_data)
+        assert not np.shares_memory(result["A"].values, synthetic_data["A"].values)
+
+    def test_copy_on_write(self):
+        """測試 Copy-on-Write 下共享記憶體，修改時才複製"""
+        train = pd.DataFrame({"A": [1, 2, 3]})
+        validation = pd.DataFrame({"A": [4, 5]})
+
+        operator = SplitterAdapter({"num_samples": 1})
+        operator.data = {1: {"train": train, "validation": validation}}
+
+        with pd.option_context("mode.copy_on_write", True):
+            result = operator.get_result()
+            assert np.shares_memory(result["train"]["A"].values, train["A"].values)
+
+            result["train"].loc[0, "A"] = 100
+            result["validation"]["A"] = 0
+
+        assert train["A"].tolist() == [1, 2, 3]
+        assert validation["A"].tolist() == [4, 5]
+
+    def test_copy_on_write_non_dataframe(self):
+        """測試 Copy-on-Write 下非 DataFrame 結果仍深複製"""
+        description = {"global": pd.DataFrame({"mean": [1.0]}), "meta": {"n": [1]}}
+
+        operator = BaseAdapter({"method": "test"})
+
+        with pd.option_context("mode.copy_on_write", True):
+            result = operator._handoff(description)
+
+        assert np.shares_memory(
+            result["global"]["mean"].values, description["global"]["mean"].values
+        )
+        result["meta"]["n"].append(2)
+        assert description["meta"]["n"] == [1]
+
+    @pytest.mark.stress
+    def test_copy_on_write_peak_memory(self):
+        """測試 Copy-on-Write 降低下游模組取得輸入時的峰值記憶體"""
+        script = textwrap.dedent(
+            """
+            import resource
+            import sys
+            from unittest.mock import Mock
+
+            import numpy as np
+            import pandas as pd
+
+            from petsard.adapter import (
+                EvaluatorAdapter,
+                SplitterAdapter,
+                SynthesizerAdapter,
+            )
+
+            pd.set_option("mode.copy_on_write", sys.argv[1] == "True")
+            data = pd.DataFrame(np.random.default_rng(0).random((2_000_000, 10)))
+
+            splitter = SplitterAdapter({"num_samples": 1})
+            splitter.data = {
+                1: {"train": data.iloc[:1_600_000], "validation": data.iloc[1_600_000:]}
+            }
+            synthesizer = SynthesizerAdapter({"method": "default"})
+            synthesizer.data_syn = data
+            operators = {"Splitter": splitter, "Synthesizer": synthesizer}
+
+            status = Mock(status=operators)
+            status.get_pre_module.side_effect = ["Splitter", "Synthesizer"]
+            status.get_result.side_effect = lambda module: operators[module].get_result()
+            inputs = [
+                SynthesizerAdapter({"method": "default"}).set_input(status),
+                EvaluatorAdapter({"method": "default"}).set_input(status),
+            ]
+            print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+            """
+        )
+
+        peak_rss = {}
+        for copy_on_write in [False, True]:
+            completed = subprocess.run(
+                [sys.executable, "-c", script, str(copy_on_write)],
+                capture_output=True,
+                check=True,
+                text=True,
+            )
+            peak_rss[copy_on_write] = int(completed.stdout.strip().splitlines()[-1])
+
+        # 2,000,000 x 10 float64 = 160 MB, deep copies hand it off about 3 times
+        assert peak_rss[False] - peak_rss[True] > 200 * 1024
+
+
 class TestConstrainerAdapter:
     """測試 ConstrainerAdapter"""
 
@@ -2,11 +2,13 @@ import os
 import tempfile
 from unittest.mock import Mock, patch
 
+import pandas as pd
 import pytest
 import yaml
 
+from petsard.adapter import LoaderAdapter, SplitterAdapter
 from petsard.exceptions import ConfigError
-from petsard.executor import Executor, ExecutorConfig
+from petsard.executor import Executor, ExecutorConfig, StageCache
 
 
 class TestExecutorConfig:
@@ -61,6 +63,21 @@ class TestExecutorConfig:
             config = ExecutorConfig(log_output_type=output_type)
             assert config.log_output_type == output_type
 
+    def test_parallel_config(self):
+        """測試平行執行配置"""
+        config = ExecutorConfig()
+        assert config.parallel == "none"
+        assert config.max_workers is None
+
+        config = ExecutorConfig(parallel="process", max_workers=4)
+        assert config.parallel == "process"
+        assert config.max_workers == 4
+
+        with pytest.raises(ConfigError):
+            ExecutorConfig(parallel="invalid")
+        with pytest.raises(ConfigError):
+            ExecutorConfig(parallel="process", max_workers=0)
+
 
 class TestExecutor:
     """測試 Executor 類別"""
@@ -471,5 +488,563 @@ class TestExecutorIntegration:
             os.unlink(config_file.name)
 
 
+class TestExecutorParallel:
+    """測試平行執行實驗分支"""
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        """建立測試資料與配置"""
+        data = pd.DataFrame(
+            {
+                "age": [20 + i % 50 for i in range(100)],
+                "job": [["a", "b", "c"][i % 3] for i in range(100)],
+            }
+        )
+        data_path = tmp_path / "data.csv"
+        data.to_csv(data_path, index=False)
+        return tmp_path, str(data_path)
+
+    def _create_config(self, tmp_path, data_path, parallel, with_reporter=True):
+        config = {
+            "Executor": {
+                "log_output_type": "file",
+                "log_dir": str(tmp_path / "logs"),
+                "parallel": parallel,
+                "max_workers": 2,
+            },
+            "Loader": {"data": {"filepath": data_path}},
+            "Splitter": {
+                "split": {
+                    "num_samples": 2,
+                    "train_split_ratio": 0.8,
+                    "random_state": 42,
+                }
+            },
+            "Synthesizer": {
+                "syn_a": {"method": "custom_data", "filepath": data_path},
+                "syn_b": {"method": "custom_data", "filepath": data_path},
+            },
+        }
+        if with_reporter:
+            config["Reporter"] = {
+                "output": {
+                    "method": "save_data",
+                    "source": "Synthesizer",
+                    "output": str(tmp_path / parallel),
+                }
+            }
+        config_path = tmp_path / f"{parallel}_{with_reporter}.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f, sort_keys=False)
+        return str(config_path)
+
+    def test_get_parallel_segment(self, workspace):
+        """測試分支切分點：Splitter 之後、Reporter 之前"""
+        tmp_path, data_path = workspace
+        executor = Executor(self._create_config(tmp_path, data_path, "process"))
+        assert executor.sequence[2:] == ["Synthesizer", "Reporter"]
+        assert executor._get_parallel_segment() == (2, 3)
+
+        executor = Executor(
+            self._create_config(tmp_path, data_path, "process", with_reporter=False)
+        )
+        assert executor._get_parallel_segment() == (2, 3)
+
+    def test_no_independent_branches(self, workspace):
+        """測試沒有可平行的分支時回傳 None"""
+        tmp_path, data_path = workspace
+        config_path = tmp_path / "single.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(
+                {
+                    "Executor": {"log_dir": str(tmp_path / "logs")},
+                    "Loader": {"data": {"filepath": data_path}},
+                },
+                f,
+            )
+        executor = Executor(str(config_path))
+        assert executor._get_parallel_segment() is None
+
+    @pytest.mark.parametrize("with_reporter", [True, False])
+    def test_parallel_matches_serial(self, workspace, with_reporter):
+        """測試平行執行的結果與序列執行一致"""
+        tmp_path, data_path = workspace
+
+        results = {}
+        for parallel in ["none", "process"]:
+            executor = Executor(
+                self._create_config(tmp_path, data_path, parallel, with_reporter)
+            )
+            executor.run()
+            assert executor.is_execution_completed()
+            results[parallel] = executor
+
+        serial, parallel = results["none"], results["process"]
+        assert list(serial.get_result().keys()) == list(parallel.get_result().keys())
+        assert len(parallel.get_result()) == 4
+        for key, serial_result in serial.get_result().items():
+            parallel_result = parallel.get_result()[key]
+            if isinstance(serial_result, pd.DataFrame):
+                pd.testing.assert_frame_equal(serial_result, parallel_result)
+            else:
+                assert serial_result.keys() == parallel_result.keys()
+
+        assert len(parallel.status.get_snapshots()) == len(
+            serial.status.get_snapshots()
+        )
+        assert len(parallel.get_timing()) == len(serial.get_timing())
+
+
+class TestExecutorCache:
+    """測試階段快取"""
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        """建立測試資料"""
+        data = pd.DataFrame({"age": [20 + i % 50 for i in range(100)]})
+        data_path = tmp_path / "data.csv"
+        data.to_csv(data_path, index=False)
+        return tmp_path, str(data_path)
+
+    def _create_config(self, tmp_path, data_path, executor_config, loaders=1):
+        config = {
+            "Executor": {
+                "log_output_type": "file",
+                "log_dir": str(tmp_path / "logs"),
+                **executor_config,
+            },
+            "Loader": {
+                f"data_{n}": {"filepath": data_path} for n in range(loaders)
+            },
+            "Splitter": {
+                "split": {
+                    "num_samples": 2,
+                    "train_split_ratio": 0.8,
+                    "random_state": 42,
+                }
+            },
+        }
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f, sort_keys=False)
+        return str(config_path)
+
+    def test_stage_key(self, workspace):
+        """測試階段鍵值依賴設定、上游與檔案內容"""
+        tmp_path, data_path = workspace
+        cache = StageCache(
+            yaml_config={
+                "Loader": {"a": {"filepath": data_path}, "b": {"filepath": data_path}},
+                "Splitter": {"s_[2-1]": {"num_samples": 1}, "s_[2-2]": {"num_samples": 1}},
+                "Reporter": {"r": {"method": "save_data"}},
+            },
+            sequence=["Loader", "Splitter", "Reporter"],
+        )
+
+        key_a = cache.get_key("Loader", "a")
+        split_1 = cache.get_key("Splitter", "s_[2-1]")
+        split_2 = cache.get_key("Splitter", "s_[2-2]")
+        assert cache.get_key("Reporter", "r") is None
+        # same config reached from another experiment name
+        assert cache.get_key("Loader", "b") == key_a
+        # Splitter samples share a config but not a result
+        assert split_1 != split_2
+
+        pd.DataFrame({"age": [1, 2, 3]}).to_csv(data_path, index=False)
+        assert cache.get_key("Loader", "a") != key_a
+
+    def test_identical_stages_run_once(self, workspace):
+        """測試相同設定的階段在同一次執行中只執行一次"""
+        tmp_path, data_path = workspace
+        executor = Executor(
+            self._create_config(tmp_path, data_path, {"cache": True}, loaders=2)
+        )
+
+        with patch.object(
+            LoaderAdapter, "_run", autospec=True, side_effect=LoaderAdapter._run
+        ) as mock_loader_run, patch.object(
+            SplitterAdapter, "_run", autospec=True, side_effect=SplitterAdapter._run
+        ) as mock_splitter_run:
+            executor.run()
+
+        assert mock_loader_run.call_count == 1
+        assert mock_splitter_run.call_count == 2
+        assert len(executor.get_result()) == 4
+
+    def test_cache_dir_skips_unchanged_stages(self, workspace):
+        """測試重複執行時從磁碟快取直接取用未變更的階段"""
+        tmp_path, data_path = workspace
+        config_path = self._create_config(
+            tmp_path, data_path, {"cache_dir": str(tmp_path / "cache")}
+        )
+
+        first = Executor(config_path)
+        first.run()
+        assert len(os.listdir(tmp_path / "cache")) == 3
+
+        second = Executor(config_path)
+        with patch.object(LoaderAdapter, "_run") as mock_loader_run, patch.object(
+            SplitterAdapter, "_run"
+        ) as mock_splitter_run:
+            second.run()
+
+        mock_loader_run.assert_not_called()
+        mock_splitter_run.assert_not_called()
+        assert first.get_result().keys() == second.get_result().keys()
+        for key, result in first.get_result().items():
+            pd.testing.assert_frame_equal(
+                result["train"], second.get_result()[key]["train"]
+            )
+
+
+class TestExecutorCheckpoint:
+    """測試檢查點與續跑"""
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """建立測試資料與配置"""
+        data = pd.DataFrame({"age": [20 + i % 50 for i in range(100)]})
+        data_path = tmp_path / "data.csv"
+        data.to_csv(data_path, index=False)
+
+        config = {
+            "Executor": {
+                "log_output_type": "file",
+                "log_dir": str(tmp_path / "logs"),
+                "checkpoint_dir": str(tmp_path / "checkpoint"),
+                "resume": True,
+            },
+            "Loader": {"data": {"filepath": str(data_path)}},
+            "Splitter": {
+                "split": {
+                    "num_samples": 2,
+                    "train_split_ratio": 0.8,
+                    "random_state": 42,
+                }
+            },
+        }
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f, sort_keys=False)
+        return str(config_path)
+
+    def test_resume_requires_checkpoint_dir(self):
+        """測試 resume 需要 checkpoint_dir"""
+        with pytest.raises(ConfigError):
+            ExecutorConfig(resume=True)
+
+    def test_checkpoint_files(self, config_path, tmp_path):
+        """測試每個完成的步驟都有檢查點"""
+        Executor(config_path).run()
+
+        step_dirs = sorted(os.listdir(tmp_path / "checkpoint"))
+        assert len(step_dirs) == 3
+        loader_dir = tmp_path / "checkpoint" / step_dirs[0]
+        assert step_dirs[0].startswith("Loader_")
+        assert (loader_dir / "operator.pkl").exists()
+        assert (loader_dir / "metadata.json").exists()
+        assert (loader_dir / "step.json").exists()
+
+    def test_resume_after_failure(self, config_path):
+        """測試中斷後從第一個未完成的步驟繼續執行"""
+        original_run = SplitterAdapter._run
+        calls = []
+
+        def interrupt_second_split(adapter, input):
+            calls.append(adapter)
+            if len(calls) > 1:
+                raise RuntimeError("interrupted")
+            return original_run(adapter, input)
+
+        failing = Executor(config_path)
+        with patch.object(
+            SplitterAdapter, "_run", autospec=True, side_effect=interrupt_second_split
+        ):
+            with pytest.raises(RuntimeError):
+                failing.run()
+
+        resumed = Executor(config_path)
+        with patch.object(LoaderAdapter, "_run") as mock_loader_run, patch.object(
+            SplitterAdapter, "_run", autospec=True, side_effect=SplitterAdapter._run
+        ) as mock_splitter_run:
+            resumed.run()
+
+        mock_loader_run.assert_not_called()
+        assert mock_splitter_run.call_count == 1
+        assert len(resumed.get_result()) == 2
+
+    def test_outdated_checkpoint(self, config_path):
+        """測試設定變更後不還原過期的檢查點"""
+        Executor(config_path).run()
+
+        with open(config_path) as f:
+            config = yaml.safe_load(f)
+        config["Splitter"]["split"]["random_state"] = 7
+        with open(config_path, "w") as f:
+            yaml.dump(config, f, sort_keys=False)
+
+        resumed = Executor(config_path)
+        with patch.object(LoaderAdapter, "_run") as mock_loader_run, patch.object(
+            SplitterAdapter, "_run", autospec=True, side_effect=SplitterAdapter._run
+        ) as mock_splitter_run:
+            resumed.run()
+
+        mock_loader_run.assert_not_called()
+        assert mock_splitter_run.call_count == 2
+
+    def test_changed_input_file(self, config_path, tmp_path):
+        """測試輸入檔案變更後不還原過期的檢查點"""
+        Executor(config_path).run()
+
+        pd.DataFrame({"age": [30 + i % 20 for i in range(120)]}).to_csv(
+            tmp_path / "data.csv", index=False
+        )
+
+        resumed = Executor(config_path)
+        with patch.object(
+            LoaderAdapter, "_run", autospec=True, side_effect=LoaderAdapter._run
+        ) as mock_loader_run, patch.object(
+            SplitterAdapter, "_run", autospec=True, side_effect=SplitterAdapter._run
+        ) as mock_splitter_run:
+            resumed.run()
+
+        assert mock_loader_run.call_count == 1
+        assert mock_splitter_run.call_count == 2
+        for result in resumed.get_result().values():
+            assert result["train"]["age"].min() >= 30
+
+    def test_reporter_not_checkpointed(self, config_path, tmp_path):
+        """測試 Reporter 不建立檢查點，續跑時重新輸出報告"""
+        with open(config_path) as f:
+            config = yaml.safe_load(f)
+        config["Reporter"] = {
+            "output": {
+                "method": "save_data",
+                "source": "Splitter",
+                "output": str(tmp_path / "report"),
+            }
+        }
+        with open(config_path, "w") as f:
+            yaml.dump(config, f, sort_keys=False)
+
+        Executor(config_path).run()
+        step_dirs = os.listdir(tmp_path / "checkpoint")
+        assert not any(step_dir.startswith("Reporter_") for step_dir in step_dirs)
+
+        reports = list(tmp_path.glob("report*.csv"))
+        assert len(reports) > 0
+        for report in reports:
+            report.unlink()
+
+        Executor(config_path).run()
+        assert sorted(tmp_path.glob("report*.csv")) == sorted(reports)
+
+
+class TestExecutorConstrainer:
+    """測試含欄位約束的 Constrainer 可建立檢查點與平行執行"""
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        """建立測試資料"""
+        data = pd.DataFrame({"age": [i % 50 for i in range(100)]})
+        data_path = tmp_path / "data.csv"
+        data.to_csv(data_path, index=False)
+        return tmp_path, str(data_path)
+
+    def _create_config(self, tmp_path, data_path, executor_config):
+        config = {
+            "Executor": {
+                "log_output_type": "file",
+                "log_dir": str(tmp_path / "logs"),
+                **executor_config,
+            },
+            "Loader": {"data": {"filepath": data_path}},
+            "Splitter": {
+                "split": {
+                    "num_samples": 1,
+                    "train_split_ratio": 0.8,
+                    "random_state": 42,
+                }
+            },
+            "Synthesizer": {"syn": {"method": "custom_data", "filepath": data_path}},
+            "Constrainer": {"adult": {"field_constraints": ["age >= 18"]}},
+            "Describer": {
+                "describe_a": {"method": "default"},
+                "describe_b": {"method": "default"},
+            },
+        }
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f, sort_keys=False)
+        return str(config_path)
+
+    @pytest.mark.parametrize(
+        "executor_config",
+        [{"checkpoint_dir": "checkpoint"}, {"parallel": "process", "max_workers": 2}],
+        ids=["checkpoint", "process"],
+    )
+    def test_field_constraints_pickled(self, workspace, executor_config):
+        """測試欄位約束編譯後的判斷式不妨礙序列化"""
+        tmp_path, data_path = workspace
+        if "checkpoint_dir" in executor_config:
+            executor_config = {"checkpoint_dir": str(tmp_path / "checkpoint")}
+
+        executor = Executor(self._create_config(tmp_path, data_path, executor_config))
+        executor.run()
+
+        assert len(executor.get_result()) == 2
+        if "checkpoint_dir" in executor_config:
+            step_dirs = os.listdir(tmp_path / "checkpoint")
+            assert any(step_dir.startswith("Constrainer_") for step_dir in step_dirs)
+
+
+class TestExecutorCopyOnWrite:
+    """測試 Copy-on-Write 結果傳遞"""
+
+    @staticmethod
+    def _create_config(tmp_path, copy_on_write):
+        """建立測試資料與配置"""
+        data_path = tmp_path / "data.csv"
+        if not data_path.exists():
+            pd.DataFrame({f"col{i}": range(i, 100 + i) for i in range(3)}).to_csv(
+                data_path, index=False
+            )
+
+        config = {
+            "Executor": {
+                "log_output_type": "file",
+                "log_dir": str(tmp_path / "logs"),
+                "copy_on_write": copy_on_write,
+            },
+            "Loader": {"data": {"filepath": str(data_path)}},
+            "Splitter": {
+                "split": {
+                    "num_samples": 1,
+                    "train_split_ratio": 0.8,
+                    "random_state": 42,
+                }
+            },
+            "Synthesizer": {
+                "custom": {"method": "custom_data", "filepath": str(data_path)}
+            },
+        }
+        config_path = tmp_path / f"config_{copy_on_write}.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f, sort_keys=False)
+        return str(config_path)
+
+    def test_copy_on_write_matches_deepcopy(self, tmp_path):
+        """測試 Copy-on-Write 與深複製的結果一致"""
+        results = {}
+        for copy_on_write in [False, True]:
+            executor = Executor(self._create_config(tmp_path, copy_on_write))
+            executor.run()
+            results[copy_on_write] = executor.get_result()
+
+        assert pd.get_option("mode.copy_on_write") is False
+        assert results[False].keys() == results[True].keys()
+        for key in results[False]:
+            pd.testing.assert_frame_equal(results[False][key], results[True][key])
+
+
+class TestExecutorMemoryBudget:
+    """測試 Status 記憶體上限"""
+
+    @pytest.fixture
+    def data_path(self, tmp_path):
+        """建立測試資料"""
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame({"age": [20 + i % 50 for i in range(100)]}).to_csv(
+            data_path, index=False
+        )
+        return data_path
+
+    def test_memory_budget_config(self):
+        """測試記憶體上限配置驗證"""
+        config = ExecutorConfig(memory_budget=1024, spill_dir="./spill")
+        assert config.memory_budget == 1024
+
+        with pytest.raises(ConfigError):
+            ExecutorConfig(memory_budget=0)
+        with pytest.raises(ConfigError):
+            ExecutorConfig(spill_dir="./spill")
+
+    @staticmethod
+    def _create_config(tmp_path, data_path, parallel, memory_budget):
+        """建立配置"""
+        config = {
+            "Executor": {
+                "log_output_type": "file",
+                "log_dir": str(tmp_path / "logs"),
+                "parallel": parallel,
+                "max_workers": 2,
+                "memory_budget": memory_budget,
+            },
+            "Loader": {"data": {"filepath": str(data_path)}},
+            "Splitter": {
+                "split": {
+                    "num_samples": 2,
+                    "train_split_ratio": 0.8,
+                    "random_state": 42,
+                }
+            },
+            "Synthesizer": {
+                "syn_a": {"method": "custom_data", "filepath": str(data_path)},
+                "syn_b": {"method": "custom_data", "filepath": str(data_path)},
+            },
+            "Reporter": {
+                "output": {
+                    "method": "save_data",
+                    "source": "Synthesizer",
+                    "output": str(tmp_path / f"{parallel}_{memory_budget}"),
+                }
+            },
+        }
+        config_path = tmp_path / f"{parallel}_{memory_budget}.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(config, f, sort_keys=False)
+        return str(config_path)
+
+    @pytest.mark.parametrize("parallel", ["none", "process"])
+    def test_memory_budget_matches_unbounded(self, tmp_path, data_path, parallel):
+        """測試設定記憶體上限後結果不變"""
+        results = {}
+        for memory_budget in [None, 1]:
+            executor = Executor(
+                self._create_config(tmp_path, data_path, parallel, memory_budget)
+            )
+            executor.run()
+            results[memory_budget] = executor.get_result()
+
+        summary = executor.status.get_status_summary()
+        assert summary["memory_budget"] == 1
+        assert summary["peak_retained_bytes"] > 0
+        assert results[None].keys() == results[1].keys()
+        for key in results[None]:
+            for source, data in results[None][key].items():
+                pd.testing.assert_frame_equal(data, results[1][key][source])
+
+    @pytest.mark.parametrize("parallel", ["none", "process"])
+    def test_spill_directory_removed(self, tmp_path, data_path, monkeypatch, parallel):
+        """測試執行結束後刪除暫存溢寫目錄"""
+        temp_dir = tmp_path / "tmp"
+        temp_dir.mkdir()
+        monkeypatch.setenv("TMPDIR", str(temp_dir))
+        monkeypatch.setattr(tempfile, "tempdir", None)
+
+        mkdtemp = tempfile.mkdtemp
+        created = []
+
+        def recording_mkdtemp(*args, **kwargs):
+            created.append(mkdtemp(*args, **kwargs))
+            return created[-1]
+
+        monkeypatch.setattr(tempfile, "mkdtemp", recording_mkdtemp)
+        Executor(self._create_config(tmp_path, data_path, parallel, 1)).run()
+
+        if parallel == "none":
+            assert len(created) == 1
+        assert os.listdir(temp_dir) == []
+
 if __name__ == "__main__":
     pytest.main([__file__])
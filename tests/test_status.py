@@ -2,12 +2,16 @@
 測試新的 Status 快照功能
 """
 
+import os
+import pickle
 from unittest.mock import Mock
 
 import pandas as pd
+import pytest
 
 from petsard.adapter import BaseAdapter
 from petsard.config import Config
+from petsard.exceptions import StatusError
 from petsard.metadater import SchemaMetadata
 from petsard.status import Status
 
@@ -145,6 +149,33 @@ class TestStatusSnapshots:
         assert len(loader_snapshots) == 1
         assert loader_snapshots[0].module_name == "Loader"
 
+    def test_merge_records_rekeys_branch_snapshots(self):
+        """測試合併分支快照時重新編號，避免同一秒完成的分支 ID 重複"""
+        data = pd.DataFrame({"A": [1, 2, 3]})
+        self.status.put("Loader", "data", DataAdapter(data))
+        snapshot_state = pickle.dumps(self.status)
+
+        # 兩個分支由相同的計數器開始，產生相同的快照 ID
+        branch_snapshots = []
+        for _ in range(2):
+            branch = pickle.loads(snapshot_state)
+            branch.snapshots.clear()
+            branch.put("Splitter", "split", DataAdapter(data))
+            branch_snapshots.append(list(branch.snapshots))
+        assert (
+            branch_snapshots[0][0].snapshot_id[:-15]
+            == branch_snapshots[1][0].snapshot_id[:-15]
+        )
+
+        for snapshots in branch_snapshots:
+            self.status.merge_records(snapshots=snapshots, timing_records=[])
+
+        snapshot_ids = [s.snapshot_id for s in self.status.get_snapshots()]
+        assert len(set(snapshot_ids)) == 3
+        assert self.status._snapshot_counter == 3
+        for snapshot_id in snapshot_ids:
+            assert self.status.get_snapshot_by_id(snapshot_id) is not None
+
 
 class TestStatusTiming:
     """測試 Status 統一計時系統"""
@@ -341,3 +372,156 @@ class TestStatusTiming:
         # 過濾不存在的模組
         nonexistent_records = self.status.get_timing_records("NonExistentModule")
         assert len(nonexistent_records) == 0
+
+
+class DataAdapter(BaseAdapter):
+    """可序列化的測試操作器，持有一份資料"""
+
+    def __init__(self, data: pd.DataFrame):
+        super().__init__({})
+        self.data = data
+
+    def get_result(self):
+        return self.data
+
+    def get_metadata(self) -> SchemaMetadata:
+        return SchemaMetadata(schema_id="test_schema")
+
+
+class TestStatusMemoryBudget:
+    """測試 Status 記憶體上限"""
+
+    def setup_method(self):
+        """設定測試環境"""
+        config_dict = {
+            "Loader": {"data": {"filepath": "benchmark://adult-income"}},
+            "Synthesizer": {"demo": {"method": "default"}},
+            "Evaluator": {"demo": {"method": "default"}},
+        }
+        self.config = Config(config_dict)
+        self.data = pd.DataFrame({"A": range(1000), "B": ["text"] * 1000})
+
+    def test_retained_bytes(self):
+        """測試保留記憶體大小的統計"""
+        status = Status(self.config, memory_budget=10**9)
+        status.put("Loader", "data", DataAdapter(self.data))
+
+        summary = status.get_status_summary()
+        expected = self.data.memory_usage(index=True, deep=True).sum()
+        assert summary["memory_budget"] == 10**9
+        assert summary["retained_bytes"] == expected
+        assert summary["peak_retained_bytes"] == expected
+
+    def test_retained_bytes_without_budget(self, monkeypatch):
+        """測試未設定上限時不估計結果大小"""
+
+        def fail_estimate(operator):
+            raise AssertionError("estimated without memory_budget")
+
+        monkeypatch.setattr(Status, "_estimate_bytes", staticmethod(fail_estimate))
+        status = Status(self.config)
+        status.put("Loader", "data", DataAdapter(self.data))
+        status.set_branch_state(status.get_branch_state())
+
+        summary = status.get_status_summary()
+        assert summary["memory_budget"] is None
+        assert summary["retained_bytes"] == 0
+        assert summary["peak_retained_bytes"] == 0
+
+    def test_release_without_budget(self):
+        """測試未設定上限時保留所有結果"""
+        status = Status(self.config)
+        status.put("Loader", "data", DataAdapter(self.data))
+        status.put("Synthesizer", "demo", DataAdapter(self.data))
+        status.release(pending=[])
+
+        assert status.get_result("Loader").equals(self.data)
+        assert status.get_status_summary()["evicted_modules"] == []
+
+    def test_evict_unneeded_results(self):
+        """測試釋放尚待執行步驟不再讀取的結果"""
+        status = Status(self.config, memory_budget=10**9)
+        status.put("Loader", "data", DataAdapter(self.data))
+        status.put("Synthesizer", "demo", DataAdapter(self.data))
+
+        # Evaluator 讀取 Loader 與 Synthesizer
+        status.release(pending=["Evaluator"])
+        assert status.get_status_summary()["evicted_modules"] == []
+
+        # 下一個 Synthesizer 實驗只讀取 Loader
+        status.release(pending=["Synthesizer", "Evaluator"])
+        assert status.get_status_summary()["evicted_modules"] == []
+
+        status.put("Evaluator", "demo", DataAdapter(self.data))
+        status.release(pending=[])
+        summary = status.get_status_summary()
+        assert summary["evicted_modules"] == ["Loader", "Synthesizer"]
+        assert summary["active_modules"] == ["Loader", "Synthesizer", "Evaluator"]
+        assert status.get_result("Evaluator").equals(self.data)
+        with pytest.raises(StatusError):
+            status.get_result("Loader")
+
+    def test_spill_needed_results(self, tmp_path):
+        """測試超出上限時溢寫仍需要的結果"""
+        status = Status(self.config, memory_budget=1, spill_dir=str(tmp_path))
+        status.put("Loader", "data", DataAdapter(self.data))
+        status.put("Synthesizer", "demo", DataAdapter(self.data))
+        status.release(pending=["Evaluator"])
+
+        summary = status.get_status_summary()
+        assert summary["spilled_modules"] == ["Loader"]
+        assert summary["retained_bytes"] < summary["peak_retained_bytes"]
+        assert len(os.listdir(tmp_path)) == 1
+        assert status.get_result("Loader").equals(self.data)
+
+        # 重新執行上游模組時刪除溢寫檔案
+        status.put("Loader", "data", DataAdapter(self.data))
+        assert status.get_status_summary()["spilled_modules"] == []
+        assert os.listdir(tmp_path) == []
+
+    def test_branch_state_loads_spilled(self, tmp_path):
+        """測試分支狀態包含已溢寫的操作器"""
+        status = Status(self.config, memory_budget=1, spill_dir=str(tmp_path))
+        status.put("Loader", "data", DataAdapter(self.data))
+        status.put("Synthesizer", "demo", DataAdapter(self.data))
+        status.release(pending=["Evaluator"])
+
+        state = status.get_branch_state()
+        assert state["status"]["Loader"]["operator"].get_result().equals(self.data)
+
+    def test_cleanup_spill_removes_temporary_directory(self):
+        """測試結束時刪除暫存溢寫目錄，溢寫的結果視為已釋放"""
+        status = Status(self.config, memory_budget=1)
+        status.put("Loader", "data", DataAdapter(self.data))
+        status.put("Synthesizer", "demo", DataAdapter(self.data))
+        status.release(pending=["Evaluator"])
+        spill_dir = status.spill_dir
+        assert len(os.listdir(spill_dir)) == 1
+
+        status.cleanup_spill()
+        assert not os.path.exists(spill_dir)
+        summary = status.get_status_summary()
+        assert summary["spilled_modules"] == []
+        assert summary["evicted_modules"] == ["Loader"]
+        with pytest.raises(StatusError):
+            status.get_result("Loader")
+
+    def test_shared_spill_files_kept_until_cleanup(self, tmp_path):
+        """測試序列化不改變原實例，共用的溢寫檔案延至結束時才刪除"""
+        status = Status(self.config, memory_budget=1, spill_dir=str(tmp_path))
+        status.put("Loader", "data", DataAdapter(self.data))
+        status.put("Synthesizer", "demo", DataAdapter(self.data))
+        status.release(pending=["Evaluator"])
+
+        spill_files = set(status._spill_files)
+        worker = pickle.loads(pickle.dumps(status))
+        assert status._spill_files == spill_files
+        assert worker._spill_files == set()
+
+        status.share_spill_files()
+        status.put("Loader", "data", DataAdapter(self.data))
+        assert len(os.listdir(tmp_path)) == 1
+        assert worker.get_result("Loader").equals(self.data)
+
+        status.cleanup_spill()
+        assert os.listdir(tmp_path) == []